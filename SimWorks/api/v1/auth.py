@@ -13,6 +13,8 @@ from django.contrib.auth import get_user_model
 import jwt
 from ninja.security import HttpBearer
 
+from apps.accounts.principal_cache import get_active_user
+
 logger = logging.getLogger(__name__)
 
 User = get_user_model()
@@ -52,8 +54,7 @@ class DualAuth(HttpBearer):
             if not user_id:
                 return None
 
-            user = User.objects.filter(pk=user_id, is_active=True).first()
-            return user
+            return get_active_user(user_id)
 
         except InvalidTokenError as e:
             logger.debug("JWT authentication failed: %s", e)
@@ -89,8 +90,7 @@ class JWTAuth(HttpBearer):
             if not user_id:
                 return None
 
-            user = User.objects.filter(pk=user_id, is_active=True).first()
-            return user
+            return get_active_user(user_id)
 
         except InvalidTokenError as e:
             logger.debug("JWT authentication failed: %s", e)
@@ -100,13 +100,13 @@ def staff_unreviewed_count(request: HttpRequest) -> FeedbackUnreviewedCountOut:
     from django.urls import reverse
 
     from apps.feedback.context_processors import build_unreviewed_feedback_label
-    from apps.feedback.models import UserFeedback
+    from apps.feedback.services import FeedbackQueryService
 
     user = request.auth
     if not getattr(user, "is_staff", False):
         raise HttpError(403, "Staff access required")
 
-    count = UserFeedback.objects.filter(is_reviewed=False, is_archived=False).count()
+    count = FeedbackQueryService().unreviewed_count()
     url = f"{reverse('feedback:staff-list')}?reviewed=unreviewed"
     return FeedbackUnreviewedCountOut(
         count=count,
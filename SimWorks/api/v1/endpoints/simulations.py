@@ -33,6 +33,7 @@ from apps.common.retries import (
     is_simulation_initial_generation_retryable,
 )
 from apps.simcore.access import get_chatlab_simulation_queryset_for_request
+from apps.simcore.search import search_simulations
 from config.logging import get_logger
 
 logger = get_logger(__name__)
@@ -143,15 +144,7 @@ def list_simulations(
 
     search = (q or "").strip()
     if search:
-        search_filter = (
-            Q(diagnosis__icontains=search)
-            | Q(chief_complaint__icontains=search)
-            | Q(prompt_instruction__icontains=search)
-            | Q(prompt_message__icontains=search)
-        )
-        if search_messages:
-            search_filter |= Q(input__content__icontains=search)
-        queryset = queryset.filter(search_filter).distinct()
+        queryset = search_simulations(queryset, search, include_messages=search_messages)
 
     # Apply cursor-based pagination (using ID for simplicity)
     if cursor:
@@ -4,6 +4,7 @@ from uuid import UUID
 
 from apps.accounts.models import Account
 from apps.accounts.permissions import can_access_account
+from apps.accounts.principal_cache import get_cached_account_resolution
 from apps.accounts.services import get_default_account_for_user
 
 ACCOUNT_HEADER_NAME = "X-Account-UUID"
@@ -47,6 +48,18 @@ def resolve_account_for_user_with_reason(
     if not getattr(user, "is_authenticated", False):
         return None, "anonymous_user"
 
+    return get_cached_account_resolution(
+        user,
+        account_uuid,
+        lambda: _resolve_account_for_user_with_reason(user, account_uuid=account_uuid),
+    )
+
+
+def _resolve_account_for_user_with_reason(
+    user,
+    *,
+    account_uuid: str | None = None,
+) -> tuple[Account | None, str]:
     account = None
     if account_uuid:
         try:
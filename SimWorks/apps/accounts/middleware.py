@@ -5,6 +5,7 @@ This middleware captures invitation tokens from URL parameters and stores them
 in the session, making them available during the allauth signup process.
 """
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.http import HttpRequest
 
 
@@ -23,10 +24,19 @@ class InvitationMiddleware:
     - Social auth signup (Apple, Google, etc.)
     """
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request: HttpRequest):
+        if self.async_mode:
+            return self.__acall__(request)
+
         # Check if invitation token is in URL parameters
         invitation_token = request.GET.get("invitation")
 
@@ -36,3 +46,12 @@ class InvitationMiddleware:
 
         response = self.get_response(request)
         return response
+
+    async def __acall__(self, request: HttpRequest):
+        invitation_token = request.GET.get("invitation")
+
+        if invitation_token:
+            # Session writes load the session from the database; use the async API.
+            await request.session.aset("invitation_token", invitation_token)
+
+        return await self.get_response(request)
@@ -0,0 +1,113 @@
+"""Short-lived cache of authenticated principals.
+
+JWT authentication (API and WebSocket) and account-context resolution would
+otherwise query the user, account and membership tables on every request.
+Entries are keyed by user id plus a per-user version token, so bumping the
+version (:func:`invalidate_principal`) drops every cached entry for that user
+at once.  Signal receivers in ``apps.accounts.signals`` bump it when a user,
+account or membership changes, and again once the transaction commits so a
+request that re-cached the old rows in between does not keep them.
+
+``PRINCIPAL_CACHE_TTL`` (seconds, default 60, ``0`` disables) bounds staleness
+when the cache is not shared between processes (e.g. the default local-memory
+backend); ``PRINCIPAL_CACHE_ALIAS`` selects the Django cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+KEY_PREFIX = "principal:"
+DEFAULT_TTL = 60
+
+_MISSING = object()
+
+
+def _cache():
+    return caches[getattr(settings, "PRINCIPAL_CACHE_ALIAS", "default")]
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "PRINCIPAL_CACHE_TTL", DEFAULT_TTL))
+
+
+def _version_key(user_id: Any) -> str:
+    return f"{KEY_PREFIX}version:{user_id}"
+
+
+def _user_version(user_id: Any) -> str:
+    cache = _cache()
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        # Never fall back to a fixed default: an evicted version key must not
+        # resurrect entries cached under an older token.
+        cache.add(key, uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _bump_versions(user_ids: frozenset[Any]) -> None:
+    _cache().set_many({_version_key(user_id): uuid4().hex for user_id in user_ids}, timeout=None)
+
+
+def invalidate_principals(user_ids: Iterable[Any]) -> None:
+    """Drop every cached principal entry for *user_ids*, now and again on commit."""
+    if _ttl() <= 0:
+        return
+    user_ids = frozenset(user_id for user_id in user_ids if user_id is not None)
+    if not user_ids:
+        return
+    _bump_versions(user_ids)
+    transaction.on_commit(partial(_bump_versions, user_ids))
+
+
+def invalidate_principal(user_id: Any) -> None:
+    """Drop every cached principal entry for *user_id*, now and again on commit."""
+    invalidate_principals((user_id,))
+
+
+def _cached(user_id: Any, name: str, compute: Callable[[], Any]) -> Any:
+    ttl = _ttl()
+    if ttl <= 0:
+        return compute()
+
+    cache = _cache()
+    key = f"{KEY_PREFIX}{user_id}:{_user_version(user_id)}:{name}"
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        value = compute()
+        cache.set(key, value, timeout=ttl)
+    return value
+
+
+def get_active_user(user_id: Any):
+    """Return the active user with primary key *user_id*, or ``None``."""
+    from apps.accounts.models import User
+
+    try:
+        user_pk = int(user_id)
+    except (TypeError, ValueError):
+        return None
+
+    return _cached(
+        user_pk,
+        "user",
+        lambda: User.objects.filter(pk=user_pk, is_active=True).first(),
+    )
+
+
+def get_cached_account_resolution(
+    user,
+    account_uuid: str | None,
+    resolve: Callable[[], tuple[Any, str]],
+) -> tuple[Any, str]:
+    """Return ``resolve()`` for *user* and *account_uuid*, cached per user version."""
+    return _cached(user.pk, f"account:{account_uuid or 'default'}", resolve)
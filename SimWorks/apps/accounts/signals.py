@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from apps.accounts.models import User
+from apps.accounts.models import Account, AccountMembership, User
+from apps.accounts.principal_cache import invalidate_principal, invalidate_principals
 from apps.accounts.services import (
     maybe_claim_pending_memberships_for_user,
     maybe_create_personal_account_for_user,
@@ -16,3 +17,30 @@ def ensure_personal_account(sender, instance: User, created: bool, **kwargs):
         return
     maybe_create_personal_account_for_user(instance)
     maybe_claim_pending_memberships_for_user(instance)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_principal(sender, instance: User, **kwargs):
+    invalidate_principal(instance.pk)
+
+
+@receiver(post_save, sender=AccountMembership)
+@receiver(post_delete, sender=AccountMembership)
+def invalidate_membership_principal(sender, instance: AccountMembership, **kwargs):
+    invalidate_principal(instance.user_id)
+
+
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+def invalidate_account_principals(sender, instance: Account, created: bool = False, **kwargs):
+    if created:
+        invalidate_principal(instance.owner_user_id)
+        return
+    user_ids = set(
+        AccountMembership.objects.filter(account_id=instance.pk, user__isnull=False).values_list(
+            "user_id", flat=True
+        )
+    )
+    user_ids.add(instance.owner_user_id)
+    invalidate_principals(user_ids)
@@ -13,7 +13,9 @@ from django.contrib import admin
 from .models import (
     Assessment,
     AssessmentCriterion,
+    AssessmentCriterionDailyRollup,
     AssessmentCriterionScore,
+    AssessmentDailyRollup,
     AssessmentRubric,
     AssessmentSource,
 )
@@ -194,3 +196,29 @@ class AssessmentSourceAdmin(admin.ModelAdmin):
         "source_assessment__id",
     )
     readonly_fields = ("created_at",)
+
+
+class ReadOnlyRollupAdmin(admin.ModelAdmin):
+    """Rollups are derived data; rebuild them with ``rebuild_assessment_rollups``."""
+
+    list_filter = ("day",)
+    date_hierarchy = "day"
+    ordering = ("-day",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(AssessmentDailyRollup)
+class AssessmentDailyRollupAdmin(ReadOnlyRollupAdmin):
+    list_display = ("day", "account", "rubric", "assessment_count", "score_count", "mean_score")
+    search_fields = ("rubric__slug",)
+
+
+@admin.register(AssessmentCriterionDailyRollup)
+class AssessmentCriterionDailyRollupAdmin(ReadOnlyRollupAdmin):
+    list_display = ("day", "account", "criterion", "score_count", "mean_score")
+    search_fields = ("criterion__slug", "rubric__slug")
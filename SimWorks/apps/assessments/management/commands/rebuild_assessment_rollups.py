@@ -0,0 +1,39 @@
+"""Backfill or repair the daily assessment dashboard rollups.
+
+Recomputes every ``(account, rubric, day)`` partition in the requested
+range from the assessment tables, removing rollups whose assessments no
+longer exist. Safe to re-run; each partition is refreshed in its own
+transaction.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+def _parse_day(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError as exc:
+        raise CommandError(f"Invalid date {value!r}; expected YYYY-MM-DD.") from exc
+
+
+class Command(BaseCommand):
+    help = "Rebuild daily assessment rollups from assessment scores."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", type=_parse_day, help="First day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--until", type=_parse_day, help="Last day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--account", type=int, help="Limit the rebuild to one account id.")
+
+    def handle(self, *args, **options):
+        from apps.assessments.services.analytics import rebuild_rollups
+
+        since, until = options["since"], options["until"]
+        if since and until and since > until:
+            raise CommandError("--since must not be after --until.")
+
+        partitions = rebuild_rollups(since=since, until=until, account_id=options["account"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {partitions} rollup partition(s)."))
@@ -0,0 +1,52 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:30
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('assessments', '0003_seed_chatlab_rubrics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssessmentCriterionDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('score_count', models.PositiveIntegerField(default=0)),
+                ('score_sum', models.DecimalField(decimal_places=3, default=Decimal('0'), max_digits=14)),
+                ('score_buckets', models.JSONField(blank=True, default=list)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='accounts.account')),
+                ('criterion', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='assessments.assessmentcriterion')),
+                ('rubric', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='assessments.assessmentrubric')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['account', 'rubric', 'day'], name='criterion_rollup_rubric_idx')],
+                'constraints': [models.UniqueConstraint(fields=('account', 'criterion', 'day'), name='uniq_criterion_rollup_day')],
+            },
+        ),
+        migrations.CreateModel(
+            name='AssessmentDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('score_count', models.PositiveIntegerField(default=0)),
+                ('score_sum', models.DecimalField(decimal_places=3, default=Decimal('0'), max_digits=14)),
+                ('score_buckets', models.JSONField(blank=True, default=list)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('assessment_count', models.PositiveIntegerField(default=0)),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='accounts.account')),
+                ('rubric', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='assessments.assessmentrubric')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['account', 'day'], name='assessment_rollup_acct_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('account', 'rubric', 'day'), name='uniq_assessment_rollup_day')],
+            },
+        ),
+    ]
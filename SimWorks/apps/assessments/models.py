@@ -28,7 +28,7 @@ import uuid
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models.signals import pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 from django.utils import timezone
 
@@ -594,6 +594,92 @@ class AssessmentSource(models.Model):
         return super().save(*args, **kwargs)
 
 
+SCORE_BUCKET_COUNT = 5
+
+
+class AssessmentScoreRollup(models.Model):
+    """Shared shape of the daily assessment rollups.
+
+    Rollups are derived data: ``apps.assessments.services.analytics``
+    recomputes them per ``(account, rubric, day)`` after assessments are
+    written, and ``rebuild_assessment_rollups`` backfills them.
+    ``score_buckets`` counts scores in ``SCORE_BUCKET_COUNT`` equal-width
+    bins over 0..1; the last bin includes 1.
+    """
+
+    day = models.DateField()
+    account = models.ForeignKey("accounts.Account", on_delete=models.CASCADE, related_name="+")
+    rubric = models.ForeignKey(AssessmentRubric, on_delete=models.CASCADE, related_name="+")
+
+    score_count = models.PositiveIntegerField(default=0)
+    score_sum = models.DecimalField(max_digits=14, decimal_places=3, default=Decimal("0"))
+    score_buckets = models.JSONField(default=list, blank=True)
+
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def mean_score(self) -> Decimal | None:
+        if not self.score_count:
+            return None
+        return (self.score_sum / self.score_count).quantize(Decimal("0.001"))
+
+
+class AssessmentDailyRollup(AssessmentScoreRollup):
+    """Per-day, per-account, per-rubric aggregate of ``Assessment.overall_score``."""
+
+    assessment_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "rubric", "day"],
+                name="uniq_assessment_rollup_day",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["account", "day"], name="assessment_rollup_acct_day_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Rollup({self.day}) account={self.account_id} rubric={self.rubric_id}"
+
+
+class AssessmentCriterionDailyRollup(AssessmentScoreRollup):
+    """Per-day, per-account, per-criterion aggregate of ``AssessmentCriterionScore.score``."""
+
+    criterion = models.ForeignKey(AssessmentCriterion, on_delete=models.CASCADE, related_name="+")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "criterion", "day"],
+                name="uniq_criterion_rollup_day",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["account", "rubric", "day"],
+                name="criterion_rollup_rubric_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"CriterionRollup({self.day}) account={self.account_id} criterion={self.criterion_id}"
+        )
+
+
 @receiver(pre_delete, sender=AssessmentCriterion)
 def _protect_published_rubric_criterion_delete(sender, instance, **kwargs):
     instance._protect_delete_when_rubric_published()
+
+
+@receiver(post_save, sender=AssessmentRubric)
+@receiver(post_delete, sender=AssessmentRubric)
+def _invalidate_resolved_rubrics(sender, instance, **kwargs):
+    from apps.assessments.services.rubric_resolution import invalidate_rubric_cache
+
+    invalidate_rubric_cache(lab_type=instance.lab_type, assessment_type=instance.assessment_type)
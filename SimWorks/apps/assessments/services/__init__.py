@@ -7,12 +7,13 @@ Importable shortcuts so callers can write::
 without reaching into submodules.
 """
 
-from .rubric_resolution import RubricNotFoundError, resolve_rubric
+from .rubric_resolution import RubricNotFoundError, invalidate_rubric_cache, resolve_rubric
 from .scoring import compute_overall_score, normalize_criterion_value
 
 __all__ = [
     "RubricNotFoundError",
     "compute_overall_score",
+    "invalidate_rubric_cache",
     "normalize_criterion_value",
     "resolve_rubric",
 ]
@@ -0,0 +1,251 @@
+"""Daily assessment rollups for account and staff dashboards.
+
+Dashboards chart scores per account over time, per rubric and per
+criterion.  Aggregating ``AssessmentCriterionScore`` at request time grows
+with the score table, so the aggregates are materialized per
+``(account, rubric, day)``:
+
+* :class:`AssessmentDailyRollup` holds the count, sum and bucket
+  distribution of ``Assessment.overall_score``.
+* :class:`AssessmentCriterionDailyRollup` holds the same per criterion.
+
+:func:`refresh_rollups` recomputes one ``(account, rubric, day)`` partition
+from its source rows.  Recomputing instead of incrementing keeps the write
+path idempotent.  Concurrent refreshes of one partition are serialized on
+its ``AssessmentDailyRollup`` row.  Persistence schedules a refresh after
+each assessment commits (:func:`schedule_rollup_refresh`), and
+:func:`rebuild_rollups` backfills or repairs whole ranges.  Deleting
+assessments does not refresh rollups; run ``rebuild_assessment_rollups``
+over the affected range.
+
+The query helpers read only rollup rows, so their cost depends on the
+number of days and criteria requested, not on the number of scores.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import partial
+import logging
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.assessments.models import (
+    SCORE_BUCKET_COUNT,
+    Assessment,
+    AssessmentCriterionDailyRollup,
+    AssessmentCriterionScore,
+    AssessmentDailyRollup,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScoreSummary:
+    """Aggregated scores for one chart point (a day or a criterion)."""
+
+    key: date | str
+    score_count: int
+    mean_score: Decimal | None
+    buckets: tuple[int, ...]
+    assessment_count: int | None = None
+
+
+def _day_bounds(day: date) -> tuple[datetime, datetime]:
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(day, time.min), tz)
+    return start, start + timedelta(days=1)
+
+
+def _bucket_counts(field: str) -> dict[str, Count]:
+    width = Decimal(1) / SCORE_BUCKET_COUNT
+    counts = {}
+    for index in range(SCORE_BUCKET_COUNT):
+        condition = Q(**{f"{field}__gte": width * index})
+        if index < SCORE_BUCKET_COUNT - 1:
+            condition &= Q(**{f"{field}__lt": width * (index + 1)})
+        counts[f"bucket_{index}"] = Count("pk", filter=condition)
+    return counts
+
+
+def _buckets(row: dict) -> list[int]:
+    return [row[f"bucket_{index}"] for index in range(SCORE_BUCKET_COUNT)]
+
+
+def refresh_rollups(*, account_id, rubric_id, day: date) -> None:
+    """Recompute the rollups of one ``(account, rubric, day)`` partition."""
+    start, end = _day_bounds(day)
+    assessments = Assessment.objects.filter(
+        account_id=account_id, rubric_id=rubric_id, created_at__gte=start, created_at__lt=end
+    )
+    criterion_rollups = AssessmentCriterionDailyRollup.objects.filter(
+        account_id=account_id, rubric_id=rubric_id, day=day
+    )
+
+    with transaction.atomic():
+        rollup, _ = AssessmentDailyRollup.objects.get_or_create(
+            account_id=account_id, rubric_id=rubric_id, day=day
+        )
+        rollup = AssessmentDailyRollup.objects.select_for_update().get(pk=rollup.pk)
+
+        totals = assessments.aggregate(
+            assessment_count=Count("pk"),
+            score_count=Count("overall_score"),
+            score_sum=Sum("overall_score"),
+            **_bucket_counts("overall_score"),
+        )
+        if not totals["assessment_count"]:
+            criterion_rollups.delete()
+            rollup.delete()
+            return
+        rollup.assessment_count = totals["assessment_count"]
+        rollup.score_count = totals["score_count"]
+        rollup.score_sum = totals["score_sum"] or Decimal("0")
+        rollup.score_buckets = _buckets(totals)
+        rollup.save()
+
+        per_criterion = (
+            AssessmentCriterionScore.objects.filter(assessment__in=assessments)
+            .values("criterion_id")
+            .annotate(
+                score_count=Count("score"),
+                score_sum=Sum("score"),
+                **_bucket_counts("score"),
+            )
+            .order_by("criterion_id")
+        )
+        rows = [
+            AssessmentCriterionDailyRollup(
+                account_id=account_id,
+                rubric_id=rubric_id,
+                criterion_id=row["criterion_id"],
+                day=day,
+                score_count=row["score_count"],
+                score_sum=row["score_sum"] or Decimal("0"),
+                score_buckets=_buckets(row),
+            )
+            for row in per_criterion
+        ]
+        criterion_rollups.exclude(criterion_id__in=[row.criterion_id for row in rows]).delete()
+        AssessmentCriterionDailyRollup.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["account", "criterion", "day"],
+            update_fields=["rubric", "score_count", "score_sum", "score_buckets", "refreshed_at"],
+        )
+
+
+def schedule_rollup_refresh(assessment: Assessment) -> None:
+    """Refresh *assessment*'s partition once the current transaction commits."""
+    transaction.on_commit(
+        partial(
+            refresh_rollups,
+            account_id=assessment.account_id,
+            rubric_id=assessment.rubric_id,
+            day=timezone.localdate(assessment.created_at),
+        ),
+        robust=True,
+    )
+
+
+def rebuild_rollups(
+    *, since: date | None = None, until: date | None = None, account_id=None
+) -> int:
+    """Recompute every partition in ``[since, until]`` and return how many.
+
+    Partitions that only exist as rollup rows (their assessments were
+    deleted) are included, so stale rows are removed.
+    """
+    assessments = Assessment.objects.all()
+    rollups = AssessmentDailyRollup.objects.all()
+    if since is not None:
+        assessments = assessments.filter(created_at__gte=_day_bounds(since)[0])
+        rollups = rollups.filter(day__gte=since)
+    if until is not None:
+        assessments = assessments.filter(created_at__lt=_day_bounds(until)[1])
+        rollups = rollups.filter(day__lte=until)
+    if account_id is not None:
+        assessments = assessments.filter(account_id=account_id)
+        rollups = rollups.filter(account_id=account_id)
+
+    partitions = set(
+        assessments.annotate(day=TruncDate("created_at"))
+        .values_list("account_id", "rubric_id", "day")
+        .distinct()
+        .order_by()
+    )
+    partitions.update(rollups.values_list("account_id", "rubric_id", "day"))
+    for account, rubric, day in sorted(
+        partitions, key=lambda key: (key[2], str(key[0]), str(key[1]))
+    ):
+        refresh_rollups(account_id=account, rubric_id=rubric, day=day)
+    logger.info("[assessments] rebuilt %d rollup partitions", len(partitions))
+    return len(partitions)
+
+
+def _summaries(
+    rows: Iterable, key: Callable[[Any], date | str], *, with_assessments: bool
+) -> list[ScoreSummary]:
+    merged: dict = {}
+    for row in rows:
+        entry = merged.setdefault(
+            key(row),
+            {
+                "assessments": 0,
+                "count": 0,
+                "sum": Decimal("0"),
+                "buckets": [0] * SCORE_BUCKET_COUNT,
+            },
+        )
+        entry["assessments"] += getattr(row, "assessment_count", 0)
+        entry["count"] += row.score_count
+        entry["sum"] += row.score_sum
+        for index, value in enumerate(row.score_buckets[:SCORE_BUCKET_COUNT]):
+            entry["buckets"][index] += value
+    return [
+        ScoreSummary(
+            key=key,
+            score_count=entry["count"],
+            mean_score=(
+                (entry["sum"] / entry["count"]).quantize(Decimal("0.001"))
+                if entry["count"]
+                else None
+            ),
+            buckets=tuple(entry["buckets"]),
+            assessment_count=entry["assessments"] if with_assessments else None,
+        )
+        for key, entry in merged.items()
+    ]
+
+
+def daily_scores(account, *, since: date, until: date, rubric=None) -> list[ScoreSummary]:
+    """Overall-score summaries for each day in ``[since, until]`` with data.
+
+    Without *rubric*, all of the account's rubrics are combined per day.
+    """
+    rollups = AssessmentDailyRollup.objects.filter(
+        account=account, day__gte=since, day__lte=until
+    ).order_by("day")
+    if rubric is not None:
+        rollups = rollups.filter(rubric=rubric)
+    return _summaries(rollups, lambda rollup: rollup.day, with_assessments=True)
+
+
+def criterion_scores(account, *, rubric, since: date, until: date) -> list[ScoreSummary]:
+    """Per-criterion summaries of *rubric* over ``[since, until]``, keyed by slug."""
+    rollups = (
+        AssessmentCriterionDailyRollup.objects.filter(
+            account=account, rubric=rubric, day__gte=since, day__lte=until
+        )
+        .select_related("criterion")
+        .order_by("criterion__sort_order", "day")
+    )
+    return _summaries(rollups, lambda rollup: rollup.criterion.slug, with_assessments=False)
@@ -29,6 +29,38 @@ _INITIAL_VALUE_BY_SLUG = {
 }
 
 
+def _validate_unsaved(instance) -> None:
+    """Run model validation for a row about to be ``bulk_create``-d.
+
+    ``bulk_create`` skips ``save()`` and therefore ``full_clean()``.  Foreign
+    key existence, uniqueness and constraint checks are left to the database:
+    Django runs one query per check, and every referenced row is already in
+    hand.
+    """
+    instance.full_clean(
+        exclude=[field.name for field in instance._meta.concrete_fields if field.is_relation],
+        validate_unique=False,
+        validate_constraints=False,
+    )
+
+
+def _save_assessment(assessment, *, scores, sources) -> None:
+    """Insert *assessment* and its rows with one statement per table.
+
+    Must run inside a transaction; the dashboard rollups for the
+    assessment's day are refreshed after it commits.
+    """
+    from apps.assessments.models import AssessmentCriterionScore, AssessmentSource
+    from apps.assessments.services.analytics import schedule_rollup_refresh
+
+    for row in (*scores, *sources):
+        _validate_unsaved(row)
+    assessment.save()
+    AssessmentCriterionScore.objects.bulk_create(scores)
+    AssessmentSource.objects.bulk_create(sources)
+    schedule_rollup_refresh(assessment)
+
+
 # ---------------------------------------------------------------------------
 # Initial feedback
 # ---------------------------------------------------------------------------
@@ -102,59 +134,57 @@ def _write_initial_assessment(*, sim, block, service_call_attempt_id):
         )
         return None
 
-    with transaction.atomic():
-        missing_required = [
-            criterion.slug
-            for criterion in rubric.criteria.all()
-            if criterion.required and criterion.slug not in _INITIAL_VALUE_BY_SLUG
-        ]
-        if missing_required:
-            raise ValidationError(
-                "Initial feedback rubric has required criteria with no persistence mapping: "
-                f"{', '.join(sorted(missing_required))}."
-            )
-
-        assessment = Assessment.objects.create(
-            rubric=rubric,
-            account=sim.account,
-            assessed_user=sim.user,
-            assessment_type="initial_feedback",
-            lab_type="chatlab",
-            overall_summary=block.overall_feedback,
-            generated_by_service="GenerateInitialFeedback",
-            source_attempt_id=service_call_attempt_id,
+    criteria = list(rubric.criteria.all())
+    missing_required = [
+        criterion.slug
+        for criterion in criteria
+        if criterion.required and criterion.slug not in _INITIAL_VALUE_BY_SLUG
+    ]
+    if missing_required:
+        raise ValidationError(
+            "Initial feedback rubric has required criteria with no persistence mapping: "
+            f"{', '.join(sorted(missing_required))}."
         )
 
-        for criterion in rubric.criteria.all().order_by("sort_order"):
-            mapping = _INITIAL_VALUE_BY_SLUG.get(criterion.slug)
-            if mapping is None:
-                logger.info(
-                    "[assessments] optional criterion slug %r not in initial value map",
-                    criterion.slug,
-                )
-                continue
-            attr, value_field = mapping
-            raw_value = getattr(block, attr)
-
-            kwargs = {value_field: raw_value}
-            kwargs["score"] = normalize_criterion_value(criterion, **kwargs)
-            AssessmentCriterionScore.objects.create(
-                assessment=assessment,
-                criterion=criterion,
-                **kwargs,
+    assessment = Assessment(
+        rubric=rubric,
+        account=sim.account,
+        assessed_user=sim.user,
+        assessment_type="initial_feedback",
+        lab_type="chatlab",
+        overall_summary=block.overall_feedback,
+        generated_by_service="GenerateInitialFeedback",
+        source_attempt_id=service_call_attempt_id,
+    )
+    scores = []
+    for criterion in criteria:
+        mapping = _INITIAL_VALUE_BY_SLUG.get(criterion.slug)
+        if mapping is None:
+            logger.info(
+                "[assessments] optional criterion slug %r not in initial value map",
+                criterion.slug,
             )
-
-        # Refresh + compute overall.
-        scored = list(assessment.criterion_scores.select_related("criterion").all())
-        assessment.overall_score = compute_overall_score(scored)
-        assessment.save(update_fields=["overall_score"])
-
-        AssessmentSource.objects.create(
+            continue
+        attr, value_field = mapping
+        raw_value = getattr(block, attr)
+
+        kwargs = {value_field: raw_value}
+        kwargs["score"] = normalize_criterion_value(criterion, **kwargs)
+        scores.append(
+            AssessmentCriterionScore(assessment=assessment, criterion=criterion, **kwargs)
+        )
+    assessment.overall_score = compute_overall_score(scores)
+    sources = [
+        AssessmentSource(
             assessment=assessment,
             source_type=AssessmentSource.SourceType.SIMULATION,
             role=AssessmentSource.Role.PRIMARY,
             simulation=sim,
         )
+    ]
+
+    with transaction.atomic():
+        _save_assessment(assessment, scores=scores, sources=sources)
 
         # Update SimulationSummary with typed values.
         SimulationSummary.objects.update_or_create(
@@ -228,6 +258,7 @@ async def persist_continuation_feedback_block(block, ctx) -> list:
 def _write_continuation_assessment(*, sim, block, service_call_attempt_id):
     from apps.assessments.models import (
         Assessment,
+        AssessmentCriterion,
         AssessmentCriterionScore,
         AssessmentSource,
     )
@@ -246,6 +277,15 @@ def _write_continuation_assessment(*, sim, block, service_call_attempt_id):
         )
         return None
 
+    direct_answer_criterion = next(
+        (criterion for criterion in rubric.criteria.all() if criterion.slug == "direct_answer"),
+        None,
+    )
+    if direct_answer_criterion is None:
+        raise AssessmentCriterion.DoesNotExist(
+            f"Rubric {rubric.slug!r} has no 'direct_answer' criterion."
+        )
+
     with transaction.atomic():
         parent = (
             Assessment.objects.filter(
@@ -258,7 +298,7 @@ def _write_continuation_assessment(*, sim, block, service_call_attempt_id):
             .first()
         )
 
-        assessment = Assessment.objects.create(
+        assessment = Assessment(
             rubric=rubric,
             account=sim.account,
             assessed_user=sim.user,
@@ -268,28 +308,32 @@ def _write_continuation_assessment(*, sim, block, service_call_attempt_id):
             generated_by_service="GenerateFeedbackContinuationReply",
             source_attempt_id=service_call_attempt_id,
         )
-
         # Single text criterion for the continuation rubric.
-        direct_answer_criterion = rubric.criteria.get(slug="direct_answer")
-        AssessmentCriterionScore.objects.create(
-            assessment=assessment,
-            criterion=direct_answer_criterion,
-            value_text=block.direct_answer,
-            score=None,
-        )
-
-        AssessmentSource.objects.create(
-            assessment=assessment,
-            source_type=AssessmentSource.SourceType.SIMULATION,
-            role=AssessmentSource.Role.PRIMARY,
-            simulation=sim,
-        )
-        if parent is not None:
-            AssessmentSource.objects.create(
+        scores = [
+            AssessmentCriterionScore(
+                assessment=assessment,
+                criterion=direct_answer_criterion,
+                value_text=block.direct_answer,
+                score=None,
+            )
+        ]
+        sources = [
+            AssessmentSource(
                 assessment=assessment,
-                source_type=AssessmentSource.SourceType.ASSESSMENT,
-                role=AssessmentSource.Role.GENERATED_FROM,
-                source_assessment=parent,
+                source_type=AssessmentSource.SourceType.SIMULATION,
+                role=AssessmentSource.Role.PRIMARY,
+                simulation=sim,
+            )
+        ]
+        if parent is not None:
+            sources.append(
+                AssessmentSource(
+                    assessment=assessment,
+                    source_type=AssessmentSource.SourceType.ASSESSMENT,
+                    role=AssessmentSource.Role.GENERATED_FROM,
+                    source_assessment=parent,
+                )
             )
+        _save_assessment(assessment, scores=scores, sources=sources)
 
     return assessment
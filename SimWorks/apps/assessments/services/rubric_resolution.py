@@ -8,19 +8,71 @@ Resolution rules (per implementation plan):
    ``(lab_type, assessment_type)``.
 
 The function raises :class:`RubricNotFoundError` if neither exists.
+
+Resolved rubrics are cached per ``(account, lab_type, assessment_type)``
+together with their ordered criteria (as a ``criteria`` prefetch), so
+``rubric.criteria.all()`` on a resolved rubric costs no query.  Published
+rubrics and their criteria are immutable, so the cache only goes stale when
+a rubric is saved (published, archived) or deleted; those writes replace the
+generation token of their ``(lab_type, assessment_type)`` pair, which orphans
+every cached resolution for that pair across all accounts.  Misses are not
+cached.
+
+``ASSESSMENT_RUBRIC_CACHE_TTL`` (seconds, default 600, ``0`` disables)
+bounds how long an orphaned entry lingers.
 """
 
 from __future__ import annotations
 
-from django.db.models import Case, IntegerField, Q, When
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, IntegerField, Prefetch, Q, When
 
-from apps.assessments.models import AssessmentRubric
+from apps.assessments.models import AssessmentCriterion, AssessmentRubric
+
+KEY_PREFIX = "assessments:rubric:"
+DEFAULT_TTL = 600
 
 
 class RubricNotFoundError(LookupError):
     """Raised when no published rubric matches the resolution request."""
 
 
+def _ttl() -> int:
+    return int(getattr(settings, "ASSESSMENT_RUBRIC_CACHE_TTL", DEFAULT_TTL))
+
+
+def _generation_key(lab_type: str, assessment_type: str) -> str:
+    return f"{KEY_PREFIX}generation:{lab_type}:{assessment_type}"
+
+
+def _resolution_key(*, account, lab_type: str, assessment_type: str) -> str | None:
+    generation = cache.get_or_set(
+        _generation_key(lab_type, assessment_type), lambda: uuid.uuid4().hex, timeout=None
+    )
+    if generation is None:
+        return None
+    account_key = account.pk if account is not None else "global"
+    return f"{KEY_PREFIX}{lab_type}:{assessment_type}:{generation}:{account_key}"
+
+
+def invalidate_rubric_cache(*, lab_type: str, assessment_type: str) -> None:
+    """Drop every cached resolution for ``(lab_type, assessment_type)``.
+
+    Runs immediately and again after the surrounding transaction commits, so
+    a resolution cached from pre-commit data in the meantime is dropped too.
+    """
+
+    def rotate() -> None:
+        cache.set(_generation_key(lab_type, assessment_type), uuid.uuid4().hex, timeout=None)
+
+    rotate()
+    transaction.on_commit(rotate)
+
+
 def resolve_rubric(*, account, lab_type: str, assessment_type: str) -> AssessmentRubric:
     """Resolve the rubric to use for the given request.
 
@@ -30,11 +82,20 @@ def resolve_rubric(*, account, lab_type: str, assessment_type: str) -> Assessmen
         assessment_type: e.g. ``"initial_feedback"``.
 
     Returns:
-        The matching :class:`AssessmentRubric`.
+        The matching :class:`AssessmentRubric`, with its criteria prefetched
+        in ``sort_order``.
 
     Raises:
         RubricNotFoundError: When no candidate exists.
     """
+    ttl = _ttl()
+    key = None
+    if ttl > 0:
+        key = _resolution_key(account=account, lab_type=lab_type, assessment_type=assessment_type)
+        rubric = cache.get(key) if key is not None else None
+        if rubric is not None:
+            return rubric
+
     queryset = (
         AssessmentRubric.objects.filter(
             status=AssessmentRubric.Status.PUBLISHED,
@@ -53,6 +114,9 @@ def resolve_rubric(*, account, lab_type: str, assessment_type: str) -> Assessmen
             )
         )
         .order_by("scope_priority", "-version", "-published_at")
+        .prefetch_related(
+            Prefetch("criteria", queryset=AssessmentCriterion.objects.order_by("sort_order"))
+        )
     )
 
     rubric = queryset.first()
@@ -61,4 +125,6 @@ def resolve_rubric(*, account, lab_type: str, assessment_type: str) -> Assessmen
             f"No published rubric for lab_type={lab_type!r} "
             f"assessment_type={assessment_type!r} account={account!r}."
         )
+    if key is not None:
+        cache.set(key, rubric, timeout=ttl)
     return rubric
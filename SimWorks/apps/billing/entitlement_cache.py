@@ -0,0 +1,111 @@
+"""Versioned cache of per-(user, account) entitlement indexes.
+
+Access checks (lab gating, guard policy, ``/accounts/me/access/``) would
+otherwise re-query entitlements, seat allocations, seat assignments and the
+personal account for every product they test.  An index is built once and
+cached under the account's and the user's version tokens; bumping either token
+(:func:`invalidate_account_entitlements`, :func:`invalidate_user_entitlements`)
+drops every index that depends on it.  Signal receivers in
+``apps.billing.signals`` bump them when entitlements, subscriptions, seats,
+memberships or accounts change; queryset ``update()`` callers bump them
+explicitly.
+
+``ENTITLEMENT_CACHE_TTL`` (seconds, default 60, ``0`` disables) bounds
+staleness when the cache is not shared between processes;
+``ENTITLEMENT_CACHE_ALIAS`` selects the Django cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+
+KEY_PREFIX = "entitlements:"
+DEFAULT_TTL = 60
+
+_MISSING = object()
+
+
+def _cache():
+    return caches[getattr(settings, "ENTITLEMENT_CACHE_ALIAS", "default")]
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "ENTITLEMENT_CACHE_TTL", DEFAULT_TTL))
+
+
+def _version_key(scope: str, pk: Any) -> str:
+    return f"{KEY_PREFIX}version:{scope}:{pk}"
+
+
+def _versions(*keys: str) -> list[str]:
+    cache = _cache()
+    found = cache.get_many(keys)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        # Never fall back to a fixed default: an evicted version key must not
+        # resurrect indexes cached under an older token.
+        for key in missing:
+            cache.add(key, uuid4().hex, timeout=None)
+        found.update(cache.get_many(missing))
+    return [found[key] for key in keys]
+
+
+def _bump(scope: str, pk: Any) -> None:
+    if pk is None or _ttl() <= 0:
+        return
+    _cache().set(_version_key(scope, pk), uuid4().hex, timeout=None)
+
+
+def invalidate_account_entitlements(account_id: Any) -> None:
+    """Drop every cached index built for *account_id*."""
+    _bump("account", account_id)
+
+
+def invalidate_user_entitlements(user_id: Any) -> None:
+    """Drop every cached index built for *user_id*, in any account."""
+    _bump("user", user_id)
+
+
+def get_cached_index(user, account, build: Callable[[], Any]) -> Any:
+    """Return ``build()`` for *user* in *account*, cached per version pair.
+
+    The index is also memoised on the user instance, so repeated checks within
+    one request skip deserialisation.  An index whose ``is_stale()`` reports
+    that an entitlement or seat window has since opened or closed is rebuilt.
+    """
+    ttl = _ttl()
+    if ttl <= 0:
+        return build()
+
+    user_id = getattr(user, "pk", None)
+    account_version, user_version = _versions(
+        _version_key("account", account.pk),
+        _version_key("user", user_id),
+    )
+    key = f"{KEY_PREFIX}{account.pk}:{account_version}:{user_id}:{user_version}"
+
+    memo = user.__dict__.setdefault("_entitlement_indexes", {})
+    memo_key, index = memo.get(account.pk, (None, _MISSING))
+    if memo_key != key:
+        index = _cache().get(key, _MISSING)
+    if index is _MISSING or index.is_stale():
+        index = build()
+        _cache().set(key, index, timeout=ttl)
+    memo[account.pk] = (key, index)
+    return index
+
+
+def invalidate_entitlement_rows(queryset) -> None:
+    """Invalidate indexes covering *queryset*; call after a bulk ``update()``."""
+    if _ttl() <= 0:
+        return
+    for account_id, subject_user_id in queryset.values_list(
+        "account_id", "subject_user_id"
+    ).distinct():
+        invalidate_account_entitlements(account_id)
+        invalidate_user_entitlements(subject_user_id)
@@ -16,6 +16,7 @@ from apps.billing.catalog import (
     product_code_from_stripe_plan_code,
     resolve_stripe_price_id,
 )
+from apps.billing.entitlement_cache import invalidate_entitlement_rows
 from apps.billing.models import (
     BillingAccount,
     Entitlement,
@@ -346,10 +347,12 @@ def _sync_subscription_from_payload(*, account, subscription: Any):
 
 def _revoke_subscription_entitlements(subscription: Subscription):
     now = timezone.now()
-    Entitlement.objects.filter(
+    rows = Entitlement.objects.filter(
         source_type=Entitlement.SourceType.SUBSCRIPTION,
         source_ref=f"subscription:{subscription.pk}",
-    ).update(status=Entitlement.Status.EXPIRED, ends_at=now)
+    )
+    if rows.update(status=Entitlement.Status.EXPIRED, ends_at=now):
+        invalidate_entitlement_rows(rows)
 
 
 def _expire_and_reconcile_subscription(subscription: Subscription):
@@ -1,6 +1,8 @@
 from .entitlements import (
+    EntitlementIndex,
     get_access_snapshot,
     get_effective_entitlements,
+    get_entitlement_index,
     get_limit,
     grant_demo_product_access,
     has_feature_access,
@@ -16,9 +18,11 @@ from .subscriptions import (
 )
 
 __all__ = [
+    "EntitlementIndex",
     "get_access_snapshot",
     "get_active_personal_subscription",
     "get_effective_entitlements",
+    "get_entitlement_index",
     "get_limit",
     "grant_demo_product_access",
     "has_active_personal_subscription",
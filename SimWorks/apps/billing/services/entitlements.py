@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import datetime
+
 from django.db import models, transaction
 from django.utils import timezone
 
@@ -10,6 +13,7 @@ from apps.billing.catalog import (
     get_product,
     is_valid_product_code,
 )
+from apps.billing.entitlement_cache import get_cached_index
 from apps.billing.models import Entitlement, SeatAllocation, SeatAssignment
 
 ACTIVE_STATUSES = {Entitlement.Status.ACTIVE, Entitlement.Status.SCHEDULED}
@@ -24,40 +28,6 @@ def _is_current(entitlement: Entitlement, at=None) -> bool:
     return not (entitlement.ends_at and entitlement.ends_at < at)
 
 
-def _current_entitlements_for_account(account, *, user=None):
-    queryset = Entitlement.objects.filter(account=account).select_related("subject_user")
-    if user is None:
-        return [ent for ent in queryset if _is_current(ent)]
-
-    rows = []
-    for entitlement in queryset:
-        if not _is_current(entitlement):
-            continue
-        if entitlement.scope_type == Entitlement.ScopeType.ACCOUNT:
-            rows.append(entitlement)
-            continue
-        if entitlement.subject_user_id == user.id:
-            rows.append(entitlement)
-    return rows
-
-
-def _portable_personal_entitlements(user, *, account):
-    if not getattr(user, "is_authenticated", False):
-        return []
-    personal_account = get_personal_account_for_user(user)
-    if personal_account.id == account.id:
-        return []
-    rows = []
-    for entitlement in _current_entitlements_for_account(personal_account, user=user):
-        if (
-            entitlement.scope_type == Entitlement.ScopeType.USER
-            and entitlement.subject_user_id == user.id
-            and entitlement.portable_across_accounts
-        ):
-            rows.append(entitlement)
-    return rows
-
-
 def _canonical_product_code(value: str | None) -> str:
     canonical_value = canonicalize_product_code(value)
     if is_valid_product_code(canonical_value):
@@ -73,49 +43,7 @@ def _is_valid_base_product_entitlement(entitlement: Entitlement) -> bool:
     )
 
 
-def _personal_account_auto_seat_applies(account, user) -> bool:
-    if not getattr(user, "is_authenticated", False):
-        return False
-    if not getattr(account, "is_personal", False):
-        return False
-    if account.owner_user_id != user.id:
-        return False
-    return get_account_membership(user, account) is not None
-
-
-def _has_active_seat(account, user, product_code: str, *, at=None) -> bool:
-    if not getattr(user, "is_authenticated", False):
-        return False
-    canonical_product_code = _canonical_product_code(product_code)
-    if not canonical_product_code:
-        return False
-    if not get_product(canonical_product_code).seat_gated:
-        return True
-    if _personal_account_auto_seat_applies(account, user):
-        return True
-    at = at or timezone.now()
-    if (
-        not SeatAllocation.objects.filter(
-            account=account,
-            product_code=canonical_product_code,
-            effective_from__lte=at,
-        )
-        .filter(models.Q(effective_to__isnull=True) | models.Q(effective_to__gte=at))
-        .exists()
-    ):
-        return True
-    return SeatAssignment.objects.filter(
-        account=account,
-        user=user,
-        product_code=canonical_product_code,
-        assigned_at__lte=at,
-        ended_at__isnull=True,
-    ).exists()
-
-
-def get_effective_entitlements(user, account):
-    entitlements = list(_current_entitlements_for_account(account, user=user))
-    entitlements.extend(_portable_personal_entitlements(user, account=account))
+def _dedupe_entitlements(entitlements) -> list[Entitlement]:
     unique = {}
     for entitlement in entitlements:
         canonical_product_code = _canonical_product_code(entitlement.product_code) or (
@@ -137,23 +65,136 @@ def get_effective_entitlements(user, account):
     return list(unique.values())
 
 
-def has_product_access(user, account, product_code: str) -> bool:
-    canonical_product_code = _canonical_product_code(product_code)
-    if not canonical_product_code:
-        return False
-    for entitlement in get_effective_entitlements(user, account):
+def _next_boundary(values, at) -> datetime | None:
+    future = [value for value in values if value and value > at]
+    return min(future) if future else None
+
+
+@dataclass(frozen=True)
+class EntitlementIndex:
+    """Everything access checks need for one user in one account.
+
+    Built by :func:`build_entitlement_index` from one entitlement query plus
+    at most one seat-allocation and one seat-assignment query; every lookup
+    after that is in memory.  ``valid_until`` is the earliest future start/end
+    among the rows it was built from, after which the index must be rebuilt.
+    """
+
+    account_id: int
+    entitlements: tuple[Entitlement, ...]
+    product_codes: tuple[str, ...]
+    membership_role: str
+    built_at: datetime
+    valid_until: datetime | None = None
+
+    def has_product(self, product_code: str) -> bool:
+        return _canonical_product_code(product_code) in self.product_codes
+
+    def is_stale(self, at=None) -> bool:
+        return self.valid_until is not None and (at or timezone.now()) >= self.valid_until
+
+
+def build_entitlement_index(user, account, *, at=None) -> EntitlementIndex:
+    at = at or timezone.now()
+    is_authenticated = getattr(user, "is_authenticated", False)
+    personal_account = get_personal_account_for_user(user) if is_authenticated else None
+
+    scope = models.Q(account=account) & (
+        models.Q(scope_type=Entitlement.ScopeType.ACCOUNT)
+        | models.Q(subject_user_id=getattr(user, "id", None))
+    )
+    if personal_account is not None and personal_account.id != account.id:
+        scope |= models.Q(
+            account=personal_account,
+            scope_type=Entitlement.ScopeType.USER,
+            subject_user_id=user.id,
+            portable_across_accounts=True,
+        )
+    rows = list(
+        Entitlement.objects.filter(scope, status__in=ACTIVE_STATUSES).select_related("subject_user")
+    )
+    boundaries = [value for row in rows for value in (row.starts_at, row.ends_at)]
+    # Preserve the historical ordering: account rows first, then portable ones.
+    rows.sort(key=lambda row: row.account_id != account.id)
+    entitlements = _dedupe_entitlements(row for row in rows if _is_current(row, at))
+
+    membership = get_account_membership(user, account)
+    auto_seat = (
+        is_authenticated
+        and getattr(account, "is_personal", False)
+        and account.owner_user_id == user.id
+        and membership is not None
+    )
+
+    candidates: dict[str, bool] = {}
+    for entitlement in entitlements:
         if not _is_valid_base_product_entitlement(entitlement):
             continue
-        if _canonical_product_code(entitlement.product_code) != canonical_product_code:
-            continue
-        if (
-            entitlement.account_id == account.id
-            and not entitlement.portable_across_accounts
-            and not _has_active_seat(account, user, canonical_product_code)
+        code = _canonical_product_code(entitlement.product_code)
+        needs_seat = entitlement.account_id == account.id and not (
+            entitlement.portable_across_accounts
+        )
+        candidates[code] = candidates.get(code, True) and needs_seat
+
+    seat_gated = {
+        code
+        for code, needs_seat in candidates.items()
+        if needs_seat and is_authenticated and not auto_seat and get_product(code).seat_gated
+    }
+    allocated: set[str] = set()
+    assigned: set[str] = set()
+    if seat_gated:
+        allocations = SeatAllocation.objects.filter(
+            account=account, product_code__in=seat_gated
+        ).filter(models.Q(effective_to__isnull=True) | models.Q(effective_to__gte=at))
+        for code, effective_from, effective_to in allocations.values_list(
+            "product_code", "effective_from", "effective_to"
         ):
-            continue
-        return True
-    return False
+            boundaries.extend((effective_from, effective_to))
+            if effective_from <= at:
+                allocated.add(code)
+        if allocated:
+            assignments = SeatAssignment.objects.filter(
+                account=account,
+                user=user,
+                product_code__in=allocated,
+                ended_at__isnull=True,
+            )
+            for code, assigned_at in assignments.values_list("product_code", "assigned_at"):
+                boundaries.append(assigned_at)
+                if assigned_at <= at:
+                    assigned.add(code)
+
+    product_codes = tuple(
+        code
+        for code, needs_seat in candidates.items()
+        if not needs_seat
+        or (
+            is_authenticated
+            and (code not in seat_gated or code not in allocated or code in assigned)
+        )
+    )
+    return EntitlementIndex(
+        account_id=account.id,
+        entitlements=tuple(entitlements),
+        product_codes=product_codes,
+        membership_role=membership.role if membership else "",
+        built_at=at,
+        valid_until=_next_boundary(boundaries, at),
+    )
+
+
+def get_entitlement_index(user, account) -> EntitlementIndex:
+    """Return the (cached) :class:`EntitlementIndex` for *user* in *account*."""
+    return get_cached_index(user, account, lambda: build_entitlement_index(user, account))
+
+
+def get_effective_entitlements(user, account):
+    return list(get_entitlement_index(user, account).entitlements)
+
+
+def has_product_access(user, account, product_code: str) -> bool:
+    return get_entitlement_index(user, account).has_product(product_code)
 
 
 def has_feature_access(user, account, product_code: str, feature_code: str) -> bool:
@@ -210,22 +251,13 @@ grant_demo_product_access = grant_manual_product_entitlement
 
 
 def get_access_snapshot(user, account):
-    membership = get_account_membership(user, account)
-    products: dict[str, dict] = {}
-    seen: set[str] = set()
-    for entitlement in get_effective_entitlements(user, account):
-        if not _is_valid_base_product_entitlement(entitlement):
-            continue
-        canonical_product_code = _canonical_product_code(entitlement.product_code)
-        if not canonical_product_code or canonical_product_code in seen:
-            continue
-        seen.add(canonical_product_code)
-        if has_product_access(user, account, canonical_product_code):
-            products[canonical_product_code] = {"enabled": True, "features": {}, "limits": {}}
+    index = get_entitlement_index(user, account)
     return {
         "account_uuid": str(account.uuid),
         "account_name": account.name,
         "account_type": account.account_type,
-        "membership_role": membership.role if membership else "",
-        "products": products,
+        "membership_role": index.membership_role,
+        "products": {
+            code: {"enabled": True, "features": {}, "limits": {}} for code in index.product_codes
+        },
     }
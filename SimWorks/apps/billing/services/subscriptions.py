@@ -11,6 +11,7 @@ from apps.billing.catalog import (
     product_code_from_apple_product_id,
     product_code_from_stripe_plan_code,
 )
+from apps.billing.entitlement_cache import invalidate_entitlement_rows
 from apps.billing.models import (
     BillingAccount,
     Entitlement,
@@ -142,10 +143,9 @@ def reconcile_subscription_entitlements(subscription: Subscription, *, actor_use
         source_type=Entitlement.SourceType.SUBSCRIPTION,
         source_ref=source_ref,
     )
-    source_rows.exclude(pk=entitlement.pk).update(
-        status=Entitlement.Status.REVOKED,
-        ends_at=timezone.now(),
-    )
+    superseded = source_rows.exclude(pk=entitlement.pk)
+    if superseded.update(status=Entitlement.Status.REVOKED, ends_at=timezone.now()):
+        invalidate_entitlement_rows(superseded)
 
     create_account_audit_event(
         account=subscription.account,
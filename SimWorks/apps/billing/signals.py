@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.models import Account, AccountMembership
+from apps.billing.entitlement_cache import (
+    invalidate_account_entitlements,
+    invalidate_user_entitlements,
+)
+from apps.billing.models import Entitlement, SeatAllocation, SeatAssignment, Subscription
+
+
+@receiver(post_save, sender=Entitlement)
+@receiver(post_delete, sender=Entitlement)
+def invalidate_entitlement_indexes(sender, instance: Entitlement, **kwargs):
+    invalidate_account_entitlements(instance.account_id)
+    # Portable user entitlements are visible from every account the user uses.
+    invalidate_user_entitlements(instance.subject_user_id)
+
+
+@receiver(post_save, sender=Subscription)
+@receiver(post_delete, sender=Subscription)
+@receiver(post_save, sender=SeatAllocation)
+@receiver(post_delete, sender=SeatAllocation)
+def invalidate_account_indexes(sender, instance, **kwargs):
+    invalidate_account_entitlements(instance.account_id)
+
+
+@receiver(post_save, sender=SeatAssignment)
+@receiver(post_delete, sender=SeatAssignment)
+@receiver(post_save, sender=AccountMembership)
+@receiver(post_delete, sender=AccountMembership)
+def invalidate_member_indexes(sender, instance, **kwargs):
+    invalidate_account_entitlements(instance.account_id)
+    invalidate_user_entitlements(instance.user_id)
+
+
+@receiver(post_save, sender=Account)
+@receiver(post_delete, sender=Account)
+def invalidate_owner_indexes(sender, instance: Account, **kwargs):
+    invalidate_account_entitlements(instance.pk)
+    invalidate_user_entitlements(instance.owner_user_id)
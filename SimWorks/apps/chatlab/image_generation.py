@@ -7,11 +7,11 @@ from dataclasses import dataclass
 from io import BytesIO
 import os
 
-import httpx
 from openai import OpenAI
 from PIL import Image
 
 from orchestrai.utils.env_utils import get_api_key
+from orchestrai.utils.http_clients import get_http_client
 
 
 class ImageGenerationError(RuntimeError):
@@ -60,7 +60,7 @@ def _extract_openai_image(response) -> tuple[bytes, str | None]:
 
     image_url = first.get("url")
     if image_url:
-        response = httpx.get(image_url, timeout=30.0)
+        response = get_http_client("openai").get(image_url, timeout=30.0)
         response.raise_for_status()
         return response.content, provider_id
 
@@ -80,7 +80,8 @@ def generate_patient_image(
 
     model_name = model or os.getenv("ORCA_IMAGE_MODEL", "gpt-image-1")
     image_size = size or os.getenv("ORCA_IMAGE_SIZE", "1024x1024")
-    client = OpenAI(api_key=api_key)
+    # The SDK client is cheap; the pooled HTTP client keeps connections warm.
+    client = OpenAI(api_key=api_key, http_client=get_http_client("openai", api_key))
 
     # gpt-image-1 and similar newer models do not accept response_format;
     # they always return b64_json.  Only pass the param for legacy models
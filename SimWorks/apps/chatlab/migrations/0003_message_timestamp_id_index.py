@@ -0,0 +1,17 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatlab', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['timestamp', 'id'], name='chatlab_msg_ts_id_idx'),
+        ),
+    ]
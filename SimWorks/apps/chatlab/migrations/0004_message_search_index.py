@@ -0,0 +1,34 @@
+"""GIN expression index backing full-text message search (PostgreSQL only).
+
+The indexed expression must match ``apps.simcore.search.message_search_vector``.
+Built concurrently so existing message tables stay writable.
+"""
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+INDEX = GinIndex(SearchVector("content", config="english"), name="chatlab_msg_search_gin")
+
+
+def add_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.add_index(apps.get_model("chatlab", "Message"), INDEX, concurrently=True)
+
+
+def remove_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.remove_index(apps.get_model("chatlab", "Message"), INDEX, concurrently=True)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("chatlab", "0003_message_timestamp_id_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_index, remove_index),
+    ]
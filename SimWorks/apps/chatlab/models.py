@@ -157,6 +157,8 @@ class Message(PersistModel):
                 fields=["simulation", "timestamp"],
                 name="chatlab_msg_sim_ts_idx",
             ),
+            # Keyset order for batched retention purges.
+            models.Index(fields=["timestamp", "id"], name="chatlab_msg_ts_id_idx"),
         ]
         constraints: ClassVar = [
             models.UniqueConstraint(
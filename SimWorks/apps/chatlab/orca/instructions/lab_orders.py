@@ -13,18 +13,21 @@ from orchestrai_django.decorators import orca
 class LabOrderPatientContextInstruction(BaseInstruction):
     namespace = "chatlab"
     group = "lab_orders"
+    context_requirements = ("simulation",)
 
     async def render_instruction(self) -> str:
         from apps.simcore.models import Simulation
 
+        simulation = self.context.get("simulation")
         simulation_id = self.context.get("simulation_id")
-        if not simulation_id:
+        if simulation is None and not simulation_id:
             return "You are generating lab results for a patient in a clinical simulation."
 
-        try:
-            simulation = await Simulation.objects.aget(pk=simulation_id)
-        except (TypeError, ValueError, ObjectDoesNotExist):
-            return "You are generating lab results for a patient in a clinical simulation."
+        if simulation is None:
+            try:
+                simulation = await Simulation.objects.aget(pk=simulation_id)
+            except (TypeError, ValueError, ObjectDoesNotExist):
+                return "You are generating lab results for a patient in a clinical simulation."
 
         parts = [
             "### Patient Context",
@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 class PatientNameInstruction(BaseInstruction):
     namespace = "chatlab"
     group = "patient"
+    context_requirements = ("simulation",)
 
     async def render_instruction(self) -> str:
         simulation = self.context.get("simulation")
@@ -55,6 +56,7 @@ class PatientModifierInstruction(BaseInstruction):
 
     namespace = "chatlab"
     group = "patient"
+    context_requirements = ("simulation",)
 
     async def render_instruction(self) -> str:
         simulation = self.context.get("simulation")
@@ -105,6 +107,7 @@ class PatientModifierInstruction(BaseInstruction):
 class PatientRecentScenarioHistoryInstruction(BaseInstruction):
     namespace = "chatlab"
     group = "patient"
+    context_requirements = ("user",)
 
     async def render_instruction(self) -> str:
         context = self.context
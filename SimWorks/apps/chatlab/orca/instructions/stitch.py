@@ -11,17 +11,26 @@ from orchestrai.instructions import BaseInstruction
 from orchestrai_django.decorators import orca
 
 
+async def _aget_simulation(context: dict) -> Simulation | None:
+    """Return the prefetched simulation, falling back to a lookup by id."""
+    simulation = context.get("simulation")
+    if simulation is not None:
+        return simulation
+    try:
+        return await Simulation.objects.aget(pk=context.get("simulation_id"))
+    except (TypeError, ValueError, ObjectDoesNotExist):
+        return None
+
+
 @orca.instruction(order=0)
 class StitchPersonaInstruction(BaseInstruction):
     namespace = "chatlab"
     group = "stitch"
+    context_requirements = ("simulation",)
 
     async def render_instruction(self) -> str:
-        simulation_id = self.context.get("simulation_id")
-
-        try:
-            sim = await Simulation.objects.aget(pk=simulation_id)
-        except (TypeError, ValueError, ObjectDoesNotExist):
+        sim = await _aget_simulation(self.context)
+        if sim is None:
             return (
                 "You are Stitch, a friendly AI medical education facilitator. "
                 "Help the student reflect on their simulation performance."
@@ -39,13 +48,11 @@ class StitchPersonaInstruction(BaseInstruction):
 class StitchConversationContextInstruction(BaseInstruction):
     namespace = "chatlab"
     group = "stitch"
+    context_requirements = ("simulation",)
 
     async def render_instruction(self) -> str:
-        simulation_id = self.context.get("simulation_id")
-
-        try:
-            sim = await Simulation.objects.aget(pk=simulation_id)
-        except (TypeError, ValueError, ObjectDoesNotExist):
+        sim = await _aget_simulation(self.context)
+        if sim is None:
             return ""
 
         history = await sync_to_async(sim.history)()
@@ -1,8 +1,10 @@
 # chatlab/orca/mixins/__init__.py
 from .ident_namespace import *
 from .stitch import *
+from .streaming import *
 
 __all__ = [
     "ChatlabMixin",
+    "PatientStreamingMixin",
     "StitchMixin",
 ]
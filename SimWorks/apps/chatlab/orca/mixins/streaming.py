@@ -0,0 +1,102 @@
+# chatlab/orca/mixins/streaming.py
+"""Streaming mixin that publishes partial patient replies to ChatLab clients."""
+
+import logging
+from typing import Any, ClassVar
+
+from channels.layers import get_channel_layer
+from pydantic_core import from_json
+
+from apps.chatlab.realtime import (
+    MESSAGE_STREAM_COMPLETED,
+    MESSAGE_STREAM_DELTA,
+    build_realtime_envelope,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["PatientStreamingMixin", "extract_message_text"]
+
+_TEXT_CONTENT_TYPES = frozenset({"text", "output_text"})
+
+
+def extract_message_text(raw: str) -> str:
+    """Return the visible message text from a partial ``messages`` JSON payload.
+
+    The patient schemas stream as JSON, so the buffer is parsed leniently
+    (incomplete trailing strings included) and the text blocks of every
+    message are joined in order.
+    """
+    try:
+        data = from_json(raw, allow_partial="trailing-strings")
+    except ValueError:
+        return ""
+    if not isinstance(data, dict):
+        return ""
+
+    parts: list[str] = []
+    for message in data.get("messages") or ():
+        if not isinstance(message, dict):
+            continue
+        for block in message.get("content") or ():
+            if not isinstance(block, dict) or block.get("type") not in _TEXT_CONTENT_TYPES:
+                continue
+            text = block.get("text")
+            if isinstance(text, str) and text:
+                parts.append(text)
+    return "\n\n".join(parts)
+
+
+class PatientStreamingMixin:
+    """Stream patient message text as transient ``message.stream.*`` events.
+
+    Deltas are sent to the simulation's channel group and forwarded to clients
+    by ``ChatConsumer.chatlab_transient``.  They are previews only: the durable
+    message is still persisted from the validated result and delivered through
+    the outbox as ``message.item.created``.
+    """
+
+    streaming: ClassVar[bool] = True
+
+    def extract_stream_text(self, raw: str) -> str:
+        return extract_message_text(raw)
+
+    async def on_stream_delta(self, context: dict[str, Any], delta: str, text: str) -> None:
+        await super().on_stream_delta(context, delta, text)
+        await self._send_stream_event(context, MESSAGE_STREAM_DELTA, {"delta": delta, "text": text})
+
+    async def on_stream_complete(self, context: dict[str, Any], text: str) -> None:
+        await super().on_stream_complete(context, text)
+        await self._send_stream_event(context, MESSAGE_STREAM_COMPLETED, {"text": text})
+
+    async def _send_stream_event(
+        self, context: dict[str, Any], event_type: str, payload: dict[str, Any]
+    ) -> None:
+        simulation_id = context.get("simulation_id")
+        channel_layer = get_channel_layer()
+        if not simulation_id or channel_layer is None:
+            return
+
+        correlation_id = context.get("correlation_id")
+        envelope = build_realtime_envelope(
+            event_type,
+            {
+                "conversation_id": context.get("conversation_id"),
+                "service_call_id": context.get("service_call_id"),
+                **payload,
+            },
+            correlation_id=str(correlation_id) if correlation_id else None,
+        )
+        try:
+            await channel_layer.group_send(
+                f"simulation_{simulation_id}",
+                {"type": "chatlab.transient", "event": envelope},
+            )
+        except Exception:
+            # Previews are best-effort; never fail the generation over them.
+            logger.warning(
+                "Failed to publish %s for simulation %s",
+                event_type,
+                simulation_id,
+                exc_info=True,
+            )
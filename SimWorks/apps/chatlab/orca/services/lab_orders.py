@@ -27,6 +27,8 @@ class GenerateLabResults(DjangoBaseService):
     ]
     required_context_keys: ClassVar[tuple[str, ...]] = ("simulation_id", "orders")
     use_native_output = True
+    # Same patient context + same orders → reuse results (consistent, no token spend).
+    cache_ttl: ClassVar[int] = 60 * 60
 
     from apps.chatlab.orca.schemas.lab_orders import LabOrderResultsOutputSchema as _Schema
 
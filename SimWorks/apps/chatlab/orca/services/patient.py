@@ -4,6 +4,7 @@
 import logging
 from typing import ClassVar
 
+from apps.chatlab.orca.mixins import PatientStreamingMixin
 from orchestrai_django.components.services import DjangoBaseService, PreviousResponseMixin
 from orchestrai_django.decorators import orca
 
@@ -11,7 +12,7 @@ logger = logging.getLogger(__name__)
 
 
 @orca.service
-class GenerateInitialResponse(DjangoBaseService):
+class GenerateInitialResponse(PatientStreamingMixin, DjangoBaseService):
     """Generate the initial patient response."""
 
     instruction_refs: ClassVar[list[str]] = [
@@ -33,7 +34,7 @@ class GenerateInitialResponse(DjangoBaseService):
 
 
 @orca.service
-class GenerateReplyResponse(PreviousResponseMixin, DjangoBaseService):
+class GenerateReplyResponse(PatientStreamingMixin, PreviousResponseMixin, DjangoBaseService):
     """Generate a reply to a user message."""
 
     instruction_refs: ClassVar[list[str]] = [
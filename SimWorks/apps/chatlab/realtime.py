@@ -19,6 +19,8 @@ SESSION_RESUMED = "session.resumed"
 SESSION_RESYNC_REQUIRED = "session.resync_required"
 ERROR = "error"
 PONG = "pong"
+MESSAGE_STREAM_DELTA = "message.stream.delta"
+MESSAGE_STREAM_COMPLETED = "message.stream.completed"
 
 ALLOWED_INBOUND_EVENT_TYPES = frozenset(
     {
@@ -38,6 +40,8 @@ TRANSIENT_EVENT_TYPES = frozenset(
         PONG,
         TYPING_STARTED,
         TYPING_STOPPED,
+        MESSAGE_STREAM_DELTA,
+        MESSAGE_STREAM_COMPLETED,
     }
 )
 DURABLE_EVENT_TYPES = frozenset(outbox_events.canonical_event_types())
@@ -13,7 +13,8 @@ Messages are now broadcast via the outbox pattern for:
 
 import logging
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from apps.common.outbox import event_types as outbox_events
@@ -22,7 +23,7 @@ from apps.simcore.models import Simulation, SimulationMetadata
 from orchestrai_django.signals import ai_response_failed
 
 from .models import Message
-from .utils import broadcast_patient_results
+from .utils import broadcast_patient_results, broadcast_tool_checksums
 
 logger = logging.getLogger(__name__)
 
@@ -301,3 +302,53 @@ def broadcast_metadata_update(sender, instance, created, **kwargs):
                 f"WebSocket broadcast failed for SimulationMetadata {instance.id}: {exc}"
             )
             # Don't raise - this is a non-critical side effect
+
+
+def _push_tool_checksums(simulation_id: int) -> None:
+    try:
+        broadcast_tool_checksums(simulation_id)
+    except Exception as exc:
+        logger.warning(f"Tool checksum push failed for simulation {simulation_id}: {exc}")
+
+
+class _ToolChecksumFlush:
+    """The single on_commit callback that pushes checksums for a transaction."""
+
+    def __init__(self):
+        self.simulation_ids: set[int] = set()
+
+    def __call__(self):
+        for simulation_id in sorted(self.simulation_ids):
+            _push_tool_checksums(simulation_id)
+
+
+def _schedule_tool_checksum_push(simulation_id: int) -> None:
+    """Push *simulation_id*'s checksums once when the current transaction commits.
+
+    The pending set lives on the flush callback itself, so a rolled-back
+    transaction discards it together with the callback.
+    """
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        for _savepoint_ids, callback, _robust in connection.run_on_commit:
+            if isinstance(callback, _ToolChecksumFlush):
+                callback.simulation_ids.add(simulation_id)
+                return
+    flush = _ToolChecksumFlush()
+    flush.simulation_ids.add(simulation_id)
+    transaction.on_commit(flush)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def push_tool_checksums_on_metadata_change(sender, instance, **kwargs):
+    """
+    Push fresh tool checksums after any SimulationMetadata row changes.
+
+    Connected without a sender so that polymorphic subclasses (LabResult,
+    PatientHistory, ...) are covered.  Runs after commit, once per simulation
+    per transaction; a non-critical side effect like ``broadcast_metadata_update``.
+    """
+    if not issubclass(sender, SimulationMetadata):
+        return
+    _schedule_tool_checksum_push(instance.simulation_id)
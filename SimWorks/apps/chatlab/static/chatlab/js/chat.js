@@ -106,6 +106,7 @@ function ChatManager(simulation_id, currentUserId, currentUserEmail) {
         typingTimeout: null,
         lastTypedTime: 0,
         typingUsersByConversation: {},
+        streamingTextByConversation: {},
         hasMoreMessages: true,
         isMessagesLoading: false,
         isOlderLoading: false,
@@ -145,6 +146,11 @@ function ChatManager(simulation_id, currentUserId, currentUserEmail) {
             return users.filter(user => !this._isSelfTypingPayload(user));
         },
 
+        get activeStreamingText() {
+            if (!this.activeConversationId) return '';
+            return this.streamingTextByConversation[this.activeConversationId] || '';
+        },
+
         init() {
             this.messageInput = document.getElementById('chat-message-input');
             this.messageForm = document.getElementById('chat-form');
@@ -365,6 +371,8 @@ function ChatManager(simulation_id, currentUserId, currentUserEmail) {
             this.eventBus.on('session.resumed', (data) => this.handleSessionReady(data));
             this.eventBus.on('session.resync_required', (data) => this.handleSessionResyncRequired(data));
             this.eventBus.on('message.item.created', (data) => this.handleChatMessage(data));
+            this.eventBus.on('message.stream.delta', (data) => this.handleMessageStream(data));
+            this.eventBus.on('message.stream.completed', (data) => this.handleMessageStream(data));
             this.eventBus.on('typing.started', (data) => this.handleTyping(data, true));
             this.eventBus.on('typing.stopped', (data) => this.handleTyping(data, false));
             this.eventBus.on('message.delivery.updated', (data) => this.handleMessageStatusUpdate(data));
@@ -385,11 +393,11 @@ function ChatManager(simulation_id, currentUserId, currentUserEmail) {
             // Declarative tool configuration - tools auto-refresh on events
             this.toolManager.configure({
                 'patient_history': {
-                    refreshOn: ['message.item.created'],
+                    refreshOn: ['simulation.tools.updated'],
                     refreshMode: 'checksum',
                 },
                 'simulation_metadata': {
-                    refreshOn: ['message.item.created'],
+                    refreshOn: ['simulation.tools.updated'],
                     refreshMode: 'checksum',
                 },
                 'simulation_assessment': {
@@ -589,6 +597,20 @@ function ChatManager(simulation_id, currentUserId, currentUserEmail) {
             return false;
         },
 
+        handleMessageStream(data) {
+            // Partial patient text is a preview only; the durable message replaces
+            // it when message.item.created arrives.
+            const conversationId = this._normalizeConversationId(
+                data.conversation_id ?? this.activeConversationId
+            );
+            if (!conversationId || typeof data.text !== 'string') return;
+            this.streamingTextByConversation = {
+                ...this.streamingTextByConversation,
+                [conversationId]: data.text,
+            };
+            this.simulateSystemTyping(true, conversationId);
+        },
+
         handleTyping(data, started) {
             if (this._isSelfTypingPayload(data)) {
                 this.removeTypingUser(data);
@@ -1306,12 +1328,23 @@ function ChatManager(simulation_id, currentUserId, currentUserEmail) {
                 display_name: this.systemDisplayName || 'Someone',
                 conversation_id: normalizedConversationId,
             };
+            if (!started) {
+                this._clearStreamingText(normalizedConversationId);
+            }
             this.updateTypingUsers(dataSim, started);
         },
 
+        _clearStreamingText(conversationId) {
+            if (!(conversationId in this.streamingTextByConversation)) return;
+            const nextText = { ...this.streamingTextByConversation };
+            delete nextText[conversationId];
+            this.streamingTextByConversation = nextText;
+        },
+
         _clearSystemTyping(conversationId) {
             const normalizedConversationId = this._normalizeConversationId(conversationId);
             if (!normalizedConversationId) return;
+            this._clearStreamingText(normalizedConversationId);
             const users = this.typingUsersByConversation[normalizedConversationId] || [];
             const nextUsers = users.filter(u => u.user !== 'System');
             this.typingUsersByConversation = {
@@ -46,9 +46,19 @@ urlpatterns = [
         views.watch_simulation,
         name="watch_simulation",
     ),
+    path(
+        "simulation/<int:simulation_id>/watch/events/",
+        views.watch_events,
+        name="watch_events",
+    ),
     path(
         "simulation/<int:simulation_id>/watch/service-calls/",
         views.watch_service_calls,
         name="watch_service_calls",
     ),
+    path(
+        "simulation/<int:simulation_id>/watch/service-calls/<uuid:service_call_id>/",
+        views.watch_service_call_detail,
+        name="watch_service_call_detail",
+    ),
 ]
@@ -383,6 +383,53 @@ def broadcast_patient_results(
     return
 
 
+def broadcast_tool_checksums(simulation_id: int) -> None:
+    """Recompute metadata-backed tool checksums and push them via the outbox.
+
+    Renders each tool with ``metadata_backed = True`` once, which refreshes
+    the checksum cache read by the checksum endpoint, and enqueues one
+    ``simulation.tools.updated`` event carrying ``{tool_name: checksum}``.
+    Nothing is enqueued when the checksums match the simulation's latest
+    event.  The idempotency key carries the write time, so returning to an
+    earlier state (A -> B -> A) is still pushed.
+    """
+    from time import time_ns
+
+    from apps.common.models import OutboxEvent
+    from apps.common.outbox import enqueue_event_sync, poke_drain_sync
+    from apps.simcore.tools import list_tools
+
+    simulation = Simulation.objects.filter(pk=simulation_id).first()
+    if simulation is None:
+        return
+
+    checksums = {
+        tool_class.tool_name: tool_class(simulation).to_dict()["checksum"]
+        for tool_class in list_tools()
+        if tool_class.metadata_backed
+    }
+    if not checksums:
+        return
+    latest = (
+        OutboxEvent.objects.filter(
+            simulation_id=simulation_id, event_type=outbox_events.SIMULATION_TOOLS_UPDATED
+        )
+        .order_by("-created_at", "-id")
+        .values_list("payload", flat=True)
+        .first()
+    )
+    if latest is not None and latest.get("tools") == checksums:
+        return
+    event = enqueue_event_sync(
+        event_type=outbox_events.SIMULATION_TOOLS_UPDATED,
+        simulation_id=simulation_id,
+        payload={"tools": checksums},
+        idempotency_key=f"{outbox_events.SIMULATION_TOOLS_UPDATED}:{simulation_id}:{time_ns()}",
+    )
+    if event:
+        poke_drain_sync()
+
+
 async def broadcast_message(
     message: Message | int,
     status: str | None = None,
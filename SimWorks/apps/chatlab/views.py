@@ -18,12 +18,15 @@ from apps.chatlab.utils import (
 )
 from apps.common.decorators import resolve_user
 from apps.common.models import OutboxEvent
-from apps.common.outbox.outbox import order_outbox_queryset
 from apps.common.retries import (
     has_user_retries_remaining,
     is_initial_generation_retryable_reason,
 )
-from apps.common.watch import build_watch_page_context, build_watch_service_calls_context
+from apps.common.watch import (
+    build_watch_events_payload,
+    build_watch_page_context,
+    build_watch_service_calls_context,
+)
 from apps.simcore.access import (
     can_access_simulation_in_request,
     get_chatlab_simulation_queryset_for_request,
@@ -302,8 +305,10 @@ def watch_simulation(request, simulation_id):
         simulation_id,
     )
     simulation = get_object_or_404(Simulation, id=simulation_id)
-    outbox_qs = order_outbox_queryset(OutboxEvent.objects.filter(simulation_id=simulation_id))
-    service_calls_qs = ServiceCall.objects.for_simulation(simulation_id).order_by("created_at")
+    outbox_qs = OutboxEvent.objects.filter(simulation_id=simulation_id)
+    service_calls_qs = (
+        ServiceCall.objects.for_simulation(simulation_id).for_listing().order_by("created_at")
+    )
     run_url = reverse("chatlab:run_simulation", args=[simulation_id])
 
     context = build_watch_page_context(
@@ -311,6 +316,7 @@ def watch_simulation(request, simulation_id):
         simulation=simulation,
         outbox_events=outbox_qs,
         service_calls_qs=service_calls_qs,
+        events_url=reverse("chatlab:watch_events", args=[simulation_id]),
         stream_url="/ws/v1/chatlab/",
         realtime_transport="websocket",
         realtime_session_payload={"simulation_id": simulation_id},
@@ -329,6 +335,24 @@ def watch_simulation(request, simulation_id):
     )
 
 
+@staff_member_required
+def watch_events(request, simulation_id):
+    """JSON page of older or re-filtered outbox events for the watch view."""
+    logger.debug(
+        "watch_events: admin=%s sim=%s before=%s",
+        request.user.pk,
+        simulation_id,
+        request.GET.get("before"),
+    )
+    get_object_or_404(Simulation, id=simulation_id)
+    return JsonResponse(
+        build_watch_events_payload(
+            request=request,
+            outbox_events=OutboxEvent.objects.filter(simulation_id=simulation_id),
+        )
+    )
+
+
 @staff_member_required
 def watch_service_calls(request, simulation_id):
     """HTMX partial — refreshes service call table on the watch page."""
@@ -338,7 +362,9 @@ def watch_service_calls(request, simulation_id):
         simulation_id,
     )
     get_object_or_404(Simulation, id=simulation_id)
-    service_calls_qs = ServiceCall.objects.for_simulation(simulation_id).order_by("created_at")
+    service_calls_qs = (
+        ServiceCall.objects.for_simulation(simulation_id).for_listing().order_by("created_at")
+    )
     return render(
         request,
         "partials/watch_service_calls.html",
@@ -349,3 +375,22 @@ def watch_service_calls(request, simulation_id):
             watch_url=reverse("chatlab:watch_simulation", args=[simulation_id]),
         ),
     )
+
+
+@staff_member_required
+def watch_service_call_detail(request, simulation_id, service_call_id):
+    """HTMX partial — payload JSON for one service call, loaded on expand."""
+    logger.debug(
+        "watch_service_call_detail: admin=%s sim=%s call=%s",
+        request.user.pk,
+        simulation_id,
+        service_call_id,
+    )
+    service_call = get_object_or_404(
+        ServiceCall.objects.for_simulation(simulation_id), id=service_call_id
+    )
+    return render(
+        request,
+        "partials/watch_service_call_detail.html",
+        {"sc": service_call},
+    )
@@ -74,6 +74,19 @@ def get_required_env(name: str) -> str:
     return value
 
 
+DEFAULT_UPLOAD_PART_SIZE_MB = 64
+
+
+def get_upload_part_size() -> int:
+    """Multipart part size in bytes; bounds the memory a streamed upload holds."""
+    raw = os.environ.get("BACKUP_UPLOAD_PART_SIZE_MB", "").strip()
+    try:
+        megabytes = int(raw) if raw else DEFAULT_UPLOAD_PART_SIZE_MB
+    except ValueError as exc:
+        raise ImproperlyConfigured("BACKUP_UPLOAD_PART_SIZE_MB must be an integer.") from exc
+    return max(megabytes, 5) * 1024 * 1024
+
+
 def get_r2_settings() -> R2Settings:
     return R2Settings(
         bucket=get_required_env("BACKUP_R2_BUCKET"),
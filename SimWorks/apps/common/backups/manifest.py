@@ -8,7 +8,8 @@ import hashlib
 import json
 from pathlib import Path
 import subprocess
-from typing import Any
+import time
+from typing import IO, Any
 
 from django.conf import settings
 from django.db import connection
@@ -17,6 +18,7 @@ from django.db.migrations.loader import MigrationLoader
 from .inventory import CORE_MIGRATION_APPS
 
 MANIFEST_VERSION = 1
+DUMP_FORMATS = ("custom", "directory")
 
 
 @dataclass(frozen=True)
@@ -50,6 +52,37 @@ def sha256_file(path: Path) -> str:
     return digest.hexdigest()
 
 
+class HashingReader:
+    """File-like wrapper that hashes and counts bytes as they are read."""
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.size_bytes = 0
+        self._digest = hashlib.sha256()
+        self._started = time.monotonic()
+        self._finished: float | None = None
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.stream.read(size)
+        if chunk:
+            self._digest.update(chunk)
+            self.size_bytes += len(chunk)
+        elif size != 0:
+            self._finished = self._finished or time.monotonic()
+        return chunk
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    def throughput(self) -> dict[str, Any]:
+        seconds = max((self._finished or time.monotonic()) - self._started, 1e-6)
+        return {
+            "seconds": round(seconds, 3),
+            "bytes_per_second": int(self.size_bytes / seconds),
+        }
+
+
 def get_git_sha() -> str:
     try:
         result = subprocess.run(
@@ -82,9 +115,12 @@ def build_manifest(
     size_bytes: int,
     created_at: datetime | None = None,
     migration_heads: dict[str, str] | None = None,
+    throughput: dict[str, Any] | None = None,
+    dump_format: str = "custom",
+    jobs: int = 1,
 ) -> dict[str, Any]:
     created = created_at or datetime.now(UTC)
-    return {
+    manifest = {
         "manifest_version": MANIFEST_VERSION,
         "created_at": created.astimezone(UTC).isoformat().replace("+00:00", "Z"),
         "backup_type": mode,
@@ -99,11 +135,16 @@ def build_manifest(
         else get_migration_heads(),
         "compression": "zstd",
         "encryption": "age",
+        "dump_format": dump_format,
+        "jobs": jobs,
         "sha256": sha256,
         "size_bytes": size_bytes,
         "backup_key": keys.backup_key,
         "manifest_key": keys.manifest_key,
     }
+    if throughput is not None:
+        manifest["throughput"] = throughput
+    return manifest
 
 
 def manifest_json(manifest: dict[str, Any]) -> bytes:
@@ -147,10 +188,17 @@ def validate_manifest(manifest: dict[str, Any], *, expected_mode: str | None = N
         raise ValueError("Unsupported backup compression.")
     if manifest["encryption"] != "age":
         raise ValueError("Unsupported backup encryption.")
+    if dump_format(manifest) not in DUMP_FORMATS:
+        raise ValueError("Unsupported backup dump format.")
     if not isinstance(manifest["tables"], list):
         raise ValueError("Backup manifest tables must be a list.")
 
 
+def dump_format(manifest: dict[str, Any]) -> str:
+    """Manifests written before parallel dumps existed are custom format."""
+    return manifest.get("dump_format", "custom")
+
+
 def validate_migration_compatibility(manifest: dict[str, Any], *, mode: str | None = None) -> None:
     current_heads = get_migration_heads()
     backup_heads = manifest.get("migration_heads") or {}
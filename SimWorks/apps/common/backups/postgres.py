@@ -7,6 +7,7 @@ from contextlib import contextmanager
 from pathlib import Path
 import shlex
 import subprocess
+from typing import IO
 
 from django.core.management.base import CommandError
 from django.db import connection
@@ -21,30 +22,57 @@ def run_checked(command: list[str], *, env: dict[str, str] | None = None) -> Non
     except FileNotFoundError as exc:
         raise CommandError(f"Required backup tool is not installed: {command[0]}") from exc
     except subprocess.CalledProcessError as exc:
-        rendered = " ".join(shlex.quote(part) for part in command)
-        raise CommandError(f"Backup tool failed: {rendered}") from exc
+        raise CommandError(f"Backup tool failed: {render_command(command)}") from exc
 
 
-def pg_dump(
+def render_command(command: list[str]) -> str:
+    return " ".join(shlex.quote(part) for part in command)
+
+
+def pg_dump_command(
     *,
     connection_info: PostgresConnectionInfo,
-    output_path: Path,
+    output_path: Path | None = None,
     tables: tuple[str, ...] = (),
     data_only: bool = False,
-) -> None:
-    command = [
-        "pg_dump",
-        "--format=custom",
-        "--no-owner",
-        "--no-acl",
-        "--file",
-        str(output_path),
-        *connection_info.command_args(),
-    ]
+    dump_format: str = "custom",
+    jobs: int = 1,
+) -> list[str]:
+    """Build a ``pg_dump`` command; without *output_path* the dump goes to stdout.
+
+    ``directory`` format is the only one ``pg_dump --jobs`` supports; it must be
+    written to *output_path* and is left uncompressed for the zstd stage.
+    """
+    command = ["pg_dump", f"--format={dump_format}", "--no-owner", "--no-acl"]
+    if dump_format == "directory":
+        command.extend(["--compress=0", "--jobs", str(jobs)])
+    if output_path is not None:
+        command.extend(["--file", str(output_path)])
+    command.extend(connection_info.command_args())
     if data_only:
         command.append("--data-only")
     for table in tables:
         command.extend(["--table", table])
+    return command
+
+
+def pg_dump(
+    *,
+    connection_info: PostgresConnectionInfo,
+    output_path: Path,
+    tables: tuple[str, ...] = (),
+    data_only: bool = False,
+    dump_format: str = "custom",
+    jobs: int = 1,
+) -> None:
+    command = pg_dump_command(
+        connection_info=connection_info,
+        output_path=output_path,
+        tables=tables,
+        data_only=data_only,
+        dump_format=dump_format,
+        jobs=jobs,
+    )
     run_checked(command, env=connection_info.subprocess_env())
 
 
@@ -52,15 +80,19 @@ def pg_restore(
     *,
     connection_info: PostgresConnectionInfo,
     input_path: Path,
+    jobs: int = 1,
 ) -> None:
-    command = [
-        "pg_restore",
-        "--single-transaction",
-        "--no-owner",
-        "--no-acl",
-        "--dbname",
-        connection_info.dbname,
-    ]
+    """Restore a custom-format archive or an extracted directory-format dump.
+
+    ``--jobs`` cannot be combined with ``--single-transaction``, so a parallel
+    restore stops at the first error instead and is not atomic.
+    """
+    command = ["pg_restore"]
+    if jobs > 1:
+        command.extend(["--jobs", str(jobs), "--exit-on-error"])
+    else:
+        command.append("--single-transaction")
+    command.extend(["--no-owner", "--no-acl", "--dbname", connection_info.dbname])
     if connection_info.host:
         command.extend(["--host", connection_info.host])
     if connection_info.port:
@@ -79,6 +111,11 @@ def zstd_decompress(input_path: Path, output_path: Path) -> None:
     run_checked(["zstd", "--decompress", "--force", str(input_path), "-o", str(output_path)])
 
 
+def tar_extract(archive_path: Path, output_dir: Path) -> None:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    run_checked(["tar", "-xf", str(archive_path), "-C", str(output_dir)])
+
+
 def age_encrypt(input_path: Path, output_path: Path, public_key: str) -> None:
     run_checked(["age", "-r", public_key, "-o", str(output_path), str(input_path)])
 
@@ -95,6 +132,123 @@ def age_decrypt(input_path: Path, output_path: Path, private_key: str) -> None:
         identity_path.unlink(missing_ok=True)
 
 
+class PipelineStream:
+    """Readable stdout of the last command in a :func:`run_pipeline` chain."""
+
+    def __init__(self, commands: list[list[str]], processes: list[subprocess.Popen]):
+        self._commands = commands
+        self._processes = processes
+        self._stdout = processes[-1].stdout
+        self._failed: list[str] | None = None
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stdout.read(size)
+
+    def finish(self) -> None:
+        """Wait for every command and raise ``CommandError`` if any failed.
+
+        Call this after reading to EOF and before committing the output
+        anywhere, so a dump that died mid-stream is never published.
+        """
+        if self._failed is None:
+            self._stdout.close()
+            self._failed = [
+                render_command(command)
+                for command, process in zip(self._commands, self._processes, strict=True)
+                if process.wait() != 0
+            ]
+        if self._failed:
+            raise CommandError(f"Backup tool failed: {'; '.join(self._failed)}")
+
+
+@contextmanager
+def run_pipeline(
+    commands: list[list[str]], *, env: dict[str, str] | None = None
+) -> Iterator[PipelineStream]:
+    """Chain *commands* stdout-to-stdin and yield the last command's stdout.
+
+    *env* is only passed to the first command, which is the one that needs
+    database credentials.  Intermediate pipes are closed in the parent so a
+    failing consumer propagates ``SIGPIPE`` upstream instead of deadlocking.
+    Every exit status is checked by :meth:`PipelineStream.finish`, which runs
+    on exit if the caller has not called it already; if the caller raises,
+    the remaining processes are killed.
+    """
+    processes: list[subprocess.Popen] = []
+    upstream: IO[bytes] | None = None
+    try:
+        for index, command in enumerate(commands):
+            process = subprocess.Popen(
+                command,
+                stdin=upstream,
+                stdout=subprocess.PIPE,
+                env=env if index == 0 else None,
+            )
+            if upstream is not None:
+                upstream.close()
+            upstream = process.stdout
+            processes.append(process)
+    except FileNotFoundError as exc:
+        _kill(processes)
+        raise CommandError(f"Required backup tool is not installed: {command[0]}") from exc
+
+    stream = PipelineStream(commands, processes)
+    try:
+        yield stream
+    except BaseException:
+        _kill(processes)
+        raise
+    stream.finish()
+
+
+def _kill(processes: list[subprocess.Popen]) -> None:
+    for process in processes:
+        if process.stdout is not None:
+            process.stdout.close()
+        process.kill()
+        process.wait()
+
+
+@contextmanager
+def encrypted_dump_stream(
+    *,
+    connection_info: PostgresConnectionInfo,
+    public_key: str,
+    tables: tuple[str, ...] = (),
+    data_only: bool = False,
+    jobs: int = 1,
+    scratch_dir: Path | None = None,
+) -> Iterator[PipelineStream]:
+    """Yield the encrypted ``pg_dump | zstd | age`` byte stream.
+
+    With ``jobs == 1`` the custom-format dump is streamed without touching
+    disk.  With more jobs, ``pg_dump`` writes a directory-format dump into
+    *scratch_dir* in parallel and that directory is streamed as a tar archive
+    through the same compression and encryption stages.  Call the stream's
+    ``finish()`` before publishing the output to surface a failed stage.
+    """
+    encrypt = [["zstd", "--stdout", "--quiet"], ["age", "-r", public_key]]
+    if jobs <= 1:
+        dump = pg_dump_command(connection_info=connection_info, tables=tables, data_only=data_only)
+        with run_pipeline([dump, *encrypt], env=connection_info.subprocess_env()) as stream:
+            yield stream
+        return
+
+    if scratch_dir is None:
+        raise ValueError("Parallel dumps need a scratch directory.")
+    dump_dir = scratch_dir / "dump"
+    pg_dump(
+        connection_info=connection_info,
+        output_path=dump_dir,
+        tables=tables,
+        data_only=data_only,
+        dump_format="directory",
+        jobs=jobs,
+    )
+    with run_pipeline([["tar", "-C", str(dump_dir), "-cf", "-", "."], *encrypt]) as stream:
+        yield stream
+
+
 @contextmanager
 def backup_advisory_lock() -> Iterator[None]:
     with connection.cursor() as cursor:
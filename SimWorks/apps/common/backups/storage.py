@@ -2,12 +2,39 @@
 
 from __future__ import annotations
 
+import base64
+from collections.abc import Callable
+from dataclasses import dataclass
+import hashlib
 import json
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from .config import R2Settings
 
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StreamedUpload:
+    key: str
+    size_bytes: int
+    etag: str
+    part_count: int
+
+
+def read_part(stream: IO[bytes], part_size: int) -> bytes:
+    """Read up to *part_size* bytes, looping over short pipe reads."""
+    chunks = []
+    remaining = part_size
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
 
 class R2Storage:
     def __init__(self, settings: R2Settings):
@@ -40,6 +67,76 @@ class R2Storage:
             extra_args["Metadata"] = metadata
         self.client.upload_file(str(path), self.settings.bucket, key, ExtraArgs=extra_args)
 
+    def upload_stream(
+        self,
+        *,
+        stream: IO[bytes],
+        key: str,
+        part_size: int,
+        content_type: str = "application/octet-stream",
+        metadata: dict[str, str] | None = None,
+        before_complete: Callable[[], None] | None = None,
+    ) -> StreamedUpload:
+        """Upload *stream* as a multipart object holding one part in memory at a time.
+
+        Every part carries ``Content-MD5`` so the server rejects corrupted
+        parts, and the returned object ETag can be compared against ``head``
+        afterwards instead of downloading the object again.  *before_complete*
+        runs once *stream* is exhausted and before the object is committed;
+        raising from it (e.g. because the producing process failed) leaves no
+        object behind.  The upload is aborted on any failure so no orphaned
+        parts are billed.
+        """
+        part_size = max(part_size, MIN_PART_SIZE)
+        create_args: dict[str, Any] = {
+            "Bucket": self.settings.bucket,
+            "Key": key,
+            "ContentType": content_type,
+        }
+        if metadata:
+            create_args["Metadata"] = metadata
+        upload_id = self.client.create_multipart_upload(**create_args)["UploadId"]
+        parts: list[dict[str, Any]] = []
+        size_bytes = 0
+        try:
+            while True:
+                body = read_part(stream, part_size)
+                if not body and parts:
+                    break
+                part_number = len(parts) + 1
+                digest = hashlib.md5(body, usedforsecurity=False).digest()
+                response = self.client.upload_part(
+                    Bucket=self.settings.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                    ContentMD5=base64.b64encode(digest).decode("ascii"),
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                size_bytes += len(body)
+                if len(body) < part_size:
+                    break
+            if before_complete is not None:
+                before_complete()
+            response = self.client.complete_multipart_upload(
+                Bucket=self.settings.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            self.client.abort_multipart_upload(
+                Bucket=self.settings.bucket, Key=key, UploadId=upload_id
+            )
+            raise
+        return StreamedUpload(
+            key=key,
+            size_bytes=size_bytes,
+            etag=response["ETag"].strip('"'),
+            part_count=len(parts),
+        )
+
     def put_json(self, *, key: str, payload: dict[str, Any]) -> None:
         self.client.put_object(
             Bucket=self.settings.bucket,
@@ -58,10 +155,19 @@ class R2Storage:
     def head(self, key: str) -> dict[str, Any]:
         return self.client.head_object(Bucket=self.settings.bucket, Key=key)
 
-    def object_matches(self, *, key: str, size_bytes: int, sha256: str | None = None) -> bool:
+    def object_matches(
+        self,
+        *,
+        key: str,
+        size_bytes: int,
+        sha256: str | None = None,
+        etag: str | None = None,
+    ) -> bool:
         head = self.head(key)
         if int(head.get("ContentLength", -1)) != int(size_bytes):
             return False
+        if etag is not None and head.get("ETag", "").strip('"') != etag:
+            return False
         metadata = head.get("Metadata") or {}
         if sha256 is None:
             return True
@@ -0,0 +1,29 @@
+"""ASGI lifespan handling for process-wide resources.
+
+Django's ASGI handler rejects ``lifespan`` scopes, so servers such as uvicorn
+never get a shutdown hook.  ``LifespanApp`` acknowledges startup and closes
+shared resources (pooled provider HTTP clients) on shutdown.
+"""
+
+import logging
+
+from orchestrai.utils.http_clients import aclose_http_clients
+
+logger = logging.getLogger(__name__)
+
+
+class LifespanApp:
+    """Minimal ASGI app for the ``lifespan`` protocol."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                try:
+                    await aclose_http_clients()
+                except Exception:
+                    logger.exception("Error closing pooled HTTP clients on shutdown")
+                await send({"type": "lifespan.shutdown.complete"})
+                return
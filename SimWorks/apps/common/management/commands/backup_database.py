@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from pathlib import Path
+import shutil
 import tempfile
 
 from django.core.management.base import BaseCommand, CommandError
@@ -11,6 +12,7 @@ from apps.common.backups.config import (
     get_postgres_connection_info,
     get_r2_settings,
     get_required_env,
+    get_upload_part_size,
 )
 from apps.common.backups.inventory import (
     BACKUP_ADVISORY_LOCK_ID,
@@ -19,19 +21,16 @@ from apps.common.backups.inventory import (
     inventory_for_mode,
 )
 from apps.common.backups.manifest import (
+    HashingReader,
     build_manifest,
     keys_for_backup,
     manifest_json,
-    sha256_file,
-)
-from apps.common.backups.postgres import (
-    age_encrypt,
-    backup_advisory_lock,
-    pg_dump,
-    zstd_compress,
 )
+from apps.common.backups.postgres import backup_advisory_lock, encrypted_dump_stream
 from apps.common.backups.storage import R2Storage
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class Command(BaseCommand):
     help = "Create an encrypted PostgreSQL logical backup and optionally upload it to R2."
@@ -42,9 +41,19 @@ class Command(BaseCommand):
         parser.add_argument("--encrypt", action="store_true")
         parser.add_argument("--verify-upload", action="store_true")
         parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help="Dump with N parallel jobs using pg_dump's directory format.",
+        )
 
     def handle(self, *args, **options):
         mode = options["mode"]
+        jobs = options["jobs"]
+        if jobs < 1:
+            raise CommandError("--jobs must be at least 1.")
+        dump_format = "directory" if jobs > 1 else "custom"
         upload = options["upload"]
         dry_run = options["dry_run"]
 
@@ -59,6 +68,7 @@ class Command(BaseCommand):
             self.stdout.write(f"Backup dry run for mode: {mode}")
             self.stdout.write(f"Environment: {environment}")
             self.stdout.write(f"Database: {connection_info.dbname}")
+            self.stdout.write(f"Dump format: {dump_format} (jobs={jobs})")
             self.stdout.write(f"Advisory lock key: {BACKUP_ADVISORY_LOCK_ID}")
             self.stdout.write(f"Backup object key: {keys.backup_key}")
             self.stdout.write(f"Manifest object key: {keys.manifest_key}")
@@ -87,22 +97,39 @@ class Command(BaseCommand):
             tempfile.TemporaryDirectory(prefix="medsim-backup-") as tmpdir_raw,
         ):
             tmpdir = Path(tmpdir_raw)
-            dump_path = tmpdir / f"{mode}.dump"
-            compressed_path = tmpdir / f"{mode}.dump.zst"
             encrypted_path = tmpdir / f"{mode}.dump.zst.age"
             manifest_path = tmpdir / f"{mode}.manifest.json"
 
-            pg_dump(
+            # pg_dump | zstd | age is hashed and uploaded in a single pass, so
+            # the compressed dump never hits disk.  Only a parallel dump keeps
+            # its uncompressed directory in the scratch dir while it is tarred.
+            upload_result = None
+            with encrypted_dump_stream(
                 connection_info=connection_info,
-                output_path=dump_path,
+                public_key=public_key,
                 tables=inventory.tables,
                 data_only=mode == "core",
-            )
-            zstd_compress(dump_path, compressed_path)
-            age_encrypt(compressed_path, encrypted_path, public_key)
-
-            checksum = sha256_file(encrypted_path)
-            size_bytes = encrypted_path.stat().st_size
+                jobs=jobs,
+                scratch_dir=tmpdir,
+            ) as stream:
+                reader = HashingReader(stream)
+                if storage:
+                    upload_result = storage.upload_stream(
+                        stream=reader,
+                        key=keys.backup_key,
+                        part_size=get_upload_part_size(),
+                        metadata={"backup-mode": mode},
+                        before_complete=stream.finish,
+                    )
+                else:
+                    with encrypted_path.open("wb") as handle:
+                        shutil.copyfileobj(reader, handle, STREAM_CHUNK_SIZE)
+
+            checksum = reader.sha256
+            size_bytes = reader.size_bytes
+            throughput = reader.throughput()
+            if upload_result is not None:
+                throughput["parts"] = upload_result.part_count
             manifest = build_manifest(
                 mode=mode,
                 environment=environment,
@@ -112,15 +139,17 @@ class Command(BaseCommand):
                 sha256=checksum,
                 size_bytes=size_bytes,
                 created_at=created_at,
+                throughput=throughput,
+                dump_format=dump_format,
+                jobs=jobs,
             )
             manifest_path.write_bytes(manifest_json(manifest))
+            self.stdout.write(
+                f"Backup streamed: {size_bytes} bytes in {throughput['seconds']}s "
+                f"({throughput['bytes_per_second']} bytes/s)"
+            )
 
             if storage:
-                storage.upload_file(
-                    path=encrypted_path,
-                    key=keys.backup_key,
-                    metadata={"sha256": checksum, "backup-mode": mode},
-                )
                 storage.upload_file(
                     path=manifest_path,
                     key=keys.manifest_key,
@@ -140,7 +169,7 @@ class Command(BaseCommand):
                 if options["verify_upload"] and not storage.object_matches(
                     key=keys.backup_key,
                     size_bytes=size_bytes,
-                    sha256=checksum,
+                    etag=upload_result.etag,
                 ):
                     raise CommandError("R2 upload verification failed for backup object.")
                 if options["verify_upload"] and not storage.object_matches(
@@ -13,12 +13,13 @@ from apps.common.backups.config import (
 )
 from apps.common.backups.inventory import BACKUP_MODES
 from apps.common.backups.manifest import (
+    dump_format,
     parse_manifest,
     sha256_file,
     validate_manifest,
     validate_migration_compatibility,
 )
-from apps.common.backups.postgres import age_decrypt, pg_restore, zstd_decompress
+from apps.common.backups.postgres import age_decrypt, pg_restore, tar_extract, zstd_decompress
 from apps.common.backups.restore import (
     check_database_empty_for_full_restore,
     check_no_business_data,
@@ -40,6 +41,15 @@ class Command(BaseCommand):
         parser.add_argument("--preserve-pending-invitations", action="store_true")
         parser.add_argument("--skip-post-restore-check", action="store_true")
         parser.add_argument("--dry-run", action="store_true")
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help=(
+                "Restore with N parallel jobs.  The default of 1 restores in a single "
+                "transaction; a parallel restore is not atomic."
+            ),
+        )
 
     def handle(self, *args, **options):
         mode = options["mode"]
@@ -57,10 +67,15 @@ class Command(BaseCommand):
         validate_manifest(manifest, expected_mode=mode)
         validate_migration_compatibility(manifest, mode=mode)
         backup_key = manifest["backup_key"]
+        archive_format = dump_format(manifest)
+        jobs = options["jobs"]
+        if jobs < 1:
+            raise CommandError("--jobs must be at least 1.")
 
         self.stdout.write(f"Restore {'dry run' if dry_run else 'started'}: mode={mode}")
         self.stdout.write(f"Backup object key: {backup_key}")
         self.stdout.write(f"Manifest object key: {manifest['manifest_key']}")
+        self.stdout.write(f"Dump format: {archive_format} (jobs={jobs})")
 
         with tempfile.TemporaryDirectory(prefix="medsim-restore-") as tmpdir_raw:
             tmpdir = Path(tmpdir_raw)
@@ -93,6 +108,11 @@ class Command(BaseCommand):
             private_key = get_required_env("BACKUP_AGE_PRIVATE_KEY")
             age_decrypt(encrypted_path, compressed_path, private_key)
             zstd_decompress(compressed_path, dump_path)
+            if archive_format == "directory":
+                dump_dir = tmpdir / "restore-dir"
+                tar_extract(dump_path, dump_dir)
+                dump_path.unlink()
+                dump_path = dump_dir
 
             if mode == "core":
                 business_check = check_no_business_data()
@@ -106,7 +126,7 @@ class Command(BaseCommand):
                     )
                 truncate_core_tables()
 
-            pg_restore(connection_info=connection_info, input_path=dump_path)
+            pg_restore(connection_info=connection_info, input_path=dump_path, jobs=jobs)
 
             if mode == "core":
                 reseed_core_sequences()
@@ -1,7 +1,21 @@
+"""Project middleware.
+
+Every class here is sync- and async-capable so the ASGI stack never adapts
+them through ``sync_to_async``; see ``docs/architecture/middleware.md``.
+"""
+
 import json
+from typing import ClassVar
 import uuid
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
 from django.http import HttpRequest, HttpResponse
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.common import CommonMiddleware
+from django.middleware.security import SecurityMiddleware
 
 from config.logging import bind_context, bind_correlation_id, clear_context
 
@@ -9,15 +23,32 @@ from config.logging import bind_context, bind_correlation_id, clear_context
 class HealthCheckMiddleware:
     """Handle health check endpoint at /health."""
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
         if request.path == "/health":
-            s = {"status": 200, "message": "OK"}
-            return HttpResponse(status=200, content=json.dumps(s), content_type="application/json")
+            return self._health_response()
         return self.get_response(request)
 
+    async def __acall__(self, request):
+        if request.path == "/health":
+            return self._health_response()
+        return await self.get_response(request)
+
+    @staticmethod
+    def _health_response() -> HttpResponse:
+        s = {"status": 200, "message": "OK"}
+        return HttpResponse(status=200, content=json.dumps(s), content_type="application/json")
+
 
 class CorrelationIDMiddleware:
     """Middleware to propagate X-Correlation-ID header.
@@ -41,20 +72,20 @@ class CorrelationIDMiddleware:
 
     HEADER_NAME = "X-Correlation-ID"
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        # Extract or generate correlation ID
-        correlation_id = request.headers.get(self.HEADER_NAME)
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4())
+        if self.async_mode:
+            return self.__acall__(request)
 
-        # Attach to request for use in views/services
-        request.correlation_id = correlation_id
-
-        # Bind to structlog context for automatic inclusion in all logs
-        bind_correlation_id(correlation_id)
+        correlation_id = self._bind(request)
 
         # Optionally bind user context if authenticated
         if hasattr(request, "user") and request.user.is_authenticated:
@@ -71,3 +102,86 @@ class CorrelationIDMiddleware:
         finally:
             # Clear structlog context to prevent leakage between requests
             clear_context()
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        correlation_id = self._bind(request)
+
+        # request.user is lazy and would hit the database synchronously here.
+        if hasattr(request, "auser"):
+            user = await request.auser()
+            if user.is_authenticated:
+                bind_context(user_id=user.pk)
+
+        try:
+            response = await self.get_response(request)
+            response[self.HEADER_NAME] = correlation_id
+            return response
+        finally:
+            clear_context()
+
+    def _bind(self, request: HttpRequest) -> str:
+        # Extract or generate correlation ID
+        correlation_id = request.headers.get(self.HEADER_NAME)
+        if not correlation_id:
+            correlation_id = str(uuid.uuid4())
+
+        # Attach to request for use in views/services
+        request.correlation_id = correlation_id
+
+        # Bind to structlog context for automatic inclusion in all logs
+        bind_correlation_id(correlation_id)
+        return correlation_id
+
+
+class InlineHooksMixin:
+    """Run non-blocking ``MiddlewareMixin`` hooks on the event loop.
+
+    Under ASGI, ``MiddlewareMixin`` runs every ``process_request`` and
+    ``process_response`` through ``sync_to_async``, a thread hop each.  Hooks
+    named in ``inline_hooks`` only touch headers and settings (no ORM, cache
+    or session I/O), so they are called directly; the rest still hop.
+    """
+
+    inline_hooks: ClassVar[frozenset[str]] = frozenset()
+
+    async def __acall__(self, request):
+        response = None
+        if hasattr(self, "process_request"):
+            response = await self._run_hook("process_request", request)
+        response = response or await self.get_response(request)
+        if hasattr(self, "process_response"):
+            response = await self._run_hook("process_response", request, response)
+        return response
+
+    async def _run_hook(self, name: str, *args):
+        hook = getattr(self, name)
+        if name in self.inline_hooks:
+            return hook(*args)
+        return await sync_to_async(hook, thread_sensitive=True)(*args)
+
+
+class AsyncSecurityMiddleware(InlineHooksMixin, SecurityMiddleware):
+    inline_hooks = frozenset({"process_request", "process_response"})
+
+
+class AsyncSessionMiddleware(InlineHooksMixin, SessionMiddleware):
+    # process_response may save the session.
+    inline_hooks = frozenset({"process_request"})
+
+
+class AsyncCommonMiddleware(InlineHooksMixin, CommonMiddleware):
+    inline_hooks = frozenset({"process_request", "process_response"})
+
+
+class AsyncAuthenticationMiddleware(InlineHooksMixin, AuthenticationMiddleware):
+    # Only installs the lazy request.user / request.auser.
+    inline_hooks = frozenset({"process_request"})
+
+
+class AsyncMessageMiddleware(InlineHooksMixin, MessageMiddleware):
+    # process_response may write messages to the session.
+    inline_hooks = frozenset({"process_request"})
+
+
+class AsyncXFrameOptionsMiddleware(InlineHooksMixin, XFrameOptionsMiddleware):
+    inline_hooks = frozenset({"process_response"})
@@ -7,6 +7,7 @@ all transports (REST catch-up, SSE streaming, WebSocket).
 Public API:
     enqueue_event()            - Create outbox event (async)
     enqueue_event_sync()       - Create outbox event (sync, for Django signals)
+    enqueue_events_sync()      - Create many outbox events in one INSERT (sync)
     poke_drain()               - Trigger immediate delivery (async)
     poke_drain_sync()          - Trigger immediate delivery (sync)
     build_canonical_envelope() - Build transport envelope from outbox event
@@ -46,10 +47,12 @@ Usage:
 from . import event_types
 from .outbox import (
     apply_outbox_cursor,
+    apply_outbox_cursor_before,
     build_canonical_envelope,
     build_ws_envelope,
     enqueue_event,
     enqueue_event_sync,
+    enqueue_events_sync,
     get_events_after_event,
     get_events_after_event_sync,
     get_events_for_simulation,
@@ -71,11 +74,13 @@ from .outbox import (
 
 __all__ = [
     "apply_outbox_cursor",
+    "apply_outbox_cursor_before",
     "build_canonical_envelope",
     "build_ws_envelope",
     # common outbox functions
     "enqueue_event",
     "enqueue_event_sync",
+    "enqueue_events_sync",
     "event_types",
     "get_events_after_event",
     "get_events_after_event_sync",
@@ -62,6 +62,7 @@ SIMULATION_ADJUSTMENT_ACCEPTED = "simulation.adjustment.updated"
 SIMULATION_ADJUSTMENT_APPLIED = SIMULATION_ADJUSTMENT_ACCEPTED
 SIMULATION_NOTE_CREATED = "simulation.note.created"
 SIMULATION_ANNOTATION_CREATED = "simulation.annotation.created"
+SIMULATION_TOOLS_UPDATED = "simulation.tools.updated"
 PATIENT_INJURY_CREATED = "patient.injury.created"
 PATIENT_INJURY_UPDATED = "patient.injury.updated"
 PATIENT_ILLNESS_CREATED = "patient.illness.created"
@@ -208,6 +209,11 @@ EVENT_TYPE_SPECS: tuple[EventTypeSpec, ...] = (
         "A debrief annotation was created.",
         aliases=("trainerlab.annotation.created",),
     ),
+    EventTypeSpec(
+        SIMULATION_TOOLS_UPDATED,
+        "Checksums of metadata-backed simulation tools changed.",
+        aliases=(),
+    ),
     EventTypeSpec(
         PATIENT_INJURY_CREATED,
         "A patient injury was created.",
@@ -187,6 +187,38 @@ def enqueue_event_sync(
         return None
 
 
+def enqueue_events_sync(events: list[dict[str, Any]]) -> int:
+    """Create many outbox events with one INSERT.
+
+    Each item takes the keyword arguments of ``enqueue_event_sync``
+    (``idempotency_key`` is required here).  Duplicates are skipped by the
+    database, exactly like the single-event path.  Returns the number of
+    events submitted.
+    """
+    from django.apps import apps
+
+    OutboxEvent = apps.get_model("common", "OutboxEvent")
+    rows = []
+    for event in events:
+        event_type = event_types.canonical_event_type(event["event_type"])
+        if not event_types.is_valid_canonical_event_type(event_type):
+            raise ValueError(f"Invalid canonical outbox event type: {event_type}")
+        rows.append(
+            OutboxEvent(
+                event_type=event_type,
+                simulation_id=event["simulation_id"],
+                payload=_normalize_payload(event["payload"]),
+                idempotency_key=event["idempotency_key"],
+                correlation_id=event.get("correlation_id"),
+            )
+        )
+    if rows:
+        with transaction.atomic():
+            OutboxEvent.objects.bulk_create(rows, ignore_conflicts=True)
+        logger.debug("Outbox events submitted in bulk: %d", len(rows))
+    return len(rows)
+
+
 def build_canonical_envelope(
     event: OutboxEvent,
     *,
@@ -250,6 +282,14 @@ def apply_outbox_cursor(queryset, cursor_event):
     )
 
 
+def apply_outbox_cursor_before(queryset, cursor_event):
+    """Return rows strictly before ``cursor_event`` using a stable tie-breaker."""
+    return queryset.filter(
+        Q(created_at__lt=cursor_event.created_at)
+        | Q(created_at=cursor_event.created_at, id__lt=cursor_event.id)
+    )
+
+
 def get_latest_cursor_sync(
     simulation_id: int,
     *,
@@ -1,6 +1,11 @@
 """Rate limiting utilities for API endpoints.
 
-This module provides Redis-based rate limiting with a sliding-window algorithm.
+This module provides Redis-based rate limiting with the generic cell rate
+algorithm (GCRA): each key stores a single "theoretical arrival time" and one
+Lua script call decides and updates it atomically, so a check is one round
+trip and O(1) memory regardless of the limit.  Keys that Redis has just denied
+are remembered per process until their retry time, and further requests on
+them are rejected without contacting Redis.
 
 Usage:
     @rate_limit(key="ip", limit=5, period=60)
@@ -15,6 +20,7 @@ Usage:
 from collections.abc import Callable
 from functools import wraps
 import hashlib
+import math
 import time
 from typing import Literal
 
@@ -23,29 +29,16 @@ from django.http import HttpRequest
 from ninja.errors import HttpError
 import redis
 
-RateLimitValue = int | Callable[[], int]
+from apps.common.redis_client import get_redis_client as get_shared_redis_client
 
+RateLimitValue = int | Callable[[], int]
 
-def get_redis_client() -> redis.Redis | None:
-    """Get Redis client for rate limiting.
+RATE_LIMIT_REDIS_DB = 3
 
-    Uses Redis database 3 (after channels=0, celery broker=1, celery results=2).
-    Constructs connection from individual settings to avoid exposing the full
-    connection URL, which contains credentials, in the settings namespace.
-    """
-    hostname = getattr(settings, "REDIS_HOSTNAME", None)
-    if not hostname:
-        return None
 
-    port = getattr(settings, "REDIS_PORT", 6379)
-    password = getattr(settings, "REDIS_PASSWORD", None)
-    return redis.Redis(
-        host=hostname,
-        port=port,
-        password=password,
-        db=3,
-        socket_connect_timeout=2,
-    )
+def get_redis_client() -> redis.Redis | None:
+    """Get the shared Redis client for rate limiting (database 3)."""
+    return get_shared_redis_client(RATE_LIMIT_REDIS_DB)
 
 
 def _is_behind_trusted_proxy() -> bool:
@@ -104,36 +97,84 @@ class RateLimitExceeded(HttpError):
         self.retry_after = retry_after
 
 
+# KEYS[1]: theoretical arrival time (ms); ARGV: limit, period (ms).
+# Returns {allowed, remaining, retry_after_ms}.  Uses the server clock so every
+# process agrees on "now".
+GCRA_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local interval = period / limit
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if not tat or tat < now then
+  tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if allow_at > now then
+  return {0, 0, math.ceil(allow_at - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {1, math.floor((period - (new_tat - now)) / interval + 1e-6), 0}
+"""
+GCRA_SCRIPT_SHA = hashlib.sha1(GCRA_SCRIPT.encode()).hexdigest()
+
+LOCAL_DENIALS_MAX = 10_000
+
+# key -> time.monotonic() deadline until which the key is known to be exhausted.
+_local_denials: dict[str, float] = {}
+
+
+def _remember_denial(key: str, retry_after_ms: int) -> None:
+    now = time.monotonic()
+    if len(_local_denials) >= LOCAL_DENIALS_MAX:
+        for stale in [k for k, deadline in _local_denials.items() if deadline <= now]:
+            del _local_denials[stale]
+        if len(_local_denials) >= LOCAL_DENIALS_MAX:
+            _local_denials.clear()
+    _local_denials[key] = now + retry_after_ms / 1000
+
+
+def _local_retry_after(key: str) -> int:
+    """Return seconds left on a remembered denial for *key*, or 0."""
+    deadline = _local_denials.get(key)
+    if deadline is None:
+        return 0
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        _local_denials.pop(key, None)
+        return 0
+    return math.ceil(remaining)
+
+
 def check_rate_limit(
     redis_client: redis.Redis,
     key: str,
     limit: int,
     period: int,
 ) -> tuple[bool, int, int]:
-    """Check whether a request is allowed under the sliding-window limit."""
-    now = time.time()
-    window_start = now - period
-
-    pipe = redis_client.pipeline()
+    """Check whether a request is allowed under the GCRA limit.
 
-    pipe.zremrangebyscore(key, 0, window_start)
-    pipe.zcard(key)
-    pipe.zadd(key, {f"{now}:{id(now)}": now})
-    pipe.expire(key, period + 1)
+    Returns ``(allowed, used, retry_after)`` where *used* is how much of the
+    burst is consumed after this request and *retry_after* is in seconds.
+    Denied requests do not consume capacity.
+    """
+    retry_after = _local_retry_after(key)
+    if retry_after:
+        return False, limit, retry_after
 
-    results = pipe.execute()
-    current_count = results[1]
+    args = (f"{key}:tat", limit, period * 1000)
+    try:
+        allowed, remaining, retry_after_ms = redis_client.evalsha(GCRA_SCRIPT_SHA, 1, *args)
+    except redis.exceptions.NoScriptError:
+        allowed, remaining, retry_after_ms = redis_client.eval(GCRA_SCRIPT, 1, *args)
 
-    if current_count >= limit:
-        oldest = redis_client.zrange(key, 0, 0, withscores=True)
-        if oldest:
-            oldest_timestamp = oldest[0][1]
-            retry_after = int(oldest_timestamp + period - now) + 1
-        else:
-            retry_after = period
-        return False, current_count, retry_after
+    if not allowed:
+        _remember_denial(key, int(retry_after_ms))
+        return False, limit, max(1, math.ceil(int(retry_after_ms) / 1000))
 
-    return True, current_count + 1, 0
+    return True, limit - int(remaining), 0
 
 
 def _resolve_limit(limit: RateLimitValue) -> int:
@@ -165,26 +206,24 @@ def rate_limit(
             if redis_client is None:
                 return func(request, *args, **kwargs)
 
+            resolved_limit = _resolve_limit(limit)
+            key_prefix = prefix or func.__name__
+            rate_key = get_rate_limit_key(request, key, key_prefix)
+
             try:
-                redis_client.ping()
-            except redis.ConnectionError as exc:
+                is_allowed, _, retry_after = check_rate_limit(
+                    redis_client,
+                    rate_key,
+                    resolved_limit,
+                    period,
+                )
+            except (redis.ConnectionError, redis.TimeoutError) as exc:
                 if fail_closed:
                     raise HttpError(
                         503, "Service temporarily unavailable. Please try again later."
                     ) from exc
                 return func(request, *args, **kwargs)
 
-            resolved_limit = _resolve_limit(limit)
-            key_prefix = prefix or func.__name__
-            rate_key = get_rate_limit_key(request, key, key_prefix)
-
-            is_allowed, _, retry_after = check_rate_limit(
-                redis_client,
-                rate_key,
-                resolved_limit,
-                period,
-            )
-
             if not is_allowed:
                 raise RateLimitExceeded(retry_after=retry_after)
 
@@ -0,0 +1,35 @@
+"""Process-wide Redis clients for application features.
+
+Databases are allocated per feature, after channels=0, celery broker=1 and
+celery results=2: rate limiting uses 3 and guard presence uses 4.
+Connections are built from individual settings so the full connection URL,
+which contains credentials, never lands in the settings namespace.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+import redis
+
+_clients: dict[tuple, redis.Redis] = {}
+
+
+def get_redis_client(db: int) -> redis.Redis | None:
+    """Return the shared client for Redis database *db*, or ``None`` if unset."""
+    hostname = getattr(settings, "REDIS_HOSTNAME", None)
+    if not hostname:
+        return None
+
+    port = getattr(settings, "REDIS_PORT", 6379)
+    password = getattr(settings, "REDIS_PASSWORD", None)
+    params = (hostname, port, password, db)
+    client = _clients.get(params)
+    if client is None:
+        client = _clients[params] = redis.Redis(
+            host=hostname,
+            port=port,
+            password=password,
+            db=db,
+            socket_connect_timeout=2,
+        )
+    return client
@@ -84,6 +84,8 @@ class SimulationEventBus {
             'session.resumed',
             'session.resync_required',
             'message.item.created',
+            'message.stream.delta',
+            'message.stream.completed',
             'typing.started',
             'typing.stopped',
             'assessment.item.created',
@@ -93,6 +95,7 @@ class SimulationEventBus {
             'assessment.generation.failed',
             'assessment.generation.updated',
             'patient.results.updated',
+            'simulation.tools.updated',
             'error',
             'pong',
             'connected',
@@ -63,6 +63,7 @@ export type CanonicalOutboxEventType =
     | 'patient.pulse.created'
     | 'patient.pulse.updated'
     | 'simulation.annotation.created'
+    | 'simulation.tools.updated'
     | 'simulation.tick.triggered'
     | 'simulation.snapshot.updated'
     | 'simulation.plan.updated'
@@ -266,6 +267,14 @@ export interface AssessmentCreatedEvent extends BaseEvent {
     html?: string;  // Optional server-rendered HTML for web clients
 }
 
+/**
+ * Metadata-backed tool checksums changed; payload maps tool name to checksum
+ */
+export interface SimulationToolsUpdatedEvent extends BaseEvent {
+    type: 'simulation.tools.updated';
+    tools: Record<string, string>;
+}
+
 export interface GuardStateUpdatedEvent extends BaseEvent {
     type: 'guard.state.updated';
     guard_state: string;
@@ -849,6 +858,7 @@ export type SimulationEvent =
     | GuardStateUpdatedEvent
     | GuardWarningUpdatedEvent
     | MetadataResultsCreatedEvent
+    | SimulationToolsUpdatedEvent
     | TrainerLabInjuryCreatedEvent
     | TrainerLabIllnessCreatedEvent
     | TrainerLabProblemCreatedEvent
@@ -22,6 +22,8 @@ const TRANSIENT_EVENT_TYPES = new Set([
     'pong',
     'typing.started',
     'typing.stopped',
+    'message.stream.delta',
+    'message.stream.completed',
 ]);
 
 class SimulationSocket {
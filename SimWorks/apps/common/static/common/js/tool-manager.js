@@ -6,7 +6,8 @@
  *
  * Features:
  * - Declarative tool registration with event subscriptions
- * - Checksum-based refresh (only refresh if data changed)
+ * - Checksum-based refresh (only refresh if data changed); events carrying a
+ *   `tools` map (e.g. `simulation.tools.updated`) supply the checksum directly
  * - HTML injection mode (for events that include rendered HTML)
  * - Auto-discovery of tools from DOM
  *
@@ -20,7 +21,7 @@
  *   // Declarative configuration
  *   toolManager.configure({
  *       'patient_history': {
- *           refreshOn: ['message.item.created'],
+ *           refreshOn: ['simulation.tools.updated'],
  *           refreshMode: 'checksum',  // or 'always' or 'html_inject'
  *       },
  *       'simulation_assessment': {
@@ -174,12 +175,33 @@ class ToolManager {
         } else if (mode === 'always') {
             // Always refresh
             this.refresh(toolName);
+        } else if (data?.tools && toolName in data.tools) {
+            // Checksum pushed with the event - no round trip needed
+            this.applyChecksum(toolName, data.tools[toolName]);
         } else {
             // Checksum mode - only refresh if data changed
             this.checkAndRefresh(toolName);
         }
     }
 
+    /**
+     * Refresh a tool if *checksum* differs from the one it last rendered.
+     * @param {string} toolName - The tool name
+     * @param {string} checksum - The tool's current checksum
+     */
+    applyChecksum(toolName, checksum) {
+        const tool = this.tools.get(toolName);
+        if (!tool) return;
+
+        if (checksum !== tool.checksum) {
+            console.info(`[ToolManager] Checksum changed for ${toolName}, refreshing...`);
+            tool.checksum = checksum;
+            this.refresh(toolName);
+        } else {
+            console.debug(`[ToolManager] Checksum unchanged for ${toolName}`);
+        }
+    }
+
     /**
      * Check checksum and refresh if changed.
      * @param {string} toolName - The tool name
@@ -190,15 +212,7 @@ class ToolManager {
 
         fetch(`/tools/${toolName}/checksum/${this.simulationId}/`)
             .then(response => response.json())
-            .then(data => {
-                if (data.checksum !== tool.checksum) {
-                    console.info(`[ToolManager] Checksum changed for ${toolName}, refreshing...`);
-                    tool.checksum = data.checksum;
-                    this.refresh(toolName);
-                } else {
-                    console.debug(`[ToolManager] Checksum unchanged for ${toolName}`);
-                }
-            })
+            .then(data => this.applyChecksum(toolName, data.checksum))
             .catch(error => {
                 console.error(`[ToolManager] Failed to fetch checksum for ${toolName}:`, error);
             });
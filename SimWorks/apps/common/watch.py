@@ -3,16 +3,48 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass
 import json
 from typing import Any
+import uuid
 
 from django.core.paginator import Paginator
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Q, TextField
+from django.db.models.functions import Cast
+
+from apps.common.outbox.outbox import (
+    apply_outbox_cursor_before,
+    get_latest_cursor_sync,
+    get_latest_event_id_sync,
+)
 
 WATCH_PAGE_SIZE_OPTIONS: tuple[int, ...] = (25, 50, 100)
 DEFAULT_WATCH_PAGE_SIZE = WATCH_PAGE_SIZE_OPTIONS[0]
 DEFAULT_EVENTS_FILTER = "all"
 DEFAULT_EVENTS_SORT = "desc"
+# Newest outbox events embedded in the watch page; older ones load on demand.
+WATCH_EVENTS_WINDOW = 200
+# Service calls whose payload JSON exceeds this are flagged before expanding.
+LARGE_SERVICE_CALL_PAYLOAD_BYTES = 1_000_000
 _QUERY_TEXT_MAX_LENGTH = 200
 
+# Mirrors CATEGORIES in simulation_watch.html; anything unmatched is "other".
+WATCH_EVENT_CATEGORY_PREFIXES: dict[str, tuple[str, ...]] = {
+    "chat": ("message.",),
+    "simulation": ("simulation.",),
+    "metadata": ("patient.",),
+    "feedback": ("feedback.",),
+    "typing": ("typing.",),
+    "trainer": (
+        "preset.",
+        "command.",
+        "adjustment.",
+        "condition.",
+        "vital.",
+        "intervention.",
+        "note.",
+        "event.",
+    ),
+}
+
 
 @dataclass(frozen=True)
 class WatchPageState:
@@ -93,6 +125,117 @@ def dump_outbox_events_json(outbox_events) -> str:
     return json.dumps(serialize_outbox_events(outbox_events), cls=DjangoJSONEncoder)
 
 
+def watch_event_category(event_type: str) -> str:
+    for category, prefixes in WATCH_EVENT_CATEGORY_PREFIXES.items():
+        if event_type.startswith(prefixes):
+            return category
+    return "other"
+
+
+def _prefix_q(prefixes) -> Q:
+    condition = Q()
+    for prefix in prefixes:
+        condition |= Q(event_type__startswith=prefix)
+    return condition
+
+
+def filter_watch_events(outbox_events, *, events_filter: str, events_q: str):
+    """Apply the watch page category filter and search text in the database."""
+    if events_filter == "other":
+        outbox_events = outbox_events.exclude(
+            _prefix_q(
+                prefix for prefixes in WATCH_EVENT_CATEGORY_PREFIXES.values() for prefix in prefixes
+            )
+        )
+    elif events_filter in WATCH_EVENT_CATEGORY_PREFIXES:
+        outbox_events = outbox_events.filter(
+            _prefix_q(WATCH_EVENT_CATEGORY_PREFIXES[events_filter])
+        )
+
+    if events_q:
+        outbox_events = outbox_events.annotate(
+            payload_text=Cast("payload", output_field=TextField())
+        ).filter(
+            Q(event_type__icontains=events_q)
+            | Q(correlation_id__icontains=events_q)
+            | Q(payload_text__icontains=events_q)
+        )
+    return outbox_events
+
+
+def count_watch_event_categories(outbox_events, *, events_q: str = "") -> dict[str, int]:
+    """Return per-category event counts (plus ``"all"``) with one grouped query."""
+    counts = dict.fromkeys(("all", *WATCH_EVENT_CATEGORY_PREFIXES, "other"), 0)
+    rows = (
+        filter_watch_events(outbox_events, events_filter=DEFAULT_EVENTS_FILTER, events_q=events_q)
+        .order_by()
+        .values("event_type")
+        .annotate(total=Count("id"))
+    )
+    for row in rows:
+        counts["all"] += row["total"]
+        counts[watch_event_category(row["event_type"])] += row["total"]
+    return counts
+
+
+def _parse_event_id(value: Any) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def select_watch_events(
+    outbox_events,
+    *,
+    events_filter: str = DEFAULT_EVENTS_FILTER,
+    events_q: str = "",
+    before: Any = None,
+    limit: int | None = None,
+) -> tuple[list, bool]:
+    """Return the newest *limit* (default ``WATCH_EVENTS_WINDOW``) matching events, oldest first.
+
+    ``before`` is an event ID; when given, only events strictly older than it
+    are considered (keyset pagination on ``(created_at, id)``).  The second
+    value tells whether older matching events remain.
+    """
+    limit = limit or WATCH_EVENTS_WINDOW
+    queryset = filter_watch_events(outbox_events, events_filter=events_filter, events_q=events_q)
+    if before is not None:
+        before_id = _parse_event_id(before)
+        anchor = outbox_events.filter(id=before_id).first() if before_id else None
+        if anchor is None:
+            return [], False
+        queryset = apply_outbox_cursor_before(queryset, anchor)
+
+    rows = list(queryset.order_by("-created_at", "-id")[: limit + 1])
+    has_older = len(rows) > limit
+    rows = rows[:limit]
+    rows.reverse()
+    return rows, has_older
+
+
+def build_watch_events_payload(*, request, outbox_events) -> dict[str, Any]:
+    """JSON body for the watch page "load older" and filter refresh requests."""
+    watch_state = parse_watch_page_state(request.GET)
+    before = request.GET.get("before") or None
+    events, has_older = select_watch_events(
+        outbox_events,
+        events_filter=watch_state.events_filter,
+        events_q=watch_state.events_q,
+        before=before,
+    )
+    payload: dict[str, Any] = {
+        "events": serialize_outbox_events(events),
+        "has_older": has_older,
+    }
+    if before is None:
+        payload["category_counts"] = count_watch_event_categories(
+            outbox_events, events_q=watch_state.events_q
+        )
+    return payload
+
+
 def build_url_with_query(base_url: str, query_params) -> str:
     encoded = query_params.urlencode()
     if not encoded:
@@ -124,6 +267,7 @@ def build_watch_service_calls_context(
         "service_calls_url": service_calls_url,
         "service_calls_partial_url": build_url_with_query(service_calls_url, request.GET),
         "watch_page_size_options": WATCH_PAGE_SIZE_OPTIONS,
+        "large_payload_bytes": LARGE_SERVICE_CALL_PAYLOAD_BYTES,
     }
 
 
@@ -133,6 +277,7 @@ def build_watch_page_context(
     simulation,
     outbox_events,
     service_calls_qs,
+    events_url: str,
     stream_url: str,
     realtime_transport: str,
     realtime_session_payload: dict[str, Any] | None = None,
@@ -143,7 +288,13 @@ def build_watch_page_context(
     can_go_to_simulation: bool,
     go_to_simulation_url: str,
 ) -> dict[str, Any]:
-    """Build shared admin watch context with an explicit transport selection."""
+    """Build shared admin watch context with an explicit transport selection.
+
+    ``outbox_events`` is the simulation's unordered ``OutboxEvent`` queryset.
+    Only the newest ``WATCH_EVENTS_WINDOW`` events matching the requested
+    filter are embedded; older ones are fetched from ``events_url`` and new
+    ones arrive over the stream, resumed from the newest event overall.
+    """
     if realtime_transport not in {"websocket", "sse"}:
         raise ValueError(f"Unsupported realtime transport: {realtime_transport}")
 
@@ -153,10 +304,31 @@ def build_watch_page_context(
         service_calls_url=service_calls_url,
         watch_url=watch_url,
     )
+    watch_state = context["watch_state"]
+    events, has_older = select_watch_events(
+        outbox_events,
+        events_filter=watch_state.events_filter,
+        events_q=watch_state.events_q,
+    )
+    if realtime_transport == "websocket":
+        stream_cursor = get_latest_event_id_sync(simulation.id)
+    else:
+        stream_cursor = get_latest_cursor_sync(simulation.id)
+
     context.update(
         {
             "simulation": simulation,
-            "outbox_events_json": dump_outbox_events_json(outbox_events),
+            "outbox_events_json": dump_outbox_events_json(events),
+            "outbox_events_window_json": json.dumps(
+                {
+                    "has_older": has_older,
+                    "stream_cursor": stream_cursor,
+                    "category_counts": count_watch_event_categories(
+                        outbox_events, events_q=watch_state.events_q
+                    ),
+                }
+            ),
+            "events_url": events_url,
             "stream_url": stream_url,
             "realtime_transport": realtime_transport,
             "realtime_session_payload_json": json.dumps(
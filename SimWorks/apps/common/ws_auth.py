@@ -9,14 +9,13 @@ from __future__ import annotations
 from channels.auth import AuthMiddlewareStack
 from channels.db import database_sync_to_async
 from channels.middleware import BaseMiddleware
-from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 
 from api.v1.auth import InvalidTokenError, decode_access_token
+from apps.accounts.principal_cache import get_active_user
 from config.logging import get_logger
 
 logger = get_logger(__name__)
-User = get_user_model()
 
 
 @database_sync_to_async
@@ -30,7 +29,7 @@ def _get_user_for_token_subject(subject: str):
         )
         return AnonymousUser()
 
-    user = User.objects.filter(pk=subject_pk, is_active=True).first()
+    user = get_active_user(subject_pk)
     if user is None:
         logger.warning(
             "ws.auth.subject_user_not_found_or_inactive",
@@ -15,9 +15,9 @@ def staff_feedback_awareness(request) -> dict[str, Any]:
     if not getattr(user, "is_authenticated", False) or not getattr(user, "is_staff", False):
         return {}
 
-    from .models import UserFeedback
+    from .services import FeedbackQueryService
 
-    count = UserFeedback.objects.filter(is_reviewed=False, is_archived=False).count()
+    count = FeedbackQueryService().unreviewed_count()
     url = f"{reverse('feedback:staff-list')}?reviewed=unreviewed"
     return {
         "unreviewed_feedback_count": count,
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import date, datetime, time, timedelta
 import json
 from typing import ClassVar
 
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import DisallowedHost
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils import timezone
@@ -25,6 +28,32 @@ FEEDBACK_NOTIFICATION_RECIPIENT = "feedback@jackfruitco.com"
 FEEDBACK_NOTIFICATION_FROM_EMAIL = "noreply@jackfruitco.com"
 FEEDBACK_BODY_PREVIEW_LENGTH = 400
 MAX_CONTEXT_BYTES = 10_240
+INBOX_PAGE_SIZE = 50
+COUNTERS_CACHE_KEY = "feedback:inbox-counters"
+DEFAULT_COUNTERS_CACHE_TTL = 60
+
+
+def _counters_cache_ttl() -> int:
+    return int(getattr(settings, "FEEDBACK_COUNTERS_CACHE_TTL", DEFAULT_COUNTERS_CACHE_TTL))
+
+
+def clear_cached_feedback_counters() -> None:
+    cache.delete(COUNTERS_CACHE_KEY)
+
+
+def invalidate_feedback_counters() -> None:
+    """Drop the cached inbox counters now and again once the transaction commits.
+
+    Called by every workflow transition (submissions clear them after
+    commit); edits made elsewhere (e.g. Django admin) show up after
+    ``FEEDBACK_COUNTERS_CACHE_TTL``.
+    """
+    clear_cached_feedback_counters()
+    transaction.on_commit(clear_cached_feedback_counters)
+
+
+def _start_of_day(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
 
 
 @dataclass
@@ -258,7 +287,7 @@ class FeedbackSubmissionService:
                 },
             )
             transaction.on_commit(
-                lambda: self._enqueue_notification(
+                lambda: self._after_commit(
                     feedback.pk,
                     request_meta={"request_id": metadata["request_id"]},
                 )
@@ -273,6 +302,11 @@ class FeedbackSubmissionService:
         )
         return feedback
 
+    def _after_commit(self, feedback_id: int, *, request_meta: dict | None = None) -> None:
+        # The new row only becomes visible to the counter query now.
+        clear_cached_feedback_counters()
+        self._enqueue_notification(feedback_id, request_meta=request_meta)
+
     def _enqueue_notification(
         self,
         feedback_id: int,
@@ -330,6 +364,7 @@ class FeedbackWorkflowService:
         feedback.reviewed_at = timezone.now()
         feedback.reviewed_by = actor
         feedback.save(update_fields=["is_reviewed", "reviewed_at", "reviewed_by", "updated_at"])
+        invalidate_feedback_counters()
         FeedbackAuditEvent.objects.create(
             feedback=feedback,
             actor=actor,
@@ -350,6 +385,7 @@ class FeedbackWorkflowService:
             if status == UserFeedback.Status.RESOLVED and feedback.resolved_at is None:
                 feedback.resolved_at = now
                 feedback.save(update_fields=["resolved_at", "updated_at"])
+                invalidate_feedback_counters()
             return feedback
 
         feedback.status = status
@@ -358,6 +394,7 @@ class FeedbackWorkflowService:
         elif old_status == UserFeedback.Status.RESOLVED:
             feedback.resolved_at = None
         feedback.save(update_fields=["status", "resolved_at", "updated_at"])
+        invalidate_feedback_counters()
         FeedbackAuditEvent.objects.create(
             feedback=feedback,
             actor=actor,
@@ -378,6 +415,7 @@ class FeedbackWorkflowService:
         feedback.archived_at = timezone.now()
         feedback.archived_by = actor
         feedback.save(update_fields=["is_archived", "archived_at", "archived_by", "updated_at"])
+        invalidate_feedback_counters()
         FeedbackAuditEvent.objects.create(
             feedback=feedback,
             actor=actor,
@@ -394,6 +432,7 @@ class FeedbackWorkflowService:
         feedback.archived_at = None
         feedback.archived_by = None
         feedback.save(update_fields=["is_archived", "archived_at", "archived_by", "updated_at"])
+        invalidate_feedback_counters()
         FeedbackAuditEvent.objects.create(
             feedback=feedback,
             actor=actor,
@@ -455,6 +494,13 @@ class FeedbackWorkflowService:
         return len(affected_ids)
 
 
+@dataclass
+class InboxPage:
+    items: list[UserFeedback]
+    next_cursor: int | None = None
+    previous_cursor: int | None = None
+
+
 class FeedbackQueryService:
     """Read-side helpers for staff feedback inboxes, badges, and metrics.
 
@@ -467,6 +513,7 @@ class FeedbackQueryService:
         UserFeedback.Status.DUPLICATE,
         UserFeedback.Status.WONT_FIX,
     }
+    INBOX_ORDERING: ClassVar[tuple[str, ...]] = ("is_reviewed", "-created_at", "-id")
 
     def staff_inbox_queryset(self, params):
         qs = UserFeedback.objects.select_related(
@@ -507,11 +554,7 @@ class FeedbackQueryService:
             if user_query.isdigit():
                 qs = qs.filter(user_id=int(user_query))
             else:
-                qs = qs.filter(
-                    Q(user__email__icontains=user_query)
-                    | Q(user__first_name__icontains=user_query)
-                    | Q(user__last_name__icontains=user_query)
-                )
+                qs = qs.filter(user_id__in=self._matching_user_ids(user_query))
 
         simulation_query = (params.get("simulation") or "").strip()
         if simulation_query:
@@ -520,48 +563,137 @@ class FeedbackQueryService:
             else:
                 qs = qs.none()
 
+        # Whole-day ranges on the raw column, so the created_at indexes apply.
         date_from = parse_date((params.get("date_from") or "").strip())
         if date_from:
-            qs = qs.filter(created_at__date__gte=date_from)
+            qs = qs.filter(created_at__gte=_start_of_day(date_from))
 
         date_to = parse_date((params.get("date_to") or "").strip())
         if date_to:
-            qs = qs.filter(created_at__date__lte=date_to)
+            qs = qs.filter(created_at__lt=_start_of_day(date_to + timedelta(days=1)))
 
         search = (params.get("q") or "").strip()
         if search:
             search_filter = (
                 Q(title__icontains=search)
                 | Q(body__icontains=search)
-                | Q(user__email__icontains=search)
-                | Q(user__first_name__icontains=search)
-                | Q(user__last_name__icontains=search)
+                | Q(user_id__in=self._matching_user_ids(search))
             )
             if search.isdigit():
                 search_filter |= Q(simulation_id=int(search))
             qs = qs.filter(search_filter)
 
-        return qs.order_by("is_reviewed", "-created_at", "-id")
+        return qs.order_by(*self.INBOX_ORDERING)
+
+    def staff_inbox_page(self, params, *, page_size: int = INBOX_PAGE_SIZE) -> InboxPage:
+        """Return one keyset page of :meth:`staff_inbox_queryset`.
+
+        ``after`` / ``before`` hold the id of the last / first row of the
+        neighbouring page.  Each page is a single ``LIMIT`` query that seeks
+        through ``feedback_inbox_idx`` from the cursor row, so deep pages cost
+        the same as the first one and no total count is needed.  An unknown
+        cursor falls back to the first page.
+        """
+        qs = self.staff_inbox_queryset(params)
+        after = self._cursor(qs, params.get("after"))
+        before = None if after else self._cursor(qs, params.get("before"))
+
+        if before is not None:
+            rows = list(
+                qs.filter(self._before(before)).order_by("-is_reviewed", "created_at", "id")[
+                    : page_size + 1
+                ]
+            )
+            items = rows[:page_size][::-1]
+            has_previous, has_next = len(rows) > page_size, True
+        else:
+            if after is not None:
+                qs = qs.filter(self._after(after))
+            rows = list(qs[: page_size + 1])
+            items = rows[:page_size]
+            has_previous, has_next = after is not None, len(rows) > page_size
+
+        return InboxPage(
+            items=items,
+            next_cursor=items[-1].pk if has_next and items else None,
+            previous_cursor=items[0].pk if has_previous and items else None,
+        )
+
+    @staticmethod
+    def _cursor(qs, raw) -> dict | None:
+        raw = (raw or "").strip()
+        if not raw.isdigit():
+            return None
+        return qs.filter(pk=int(raw)).values("is_reviewed", "created_at", "id").first()
+
+    @staticmethod
+    def _after(cursor: dict) -> Q:
+        """Rows after *cursor* in ``INBOX_ORDERING``."""
+        return (
+            Q(is_reviewed__gt=cursor["is_reviewed"])
+            | Q(is_reviewed=cursor["is_reviewed"], created_at__lt=cursor["created_at"])
+            | Q(
+                is_reviewed=cursor["is_reviewed"],
+                created_at=cursor["created_at"],
+                id__lt=cursor["id"],
+            )
+        )
+
+    @staticmethod
+    def _before(cursor: dict) -> Q:
+        """Rows before *cursor* in ``INBOX_ORDERING``."""
+        return (
+            Q(is_reviewed__lt=cursor["is_reviewed"])
+            | Q(is_reviewed=cursor["is_reviewed"], created_at__gt=cursor["created_at"])
+            | Q(
+                is_reviewed=cursor["is_reviewed"],
+                created_at=cursor["created_at"],
+                id__gt=cursor["id"],
+            )
+        )
+
+    @staticmethod
+    def _matching_user_ids(text: str):
+        """Semi-join on matching users instead of OR-ing across the user join."""
+        return (
+            get_user_model()
+            .objects.filter(
+                Q(email__icontains=text)
+                | Q(first_name__icontains=text)
+                | Q(last_name__icontains=text)
+            )
+            .values("pk")
+        )
 
     def analytics(self) -> dict[str, int]:
-        now = timezone.now()
-        recent_cutoff = now - timedelta(days=30)
-        base = UserFeedback.objects.all()
-        return {
-            "open": base.filter(is_archived=False)
-            .exclude(status__in=self.OPEN_EXCLUDED_STATUSES)
-            .count(),
-            "planned": base.filter(is_archived=False, status=UserFeedback.Status.PLANNED).count(),
-            "resolved_last_30_days": base.filter(
-                status=UserFeedback.Status.RESOLVED,
-                resolved_at__gte=recent_cutoff,
-            ).count(),
-            "duplicate": base.filter(
-                is_archived=False, status=UserFeedback.Status.DUPLICATE
-            ).count(),
-            "wont_fix": base.filter(is_archived=False, status=UserFeedback.Status.WONT_FIX).count(),
-            "unreviewed": self.unreviewed_count(),
-        }
+        """Inbox counters from one conditional-aggregate query.
+
+        Cached under ``COUNTERS_CACHE_KEY`` for ``FEEDBACK_COUNTERS_CACHE_TTL``
+        seconds (``0`` disables) and invalidated by submissions and workflow
+        transitions.
+        """
+        ttl = _counters_cache_ttl()
+        if ttl > 0:
+            counters = cache.get(COUNTERS_CACHE_KEY)
+            if counters is not None:
+                return counters
+
+        recent_cutoff = timezone.now() - timedelta(days=30)
+        unarchived = Q(is_archived=False)
+        counters = UserFeedback.objects.aggregate(
+            open=Count("pk", filter=unarchived & ~Q(status__in=self.OPEN_EXCLUDED_STATUSES)),
+            planned=Count("pk", filter=unarchived & Q(status=UserFeedback.Status.PLANNED)),
+            resolved_last_30_days=Count(
+                "pk",
+                filter=Q(status=UserFeedback.Status.RESOLVED, resolved_at__gte=recent_cutoff),
+            ),
+            duplicate=Count("pk", filter=unarchived & Q(status=UserFeedback.Status.DUPLICATE)),
+            wont_fix=Count("pk", filter=unarchived & Q(status=UserFeedback.Status.WONT_FIX)),
+            unreviewed=Count("pk", filter=unarchived & Q(is_reviewed=False)),
+        )
+        if ttl > 0:
+            cache.set(COUNTERS_CACHE_KEY, counters, timeout=ttl)
+        return counters
 
     def unreviewed_count(self) -> int:
-        return UserFeedback.objects.filter(is_reviewed=False, is_archived=False).count()
+        return self.analytics()["unreviewed"]
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
-from django.core.paginator import Paginator
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.views.decorators.http import require_http_methods, require_POST
@@ -42,18 +41,20 @@ def staff_feedback_list(request):
             url = f"{url}?{request.GET.urlencode()}"
         return redirect(url)
 
-    qs = query_service.staff_inbox_queryset(request.GET)
-    paginator = Paginator(qs, 50)
-    page_obj = paginator.get_page(request.GET.get("page"))
+    page = query_service.staff_inbox_page(request.GET)
+    filters = request.GET.copy()
+    for key in ("after", "before", "page"):
+        filters.pop(key, None)
     context = {
-        "page_obj": page_obj,
-        "feedback_items": page_obj.object_list,
+        "page": page,
+        "feedback_items": page.items,
         "analytics": query_service.analytics(),
         "categories": UserFeedback.Category.choices,
         "statuses": UserFeedback.Status.choices,
         "platforms": UserFeedback.ClientPlatform.choices,
         "bulk_form": FeedbackBulkActionForm(),
         "querystring": request.GET.urlencode(),
+        "filter_querystring": filters.urlencode(),
     }
     return render(request, "feedback/staff/list.html", context)
 
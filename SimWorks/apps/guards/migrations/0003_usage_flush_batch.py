@@ -0,0 +1,21 @@
+# Generated by Django 6.0.4 on 2026-10-19 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('guards', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UsageFlushBatch',
+            fields=[
+                ('token', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('row_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+    ]
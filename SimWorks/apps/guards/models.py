@@ -186,3 +186,19 @@ class UsageRecord(models.Model):
         return (
             f"UsageRecord(scope={self.scope_type}, lab={self.lab_type}, tokens={self.total_tokens})"
         )
+
+
+class UsageFlushBatch(models.Model):
+    """A Redis usage batch that has been applied to ``UsageRecord``.
+
+    Written in the same transaction as the batch's upsert.  A flush retried
+    after a failed Redis acknowledgement finds its token here and skips the
+    upsert instead of counting the tokens twice.
+    """
+
+    token = models.CharField(max_length=32, primary_key=True)
+    row_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self) -> str:
+        return f"UsageFlushBatch(token={self.token}, rows={self.row_count})"
@@ -113,6 +113,36 @@ _POLICY_TABLE: dict[tuple[str, str], GuardPolicy] = {
 }
 
 
+def min_inactivity_threshold_seconds() -> int | None:
+    """Return the shortest inactivity warning/pause threshold of any policy.
+
+    Sessions whose last presence is younger than this cannot transition on
+    inactivity under any plan.  ``None`` when no policy enables inactivity.
+    """
+    thresholds = [
+        seconds
+        for policy in (_DEFAULT, *_POLICY_TABLE.values())
+        for seconds in (policy.inactivity_warning_seconds, policy.inactivity_pause_seconds)
+        if seconds > 0
+    ]
+    return min(thresholds, default=None)
+
+
+def uniform_inactivity_policy(lab_type: str) -> GuardPolicy | None:
+    """Return a policy whose inactivity thresholds hold for every product of *lab_type*.
+
+    Lets batch evaluation skip per-session product resolution.  ``None``
+    when some product of the lab overrides the default thresholds.
+    """
+    thresholds = {
+        (policy.inactivity_warning_seconds, policy.inactivity_pause_seconds)
+        for (lab, _), policy in _POLICY_TABLE.items()
+        if lab == lab_type
+    }
+    thresholds.add((_DEFAULT.inactivity_warning_seconds, _DEFAULT.inactivity_pause_seconds))
+    return _DEFAULT if len(thresholds) == 1 else None
+
+
 def resolve_policy(lab_type: str, product_code: str) -> GuardPolicy:
     """Return the guard policy for a given lab type and product code.
 
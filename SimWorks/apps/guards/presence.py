@@ -0,0 +1,166 @@
+"""Redis-backed presence freshness for guard heartbeats.
+
+Heartbeats are the largest write load on ``SessionPresence``.  With
+``GUARDS_PRESENCE_BACKEND = "redis"`` they no longer touch the database:
+
+* ``guards:presence:<simulation_id>`` — hash with ``last_presence_at``,
+  ``visibility`` and ``visibility_changed_at`` (epoch seconds), expiring
+  ``GUARDS_PRESENCE_TTL`` seconds after the last heartbeat.
+* ``guards:presence:due`` — sorted set of TrainerLab simulation ids scored by
+  their last heartbeat.  ``check_stale_sessions`` reads only the members
+  older than the shortest inactivity threshold instead of scanning the table.
+
+Only guard-state transitions (WARNING, PAUSED_*, …) are written to
+``SessionPresence``.  Its presence columns become a floor: readers take the
+newer of the database value and the Redis value.  Any other backend value
+keeps the historical database-only behaviour.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from django.conf import settings
+import redis
+
+from apps.common.redis_client import get_redis_client
+
+from .enums import ClientVisibility
+
+PRESENCE_REDIS_DB = 4
+DEFAULT_TTL = 86_400
+KEY_PREFIX = "guards:presence:"
+DUE_KEY = f"{KEY_PREFIX}due"
+
+# KEYS: presence hash, due index.  ARGV: now, visibility, ttl, simulation id,
+# "1" to index the session for inactivity evaluation.
+# Returns the visibility-change timestamp after the update (or false).
+RECORD_SCRIPT = """
+local previous = redis.call('HGET', KEYS[1], 'visibility') or 'unknown'
+if previous ~= ARGV[2] then
+  redis.call('HSET', KEYS[1], 'visibility', ARGV[2], 'visibility_changed_at', ARGV[1])
+end
+redis.call('HSET', KEYS[1], 'last_presence_at', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+if ARGV[5] == '1' then
+  redis.call('ZADD', KEYS[2], ARGV[1], ARGV[4])
+end
+return redis.call('HGET', KEYS[1], 'visibility_changed_at')
+"""
+
+
+@dataclass(frozen=True)
+class PresenceSnapshot:
+    """Presence freshness as last reported by the client."""
+
+    last_presence_at: datetime | None
+    client_visibility: str = ClientVisibility.UNKNOWN
+    last_visibility_change_at: datetime | None = None
+
+
+def _to_timestamp(value: datetime) -> str:
+    return repr(value.timestamp())
+
+
+def _from_timestamp(value: bytes | str | None) -> datetime | None:
+    if not value:
+        return None
+    return datetime.fromtimestamp(float(value), tz=UTC)
+
+
+def _decode(value: bytes | str | None) -> str:
+    if isinstance(value, bytes):
+        return value.decode()
+    return value or ""
+
+
+class RedisPresenceStore:
+    """Presence hashes plus a due index, one round trip per heartbeat."""
+
+    def __init__(self, client: redis.Redis, *, ttl: int = DEFAULT_TTL):
+        self.client = client
+        self.ttl = ttl
+        self._record = client.register_script(RECORD_SCRIPT)
+
+    @staticmethod
+    def key(simulation_id: int) -> str:
+        return f"{KEY_PREFIX}{simulation_id}"
+
+    def record(
+        self,
+        simulation_id: int,
+        client_visibility: str,
+        at: datetime,
+        *,
+        index: bool,
+    ) -> PresenceSnapshot:
+        """Store a heartbeat; *index* adds the session to the due index."""
+        changed_at = self._record(
+            keys=[self.key(simulation_id), DUE_KEY],
+            args=[_to_timestamp(at), client_visibility, self.ttl, simulation_id, int(index)],
+        )
+        return PresenceSnapshot(
+            last_presence_at=at,
+            client_visibility=client_visibility,
+            last_visibility_change_at=_from_timestamp(changed_at),
+        )
+
+    def get_many(self, simulation_ids: Iterable[int]) -> dict[int, PresenceSnapshot]:
+        ids = list(simulation_ids)
+        pipe = self.client.pipeline(transaction=False)
+        for simulation_id in ids:
+            pipe.hmget(
+                self.key(simulation_id),
+                "last_presence_at",
+                "visibility",
+                "visibility_changed_at",
+            )
+        snapshots = {}
+        for simulation_id, (last_at, visibility, changed_at) in zip(
+            ids, pipe.execute(), strict=True
+        ):
+            if last_at is None:
+                continue
+            snapshots[simulation_id] = PresenceSnapshot(
+                last_presence_at=_from_timestamp(last_at),
+                client_visibility=_decode(visibility) or ClientVisibility.UNKNOWN,
+                last_visibility_change_at=_from_timestamp(changed_at),
+            )
+        return snapshots
+
+    def get(self, simulation_id: int) -> PresenceSnapshot | None:
+        return self.get_many([simulation_id]).get(simulation_id)
+
+    def due(self, cutoff: datetime) -> list[int]:
+        """Return indexed simulation ids whose last heartbeat is at or before *cutoff*."""
+        members = self.client.zrangebyscore(DUE_KEY, "-inf", cutoff.timestamp())
+        return [int(member) for member in members]
+
+    def index(self, simulation_id: int, at: datetime) -> None:
+        """Add (or refresh) a session in the due index without a heartbeat."""
+        self.client.zadd(DUE_KEY, {simulation_id: at.timestamp()})
+
+    def forget(self, simulation_ids: Iterable[int]) -> None:
+        """Drop simulation ids from the due index."""
+        ids = list(simulation_ids)
+        if ids:
+            self.client.zrem(DUE_KEY, *ids)
+
+
+_stores: dict[int, RedisPresenceStore] = {}
+
+
+def get_presence_store() -> RedisPresenceStore | None:
+    """Return the Redis presence store, or ``None`` for database-only presence."""
+    if getattr(settings, "GUARDS_PRESENCE_BACKEND", "database") != "redis":
+        return None
+    client = get_redis_client(PRESENCE_REDIS_DB)
+    if client is None:
+        return None
+    ttl = int(getattr(settings, "GUARDS_PRESENCE_TTL", DEFAULT_TTL))
+    store = _stores.get(id(client))
+    if store is None or store.client is not client or store.ttl != ttl:
+        store = _stores[id(client)] = RedisPresenceStore(client, ttl=ttl)
+    return store
@@ -13,17 +13,22 @@ Key entry points:
 * ``evaluate_inactivity()`` — server-side inactivity evaluation.
 * ``evaluate_runtime_cap()`` — runtime cap evaluation.
 * ``evaluate_wall_clock()`` — wall-clock expiry evaluation.
+* ``evaluate_inactivity_batch()`` / ``evaluate_wall_clock_batch()`` — set-based
+  evaluation for the periodic stale-session task.
 * ``record_usage()`` — increment usage counters after a service call.
+* ``flush_buffered_usage()`` — apply Redis-buffered usage to ``UsageRecord``.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import timedelta
 from typing import Any
 
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.models import F, Sum
 from django.utils import timezone
+import redis
 
 from config.logging import get_logger
 
@@ -37,8 +42,15 @@ from .enums import (
     PauseReason,
     UsageScopeType,
 )
-from .models import SessionPresence, UsageRecord
-from .policy import GuardPolicy, resolve_policy, resolve_policy_for_simulation
+from .models import SessionPresence, UsageFlushBatch, UsageRecord
+from .policy import (
+    GuardPolicy,
+    resolve_policy,
+    resolve_policy_for_simulation,
+    uniform_inactivity_policy,
+)
+from .presence import get_presence_store
+from .usage_buffer import COUNTER_FIELDS, SCOPE_COLUMNS, BufferedUsage, get_usage_buffer
 
 logger = get_logger(__name__)
 
@@ -87,9 +99,55 @@ def ensure_session_presence(
             simulation_id=simulation_id,
             lab_type=lab_type,
         )
+        if lab_type == LabType.TRAINERLAB:
+            _index_presence(simulation_id, now)
     return presence
 
 
+# Guard states evaluated for inactivity.
+_INACTIVITY_GUARD_STATES = frozenset({GuardState.ACTIVE, GuardState.IDLE, GuardState.WARNING})
+
+
+def _index_presence(simulation_id: int, at) -> None:
+    """Add a session to the Redis due index so inactivity evaluation sees it."""
+    store = get_presence_store()
+    if store is None:
+        return
+    try:
+        store.index(simulation_id, at)
+    except redis.RedisError:
+        logger.warning("guards.presence.index_failed", simulation_id=simulation_id)
+
+
+def _apply_store_presence(presence: SessionPresence) -> SessionPresence:
+    """Overlay Redis presence freshness onto *presence* (not saved).
+
+    The database columns are a floor: they are written on creation and on
+    resume, so the newer of the two values wins.  Raises ``redis.RedisError``
+    when the store is configured but unreachable.
+    """
+    _apply_store_presence_many([presence])
+    return presence
+
+
+def _apply_store_presence_many(presences: list[SessionPresence]) -> None:
+    """Overlay Redis presence onto many rows with one store round trip."""
+    store = get_presence_store()
+    if store is None or not presences:
+        return
+    snapshots = store.get_many(presence.simulation_id for presence in presences)
+    for presence in presences:
+        snapshot = snapshots.get(presence.simulation_id)
+        if snapshot is None:
+            continue
+        if not presence.last_presence_at or snapshot.last_presence_at > presence.last_presence_at:
+            presence.last_presence_at = snapshot.last_presence_at
+            presence.client_visibility = snapshot.client_visibility
+            presence.last_visibility_change_at = (
+                snapshot.last_visibility_change_at or presence.last_visibility_change_at
+            )
+
+
 def record_heartbeat(
     simulation_id: int,
     client_visibility: str = ClientVisibility.UNKNOWN,
@@ -106,6 +164,13 @@ def record_heartbeat(
         else ClientVisibility.UNKNOWN
     )
 
+    store = get_presence_store()
+    if store is not None:
+        try:
+            return _record_heartbeat_in_store(store, simulation_id, valid_visibility, now)
+        except redis.RedisError:
+            logger.warning("guards.presence.store_unavailable", simulation_id=simulation_id)
+
     with transaction.atomic():
         presence = SessionPresence.objects.select_for_update().get(
             simulation_id=simulation_id,
@@ -142,6 +207,50 @@ def record_heartbeat(
     return presence
 
 
+def _record_heartbeat_in_store(store, simulation_id: int, visibility: str, now) -> SessionPresence:
+    """Heartbeat path for the Redis presence store.
+
+    Freshness goes to Redis only; the row is read without a lock and written
+    only when the heartbeat clears a WARNING.
+    """
+    presence = SessionPresence.objects.get(simulation_id=simulation_id)
+    snapshot = store.record(
+        simulation_id,
+        visibility,
+        now,
+        index=(
+            presence.lab_type == LabType.TRAINERLAB
+            and presence.guard_state in _INACTIVITY_GUARD_STATES
+        ),
+    )
+    presence.last_presence_at = snapshot.last_presence_at
+    presence.client_visibility = snapshot.client_visibility
+    presence.last_visibility_change_at = (
+        snapshot.last_visibility_change_at or presence.last_visibility_change_at
+    )
+
+    if presence.guard_state == GuardState.WARNING:
+        cleared = SessionPresence.objects.filter(
+            pk=presence.pk,
+            guard_state=GuardState.WARNING,
+        ).update(
+            guard_state=GuardState.ACTIVE,
+            warning_sent_at=None,
+            engine_runnable=True,
+            modified_at=now,
+        )
+        if cleared:
+            presence.guard_state = GuardState.ACTIVE
+            presence.warning_sent_at = None
+            presence.engine_runnable = True
+            logger.info(
+                "guards.warning_cleared",
+                simulation_id=simulation_id,
+            )
+
+    return presence
+
+
 # ───────────────────────────────────────────────────────────────────────
 # Guard service entry — the single shared entrypoint
 # ───────────────────────────────────────────────────────────────────────
@@ -219,11 +328,14 @@ def evaluate_inactivity(simulation_id: int) -> GuardState | None:
         # Only evaluate inactivity for active/idle/warning TrainerLab sessions.
         if presence.lab_type != LabType.TRAINERLAB:
             return None
-        if presence.guard_state not in {
-            GuardState.ACTIVE,
-            GuardState.IDLE,
-            GuardState.WARNING,
-        }:
+        if presence.guard_state not in _INACTIVITY_GUARD_STATES:
+            return None
+
+        try:
+            _apply_store_presence(presence)
+        except redis.RedisError:
+            # Without fresh presence the database floor would look stale.
+            logger.warning("guards.presence.store_unavailable", simulation_id=simulation_id)
             return None
 
         _, _, policy = resolve_policy_for_simulation(presence.simulation)
@@ -462,6 +574,210 @@ def evaluate_wall_clock(simulation_id: int) -> GuardState | None:
     return None
 
 
+# ───────────────────────────────────────────────────────────────────────
+# Batched evaluation (called by the periodic stale-session task)
+# ───────────────────────────────────────────────────────────────────────
+
+
+def evaluate_inactivity_batch(simulation_ids: Iterable[int]) -> dict[int, GuardState]:
+    """Evaluate inactivity for many sessions with a constant number of queries.
+
+    Candidates are read and classified without locks.  Only the rows that
+    need a transition are then locked, with ``skip_locked`` so rows held by
+    a concurrent resume or heartbeat are left for the next run.  Locked rows
+    are re-classified against fresh presence, updated with one ``UPDATE``
+    per target state, and their guard events are inserted together.
+
+    Returns ``{simulation_id: new_state}`` for the sessions that transitioned.
+    """
+    ids = list(simulation_ids)
+    if not ids:
+        return {}
+    now = timezone.now()
+    candidates = SessionPresence.objects.filter(
+        simulation_id__in=ids,
+        lab_type=LabType.TRAINERLAB,
+        guard_state__in=_INACTIVITY_GUARD_STATES,
+    )
+    policy = uniform_inactivity_policy(LabType.TRAINERLAB)
+    if policy is None:
+        candidates = candidates.select_related("simulation")
+    presences = list(candidates)
+    policies = _inactivity_policies(presences, policy)
+
+    try:
+        _apply_store_presence_many(presences)
+        planned = _classify_inactivity(presences, policies, now)
+        if not planned:
+            return {}
+        with transaction.atomic():
+            locked = list(
+                SessionPresence.objects.select_for_update(skip_locked=True).filter(
+                    simulation_id__in=planned,
+                    guard_state__in=_INACTIVITY_GUARD_STATES,
+                )
+            )
+            _apply_store_presence_many(locked)
+            transitions = _classify_inactivity(locked, policies, now)
+            _apply_inactivity_transitions(transitions, policies, now)
+    except redis.RedisError:
+        # Without fresh presence the database floor would look stale.
+        logger.warning("guards.presence.store_unavailable", simulation_count=len(ids))
+        return {}
+
+    for simulation_id, (new_state, age) in transitions.items():
+        if new_state == GuardState.PAUSED_INACTIVITY:
+            logger.info(
+                "guards.autopause.inactivity",
+                simulation_id=simulation_id,
+                age_seconds=int(age),
+            )
+            _autopause_trainerlab_session(simulation_id)
+        else:
+            logger.info(
+                "guards.warning.inactivity",
+                simulation_id=simulation_id,
+                age_seconds=int(age),
+            )
+    return {simulation_id: new_state for simulation_id, (new_state, _) in transitions.items()}
+
+
+def _inactivity_policies(
+    presences: list[SessionPresence], uniform: GuardPolicy | None
+) -> dict[int, GuardPolicy]:
+    """Map simulation ids to their policy, resolving products once per user and account."""
+    if uniform is not None:
+        return {presence.simulation_id: uniform for presence in presences}
+    resolved: dict[tuple[int | None, int | None], GuardPolicy] = {}
+    policies = {}
+    for presence in presences:
+        simulation = presence.simulation
+        key = (simulation.user_id, simulation.account_id)
+        if key not in resolved:
+            resolved[key] = resolve_policy_for_simulation(simulation)[2]
+        policies[presence.simulation_id] = resolved[key]
+    return policies
+
+
+def _classify_inactivity(
+    presences: list[SessionPresence],
+    policies: dict[int, GuardPolicy],
+    now,
+) -> dict[int, tuple[GuardState, float]]:
+    """Return ``{simulation_id: (new_state, presence_age)}`` for rows that must transition."""
+    transitions = {}
+    for presence in presences:
+        policy = policies.get(presence.simulation_id)
+        if policy is None or policy.inactivity_pause_seconds <= 0:
+            continue
+        if not presence.last_presence_at:
+            continue
+        age = (now - presence.last_presence_at).total_seconds()
+        guard = RuntimeGuard(presence, policy)
+        if not guard.should_pause(age).allowed:
+            transitions[presence.simulation_id] = (GuardState.PAUSED_INACTIVITY, age)
+        elif not guard.should_warn(age).allowed and presence.guard_state != GuardState.WARNING:
+            transitions[presence.simulation_id] = (GuardState.WARNING, age)
+    return transitions
+
+
+def _apply_inactivity_transitions(
+    transitions: dict[int, tuple[GuardState, float]],
+    policies: dict[int, GuardPolicy],
+    now,
+) -> None:
+    """Write classified inactivity transitions and their guard events in bulk."""
+    paused = [
+        sid for sid, (state, _) in transitions.items() if state == GuardState.PAUSED_INACTIVITY
+    ]
+    warned = [sid for sid, (state, _) in transitions.items() if state == GuardState.WARNING]
+    if paused:
+        SessionPresence.objects.filter(simulation_id__in=paused).update(
+            guard_state=GuardState.PAUSED_INACTIVITY,
+            pause_reason=PauseReason.INACTIVITY,
+            paused_at=now,
+            engine_runnable=False,
+            modified_at=now,
+        )
+    if warned:
+        SessionPresence.objects.filter(simulation_id__in=warned).update(
+            guard_state=GuardState.WARNING,
+            warning_sent_at=now,
+            modified_at=now,
+        )
+    _emit_guard_events(
+        [
+            (
+                sid,
+                "guard.state.updated",
+                {
+                    "guard_state": GuardState.PAUSED_INACTIVITY,
+                    "guard_reason": PauseReason.INACTIVITY,
+                },
+            )
+            for sid in paused
+        ]
+        + [
+            (
+                sid,
+                "guard.warning.updated",
+                {
+                    "guard_state": GuardState.WARNING,
+                    "seconds_until_pause": int(
+                        policies[sid].inactivity_pause_seconds - transitions[sid][1]
+                    ),
+                },
+            )
+            for sid in warned
+        ]
+    )
+
+
+def evaluate_wall_clock_batch() -> dict[int, GuardState]:
+    """End every active session whose wall clock has expired.
+
+    The expiry condition is evaluated by the locking query itself, so only
+    rows that transition are locked (``skip_locked``), and they are ended
+    with one ``UPDATE``.  Returns ``{simulation_id: GuardState.ENDED}``.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        expired = list(
+            SessionPresence.objects.select_for_update(skip_locked=True)
+            .filter(
+                guard_state__in=_INACTIVITY_GUARD_STATES,
+                wall_clock_expires_at__isnull=False,
+                wall_clock_expires_at__lte=now,
+            )
+            .values_list("simulation_id", flat=True)
+        )
+        if not expired:
+            return {}
+        SessionPresence.objects.filter(simulation_id__in=expired).update(
+            guard_state=GuardState.ENDED,
+            pause_reason=PauseReason.WALL_CLOCK_EXPIRY,
+            paused_at=now,
+            engine_runnable=False,
+            modified_at=now,
+        )
+        _emit_guard_events(
+            [
+                (
+                    sid,
+                    "guard.state.updated",
+                    {
+                        "guard_state": GuardState.ENDED,
+                        "guard_reason": PauseReason.WALL_CLOCK_EXPIRY,
+                    },
+                )
+                for sid in expired
+            ]
+        )
+    for simulation_id in expired:
+        logger.info("guards.wall_clock_expired", simulation_id=simulation_id)
+    return dict.fromkeys(expired, GuardState.ENDED)
+
+
 # ───────────────────────────────────────────────────────────────────────
 # Resumption
 # ───────────────────────────────────────────────────────────────────────
@@ -503,6 +819,8 @@ def resume_guard_state(simulation_id: int) -> GuardDecision:
             ]
         )
 
+    if presence.lab_type == LabType.TRAINERLAB:
+        _index_presence(simulation_id, now)
     _emit_guard_event(
         simulation_id,
         "guard.state.updated",
@@ -612,6 +930,25 @@ def get_usage_snapshot(
         ).aggregate(total=Sum("total_tokens"))
         result["account_total_tokens"] = agg["total"] or 0
 
+    buffer = get_usage_buffer()
+    if buffer is not None:
+        scopes = [
+            (scope_type, scope_id)
+            for scope_type, scope_id in (
+                (UsageScopeType.SESSION, simulation_id),
+                (UsageScopeType.USER, user_id),
+                (UsageScopeType.ACCOUNT, account_id),
+            )
+            if scope_id is not None
+        ]
+        try:
+            unflushed = buffer.unflushed_totals(scopes)
+        except redis.RedisError:
+            logger.warning("guards.usage.buffer_unavailable", operation="snapshot")
+            unflushed = {}
+        for scope_type, tokens in unflushed.items():
+            result[f"{scope_type}_total_tokens"] += tokens
+
     return result
 
 
@@ -630,11 +967,38 @@ def record_usage(
     """Increment usage counters at session / user / account level.
 
     Called after each completed ServiceCall (via the signal handler in
-    ``apps.guards.signals``).
+    ``apps.guards.signals``).  With the Redis usage buffer the increments
+    are buffered and applied later by ``flush_buffered_usage()``; if Redis
+    is unreachable they are written directly.
     """
     now = timezone.now()
     period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
+    buffer = get_usage_buffer()
+    if buffer is not None:
+        scopes = [(UsageScopeType.SESSION, simulation_id)]
+        if user_id is not None:
+            scopes.append((UsageScopeType.USER, user_id))
+        if account_id is not None:
+            scopes.append((UsageScopeType.ACCOUNT, account_id))
+        try:
+            buffer.add(
+                scopes,
+                lab_type=lab_type,
+                product_code=product_code,
+                period_start=period_start,
+                counters={
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "reasoning_tokens": reasoning_tokens,
+                    "total_tokens": total_tokens,
+                    "service_call_count": 1,
+                },
+            )
+            return
+        except redis.RedisError:
+            logger.warning("guards.usage.buffer_unavailable", operation="record")
+
     _upsert_usage(
         scope_type=UsageScopeType.SESSION,
         simulation_id=simulation_id,
@@ -746,6 +1110,93 @@ def _upsert_usage(
             UsageRecord.objects.filter(**lookup).update(**increments)
 
 
+USAGE_FLUSH_BATCH_RETENTION = timedelta(days=7)
+
+
+def flush_buffered_usage(*, batch_size: int = 1000, lock_timeout_ms: int = 60_000) -> int:
+    """Apply Redis-buffered usage increments to ``UsageRecord``.
+
+    Drains at most *batch_size* pending rows, or retries the batch left in
+    flight by a failed flush, and writes them with one multi-row upsert per
+    scope type.  The batch token is recorded as a ``UsageFlushBatch`` in the
+    same transaction, so a batch whose acknowledgement failed is not applied
+    twice.  Only one flush runs at a time.  Returns the number of rows in the
+    batch.
+    """
+    buffer = get_usage_buffer()
+    if buffer is None:
+        return 0
+    token = buffer.acquire(lock_timeout_ms)
+    if token is None:
+        return 0
+    try:
+        batch = buffer.drain(batch_size)
+        if not batch.rows:
+            return 0
+        with transaction.atomic():
+            _, created = UsageFlushBatch.objects.get_or_create(
+                token=batch.token, defaults={"row_count": len(batch.rows)}
+            )
+            if created:
+                _bulk_upsert_usage(batch.rows)
+            else:
+                logger.info("guards.usage.flush_already_applied", batch_token=batch.token)
+            UsageFlushBatch.objects.filter(
+                created_at__lt=timezone.now() - USAGE_FLUSH_BATCH_RETENTION
+            ).delete()
+        buffer.ack(batch)
+    finally:
+        buffer.release(token)
+    return len(batch.rows)
+
+
+def _bulk_upsert_usage(rows: list[BufferedUsage]) -> None:
+    """Add buffered counters to ``UsageRecord`` with ``INSERT … ON CONFLICT``.
+
+    Each scope type has its own partial unique constraint, so rows are
+    grouped per scope and each group is one statement whose conflict target
+    names that constraint's columns and condition (inlined, not bound, so
+    PostgreSQL can infer the partial index).  Rows are sorted so concurrent
+    writers lock them in the same order.
+    """
+    table = connection.ops.quote_name(UsageRecord._meta.db_table)
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    by_scope: dict[str, list[BufferedUsage]] = {}
+    for row in sorted(rows, key=lambda row: row.key):
+        by_scope.setdefault(row.scope_type, []).append(row)
+
+    with connection.cursor() as cursor:
+        for scope_type, scope_rows in by_scope.items():
+            scope_column = SCOPE_COLUMNS[scope_type]
+            key_columns = ["scope_type", scope_column, "lab_type", "product_code", "period_start"]
+            columns = [*key_columns, *COUNTER_FIELDS, "created_at", "modified_at"]
+            placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+            params: list[Any] = []
+            for row in scope_rows:
+                params.extend(
+                    [
+                        row.scope_type,
+                        row.scope_id,
+                        row.lab_type,
+                        row.product_code,
+                        connection.ops.adapt_datetimefield_value(row.period_start),
+                        *(row.counters.get(field, 0) for field in COUNTER_FIELDS),
+                        now,
+                        now,
+                    ]
+                )
+            updates = ", ".join(
+                f"{field} = {table}.{field} + excluded.{field}" for field in COUNTER_FIELDS
+            )
+            cursor.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES {', '.join([placeholders] * len(scope_rows))} "
+                f"ON CONFLICT ({', '.join(key_columns)}) WHERE scope_type = '{scope_type}' "
+                f"DO UPDATE SET {updates}, modified_at = excluded.modified_at",
+                params,
+            )
+
+
 # ───────────────────────────────────────────────────────────────────────
 # Guard state retrieval (for API / UI)
 # ───────────────────────────────────────────────────────────────────────
@@ -797,6 +1248,10 @@ def get_guard_state_for_simulation(
 
     if presence.guard_state == GuardState.WARNING:
         age = 0.0
+        try:
+            _apply_store_presence(presence)
+        except redis.RedisError:
+            logger.warning("guards.presence.store_unavailable", simulation_id=simulation_id)
         if presence.last_presence_at:
             age = (timezone.now() - presence.last_presence_at).total_seconds()
         seconds_until_pause = max(0, int(policy.inactivity_pause_seconds - age))
@@ -858,3 +1313,28 @@ def _emit_guard_event(
             simulation_id=simulation_id,
             event_type=event_type,
         )
+
+
+def _emit_guard_events(events: list[tuple[int, str, dict[str, Any]]]) -> None:
+    """Emit ``(simulation_id, event_type, payload)`` guard events in one insert."""
+    if not events:
+        return
+    try:
+        from apps.common.outbox import enqueue_events_sync, poke_drain_sync
+
+        enqueue_events_sync(
+            [
+                {
+                    "event_type": event_type,
+                    "simulation_id": simulation_id,
+                    "payload": payload,
+                    "idempotency_key": (
+                        f"{event_type}:{simulation_id}:{payload.get('guard_state', '')}"
+                    ),
+                }
+                for simulation_id, event_type, payload in events
+            ]
+        )
+        poke_drain_sync()
+    except Exception:
+        logger.exception("guards.emit_events_failed", event_count=len(events))
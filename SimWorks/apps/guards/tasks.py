@@ -6,13 +6,19 @@ remains authoritative for pause transitions.
 
 from __future__ import annotations
 
+from datetime import timedelta
+
 from celery import shared_task
+from django.conf import settings
 from django.utils import timezone
+import redis
 
 from config.logging import get_logger
 
 from .enums import GuardState, LabType
 from .models import SessionPresence
+from .policy import min_inactivity_threshold_seconds
+from .presence import get_presence_store
 
 logger = get_logger(__name__)
 
@@ -24,42 +30,76 @@ _ACTIVE_GUARD_STATES = frozenset({GuardState.ACTIVE, GuardState.IDLE, GuardState
 def check_stale_sessions() -> int:
     """Periodic task: evaluate inactivity and wall-clock for all active sessions.
 
-    Designed to run every 15 seconds via Celery Beat.
-    Returns the number of sessions that transitioned.
+    Designed to run every 15 seconds via Celery Beat.  Candidates are
+    evaluated as a set (see ``evaluate_inactivity_batch`` and
+    ``evaluate_wall_clock_batch``), so the query count does not grow with
+    the number of active sessions.  Returns the number of sessions that
+    transitioned.
     """
-    transitions = 0
+    from .services import evaluate_inactivity_batch, evaluate_wall_clock_batch
 
-    # Find all active TrainerLab sessions that may need inactivity checks.
-    stale_candidates = SessionPresence.objects.filter(
-        lab_type=LabType.TRAINERLAB,
-        guard_state__in=_ACTIVE_GUARD_STATES,
-    ).values_list("simulation_id", flat=True)
+    transitions = len(evaluate_inactivity_batch(_inactivity_candidates()))
+    transitions += len(evaluate_wall_clock_batch())
+
+    if transitions:
+        logger.info("guards.stale_check.transitions", count=transitions)
 
-    for simulation_id in stale_candidates:
-        from .services import evaluate_inactivity
+    return transitions
 
-        new_state = evaluate_inactivity(simulation_id)
-        if new_state is not None:
-            transitions += 1
 
-    # Check wall-clock expiry for all active sessions (any lab type).
-    wall_clock_candidates = SessionPresence.objects.filter(
-        guard_state__in=_ACTIVE_GUARD_STATES,
-        wall_clock_expires_at__isnull=False,
-        wall_clock_expires_at__lte=timezone.now(),
-    ).values_list("simulation_id", flat=True)
+def _inactivity_candidates() -> list[int]:
+    """Return simulation ids that may need an inactivity transition.
 
-    for simulation_id in wall_clock_candidates:
-        from .services import evaluate_wall_clock
+    Database-only presence scans every active TrainerLab row.  With the Redis
+    presence store only sessions whose last heartbeat is older than the
+    shortest inactivity threshold are read from the due index; ids that are
+    no longer active TrainerLab sessions are pruned from it.
+    """
+    candidates = SessionPresence.objects.filter(
+        lab_type=LabType.TRAINERLAB,
+        guard_state__in=_ACTIVE_GUARD_STATES,
+    )
+    store = get_presence_store()
+    if store is None:
+        return list(candidates.values_list("simulation_id", flat=True))
+
+    threshold = min_inactivity_threshold_seconds()
+    if threshold is None:
+        return []
+    try:
+        due = store.due(timezone.now() - timedelta(seconds=threshold))
+        if not due:
+            return []
+        active = list(
+            candidates.filter(simulation_id__in=due).values_list("simulation_id", flat=True)
+        )
+        store.forget(set(due).difference(active))
+    except redis.RedisError:
+        logger.warning("guards.stale_check.presence_store_unavailable")
+        return []
+    return active
 
-        new_state = evaluate_wall_clock(simulation_id)
-        if new_state is not None:
-            transitions += 1
 
-    if transitions:
-        logger.info("guards.stale_check.transitions", count=transitions)
+@shared_task(ignore_result=True)
+def flush_usage_buffer() -> int:
+    """Periodic task: apply Redis-buffered usage counters to ``UsageRecord``.
 
-    return transitions
+    Designed to run every 10 seconds via Celery Beat.  Redis outages are
+    logged and retried on the next run; nothing is lost while Redis keeps
+    the buffered counters.
+    """
+    from .services import flush_buffered_usage
+
+    try:
+        flushed = flush_buffered_usage(
+            batch_size=int(getattr(settings, "GUARDS_USAGE_FLUSH_BATCH", 1000))
+        )
+    except redis.RedisError:
+        logger.warning("guards.usage.flush_buffer_unavailable")
+        return 0
+    if flushed:
+        logger.info("guards.usage.flushed", rows=flushed)
+    return flushed
 
 
 @shared_task(ignore_result=True)
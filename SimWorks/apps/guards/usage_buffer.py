@@ -0,0 +1,242 @@
+"""Redis accumulate-and-flush buffer for ``UsageRecord`` counters.
+
+Every completed service call used to run three locked upserts (session, user
+and account scope).  Account rows are shared by everyone in an organisation,
+so a class running simulations at once serialised on them.  With
+``GUARDS_USAGE_BACKEND = "redis"`` a call instead adds its counters to
+Redis in one MULTI round trip:
+
+* ``guards:usage:<scope>:<id>:<lab>:<product>:<period>`` — hash of counter
+  increments for one ``UsageRecord`` row, listed in ``guards:usage:pending``.
+* ``guards:usage:unflushed:<scope>:<id>`` — running total of tokens not yet
+  in the database, so ``get_usage_snapshot`` can add them to the flushed
+  totals and budgets stay exact.
+
+``apps.guards.tasks.flush_usage_buffer`` periodically moves pending hashes to
+``…:inflight`` under a fresh batch token, applies them as one multi-row
+upsert per scope and then acknowledges them.  A batch left in flight by a
+failed flush is retried on its own, with its original token, before anything
+new is drained.  The flush records the token in the database in the same
+transaction as the upsert, so a retry after a failed acknowledgement is
+skipped instead of counted twice.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import uuid4
+
+from django.conf import settings
+import redis
+
+from apps.common.redis_client import get_redis_client
+
+from .enums import UsageScopeType
+
+USAGE_REDIS_DB = 4
+KEY_PREFIX = "guards:usage:"
+PENDING_KEY = f"{KEY_PREFIX}pending"
+INFLIGHT_KEY = f"{KEY_PREFIX}inflight"
+BATCH_TOKEN_KEY = f"{KEY_PREFIX}inflight-token"
+LOCK_KEY = f"{KEY_PREFIX}flush-lock"
+SCOPE_COLUMNS = {
+    UsageScopeType.SESSION: "simulation_id",
+    UsageScopeType.USER: "user_id",
+    UsageScopeType.ACCOUNT: "account_id",
+}
+COUNTER_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "reasoning_tokens",
+    "total_tokens",
+    "service_call_count",
+)
+
+# KEYS: pending set, inflight set, batch token.  ARGV: batch size, new token.
+# Returns {token, inflight keys}.  A batch still in flight is returned as is;
+# otherwise up to ARGV[1] pending hashes move to "<key>:inflight" under the
+# new token.
+DRAIN_SCRIPT = """
+local inflight = redis.call('SMEMBERS', KEYS[2])
+if #inflight > 0 then
+  local token = redis.call('GET', KEYS[3])
+  if not token then
+    token = ARGV[2]
+    redis.call('SET', KEYS[3], token)
+  end
+  return {token, inflight}
+end
+local keys = redis.call('SPOP', KEYS[1], ARGV[1])
+for _, key in ipairs(keys) do
+  local values = redis.call('HGETALL', key)
+  for i = 1, #values, 2 do
+    redis.call('HINCRBY', key .. ':inflight', values[i], values[i + 1])
+  end
+  redis.call('DEL', key)
+  redis.call('SADD', KEYS[2], key)
+end
+if #keys > 0 then
+  redis.call('SET', KEYS[3], ARGV[2])
+end
+return {ARGV[2], keys}
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class BufferedUsage:
+    """Counter increments for one ``UsageRecord`` row."""
+
+    key: str
+    scope_type: str
+    scope_id: int
+    lab_type: str
+    product_code: str
+    period_start: datetime
+    counters: dict[str, int]
+
+    @property
+    def scope_column(self) -> str:
+        return SCOPE_COLUMNS[self.scope_type]
+
+
+@dataclass(frozen=True)
+class UsageBatch:
+    """Drained rows plus the token that identifies them until acknowledged."""
+
+    token: str
+    rows: list[BufferedUsage]
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _unflushed_key(scope_type: str, scope_id: int) -> str:
+    return f"{KEY_PREFIX}unflushed:{scope_type}:{scope_id}"
+
+
+class RedisUsageBuffer:
+    """Per-row counter hashes plus per-scope unflushed totals."""
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self._drain = client.register_script(DRAIN_SCRIPT)
+        self._release = client.register_script(RELEASE_SCRIPT)
+
+    @staticmethod
+    def key(scope_type: str, scope_id: int, lab_type: str, product_code: str, period_start) -> str:
+        return (
+            f"{KEY_PREFIX}{scope_type}:{scope_id}:{lab_type}:{product_code}:"
+            f"{period_start.isoformat()}"
+        )
+
+    @staticmethod
+    def parse(key: str, counters: dict[str, int]) -> BufferedUsage:
+        scope_type, scope_id, lab_type, product_code, period = key.removeprefix(KEY_PREFIX).split(
+            ":", 4
+        )
+        return BufferedUsage(
+            key=key,
+            scope_type=scope_type,
+            scope_id=int(scope_id),
+            lab_type=lab_type,
+            product_code=product_code,
+            period_start=datetime.fromisoformat(period),
+            counters=counters,
+        )
+
+    def add(
+        self,
+        scopes: Iterable[tuple[str, int]],
+        *,
+        lab_type: str,
+        product_code: str,
+        period_start: datetime,
+        counters: dict[str, int],
+    ) -> None:
+        """Buffer *counters* for every ``(scope_type, scope_id)`` in one round trip."""
+        pipe = self.client.pipeline(transaction=True)
+        for scope_type, scope_id in scopes:
+            key = self.key(scope_type, scope_id, lab_type, product_code, period_start)
+            for field, amount in counters.items():
+                if amount:
+                    pipe.hincrby(key, field, amount)
+            pipe.sadd(PENDING_KEY, key)
+            pipe.incrby(_unflushed_key(scope_type, scope_id), counters["total_tokens"])
+        pipe.execute()
+
+    def unflushed_totals(self, scopes: list[tuple[str, int]]) -> dict[str, int]:
+        """Return buffered total tokens keyed by scope type."""
+        if not scopes:
+            return {}
+        values = self.client.mget([_unflushed_key(*scope) for scope in scopes])
+        return {
+            scope_type: int(value or 0)
+            for (scope_type, _), value in zip(scopes, values, strict=True)
+        }
+
+    def acquire(self, timeout_ms: int) -> str | None:
+        """Take the flush lock; returns a release token or ``None`` if held."""
+        token = uuid4().hex
+        if self.client.set(LOCK_KEY, token, nx=True, px=timeout_ms):
+            return token
+        return None
+
+    def release(self, token: str) -> None:
+        self._release(keys=[LOCK_KEY], args=[token])
+
+    def drain(self, batch_size: int) -> UsageBatch:
+        """Return the batch in flight, or move pending counters into a new one."""
+        token, keys = self._drain(
+            keys=[PENDING_KEY, INFLIGHT_KEY, BATCH_TOKEN_KEY], args=[batch_size, uuid4().hex]
+        )
+        keys = [_decode(key) for key in keys]
+        if not keys:
+            return UsageBatch(token=_decode(token), rows=[])
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hgetall(f"{key}:inflight")
+        rows = []
+        for key, values in zip(keys, pipe.execute(), strict=True):
+            counters = {_decode(field): int(amount) for field, amount in values.items()}
+            rows.append(self.parse(key, counters))
+        return UsageBatch(token=_decode(token), rows=rows)
+
+    def ack(self, batch: UsageBatch) -> None:
+        """Forget a flushed batch and subtract it from the unflushed totals."""
+        if not batch.rows:
+            return
+        pipe = self.client.pipeline(transaction=True)
+        for row in batch.rows:
+            pipe.delete(f"{row.key}:inflight")
+            pipe.srem(INFLIGHT_KEY, row.key)
+            total = row.counters.get("total_tokens", 0)
+            if total:
+                pipe.decrby(_unflushed_key(row.scope_type, row.scope_id), total)
+        pipe.delete(BATCH_TOKEN_KEY)
+        pipe.execute()
+
+
+_buffers: dict[int, RedisUsageBuffer] = {}
+
+
+def get_usage_buffer() -> RedisUsageBuffer | None:
+    """Return the Redis usage buffer, or ``None`` to write usage directly."""
+    if getattr(settings, "GUARDS_USAGE_BACKEND", "database") != "redis":
+        return None
+    client = get_redis_client(USAGE_REDIS_DB)
+    if client is None:
+        return None
+    buffer = _buffers.get(id(client))
+    if buffer is None or buffer.client is not client:
+        buffer = _buffers[id(client)] = RedisUsageBuffer(client)
+    return buffer
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.4 on 2026-10-19 00:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RetentionCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('last_timestamp', models.DateTimeField(blank=True, null=True)),
+                ('last_pk', models.CharField(blank=True, default='', max_length=64)),
+                ('rows_processed', models.PositiveBigIntegerField(default=0)),
+                ('last_run_at', models.DateTimeField(blank=True, null=True)),
+                ('last_run_rows', models.PositiveIntegerField(default=0)),
+                ('last_run_complete', models.BooleanField(default=False)),
+            ],
+            options={
+                'ordering': ('name',),
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+"""Privacy bookkeeping models."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+from django.conf import settings
+from django.db import models
+
+
+class RetentionCheckpoint(models.Model):
+    """Persisted progress of one retention target.
+
+    ``last_timestamp``/``last_pk`` is the keyset position of the last row the
+    target processed, so a run that exhausts its time budget resumes where it
+    stopped instead of rescanning already-scrubbed rows.
+    """
+
+    name = models.CharField(max_length=64, unique=True)
+    last_timestamp = models.DateTimeField(null=True, blank=True)
+    last_pk = models.CharField(max_length=64, blank=True, default="")
+    rows_processed = models.PositiveBigIntegerField(default=0)
+    last_run_at = models.DateTimeField(null=True, blank=True)
+    last_run_rows = models.PositiveIntegerField(default=0)
+    last_run_complete = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ("name",)
+
+    def __str__(self) -> str:
+        return f"{self.name} @ {self.last_timestamp or '-'}"
+
+
+def _export_upload_to(instance: DataExport, filename: str) -> str:
+    return f"privacy-exports/{instance.user_id}/{instance.pk.hex}-{filename}"
+
+
+class DataExport(models.Model):
+    """A user's data export, generated in the background and stored as a zip."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        READY = "ready", "Ready"
+        FAILED = "failed", "Failed"
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="data_exports",
+    )
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    file = models.FileField(upload_to=_export_upload_to, blank=True)
+    size_bytes = models.PositiveBigIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+
+    def __str__(self) -> str:
+        return f"Export {self.pk} ({self.status}) for user {self.user_id}"
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in {self.Status.PENDING, self.Status.RUNNING}
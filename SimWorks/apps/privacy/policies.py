@@ -25,6 +25,18 @@ def raw_ai_retention_days() -> int:
     return int(settings.PRIVACY_RAW_AI_RETENTION_DAYS)
 
 
+def retention_batch_size() -> int:
+    return int(settings.PRIVACY_RETENTION_BATCH_SIZE)
+
+
+def retention_time_budget_seconds() -> int:
+    return int(settings.PRIVACY_RETENTION_TIME_BUDGET_SECONDS)
+
+
+def export_stale_after_seconds() -> int:
+    return int(settings.PRIVACY_EXPORT_STALE_AFTER_SECONDS)
+
+
 def derived_feedback_retention_days() -> int:
     return int(settings.PRIVACY_DERIVED_FEEDBACK_RETENTION_DAYS)
 
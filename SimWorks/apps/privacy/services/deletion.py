@@ -2,6 +2,7 @@ from django.utils import timezone
 
 from apps.accounts.models import AccountMembership
 from apps.accounts.services import get_personal_account_for_user
+from apps.privacy.models import DataExport
 from apps.simcore.models import Simulation
 from orchestrai_django.models import ServiceCall, ServiceCallAttempt
 
@@ -25,5 +26,8 @@ class UserDeletionService:
             status=AccountMembership.Status.REMOVED,
             ended_at=timezone.now(),
         )
+        for export in DataExport.objects.filter(user=user):
+            if export.file:
+                export.file.delete(save=False)
         personal_account.delete()
         user.delete()
@@ -1,9 +1,39 @@
+"""Streaming user data export.
+
+The export document has the same shape as a single JSON object, but it is
+produced as text fragments from ``iterator(chunk_size=EXPORT_CHUNK_SIZE)``
+querysets and written straight into a zip member on a temporary file, so peak
+memory stays at roughly one chunk of rows regardless of a user's history.
+``generate_user_export`` runs in a background task and stores the zip on
+``DataExport.file``; users download it through an authenticated view.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+import json
+import tempfile
+from typing import Any
+import zipfile
+
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.db.models import Q
+from django.utils import timezone
 
 from apps.accounts.services import get_personal_account_for_user
 from apps.assessments.models import Assessment
 from apps.chatlab.models import Message
+from apps.privacy.models import DataExport
+from apps.privacy.policies import export_stale_after_seconds
 from apps.simcore.models import Simulation, SimulationSummary
+from config.logging import get_logger
+
+logger = get_logger(__name__)
+
+EXPORT_CHUNK_SIZE = 500
+EXPORT_FILENAME = "medsim-data-export.zip"
+EXPORT_MEMBER = "export.json"
 
 
 def _typed_score_value(score):
@@ -22,7 +52,100 @@ def _typed_score_value(score):
     return None
 
 
-def build_user_export_payload(user) -> dict:
+def _account_record(user) -> dict:
+    return {
+        "id": user.id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "role": getattr(user.role, "title", None),
+        "date_joined": user.date_joined.isoformat() if user.date_joined else None,
+    }
+
+
+def _lab_record(membership) -> dict:
+    return {
+        "lab": membership.lab.slug,
+        "access_level": membership.access_level,
+        "is_active": membership.is_active,
+    }
+
+
+def _simulation_record(sim) -> dict:
+    return {
+        "id": sim.id,
+        "status": sim.status,
+        "start_timestamp": sim.start_timestamp.isoformat() if sim.start_timestamp else None,
+        "end_timestamp": sim.end_timestamp.isoformat() if sim.end_timestamp else None,
+        "diagnosis": sim.diagnosis,
+        "chief_complaint": sim.chief_complaint,
+    }
+
+
+def _message_record(message) -> dict:
+    return {
+        "id": message.id,
+        "simulation_id": message.simulation_id,
+        "conversation_id": message.conversation_id,
+        "timestamp": message.timestamp.isoformat() if message.timestamp else None,
+        "role": message.role,
+        "content": message.content,
+        "message_type": message.message_type,
+    }
+
+
+def _summary_record(summary) -> dict:
+    return {
+        "simulation_id": summary.simulation_id,
+        "summary_text": summary.summary_text,
+        "chief_complaint": summary.chief_complaint,
+        "diagnosis": summary.diagnosis,
+        "strengths": summary.strengths,
+        "improvement_areas": summary.improvement_areas,
+        "learning_points": summary.learning_points,
+        "recommended_study_topics": summary.recommended_study_topics,
+    }
+
+
+def _assessment_record(assessment) -> dict:
+    return {
+        "id": str(assessment.id),
+        "assessment_type": assessment.assessment_type,
+        "lab_type": assessment.lab_type,
+        "rubric": {
+            "slug": assessment.rubric.slug,
+            "version": assessment.rubric.version,
+            "name": assessment.rubric.name,
+        },
+        "overall_summary": assessment.overall_summary,
+        "overall_score": (
+            float(assessment.overall_score) if assessment.overall_score is not None else None
+        ),
+        "created_at": assessment.created_at.isoformat(),
+        "criterion_scores": [
+            {
+                "criterion_slug": cs.criterion.slug,
+                "value": _typed_score_value(cs),
+                "score": float(cs.score) if cs.score is not None else None,
+                "rationale": cs.rationale,
+            }
+            for cs in assessment.criterion_scores.all()
+        ],
+        "sources": [
+            {
+                "source_type": src.source_type,
+                "role": src.role,
+                "simulation_id": src.simulation_id,
+                "source_assessment_id": (
+                    str(src.source_assessment_id) if src.source_assessment_id else None
+                ),
+            }
+            for src in assessment.sources.all()
+        ],
+    }
+
+
+def _export_sections(user) -> Iterator[tuple[str, Iterable[dict]]]:
     personal_account = get_personal_account_for_user(user)
     simulation_filter = Q(account=personal_account) | Q(account__isnull=True, user=user)
     related_filter = Q(simulation__account=personal_account) | Q(
@@ -39,98 +162,95 @@ def build_user_export_payload(user) -> dict:
         .prefetch_related("criterion_scores__criterion", "sources")
         .order_by("created_at")
     )
+    memberships = user.lab_memberships.select_related("lab").order_by("id")
 
-    return {
-        "account": {
-            "id": user.id,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "role": getattr(user.role, "title", None),
-            "date_joined": user.date_joined.isoformat() if user.date_joined else None,
-        },
-        "labs": [
-            {
-                "lab": m.lab.slug,
-                "access_level": m.access_level,
-                "is_active": m.is_active,
-            }
-            for m in user.lab_memberships.select_related("lab").all()
-        ],
-        "simulations": [
-            {
-                "id": sim.id,
-                "status": sim.status,
-                "start_timestamp": sim.start_timestamp.isoformat() if sim.start_timestamp else None,
-                "end_timestamp": sim.end_timestamp.isoformat() if sim.end_timestamp else None,
-                "diagnosis": sim.diagnosis,
-                "chief_complaint": sim.chief_complaint,
-            }
-            for sim in sims
-        ],
-        "messages": [
-            {
-                "id": message.id,
-                "simulation_id": message.simulation_id,
-                "conversation_id": message.conversation_id,
-                "timestamp": message.timestamp.isoformat() if message.timestamp else None,
-                "role": message.role,
-                "content": message.content,
-                "message_type": message.message_type,
-            }
-            for message in messages
-        ],
-        "simulation_summaries": [
-            {
-                "simulation_id": summary.simulation_id,
-                "summary_text": summary.summary_text,
-                "chief_complaint": summary.chief_complaint,
-                "diagnosis": summary.diagnosis,
-                "strengths": summary.strengths,
-                "improvement_areas": summary.improvement_areas,
-                "learning_points": summary.learning_points,
-                "recommended_study_topics": summary.recommended_study_topics,
-            }
-            for summary in summaries
-        ],
-        "assessments": [
-            {
-                "id": str(assessment.id),
-                "assessment_type": assessment.assessment_type,
-                "lab_type": assessment.lab_type,
-                "rubric": {
-                    "slug": assessment.rubric.slug,
-                    "version": assessment.rubric.version,
-                    "name": assessment.rubric.name,
-                },
-                "overall_summary": assessment.overall_summary,
-                "overall_score": (
-                    float(assessment.overall_score)
-                    if assessment.overall_score is not None
-                    else None
-                ),
-                "created_at": assessment.created_at.isoformat(),
-                "criterion_scores": [
-                    {
-                        "criterion_slug": cs.criterion.slug,
-                        "value": _typed_score_value(cs),
-                        "score": float(cs.score) if cs.score is not None else None,
-                        "rationale": cs.rationale,
-                    }
-                    for cs in assessment.criterion_scores.all()
-                ],
-                "sources": [
-                    {
-                        "source_type": src.source_type,
-                        "role": src.role,
-                        "simulation_id": src.simulation_id,
-                        "source_assessment_id": (
-                            str(src.source_assessment_id) if src.source_assessment_id else None
-                        ),
-                    }
-                    for src in assessment.sources.all()
-                ],
-            }
-            for assessment in assessments
-        ],
-    }
+    yield "labs", map(_lab_record, memberships.iterator(chunk_size=EXPORT_CHUNK_SIZE))
+    yield "simulations", map(_simulation_record, sims.iterator(chunk_size=EXPORT_CHUNK_SIZE))
+    yield "messages", map(_message_record, messages.iterator(chunk_size=EXPORT_CHUNK_SIZE))
+    yield (
+        "simulation_summaries",
+        map(_summary_record, summaries.iterator(chunk_size=EXPORT_CHUNK_SIZE)),
+    )
+    yield (
+        "assessments",
+        map(_assessment_record, assessments.iterator(chunk_size=EXPORT_CHUNK_SIZE)),
+    )
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, cls=DjangoJSONEncoder)
+
+
+def iter_user_export(user) -> Iterator[str]:
+    """Yield the export document for *user* as JSON text fragments."""
+    yield "{" + _dumps("account") + ": " + _dumps(_account_record(user))
+    for section, records in _export_sections(user):
+        yield ",\n" + _dumps(section) + ": ["
+        for index, record in enumerate(records):
+            yield ("," if index else "") + "\n" + _dumps(record)
+        yield "]"
+    yield "}\n"
+
+
+def request_user_export(user) -> DataExport:
+    """Return the user's in-flight export, or create one and enqueue it.
+
+    In-flight exports older than ``PRIVACY_EXPORT_STALE_AFTER_SECONDS`` are
+    marked failed first, so a lost or crashed task does not block the user.
+    """
+    from apps.privacy.tasks import enqueue_user_export
+
+    in_flight = user.data_exports.filter(
+        status__in=[DataExport.Status.PENDING, DataExport.Status.RUNNING]
+    )
+    now = timezone.now()
+    stale = in_flight.filter(
+        created_at__lt=now - timedelta(seconds=export_stale_after_seconds())
+    ).update(status=DataExport.Status.FAILED, error="Export timed out.", completed_at=now)
+    if stale:
+        logger.warning("privacy.export.stale", user_id=user.pk, count=stale)
+    active = in_flight.first()
+    if active is not None:
+        return active
+    export = DataExport.objects.create(user=user)
+    transaction.on_commit(lambda: enqueue_user_export(export.pk))
+    return export
+
+
+def generate_user_export(export: DataExport) -> DataExport:
+    """Write *export* to storage and replace the user's previous exports."""
+    export.status = DataExport.Status.RUNNING
+    export.save(update_fields=["status"])
+    try:
+        with tempfile.TemporaryFile() as handle:
+            with (
+                zipfile.ZipFile(handle, "w", compression=zipfile.ZIP_DEFLATED) as archive,
+                archive.open(EXPORT_MEMBER, "w", force_zip64=True) as member,
+            ):
+                for fragment in iter_user_export(export.user):
+                    member.write(fragment.encode("utf-8"))
+            export.size_bytes = handle.tell()
+            handle.seek(0)
+            export.file.save(EXPORT_FILENAME, File(handle), save=False)
+    except Exception as exc:
+        logger.exception("privacy.export.failed", export_id=str(export.pk))
+        export.status = DataExport.Status.FAILED
+        export.error = f"{type(exc).__name__}: {exc}"[:2000]
+        export.completed_at = timezone.now()
+        export.save(update_fields=["status", "error", "completed_at"])
+        return export
+
+    export.status = DataExport.Status.READY
+    export.completed_at = timezone.now()
+    export.save(update_fields=["status", "file", "size_bytes", "completed_at"])
+    for previous in export.user.data_exports.exclude(pk=export.pk).exclude(
+        status__in=[DataExport.Status.PENDING, DataExport.Status.RUNNING]
+    ):
+        delete_export(previous)
+    return export
+
+
+def delete_export(export: DataExport) -> None:
+    if export.file:
+        export.file.delete(save=False)
+    export.delete()
@@ -1,34 +1,235 @@
+"""Chunked, resumable retention purges.
+
+Each ``RetentionTarget`` walks its expired rows in ``(time_field, pk)`` keyset
+order, one ``PRIVACY_RETENTION_BATCH_SIZE`` batch per transaction, until the
+run's ``PRIVACY_RETENTION_TIME_BUDGET_SECONDS`` is spent.  Progress is kept in
+``RetentionCheckpoint`` rows:
+
+* Scrub targets (raw AI payloads) resume after the persisted high-water mark,
+  because scrubbed rows stay in the table and would otherwise be rescanned on
+  every run.  The time fields are insert-time stamps, so nothing new ever
+  appears behind the mark.
+* Delete targets always restart from the oldest remaining expired row; the
+  rows they processed are gone, so the scan is already cheap and no row can
+  be skipped.
+
+Scrubs are plain ``UPDATE ... WHERE pk IN (...)`` statements; ServiceCall
+scrubs set the recomputed ``payload_bytes`` in the same statement.  Deletes use a
+raw ``DELETE`` when Django's collector reports no cascades or signals, and a
+batch-bounded ``QuerySet.delete()`` otherwise.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import timedelta
+import time
+from typing import Any
 
+from django.db import models, router, transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.deletion import Collector
 from django.utils import timezone
 
 from apps.chatlab.models import Message
 from apps.privacy import policies
-from orchestrai_django.models import ServiceCall, ServiceCallAttempt
+from apps.privacy.models import RetentionCheckpoint
+from config.logging import get_logger
+from orchestrai_django.models import (
+    SERVICE_CALL_PAYLOAD_FIELDS,
+    ServiceCall,
+    ServiceCallAttempt,
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionTarget:
+    name: str
+    model: type[models.Model]
+    time_field: str
+    retention_days: Callable[[], int]
+    scrub: dict[str, Any] | None = None
+    """Field values to clear; ``None`` deletes expired rows instead."""
+    scrub_extra: Callable[[list[Any], dict[str, Any]], dict[str, Any]] | None = None
+    """Extra values for a scrub batch's ``UPDATE``, given its pks and ``scrub``."""
+
+    @property
+    def resumable(self) -> bool:
+        return self.scrub is not None
+
+
+@dataclass
+class PurgeProgress:
+    target: str
+    rows: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    complete: bool = False
+    fast_delete: bool | None = None
+    high_water_mark: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "batches": self.batches,
+            "seconds": round(self.seconds, 3),
+            "complete": self.complete,
+            "fast_delete": self.fast_delete,
+            "high_water_mark": self.high_water_mark,
+        }
+
+
+CHAT_MESSAGES = RetentionTarget(
+    name="chat_messages",
+    model=Message,
+    time_field="timestamp",
+    retention_days=policies.chat_retention_days,
+)
+
+
+def _scrubbed_payload_bytes(pks: list[Any], scrub: dict[str, Any]) -> dict[str, Any]:
+    """``payload_bytes`` for scrubbed ServiceCalls, as one ``CASE`` expression.
+
+    Only the payload columns the scrub keeps are loaded; the cleared ones are
+    measured from their scrubbed values.
+    """
+    kept = [field for field in SERVICE_CALL_PAYLOAD_FIELDS if field not in scrub]
+    whens = []
+    for call in ServiceCall._base_manager.filter(pk__in=pks).only(*kept):
+        for field, value in scrub.items():
+            setattr(call, field, value)
+        whens.append(When(pk=call.pk, then=Value(call.measure_payload_bytes())))
+    if not whens:
+        return {}
+    return {
+        "payload_bytes": Case(
+            *whens, default=F("payload_bytes"), output_field=models.PositiveBigIntegerField()
+        )
+    }
+
+
+SERVICE_CALL_PAYLOADS = RetentionTarget(
+    name="service_calls",
+    model=ServiceCall,
+    time_field="created_at",
+    retention_days=policies.raw_ai_retention_days,
+    scrub={"request": None, "messages_json": []},
+    scrub_extra=_scrubbed_payload_bytes,
+)
+SERVICE_CALL_ATTEMPT_PAYLOADS = RetentionTarget(
+    name="service_call_attempts",
+    model=ServiceCallAttempt,
+    time_field="created_at",
+    retention_days=policies.raw_ai_retention_days,
+    scrub={
+        "request_input": None,
+        "request_pydantic": None,
+        "request_provider": None,
+        "request_messages": [],
+        "request_tools": None,
+        "response_raw": None,
+        "response_provider_raw": None,
+        "agent_config": None,
+    },
+)
+RETENTION_TARGETS = (CHAT_MESSAGES, SERVICE_CALL_PAYLOADS, SERVICE_CALL_ATTEMPT_PAYLOADS)
+
+
+def _delete_batch(model: type[models.Model], pks: list[Any]) -> tuple[int, bool]:
+    queryset = model._base_manager.filter(pk__in=pks)
+    using = router.db_for_write(model)
+    if Collector(using=using, origin=queryset).can_fast_delete(queryset):
+        return queryset._raw_delete(using), True
+    deleted, per_model = queryset.delete()
+    return per_model.get(model._meta.label, deleted), False
+
+
+def purge_target(
+    target: RetentionTarget,
+    *,
+    deadline: float,
+    batch_size: int | None = None,
+) -> PurgeProgress:
+    """Process expired rows of *target* in batches until done or *deadline*."""
+    batch_size = batch_size or policies.retention_batch_size()
+    started = time.monotonic()
+    progress = PurgeProgress(target=target.name)
+    checkpoint, _ = RetentionCheckpoint.objects.get_or_create(name=target.name)
+    cutoff = timezone.now() - timedelta(days=target.retention_days())
+    time_field = target.time_field
+    expired = target.model._base_manager.filter(**{f"{time_field}__lt": cutoff})
+
+    while time.monotonic() < deadline:
+        batch = expired
+        if target.resumable and checkpoint.last_timestamp is not None:
+            last_pk = target.model._meta.pk.to_python(checkpoint.last_pk)
+            batch = batch.filter(
+                models.Q(**{f"{time_field}__gt": checkpoint.last_timestamp})
+                | models.Q(**{time_field: checkpoint.last_timestamp, "pk__gt": last_pk})
+            )
+        rows = list(batch.order_by(time_field, "pk").values_list(time_field, "pk")[:batch_size])
+        if not rows:
+            progress.complete = True
+            break
+
+        pks = [pk for _, pk in rows]
+        with transaction.atomic():
+            if target.scrub is not None:
+                values = dict(target.scrub)
+                if target.scrub_extra is not None:
+                    values.update(target.scrub_extra(pks, target.scrub))
+                affected = target.model._base_manager.filter(pk__in=pks).update(**values)
+            else:
+                affected, progress.fast_delete = _delete_batch(target.model, pks)
+            checkpoint.last_timestamp, last_pk = rows[-1]
+            checkpoint.last_pk = str(last_pk)
+            checkpoint.rows_processed += affected
+            checkpoint.save(update_fields=["last_timestamp", "last_pk", "rows_processed"])
+        progress.rows += affected
+        progress.batches += 1
+        if len(rows) < batch_size:
+            progress.complete = True
+            break
+
+    progress.seconds = time.monotonic() - started
+    if checkpoint.last_timestamp is not None:
+        progress.high_water_mark = checkpoint.last_timestamp.isoformat()
+    checkpoint.last_run_at = timezone.now()
+    checkpoint.last_run_rows = progress.rows
+    checkpoint.last_run_complete = progress.complete
+    checkpoint.save(update_fields=["last_run_at", "last_run_rows", "last_run_complete"])
+    logger.info("privacy.retention.target", **{"target": target.name, **progress.as_dict()})
+    return progress
+
+
+def run_retention(
+    targets: tuple[RetentionTarget, ...] = RETENTION_TARGETS,
+    *,
+    time_budget_seconds: float | None = None,
+    batch_size: int | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Run *targets* in order within one shared time budget.
+
+    Targets the budget does not reach are reported as incomplete and are
+    picked up by the next run.
+    """
+    budget = time_budget_seconds or policies.retention_time_budget_seconds()
+    deadline = time.monotonic() + budget
+    return {
+        target.name: purge_target(target, deadline=deadline, batch_size=batch_size).as_dict()
+        for target in targets
+    }
 
 
 class RetentionService:
     @classmethod
     def purge_expired_chat_messages(cls) -> int:
-        cutoff = timezone.now() - timedelta(days=policies.chat_retention_days())
-        deleted, _ = Message.objects.filter(timestamp__lt=cutoff).delete()
-        return deleted
+        return run_retention((CHAT_MESSAGES,))[CHAT_MESSAGES.name]["rows"]
 
     @classmethod
     def purge_expired_raw_ai_payloads(cls) -> dict:
-        cutoff = timezone.now() - timedelta(days=policies.raw_ai_retention_days())
-        call_count = ServiceCall.objects.filter(created_at__lt=cutoff).update(
-            request=None,
-            messages_json=[],
-        )
-        attempt_count = ServiceCallAttempt.objects.filter(created_at__lt=cutoff).update(
-            request_input=None,
-            request_pydantic=None,
-            request_provider=None,
-            request_messages=[],
-            request_tools=None,
-            response_raw=None,
-            response_provider_raw=None,
-            agent_config=None,
-        )
-        return {"service_calls": call_count, "service_call_attempts": attempt_count}
+        report = run_retention((SERVICE_CALL_PAYLOADS, SERVICE_CALL_ATTEMPT_PAYLOADS))
+        return {name: metrics["rows"] for name, metrics in report.items()}
@@ -1,11 +1,45 @@
+from celery import shared_task
 from django.tasks import task
 
-from .services.retention import RetentionService
+from .models import DataExport
+from .services.retention import run_retention
 
 
 @task
 def run_privacy_retention_cleanup() -> dict:
+    """One time-budgeted, resumable retention pass.
+
+    Returns rows purged per table; the detailed per-target report (batches,
+    duration, completion) is logged by ``run_retention``.
+    """
+    report = run_retention()
     return {
-        "messages_deleted": RetentionService.purge_expired_chat_messages(),
-        **RetentionService.purge_expired_raw_ai_payloads(),
+        "messages_deleted": report["chat_messages"]["rows"],
+        "service_calls": report["service_calls"]["rows"],
+        "service_call_attempts": report["service_call_attempts"]["rows"],
     }
+
+
+@shared_task(ignore_result=True)
+def purge_expired_privacy_data() -> None:
+    """Celery Beat trigger for :func:`run_privacy_retention_cleanup` (hourly).
+
+    A backlog larger than one budget is worked off over consecutive runs from
+    the persisted checkpoints.
+    """
+    run_privacy_retention_cleanup.call()
+
+
+@task
+def generate_user_data_export(export_id: str) -> None:
+    from .services.export import generate_user_export
+
+    export = DataExport.objects.select_related("user").filter(pk=export_id).first()
+    if export is None or not export.is_active:
+        return
+    generate_user_export(export)
+
+
+def enqueue_user_export(export_id) -> None:
+    """Thin indirection to make task enqueueing patchable in tests."""
+    generate_user_data_export.enqueue(export_id=str(export_id))
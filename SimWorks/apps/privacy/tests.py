@@ -1,4 +1,8 @@
 from datetime import timedelta
+import io
+import json
+from unittest.mock import patch
+import zipfile
 
 from django.test import Client, TestCase, override_settings
 from django.urls import reverse
@@ -6,11 +10,29 @@ from django.utils import timezone
 
 from apps.accounts.models import User, UserRole
 from apps.chatlab.models import Message, RoleChoices
+from apps.privacy.models import DataExport, RetentionCheckpoint
 from apps.privacy.services.classification import scan_text_for_pii
-from apps.privacy.services.retention import RetentionService
+from apps.privacy.services.export import EXPORT_MEMBER, generate_user_export, iter_user_export
+from apps.privacy.services.retention import (
+    CHAT_MESSAGES,
+    SERVICE_CALL_PAYLOADS,
+    RetentionService,
+    run_retention,
+)
+from apps.privacy.tasks import generate_user_data_export
 from apps.simcore.models import Conversation, ConversationType, Simulation, SimulationSummary
 from orchestrai_django.models import ServiceCall, ServiceCallAttempt
 
+IN_MEMORY_STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+
+def _read_export(raw: bytes) -> dict:
+    with zipfile.ZipFile(io.BytesIO(raw)) as archive:
+        return json.loads(archive.read(EXPORT_MEMBER))
+
 
 class PrivacyTests(TestCase):
     def setUp(self):
@@ -41,6 +63,7 @@ class PrivacyTests(TestCase):
         self.assertFalse(settings.PRIVACY_PERSIST_RAW_AI_RESPONSES)
         self.assertFalse(settings.PRIVACY_PERSIST_PROVIDER_RAW)
 
+    @override_settings(STORAGES=IN_MEMORY_STORAGES)
     def test_export_endpoint_includes_summary(self):
         SimulationSummary.objects.create(
             simulation=self.sim,
@@ -52,10 +75,25 @@ class PrivacyTests(TestCase):
             learning_points=["Risk stratification"],
             recommended_study_topics=["ACS workup"],
         )
-        response = self.client.get(reverse("privacy:export"))
-        self.assertEqual(response.status_code, 200)
-        payload = response.json()
+        with (
+            patch("apps.privacy.tasks.enqueue_user_export") as enqueue,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(reverse("privacy:export"))
+        self.assertEqual(response.status_code, 202)
+        export_id = response.json()["id"]
+        enqueue.assert_called_once()
+        self.assertIsNone(response.json()["download_url"])
+
+        generate_user_data_export.call(export_id=export_id)
+
+        status = self.client.get(reverse("privacy:export")).json()["exports"][0]
+        self.assertEqual(status["status"], "ready")
+        download = self.client.get(status["download_url"])
+        self.assertEqual(download.status_code, 200)
+        payload = _read_export(b"".join(download.streaming_content))
         self.assertTrue(payload["simulation_summaries"])
+        self.assertEqual(payload["account"]["email"], "student@example.com")
         self.assertNotIn("password", str(payload))
 
     def test_delete_account_removes_service_calls(self):
@@ -155,3 +193,208 @@ class PrivacyTests(TestCase):
         Message.objects.filter(id=msg.id).update(timestamp=timezone.now() - timedelta(days=5))
         RetentionService.purge_expired_chat_messages()
         self.assertTrue(SimulationSummary.objects.filter(simulation=self.sim).exists())
+
+
+@override_settings(PRIVACY_CHAT_RETENTION_DAYS=1, PRIVACY_RAW_AI_RETENTION_DAYS=1)
+class ChunkedRetentionTests(TestCase):
+    def setUp(self):
+        role = UserRole.objects.create(title="Student")
+        self.user = User.objects.create_user(
+            email="retention@example.com", password="password123", role=role
+        )
+        self.sim = Simulation.objects.create(user=self.user)
+        self.conversation = Conversation.objects.create(
+            simulation=self.sim,
+            conversation_type=ConversationType.objects.create(
+                slug="retention_test", display_name="Patient"
+            ),
+        )
+        self.old = timezone.now() - timedelta(days=5)
+
+    def _old_messages(self, count):
+        for index in range(count):
+            Message.objects.create(
+                simulation=self.sim,
+                conversation=self.conversation,
+                sender=self.user,
+                role=RoleChoices.USER,
+                content=f"old {index}",
+            )
+        Message.objects.update(timestamp=self.old)
+
+    def _old_calls(self, count):
+        calls = [
+            ServiceCall.objects.create(
+                service_identity="chatlab.patient",
+                request={"raw": index},
+                messages_json=[{"content": "raw"}],
+            )
+            for index in range(count)
+        ]
+        ServiceCall.objects.update(created_at=self.old)
+        return calls
+
+    def test_deletes_in_batches_and_reports_progress(self):
+        self._old_messages(5)
+        fresh = Message.objects.create(
+            simulation=self.sim, conversation=self.conversation, sender=self.user, content="new"
+        )
+
+        report = run_retention((CHAT_MESSAGES,), batch_size=2)
+
+        self.assertEqual(list(Message.objects.values_list("id", flat=True)), [fresh.id])
+        metrics = report["chat_messages"]
+        self.assertEqual((metrics["rows"], metrics["batches"]), (5, 3))
+        self.assertTrue(metrics["complete"])
+        checkpoint = RetentionCheckpoint.objects.get(name="chat_messages")
+        self.assertEqual(checkpoint.rows_processed, 5)
+        self.assertTrue(checkpoint.last_run_complete)
+
+    def test_exhausted_budget_leaves_work_for_next_run(self):
+        self._old_calls(3)
+
+        with self.settings(PRIVACY_RETENTION_BATCH_SIZE=1):
+            with patch(
+                "apps.privacy.services.retention.time.monotonic", side_effect=[0, 0, 0, 99, 99]
+            ):
+                report = run_retention((SERVICE_CALL_PAYLOADS,), time_budget_seconds=10)
+            self.assertEqual(report["service_calls"]["rows"], 1)
+            self.assertFalse(report["service_calls"]["complete"])
+            self.assertEqual(ServiceCall.objects.filter(request__isnull=True).count(), 1)
+
+            report = run_retention((SERVICE_CALL_PAYLOADS,))
+
+        self.assertEqual(report["service_calls"]["rows"], 2)
+        self.assertTrue(report["service_calls"]["complete"])
+        self.assertFalse(ServiceCall.objects.filter(request__isnull=False).exists())
+
+    def test_scrub_resumes_after_high_water_mark(self):
+        self._old_calls(2)
+        run_retention((SERVICE_CALL_PAYLOADS,))
+
+        with self.assertNumQueries(3):
+            report = run_retention((SERVICE_CALL_PAYLOADS,))
+
+        self.assertEqual(report["service_calls"]["rows"], 0)
+        self.assertTrue(report["service_calls"]["complete"])
+        self.assertEqual(RetentionCheckpoint.objects.get(name="service_calls").rows_processed, 2)
+
+    def test_scrub_refreshes_payload_bytes(self):
+        [call] = self._old_calls(1)
+        call.refresh_from_db()
+        unscrubbed = call.payload_bytes
+
+        run_retention((SERVICE_CALL_PAYLOADS,))
+
+        call.refresh_from_db()
+        self.assertLess(call.payload_bytes, unscrubbed)
+        self.assertEqual(call.payload_bytes, call.measure_payload_bytes())
+
+    def test_cleanup_task_reports_rows_per_table(self):
+        from apps.privacy.tasks import run_privacy_retention_cleanup
+
+        self._old_messages(2)
+        self._old_calls(1)
+
+        result = run_privacy_retention_cleanup.call()
+
+        self.assertEqual(
+            result, {"messages_deleted": 2, "service_calls": 1, "service_call_attempts": 0}
+        )
+
+
+@override_settings(STORAGES=IN_MEMORY_STORAGES)
+class StreamingExportTests(TestCase):
+    def setUp(self):
+        role = UserRole.objects.create(title="Student")
+        self.user = User.objects.create_user(
+            email="export@example.com", password="password123", role=role
+        )
+        self.other = User.objects.create_user(
+            email="other@example.com", password="password123", role=role
+        )
+        self.sim = Simulation.objects.create(user=self.user)
+        conversation = Conversation.objects.create(
+            simulation=self.sim,
+            conversation_type=ConversationType.objects.create(
+                slug="export_test", display_name="Patient"
+            ),
+        )
+        for index in range(3):
+            Message.objects.create(
+                simulation=self.sim,
+                conversation=conversation,
+                sender=self.user,
+                content=f"message {index}",
+            )
+
+    def test_streamed_document_is_valid_json(self):
+        with patch("apps.privacy.services.export.EXPORT_CHUNK_SIZE", 2):
+            document = json.loads("".join(iter_user_export(self.user)))
+
+        self.assertEqual(
+            [message["content"] for message in document["messages"]],
+            ["message 0", "message 1", "message 2"],
+        )
+        self.assertEqual([sim["id"] for sim in document["simulations"]], [self.sim.id])
+        self.assertEqual(document["assessments"], [])
+
+    def test_new_export_replaces_previous_file(self):
+        first = generate_user_export(DataExport.objects.create(user=self.user))
+        second = generate_user_export(DataExport.objects.create(user=self.user))
+
+        self.assertEqual(second.status, DataExport.Status.READY)
+        self.assertGreater(second.size_bytes, 0)
+        self.assertEqual(list(self.user.data_exports.all()), [second])
+        self.assertFalse(first.file.storage.exists(first.file.name))
+
+    def test_request_reuses_in_flight_export(self):
+        with patch("apps.privacy.tasks.enqueue_user_export"):
+            self.client.force_login(self.user)
+            first = self.client.post(reverse("privacy:export")).json()
+            second = self.client.post(reverse("privacy:export")).json()
+
+        self.assertEqual(first["id"], second["id"])
+        self.assertEqual(DataExport.objects.filter(user=self.user).count(), 1)
+
+    def test_request_replaces_stale_in_flight_export(self):
+        stale = DataExport.objects.create(user=self.user, status=DataExport.Status.RUNNING)
+        DataExport.objects.filter(pk=stale.pk).update(
+            created_at=timezone.now() - timedelta(seconds=3601)
+        )
+
+        with patch("apps.privacy.tasks.enqueue_user_export"):
+            self.client.force_login(self.user)
+            response = self.client.post(reverse("privacy:export")).json()
+
+        self.assertNotEqual(response["id"], str(stale.pk))
+        stale.refresh_from_db()
+        self.assertEqual(stale.status, DataExport.Status.FAILED)
+        self.assertEqual(stale.error, "Export timed out.")
+        self.assertIsNotNone(stale.completed_at)
+
+    def test_download_is_limited_to_owner(self):
+        export = generate_user_export(DataExport.objects.create(user=self.user))
+        url = reverse("privacy:export_download", kwargs={"export_id": export.pk})
+
+        self.client.force_login(self.other)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        self.client.force_login(self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        payload = _read_export(b"".join(response.streaming_content))
+        self.assertEqual(len(payload["messages"]), 3)
+
+    def test_failed_export_is_recorded(self):
+        export = DataExport.objects.create(user=self.user)
+
+        with patch(
+            "apps.privacy.services.export.iter_user_export", side_effect=RuntimeError("boom")
+        ):
+            generate_user_export(export)
+
+        export.refresh_from_db()
+        self.assertEqual(export.status, DataExport.Status.FAILED)
+        self.assertIn("boom", export.error)
+        self.assertFalse(export.file)
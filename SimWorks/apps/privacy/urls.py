@@ -7,5 +7,10 @@ app_name = "privacy"
 urlpatterns = [
     path("", views.privacy_policy, name="policy"),
     path("export/", views.export_user_data, name="export"),
+    path(
+        "export/<uuid:export_id>/download/",
+        views.download_user_export,
+        name="export_download",
+    ),
     path("delete-account/", views.delete_account, name="delete_account"),
 ]
@@ -1,10 +1,12 @@
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponseBadRequest, JsonResponse
-from django.shortcuts import render
-from django.views.decorators.http import require_GET
+from django.http import FileResponse, HttpResponseBadRequest, JsonResponse
+from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
+from django.views.decorators.http import require_GET, require_http_methods
 
+from .models import DataExport
 from .services.deletion import UserDeletionService
-from .services.export import build_user_export_payload
+from .services.export import EXPORT_FILENAME, request_user_export
 
 
 @require_GET
@@ -13,10 +15,39 @@ def privacy_policy(request):
     return render(request, "privacy/policy.html")
 
 
-@require_GET
+def _export_status(export: DataExport) -> dict:
+    return {
+        "id": str(export.pk),
+        "status": export.status,
+        "created_at": export.created_at.isoformat(),
+        "completed_at": export.completed_at.isoformat() if export.completed_at else None,
+        "size_bytes": export.size_bytes,
+        "download_url": (
+            reverse("privacy:export_download", kwargs={"export_id": export.pk})
+            if export.status == DataExport.Status.READY
+            else None
+        ),
+    }
+
+
+@require_http_methods(["GET", "POST"])
 @login_required
 def export_user_data(request):
-    return JsonResponse(build_user_export_payload(request.user), json_dumps_params={"indent": 2})
+    """POST requests a background export; GET reports export status and links."""
+    if request.method == "POST":
+        export = request_user_export(request.user)
+        return JsonResponse(_export_status(export), status=202)
+    exports = request.user.data_exports.all()[:5]
+    return JsonResponse({"exports": [_export_status(export) for export in exports]})
+
+
+@require_GET
+@login_required
+def download_user_export(request, export_id):
+    export = get_object_or_404(
+        DataExport, pk=export_id, user=request.user, status=DataExport.Status.READY
+    )
+    return FileResponse(export.file.open("rb"), as_attachment=True, filename=EXPORT_FILENAME)
 
 
 @login_required
@@ -15,3 +15,7 @@ class SimCoreConfig(AppConfig):
     def ready(self):
         # Import all built-in tools
         autodiscover_modules("tools.builtins")
+
+        from .orca.context import register_context_resolvers
+
+        register_context_resolvers()
@@ -0,0 +1,40 @@
+"""GIN expression index backing full-text simulation search (PostgreSQL only).
+
+The indexed expression must match ``apps.simcore.search.simulation_search_vector``.
+"""
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+INDEX = GinIndex(
+    SearchVector(
+        "diagnosis",
+        "chief_complaint",
+        "prompt_instruction",
+        "prompt_message",
+        config="english",
+    ),
+    name="simcore_sim_search_gin",
+)
+
+
+def add_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.add_index(apps.get_model("simcore", "Simulation"), INDEX)
+
+
+def remove_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.remove_index(apps.get_model("simcore", "Simulation"), INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("simcore", "0011_modifier_models"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_index, remove_index),
+    ]
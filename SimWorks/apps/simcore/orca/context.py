@@ -0,0 +1,57 @@
+"""Context resolvers for instruction ``context_requirements``.
+
+Instructions declare the objects they read (``simulation``, ``user``) and the
+owning service prefetches the union once per run.  Simulation and user are
+served by one resolver so both come back from a single ``select_related``
+query whenever a ``simulation_id`` is available.
+"""
+
+import logging
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ObjectDoesNotExist
+
+from orchestrai.components.services import BaseService
+
+logger = logging.getLogger(__name__)
+
+SIMULATION_CONTEXT_KEYS = ("simulation", "user")
+
+
+async def resolve_simulation_context(
+    context: dict[str, Any], requested: frozenset[str]
+) -> dict[str, Any]:
+    """Resolve ``simulation`` and/or ``user`` from context id primitives."""
+    from apps.simcore.models import Simulation
+
+    resolved: dict[str, Any] = {}
+    need_user = "user" in requested and context.get("user") is None
+    user_id = context.get("user_id")
+
+    simulation = context.get("simulation")
+    simulation_id = context.get("simulation_id")
+    # Fetch the simulation when asked for, or when it is the only route to the user.
+    if simulation is None and simulation_id and ("simulation" in requested or not user_id):
+        try:
+            simulation = await Simulation.objects.select_related("user").aget(pk=simulation_id)
+        except (TypeError, ValueError, ObjectDoesNotExist):
+            simulation = None
+        else:
+            resolved["simulation"] = simulation
+            if need_user and simulation.user is not None:
+                resolved["user"] = simulation.user
+                need_user = False
+
+    if need_user and user_id:
+        try:
+            resolved["user"] = await get_user_model().objects.aget(pk=user_id)
+        except (TypeError, ValueError, ObjectDoesNotExist):
+            logger.debug("Unable to resolve user_id=%s for instruction context", user_id)
+
+    return resolved
+
+
+def register_context_resolvers() -> None:
+    """Register simcore context resolvers on the service base class."""
+    BaseService.register_context_resolver(SIMULATION_CONTEXT_KEYS, resolve_simulation_context)
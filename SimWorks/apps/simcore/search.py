@@ -0,0 +1,85 @@
+# simcore/search.py
+"""Full-text search over simulations and their chat messages.
+
+On PostgreSQL, searches match ``to_tsvector`` expressions that are backed by
+GIN expression indexes (``simcore_sim_search_gin`` and
+``chatlab_msg_search_gin``).  PostgreSQL maintains expression indexes on every
+write, so no search column, trigger or signal has to be kept in sync.  The
+query must build exactly the same ``SearchVector`` expression as the index
+for the planner to use it, so both sides use the helpers below.
+
+Other databases (SQLite in tests and local development) fall back to
+``icontains`` matching.
+"""
+
+from __future__ import annotations
+
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connections
+from django.db.models import Q, QuerySet
+
+SEARCH_CONFIG = "english"
+SIMULATION_SEARCH_FIELDS = ("diagnosis", "chief_complaint", "prompt_instruction", "prompt_message")
+MESSAGE_SEARCH_FIELDS = ("content",)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def simulation_search_vector() -> SearchVector:
+    return SearchVector(*SIMULATION_SEARCH_FIELDS, config=SEARCH_CONFIG)
+
+
+def message_search_vector() -> SearchVector:
+    return SearchVector(*MESSAGE_SEARCH_FIELDS, config=SEARCH_CONFIG)
+
+
+def prefix_search_query(text: str) -> SearchQuery | None:
+    """AND together every word of *text*, prefix-matching each one.
+
+    Only ``\\w+`` tokens reach the raw tsquery, so user input cannot inject
+    tsquery operators.
+    """
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    raw = " & ".join(f"{token}:*" for token in tokens)
+    return SearchQuery(raw, config=SEARCH_CONFIG, search_type="raw")
+
+
+def uses_full_text_search(queryset: QuerySet) -> bool:
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def search_simulations(queryset: QuerySet, text: str, *, include_messages: bool = False):
+    """Filter a ``Simulation`` queryset by *text*.
+
+    Message matches are applied as a ``simulation_id IN (...)`` semi-join, so
+    the result needs no ``DISTINCT`` and keeps the caller's ordering.
+    """
+    from apps.chatlab.models import Message
+
+    if not uses_full_text_search(queryset):
+        search_filter = Q()
+        for field in SIMULATION_SEARCH_FIELDS:
+            search_filter |= Q(**{f"{field}__icontains": text})
+        if include_messages:
+            search_filter |= Q(
+                pk__in=Message.objects.filter(content__icontains=text).values("simulation_id")
+            )
+        return queryset.filter(search_filter)
+
+    query = prefix_search_query(text)
+    if query is None:
+        return queryset
+    queryset = queryset.alias(_search=simulation_search_vector())
+    search_filter = Q(_search=query)
+    if include_messages:
+        matching_messages = (
+            Message.objects.alias(_search=message_search_vector())
+            .filter(_search=query)
+            .values("simulation_id")
+        )
+        search_filter |= Q(pk__in=matching_messages)
+    return queryset.filter(search_filter)
@@ -302,10 +302,12 @@ function getCsrfToken() {
     return '';
 }
 
-// Auto-refresh tools every 30 seconds
+// Fallback polling for pages without a live event bus. Metadata-backed tools
+// are refreshed by `simulation.tools.updated` pushes, and the checksum
+// endpoint serves cached values, so keep the interval long.
 let toolRefreshInterval = null;
 
-function startToolAutoRefresh(simulationId, intervalMs = 30000) {
+function startToolAutoRefresh(simulationId, intervalMs = 120000) {
     if (toolRefreshInterval) {
         clearInterval(toolRefreshInterval);
     }
@@ -1,12 +1,12 @@
 # simcore/tools/base.py
-import builtins
 import hashlib
 import json
 import logging
-import pprint
 
 from asgiref.sync import sync_to_async
 
+from .checksums import cache_checksums, get_cached_checksum
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +24,9 @@ class BaseTool:
     tool_name = None
     display_name = None
     is_generic = False
+    # True when get_data() only reads SimulationMetadata, so metadata changes
+    # push a fresh checksum (see apps.simcore.tools.checksums).
+    metadata_backed = False
 
     def __init__(self, simulation):
         self.simulation = simulation
@@ -66,12 +69,17 @@ class BaseTool:
         return self.to_dict()
 
     def get_checksum(self):
-        """Generate a checksum for the tool's data."""
+        """Return the checksum of the tool's rendered data.
+
+        Metadata-backed tools are served from the cache when possible;
+        otherwise the tool is rendered once, which also caches the result.
+        """
+        if self.metadata_backed:
+            cached = get_cached_checksum(self.tool_name, self.simulation.pk)
+            if cached is not None:
+                return cached
         try:
-            raw_data = self.get_data() or {}  # Treat None as {}
-            logger.debug("[get_checksum] raw_data = %s", pprint.pformat(raw_data))
-            data_string = json.dumps(raw_data, sort_keys=True, default=builtins.str)
-            return hashlib.sha256(data_string.encode("utf-8")).hexdigest()
+            return self.to_dict()["checksum"]
         except Exception as e:
             raise ValueError(f"Failed to generate checksum for {self.tool_name}: {e}") from e
 
@@ -80,12 +88,16 @@ class BaseTool:
         return self.get_checksum()
 
     def default_dict(self, data=None):
+        data = data or []
+        checksum = safe_json_checksum(data)
+        if self.metadata_backed:
+            cache_checksums(self.simulation.pk, {self.tool_name: checksum})
         return {
             "name": self.tool_name,
             "display_name": self.display_name,
-            "data": data or [],
+            "data": data,
             "is_generic": self.is_generic,
-            "checksum": self.get_checksum(),
+            "checksum": checksum,
         }
 
 
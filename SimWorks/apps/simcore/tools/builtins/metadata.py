@@ -6,6 +6,7 @@ from apps.simcore.tools.serializers import serialize_patient_demographics
 @register_tool
 class SimulationMetadataTool(GenericTool):
     tool_name = "simulation_metadata"
+    metadata_backed = True
 
     def get_data(self):
         from apps.simcore.models import PatientDemographics
@@ -11,6 +11,7 @@ logger = logging.getLogger(__name__)
 class PatientHistoryTool(BaseTool):
     tool_name = "patient_history"
     display_name = "Patient History"
+    metadata_backed = True
 
     def get_data(self) -> list:
         from apps.simcore.models import PatientHistory
@@ -30,6 +31,7 @@ class PatientResultsTool(BaseTool):
     tool_name = "patient_results"
     display_name = "Patient Results"
     is_generic = False
+    metadata_backed = True
 
     def new_order(self, order):
         pass
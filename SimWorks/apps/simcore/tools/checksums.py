@@ -0,0 +1,58 @@
+# simcore/tools/checksums.py
+"""Cached tool checksums.
+
+A tool's checksum is the SHA-256 of the data it renders.  Computing it means
+running the tool's query, so it is cached per ``(tool, simulation)`` whenever
+a tool is rendered or its checksum is requested.  Tools whose data comes from
+``SimulationMetadata`` set ``metadata_backed = True``; when metadata changes,
+``apps.chatlab.utils.broadcast_tool_checksums`` recomputes their checksums
+once, refreshes the cache and pushes the new values to connected clients, so
+the checksum endpoint is only a cheap fallback.
+
+``TOOL_CHECKSUM_CACHE_TTL`` (seconds, default 300, ``0`` disables) bounds
+staleness for tools that are not refreshed by a push.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache
+
+KEY_PREFIX = "simcore:tool-checksum:"
+DEFAULT_TTL = 300
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "TOOL_CHECKSUM_CACHE_TTL", DEFAULT_TTL))
+
+
+def _key(tool_name: str, simulation_id: int) -> str:
+    return f"{KEY_PREFIX}{tool_name}:{simulation_id}"
+
+
+def get_cached_checksum(tool_name: str, simulation_id: int) -> str | None:
+    if _ttl() <= 0:
+        return None
+    return cache.get(_key(tool_name, simulation_id))
+
+
+def get_cached_checksums(tool_names: list[str], simulation_id: int) -> dict[str, str]:
+    """Return the cached checksums of *tool_names* that are present."""
+    if _ttl() <= 0 or not tool_names:
+        return {}
+    found = cache.get_many([_key(name, simulation_id) for name in tool_names])
+    return {
+        name: found[_key(name, simulation_id)]
+        for name in tool_names
+        if _key(name, simulation_id) in found
+    }
+
+
+def cache_checksums(simulation_id: int, checksums: dict[str, str]) -> None:
+    ttl = _ttl()
+    if ttl <= 0 or not checksums:
+        return
+    cache.set_many(
+        {_key(name, simulation_id): checksum for name, checksum in checksums.items()},
+        timeout=ttl,
+    )
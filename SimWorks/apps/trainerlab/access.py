@@ -4,7 +4,7 @@ from ninja.errors import HttpError
 
 from apps.accounts.context import resolve_account_for_user, resolve_request_account
 from apps.billing.catalog import product_codes_for_lab
-from apps.billing.services.entitlements import has_product_access
+from apps.billing.services.entitlements import get_entitlement_index
 
 LAB_SLUG = "trainerlab"
 
@@ -13,7 +13,8 @@ def has_lab_access(user, account, *, lab_slug: str = LAB_SLUG) -> bool:
     """Return True when *user* has effective product access for *lab_slug* in *account*."""
     if account is None:
         return False
-    return any(has_product_access(user, account, pc) for pc in product_codes_for_lab(lab_slug))
+    index = get_entitlement_index(user, account)
+    return any(index.has_product(pc) for pc in product_codes_for_lab(lab_slug))
 
 
 def check_lab_access(user, *, lab_slug: str = LAB_SLUG, request=None) -> bool:
@@ -5,7 +5,7 @@ from asgiref.sync import sync_to_async
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.core.serializers.json import DjangoJSONEncoder
-from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.http import Http404, HttpResponse, HttpResponseForbidden, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.views.decorators.http import require_http_methods
@@ -14,8 +14,11 @@ from api.v1.sse import build_outbox_events_stream_response, resolve_outbox_strea
 from apps.accounts.context import resolve_request_account
 from apps.common.decorators import resolve_user
 from apps.common.models import OutboxEvent
-from apps.common.outbox.outbox import order_outbox_queryset
-from apps.common.watch import build_watch_page_context, build_watch_service_calls_context
+from apps.common.watch import (
+    build_watch_events_payload,
+    build_watch_page_context,
+    build_watch_service_calls_context,
+)
 from apps.simcore.access import can_access_simulation_in_request
 from apps.simcore.models import Simulation
 from apps.trainerlab.access import has_lab_access_for_request
@@ -88,8 +91,10 @@ def watch_simulation(request, simulation_id):
         simulation_id,
     )
     simulation = get_object_or_404(Simulation, id=simulation_id)
-    outbox_qs = order_outbox_queryset(OutboxEvent.objects.filter(simulation_id=simulation_id))
-    service_calls_qs = ServiceCall.objects.for_simulation(simulation_id).order_by("created_at")
+    outbox_qs = OutboxEvent.objects.filter(simulation_id=simulation_id)
+    service_calls_qs = (
+        ServiceCall.objects.for_simulation(simulation_id).for_listing().order_by("created_at")
+    )
     run_url = reverse("trainerlab:run_simulation", args=[simulation_id])
 
     context = build_watch_page_context(
@@ -97,6 +102,7 @@ def watch_simulation(request, simulation_id):
         simulation=simulation,
         outbox_events=outbox_qs,
         service_calls_qs=service_calls_qs,
+        events_url=reverse("trainerlab:watch_events", args=[simulation_id]),
         stream_url=reverse("trainerlab:watch_stream", args=[simulation_id]),
         realtime_transport="sse",
         service_calls_url=reverse("trainerlab:watch_service_calls", args=[simulation_id]),
@@ -188,6 +194,24 @@ def watch_stream(request, simulation_id):
     )
 
 
+@staff_member_required
+def watch_events(request, simulation_id):
+    """JSON page of older or re-filtered outbox events for the watch view."""
+    logger.debug(
+        "watch_events: admin=%s sim=%s before=%s (trainerlab)",
+        request.user.pk,
+        simulation_id,
+        request.GET.get("before"),
+    )
+    get_object_or_404(Simulation, id=simulation_id)
+    return JsonResponse(
+        build_watch_events_payload(
+            request=request,
+            outbox_events=OutboxEvent.objects.filter(simulation_id=simulation_id),
+        )
+    )
+
+
 @staff_member_required
 def watch_service_calls(request, simulation_id):
     """HTMX partial — refreshes service call table on the watch page."""
@@ -197,7 +221,9 @@ def watch_service_calls(request, simulation_id):
         simulation_id,
     )
     get_object_or_404(Simulation, id=simulation_id)
-    service_calls_qs = ServiceCall.objects.for_simulation(simulation_id).order_by("created_at")
+    service_calls_qs = (
+        ServiceCall.objects.for_simulation(simulation_id).for_listing().order_by("created_at")
+    )
     return render(
         request,
         "partials/watch_service_calls.html",
@@ -208,3 +234,22 @@ def watch_service_calls(request, simulation_id):
             watch_url=reverse("trainerlab:watch_simulation", args=[simulation_id]),
         ),
     )
+
+
+@staff_member_required
+def watch_service_call_detail(request, simulation_id, service_call_id):
+    """HTMX partial — payload JSON for one service call, loaded on expand."""
+    logger.debug(
+        "watch_service_call_detail: admin=%s sim=%s call=%s (trainerlab)",
+        request.user.pk,
+        simulation_id,
+        service_call_id,
+    )
+    service_call = get_object_or_404(
+        ServiceCall.objects.for_simulation(simulation_id), id=service_call_id
+    )
+    return render(
+        request,
+        "partials/watch_service_call_detail.html",
+        {"sc": service_call},
+    )
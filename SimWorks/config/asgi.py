@@ -17,6 +17,7 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 django_asgi_app = get_asgi_application()
 
 from apps.chatlab.routing import websocket_urlpatterns as chatlab_ws  # noqa: E402
+from apps.common.lifespan import LifespanApp  # noqa: E402
 from apps.common.routing import websocket_urlpatterns as core_ws  # noqa: E402
 from apps.common.ws_auth import SessionOrJWTAuthMiddlewareStack  # noqa: E402
 
@@ -24,5 +25,6 @@ application = ProtocolTypeRouter(
     {
         "http": django_asgi_app,
         "websocket": SessionOrJWTAuthMiddlewareStack(URLRouter(chatlab_ws + core_ws)),
+        "lifespan": LifespanApp(),
     }
 )
@@ -36,3 +36,5 @@ BILLING_STRIPE_PORTAL_ENABLED = bool_from_env("BILLING_STRIPE_PORTAL_ENABLED", d
 BILLING_STRIPE_PROMO_COUPON_ID = os.getenv("BILLING_STRIPE_PROMO_COUPON_ID", "").strip()
 BILLING_STRIPE_TRIAL_DAYS = int_from_env("BILLING_STRIPE_TRIAL_DAYS", default=14, minimum=0)
 BILLING_STRIPE_RETURN_BASE_URL = os.getenv("BILLING_STRIPE_RETURN_BASE_URL", "").strip()
+# Cached per-(user, account) entitlement indexes (apps.billing.entitlement_cache); 0 disables
+ENTITLEMENT_CACHE_TTL = int_from_env("ENTITLEMENT_CACHE_TTL", default=60, minimum=0)
@@ -1,7 +1,7 @@
 # config/celery.py
 import os
 
-from celery import Celery
+from celery import Celery, signals
 from celery.schedules import crontab
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
@@ -36,13 +36,32 @@ app.conf.beat_schedule = {
         "task": "apps.guards.tasks.check_stale_sessions",
         "schedule": 15.0,  # seconds
     },
+    # Apply Redis-buffered token usage to UsageRecord.
+    "flush-usage-buffer-every-10-seconds": {
+        "task": "apps.guards.tasks.flush_usage_buffer",
+        "schedule": 10.0,  # seconds
+    },
     # Archive failed TrainerLab simulations after the 5-minute grace period.
     "archive-failed-trainerlab-sims-every-60-seconds": {
         "task": "apps.trainerlab.tasks.archive_failed_trainerlab_simulations",
         "schedule": 60.0,  # seconds
     },
+    # Purge expired chat transcripts and raw AI payloads in budgeted batches.
+    "purge-expired-privacy-data-hourly": {
+        "task": "apps.privacy.tasks.purge_expired_privacy_data",
+        "schedule": crontab(minute=45),
+    },
 }
 
+
+@signals.worker_shutdown.connect
+def _close_provider_http_clients(**_):
+    # Release pooled provider connections (orchestrai.utils.http_clients).
+    from orchestrai.utils.http_clients import close_http_clients
+
+    close_http_clients()
+
+
 # @signals.worker_process_init.connect
 # def _ai_setup_for_worker(**_):
 #     # Runs in each worker child; ensures registries are populated in this process.
@@ -11,6 +11,13 @@ PRIVACY_DERIVED_FEEDBACK_RETENTION_DAYS = int_from_env(
     "PRIVACY_DERIVED_FEEDBACK_RETENTION_DAYS", default=3650, minimum=1
 )
 
+# Retention purges run in keyset-ordered batches and stop once the time budget
+# is spent; keep the budget below CELERY_TASK_TIME_LIMIT.
+PRIVACY_RETENTION_BATCH_SIZE = int_from_env("PRIVACY_RETENTION_BATCH_SIZE", default=1000, minimum=1)
+PRIVACY_RETENTION_TIME_BUDGET_SECONDS = int_from_env(
+    "PRIVACY_RETENTION_TIME_BUDGET_SECONDS", default=20, minimum=1
+)
+
 PRIVACY_PERSIST_RAW_AI_REQUESTS = bool_from_env("PRIVACY_PERSIST_RAW_AI_REQUESTS", default=False)
 PRIVACY_PERSIST_RAW_AI_RESPONSES = bool_from_env("PRIVACY_PERSIST_RAW_AI_RESPONSES", default=False)
 PRIVACY_PERSIST_AI_MESSAGE_HISTORY = bool_from_env(
@@ -24,3 +31,9 @@ PRIVACY_ANALYTICS_REQUIRE_CONSENT = bool_from_env("PRIVACY_ANALYTICS_REQUIRE_CON
 PRIVACY_DELETE_EXPORT_TOKEN_TTL_SECONDS = int_from_env(
     "PRIVACY_DELETE_EXPORT_TOKEN_TTL_SECONDS", default=600, minimum=60
 )
+
+# A pending or running data export older than this is treated as failed, so a
+# lost task does not block new export requests.
+PRIVACY_EXPORT_STALE_AFTER_SECONDS = int_from_env(
+    "PRIVACY_EXPORT_STALE_AFTER_SECONDS", default=3600, minimum=60
+)
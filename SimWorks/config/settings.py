@@ -27,6 +27,7 @@ from .billing_settings import (
     BILLING_STRIPE_SECRET_KEY,
     BILLING_STRIPE_TRIAL_DAYS,
     BILLING_STRIPE_WEBHOOK_SECRET,
+    ENTITLEMENT_CACHE_TTL,
 )
 from .email_settings import (
     ACCOUNT_DEFAULT_HTTP_PROTOCOL,
@@ -56,11 +57,14 @@ from .privacy_settings import (
     PRIVACY_DERIVED_FEEDBACK_RETENTION_DAYS,
     PRIVACY_ENABLE_BASIC_PII_SCAN,
     PRIVACY_ENABLE_PII_WARNING,
+    PRIVACY_EXPORT_STALE_AFTER_SECONDS,
     PRIVACY_PERSIST_AI_MESSAGE_HISTORY,
     PRIVACY_PERSIST_PROVIDER_RAW,
     PRIVACY_PERSIST_RAW_AI_REQUESTS,
     PRIVACY_PERSIST_RAW_AI_RESPONSES,
     PRIVACY_RAW_AI_RETENTION_DAYS,
+    PRIVACY_RETENTION_BATCH_SIZE,
+    PRIVACY_RETENTION_TIME_BUDGET_SECONDS,
 )
 from .security_settings import (
     ALLOWED_HOSTS,
@@ -89,6 +93,10 @@ from .task_settings import (
     CHANNEL_LAYERS,
     DJANGO_TASKS_MAX_RETRIES,
     DJANGO_TASKS_RETRY_DELAY,
+    GUARDS_PRESENCE_BACKEND,
+    GUARDS_PRESENCE_TTL,
+    GUARDS_USAGE_BACKEND,
+    GUARDS_USAGE_FLUSH_BATCH,
     RATE_LIMIT_API_REQUESTS,
     RATE_LIMIT_AUTH_REQUESTS,
     RATE_LIMIT_MESSAGE_REQUESTS,
@@ -147,20 +155,21 @@ INSTALLED_APPS = [
     "imagekit",
 ]
 
+# Every entry must be async-capable; see docs/architecture/middleware.md.
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "apps.common.middleware.HealthCheckMiddleware",
     "apps.common.middleware.CorrelationIDMiddleware",
-    "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
-    "django.middleware.common.CommonMiddleware",
+    "apps.common.middleware.AsyncSecurityMiddleware",
+    "apps.common.middleware.AsyncSessionMiddleware",
+    "apps.common.middleware.AsyncCommonMiddleware",
     "django_htmx.middleware.HtmxMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.common.middleware.AsyncAuthenticationMiddleware",
     "allauth.account.middleware.AccountMiddleware",
     "apps.accounts.middleware.InvitationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.common.middleware.AsyncMessageMiddleware",
+    "apps.common.middleware.AsyncXFrameOptionsMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -222,6 +231,14 @@ ORCA_ENTRYPOINT = "config.orca:get_orca"
 ORCHESTRAI = {
     "MODE": "single",
     "DEFAULT_MODEL": os.getenv("ORCA_DEFAULT_MODEL", "openai-responses:gpt-5o-mini"),
+    "HTTP_POOL": {
+        "MAX_CONNECTIONS": int_from_env("ORCA_HTTP_MAX_CONNECTIONS", default=100, minimum=1),
+        "MAX_KEEPALIVE_CONNECTIONS": int_from_env(
+            "ORCA_HTTP_MAX_KEEPALIVE_CONNECTIONS", default=20, minimum=0
+        ),
+        "KEEPALIVE_EXPIRY": int_from_env("ORCA_HTTP_KEEPALIVE_EXPIRY", default=30, minimum=1),
+        "HTTP2": bool_from_env("ORCA_HTTP2", default=True),
+    },
 }
 ORCA_MAX_ATTEMPTS = int_from_env("ORCA_MAX_ATTEMPTS", default=4, minimum=1)
 ORCA_RETRY_BACKOFF_BASE = int_from_env("ORCA_RETRY_BACKOFF_BASE", default=5, minimum=1)
@@ -245,6 +262,14 @@ TRAINERLAB_RUNTIME_MAX_BATCH_REASONS = int_from_env(
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "django-insecure-jwt-ci-placeholder")
 JWT_ACCESS_TOKEN_LIFETIME = int_from_env("JWT_ACCESS_TOKEN_LIFETIME", default=3600, minimum=1)
 JWT_REFRESH_TOKEN_LIFETIME = int_from_env("JWT_REFRESH_TOKEN_LIFETIME", default=604800, minimum=1)
+# Cached JWT principals / account resolution (apps.accounts.principal_cache); 0 disables
+PRINCIPAL_CACHE_TTL = int_from_env("PRINCIPAL_CACHE_TTL", default=60, minimum=0)
+# Cached simulation tool checksums (apps.simcore.tools.checksums); 0 disables
+TOOL_CHECKSUM_CACHE_TTL = int_from_env("TOOL_CHECKSUM_CACHE_TTL", default=300, minimum=0)
+# Cached published-rubric resolution (apps.assessments.services.rubric_resolution); 0 disables
+ASSESSMENT_RUBRIC_CACHE_TTL = int_from_env("ASSESSMENT_RUBRIC_CACHE_TTL", default=600, minimum=0)
+# Cached staff feedback inbox counters (apps.feedback.services); 0 disables
+FEEDBACK_COUNTERS_CACHE_TTL = int_from_env("FEEDBACK_COUNTERS_CACHE_TTL", default=60, minimum=0)
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
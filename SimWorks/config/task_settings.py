@@ -47,3 +47,15 @@ CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 RATE_LIMIT_AUTH_REQUESTS = int_from_env("RATE_LIMIT_AUTH_REQUESTS", default=5, minimum=1)
 RATE_LIMIT_MESSAGE_REQUESTS = int_from_env("RATE_LIMIT_MESSAGE_REQUESTS", default=30, minimum=1)
 RATE_LIMIT_API_REQUESTS = int_from_env("RATE_LIMIT_API_REQUESTS", default=100, minimum=1)
+
+# Guard heartbeat presence (apps.guards.presence): "redis" keeps freshness in
+# Redis db 4 and writes only guard-state transitions; "database" writes every
+# heartbeat to SessionPresence.
+GUARDS_PRESENCE_BACKEND = os.getenv("GUARDS_PRESENCE_BACKEND", "redis").strip().lower()
+GUARDS_PRESENCE_TTL = int_from_env("GUARDS_PRESENCE_TTL", default=86400, minimum=60)
+
+# Guard usage accounting (apps.guards.usage_buffer): "redis" buffers
+# UsageRecord increments in Redis db 4 and flushes them in bulk; "database"
+# upserts the rows on every service call.
+GUARDS_USAGE_BACKEND = os.getenv("GUARDS_USAGE_BACKEND", "redis").strip().lower()
+GUARDS_USAGE_FLUSH_BATCH = int_from_env("GUARDS_USAGE_FLUSH_BATCH", default=1000, minimum=1)
@@ -64,6 +64,12 @@ class BaseInstruction(IdentityMixin, ABC):
     # warnings at load time.  No runtime behaviour change.
     optional_variables: ClassVar[tuple[str, ...]] = ()
 
+    # Declare context objects (e.g. ``"simulation"``, ``"user"``) this
+    # instruction reads.  The owning service resolves the union across all of
+    # its instructions once per run via registered context resolvers, so
+    # renders share one lookup instead of each fetching its own copy.
+    context_requirements: ClassVar[tuple[str, ...]] = ()
+
     def _validate_context(self, context: dict[str, Any]) -> None:
         """Raise MissingRequiredContextError if any required_variables are absent.
 
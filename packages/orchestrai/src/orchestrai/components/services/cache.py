@@ -0,0 +1,135 @@
+# orchestrai/components/services/cache.py
+"""Opt-in response cache for deterministic service calls.
+
+Services set ``cache_ttl`` (seconds) to opt in.  The cache key covers the
+service identity, effective model, rendered instructions, user message, model
+settings and response schema, so any change to what the provider would see is
+a miss.  Runs that depend on conversation state (``message_history`` or a
+previous provider response id) are never cached.
+
+A hit returns a :class:`CachedRunResult` that mimics the parts of Pydantic AI's
+``AgentRunResult`` the execution pipeline reads, with zero usage and
+``cache_hit = True``.
+
+The default store is a process-local :class:`InMemoryResponseCache`; framework
+integrations may install a shared store via
+``BaseService.set_response_cache()``.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Protocol, runtime_checkable
+
+__all__ = (
+    "CachedRunResult",
+    "InMemoryResponseCache",
+    "ResponseCache",
+    "build_cache_key",
+)
+
+
+@runtime_checkable
+class ResponseCache(Protocol):
+    """Store for cached service outputs (JSON-safe payloads)."""
+
+    async def aget(self, key: str) -> Any | None: ...
+
+    async def aset(self, key: str, value: Any, ttl: int) -> None: ...
+
+
+class InMemoryResponseCache:
+    """Thread-safe, size-bounded LRU store with per-entry TTL."""
+
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def aget(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def aset(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def build_cache_key(
+    *,
+    identity: str,
+    model: str,
+    instructions: list[str],
+    user_message: Any,
+    model_settings: dict[str, Any] | None,
+    schema: dict[str, Any] | None,
+) -> str:
+    """Return a stable SHA-256 key for a service request."""
+    material = {
+        "identity": identity,
+        "model": model,
+        "instructions": instructions,
+        "user_message": user_message,
+        "model_settings": model_settings or {},
+        "schema": schema,
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+@dataclass
+class _ZeroUsage:
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    reasoning_tokens: int = 0
+
+
+@dataclass
+class CachedRunResult:
+    """Result served from the response cache instead of the provider."""
+
+    output: Any
+    cache_key: str
+    cache_hit: bool = True
+    run_id: str | None = None
+    _timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def usage(self) -> _ZeroUsage:
+        return _ZeroUsage()
+
+    def timestamp(self) -> datetime:
+        return self._timestamp
+
+    def all_messages(self) -> list[Any]:
+        return []
+
+    def new_messages(self) -> list[Any]:
+        return []
+
+    def all_messages_json(self) -> bytes:
+        return b"[]"
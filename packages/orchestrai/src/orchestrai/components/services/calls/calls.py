@@ -57,6 +57,8 @@ class ServiceCall:
     input_tokens: int = 0
     output_tokens: int = 0
     total_tokens: int = 0
+    # True when the result was served from the response cache
+    cache_hit: bool = False
 
     def to_jsonable(self) -> dict[str, Any]:
         payload = asdict(self)
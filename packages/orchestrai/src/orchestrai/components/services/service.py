@@ -43,7 +43,7 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import UTC, datetime
 from functools import cached_property
 import logging
@@ -55,10 +55,17 @@ from orchestrai.components.base import BaseComponent
 from orchestrai.components.instructions.base import BaseInstruction
 from orchestrai.components.instructions.collector import collect_instructions
 from orchestrai.components.mixins import LifecycleMixin
+from orchestrai.components.services.cache import (
+    CachedRunResult,
+    InMemoryResponseCache,
+    ResponseCache,
+    build_cache_key,
+)
 from orchestrai.components.services.calls.mixins import ServiceCallMixin
 from orchestrai.identity import IdentityMixin
 from orchestrai.identity.domains import SERVICES_DOMAIN
 from orchestrai.tracing import flatten_context as flatten_context_, get_tracer, service_span
+from orchestrai.utils.http_clients import get_async_http_client
 
 if TYPE_CHECKING:
     from pydantic_ai import Agent
@@ -73,8 +80,24 @@ tracer = get_tracer("orchestrai.service")
 T = TypeVar("T", bound=BaseModel)
 
 
+def _has_custom_render(instruction_cls: type[BaseInstruction]) -> bool:
+    """True when an instruction renders dynamically rather than from static text."""
+    return (
+        hasattr(instruction_cls, "render_instruction")
+        and instruction_cls.render_instruction is not BaseInstruction.render_instruction
+    )
+
+
+#: Async resolver ``(context, requested_keys) -> {key: value}`` used to prefetch
+#: instruction ``context_requirements`` once per service run.
+type ContextResolver = Callable[[dict[str, Any], frozenset[str]], Awaitable[dict[str, Any]]]
+
+
 # ---------------------------------------------------------------------------
 # Provider factory functions (lazy imports — optional provider SDKs)
+#
+# Providers share pooled HTTP clients (orchestrai.utils.http_clients) so models
+# built for different services reuse keep-alive connections to the same API.
 # ---------------------------------------------------------------------------
 
 
@@ -83,7 +106,12 @@ def _make_openai_model(model_name: str, api_key: str | None) -> Any:
     from pydantic_ai.providers.openai import OpenAIProvider
 
     logger.info("Creating OpenAI model '%s'", model_name)
-    return OpenAIResponsesModel(model_name, provider=OpenAIProvider(api_key=api_key))
+    return OpenAIResponsesModel(
+        model_name,
+        provider=OpenAIProvider(
+            api_key=api_key, http_client=get_async_http_client("openai", api_key)
+        ),
+    )
 
 
 def _make_anthropic_model(model_name: str, api_key: str | None) -> Any:
@@ -91,7 +119,12 @@ def _make_anthropic_model(model_name: str, api_key: str | None) -> Any:
     from pydantic_ai.providers.anthropic import AnthropicProvider
 
     logger.info("Creating Anthropic model '%s'", model_name)
-    return AnthropicModel(model_name, provider=AnthropicProvider(api_key=api_key))
+    return AnthropicModel(
+        model_name,
+        provider=AnthropicProvider(
+            api_key=api_key, http_client=get_async_http_client("anthropic", api_key)
+        ),
+    )
 
 
 def _make_gemini_model(model_name: str, api_key: str | None) -> Any:
@@ -99,7 +132,12 @@ def _make_gemini_model(model_name: str, api_key: str | None) -> Any:
     from pydantic_ai.providers.google import GoogleProvider
 
     logger.info("Creating Gemini model '%s'", model_name)
-    return GeminiModel(model_name, provider=GoogleProvider(api_key=api_key))
+    return GeminiModel(
+        model_name,
+        provider=GoogleProvider(
+            api_key=api_key, http_client=get_async_http_client("google", api_key)
+        ),
+    )
 
 
 def _make_groq_model(model_name: str, api_key: str | None) -> Any:
@@ -107,7 +145,10 @@ def _make_groq_model(model_name: str, api_key: str | None) -> Any:
     from pydantic_ai.providers.groq import GroqProvider
 
     logger.info("Creating Groq model '%s'", model_name)
-    return GroqModel(model_name, provider=GroqProvider(api_key=api_key))
+    return GroqModel(
+        model_name,
+        provider=GroqProvider(api_key=api_key, http_client=get_async_http_client("groq", api_key)),
+    )
 
 
 def _make_mistral_model(model_name: str, api_key: str | None) -> Any:
@@ -115,7 +156,12 @@ def _make_mistral_model(model_name: str, api_key: str | None) -> Any:
     from pydantic_ai.providers.mistral import MistralProvider
 
     logger.info("Creating Mistral model '%s'", model_name)
-    return MistralModel(model_name, provider=MistralProvider(api_key=api_key))
+    return MistralModel(
+        model_name,
+        provider=MistralProvider(
+            api_key=api_key, http_client=get_async_http_client("mistral", api_key)
+        ),
+    )
 
 
 def _make_cohere_model(model_name: str, api_key: str | None) -> Any:
@@ -123,7 +169,12 @@ def _make_cohere_model(model_name: str, api_key: str | None) -> Any:
     from pydantic_ai.providers.cohere import CohereProvider
 
     logger.info("Creating Cohere model '%s'", model_name)
-    return CohereModel(model_name, provider=CohereProvider(api_key=api_key))
+    return CohereModel(
+        model_name,
+        provider=CohereProvider(
+            api_key=api_key, http_client=get_async_http_client("cohere", api_key)
+        ),
+    )
 
 
 #: Built-in provider dispatch table.  Maps the provider prefix (extracted from
@@ -317,6 +368,10 @@ class BaseService[T: BaseModel](
     # Falls back to _BUILTIN_PROVIDER_FACTORIES for unknown names.
     _PROVIDER_FACTORIES: ClassVar[dict[str, Callable[[str, str | None], Any]]] = {}
 
+    # Context resolvers keyed by requirement name.  Populated via
+    # register_context_resolver(); one resolver may serve several keys.
+    _CONTEXT_RESOLVERS: ClassVar[dict[str, ContextResolver]] = {}
+
     # Response schema (Pydantic model)
     response_schema: ClassVar[type[BaseModel] | None] = None
 
@@ -324,6 +379,16 @@ class BaseService[T: BaseModel](
     use_native_output: ClassVar[bool] = False
     native_output_strict: ClassVar[bool] = True
 
+    # Stream model output while the run is in flight.  Partial output is
+    # surfaced through on_stream_delta(); the validated result is unchanged.
+    streaming: ClassVar[bool] = False
+
+    # Opt-in response cache.  A positive TTL (seconds) caches outputs keyed by
+    # identity, model, rendered instructions, user message and schema.  The
+    # store is shared by all services; swap it via set_response_cache().
+    cache_ttl: ClassVar[int | None] = None
+    _RESPONSE_CACHE: ClassVar[ResponseCache] = InMemoryResponseCache()
+
     # Required context keys
     required_context_keys: ClassVar[tuple[str, ...]] = ()
 
@@ -356,6 +421,13 @@ class BaseService[T: BaseModel](
         # Cached instruction classes (collected from class MRO)
         self._instruction_classes = collect_instructions(type(self))
 
+        # Union of context objects the instructions declare they read
+        self._context_requirements: frozenset[str] = frozenset(
+            key
+            for instruction_cls in self._instruction_classes
+            for key in getattr(instruction_cls, "context_requirements", ())
+        )
+
         # Agent instance (lazily created)
         self._agent: Agent | None = None
 
@@ -394,6 +466,128 @@ class BaseService[T: BaseModel](
         """Return the factory for *provider*, class-level overrides first."""
         return cls._PROVIDER_FACTORIES.get(provider) or _BUILTIN_PROVIDER_FACTORIES.get(provider)
 
+    # ---------------------------------------------------------------------------
+    # Response cache
+    # ---------------------------------------------------------------------------
+
+    @classmethod
+    def set_response_cache(cls, cache: ResponseCache) -> None:
+        """Install the store used by services that set ``cache_ttl``."""
+        cls._RESPONSE_CACHE = cache
+
+    async def _aresponse_cache_key(
+        self,
+        working_ctx: dict[str, Any],
+        model_settings: dict[str, Any] | None,
+    ) -> str | None:
+        """Return the cache key for this run, or None when it must not be cached."""
+        if not self.cache_ttl or self.cache_ttl <= 0:
+            return None
+        # Conversation-continuation runs depend on provider-side state.
+        if working_ctx.get("message_history") or (
+            model_settings and model_settings.get("openai_previous_response_id")
+        ):
+            return None
+
+        instructions: list[str] = []
+        for instruction_cls in self._instruction_classes:
+            if _has_custom_render(instruction_cls):
+                text = instruction_cls.render_instruction(self)
+                if asyncio.iscoroutine(text):
+                    text = await text
+            else:
+                text = instruction_cls.instruction
+            instructions.append(text or "")
+
+        schema = None
+        if self.response_schema is not None:
+            schema = {
+                "json_schema": self.response_schema.model_json_schema(),
+                "native_output": self.use_native_output,
+                "strict": self.native_output_strict,
+            }
+        return build_cache_key(
+            identity=self.identity.as_str,
+            model=self.effective_model,
+            instructions=instructions,
+            user_message=working_ctx.get("user_message", ""),
+            model_settings=model_settings,
+            schema=schema,
+        )
+
+    def _restore_cached_output(self, value: Any) -> Any:
+        if self.response_schema is not None and isinstance(value, dict):
+            return self.response_schema.model_validate(value)
+        return value
+
+    # ---------------------------------------------------------------------------
+    # Context requirements
+    # ---------------------------------------------------------------------------
+
+    @classmethod
+    def register_context_resolver(
+        cls,
+        keys: str | Iterable[str],
+        resolver: ContextResolver,
+    ) -> None:
+        """Register an async resolver for instruction ``context_requirements``.
+
+        The resolver receives ``(context, requested_keys)`` and returns a dict of
+        resolved values.  Registering one resolver for several keys lets it
+        fetch related objects together (e.g. a simulation with its user in a
+        single query); it is called at most once per run.
+
+        Example::
+
+            BaseService.register_context_resolver(
+                ("simulation", "user"),
+                resolve_simulation_context,
+            )
+        """
+        if isinstance(keys, str):
+            keys = (keys,)
+        for key in keys:
+            cls._CONTEXT_RESOLVERS[key] = resolver
+
+    async def _aresolve_context_requirements(self, context: dict[str, Any]) -> dict[str, Any]:
+        """Prefetch declared instruction context objects missing from *context*.
+
+        Only requirements absent (or ``None``) in *context* are requested.  Keys
+        are grouped by resolver so each resolver runs once with the full set it
+        serves.  Resolver failures are logged and left to the instructions'
+        own fallbacks.
+
+        Returns:
+            The resolved values; *context* itself is not modified.
+        """
+        missing = [key for key in sorted(self._context_requirements) if context.get(key) is None]
+        if not missing:
+            return {}
+
+        grouped: dict[int, tuple[ContextResolver, set[str]]] = {}
+        for key in missing:
+            resolver = type(self)._CONTEXT_RESOLVERS.get(key)
+            if resolver is None:
+                continue
+            grouped.setdefault(id(resolver), (resolver, set()))[1].add(key)
+
+        found: dict[str, Any] = {}
+        for resolver, keys in grouped.values():
+            try:
+                resolved = await resolver(context, frozenset(keys))
+            except Exception:
+                logger.warning(
+                    "Context resolver failed for %s keys=%s",
+                    self.__class__.__name__,
+                    sorted(keys),
+                    exc_info=True,
+                )
+                continue
+            for key, value in (resolved or {}).items():
+                if value is not None and context.get(key) is None:
+                    found.setdefault(key, value)
+        return found
+
     # ---------------------------------------------------------------------------
     # Model resolution
     # ---------------------------------------------------------------------------
@@ -583,10 +777,7 @@ class BaseService[T: BaseModel](
 
         # Register instruction callbacks in deterministic order.
         for instruction_cls in self._instruction_classes:
-            has_custom_render = (
-                hasattr(instruction_cls, "render_instruction")
-                and instruction_cls.render_instruction is not BaseInstruction.render_instruction
-            )
+            has_custom_render = _has_custom_render(instruction_cls)
 
             def make_instruction_fn(cls, is_dynamic: bool):
                 if is_dynamic:
@@ -653,7 +844,9 @@ class BaseService[T: BaseModel](
         Execute the service using Pydantic AI Agent.
 
         This is the main execution method. It:
-        1. Builds a working context copy (self.context is never mutated)
+        1. Builds a working context copy (self.context is never mutated);
+           instructions render against it, plus the prefetched context
+           objects they declare, as ``self.context`` for this run only
         2. Builds the system prompt from instruction classes
         3. Gets the user message from context
         4. Executes the agent with the prompts
@@ -684,6 +877,10 @@ class BaseService[T: BaseModel](
             finally:
                 self.context = _saved_ctx
 
+        # Instruction callbacks render against self.context; prefetch the union of
+        # their declared context objects once so renders do not query separately.
+        resolved = await self._aresolve_context_requirements(working_ctx)
+
         # Create service call for tracking
         call = self._create_call(
             payload=ctx,
@@ -694,6 +891,8 @@ class BaseService[T: BaseModel](
         call.status = "running"
         call.started_at = datetime.now(UTC)
 
+        _saved_ctx = self.context
+        self.context = {**working_ctx, **resolved}
         try:
             async with service_span(
                 f"pydantic_ai.{self.__class__.__name__}.run",
@@ -716,6 +915,20 @@ class BaseService[T: BaseModel](
                         "openai_previous_response_id": previous_response_id,
                     }
 
+                cache_key = await self._aresponse_cache_key(working_ctx, model_settings)
+                if cache_key is not None:
+                    cached = await self._aget_cached_result(cache_key)
+                    if cached is not None:
+                        call.status = "completed"
+                        call.finished_at = datetime.now(UTC)
+                        call.cache_hit = True
+                        await self.on_success(working_ctx, cached)
+                        return cached
+
+                run_kwargs: dict[str, Any] = {}
+                if self.streaming:
+                    run_kwargs["event_stream_handler"] = self._handle_stream_events
+
                 # Execute agent. Instruction callbacks are registered on the agent and
                 # capture the service instance to read the latest context state.
                 result = await self.agent.run(
@@ -723,6 +936,7 @@ class BaseService[T: BaseModel](
                     deps=working_ctx,
                     message_history=message_history,
                     model_settings=model_settings,
+                    **run_kwargs,
                 )
 
                 # Update call with result
@@ -735,6 +949,9 @@ class BaseService[T: BaseModel](
                     call.output_tokens = result.usage().output_tokens or 0
                     call.total_tokens = result.usage().total_tokens or 0
 
+                if cache_key is not None:
+                    await self._aset_cached_result(cache_key, result.output)
+
                 await self.on_success(working_ctx, result)
                 return result
 
@@ -744,6 +961,29 @@ class BaseService[T: BaseModel](
             call.error = str(e)
             await self.on_failure(working_ctx, e)
             raise
+        finally:
+            self.context = _saved_ctx
+
+    async def _aget_cached_result(self, cache_key: str) -> CachedRunResult | None:
+        try:
+            value = await self._RESPONSE_CACHE.aget(cache_key)
+            if value is None:
+                return None
+            output = self._restore_cached_output(value)
+        except Exception:
+            logger.warning("Response cache read failed for %s", self.identity.as_str, exc_info=True)
+            return None
+        logger.debug("Response cache hit for %s", self.identity.as_str)
+        return CachedRunResult(output=output, cache_key=cache_key)
+
+    async def _aset_cached_result(self, cache_key: str, output: Any) -> None:
+        value = output.model_dump(mode="json") if isinstance(output, BaseModel) else output
+        try:
+            await self._RESPONSE_CACHE.aset(cache_key, value, int(self.cache_ttl or 0))
+        except Exception:
+            logger.warning(
+                "Response cache write failed for %s", self.identity.as_str, exc_info=True
+            )
 
     async def on_success(self, context: dict[str, Any], result: RunResult[T]) -> None:
         """Called after successful execution. Override in subclasses."""
@@ -751,6 +991,70 @@ class BaseService[T: BaseModel](
     async def on_failure(self, context: dict[str, Any], error: Exception) -> None:
         """Called after failed execution. Override in subclasses."""
 
+    # ---------------------------------------------------------------------------
+    # Streaming
+    # ---------------------------------------------------------------------------
+
+    async def _handle_stream_events(self, run_ctx: Any, events: Any) -> None:
+        """Pydantic AI ``event_stream_handler`` for one model request.
+
+        Accumulates raw text / tool-call argument deltas, maps the buffer to
+        visible text via :meth:`extract_stream_text`, and forwards growth to
+        :meth:`on_stream_delta`.
+        """
+        from pydantic_ai.messages import (
+            PartDeltaEvent,
+            PartStartEvent,
+            TextPart,
+            TextPartDelta,
+            ToolCallPart,
+            ToolCallPartDelta,
+        )
+
+        context = run_ctx.deps if isinstance(run_ctx.deps, dict) else self.context
+        buffer: list[str] = []
+        emitted = ""
+
+        async for event in events:
+            chunk: Any = None
+            if isinstance(event, PartStartEvent):
+                if isinstance(event.part, TextPart):
+                    chunk = event.part.content
+                elif isinstance(event.part, ToolCallPart):
+                    chunk = event.part.args
+            elif isinstance(event, PartDeltaEvent):
+                if isinstance(event.delta, TextPartDelta):
+                    chunk = event.delta.content_delta
+                elif isinstance(event.delta, ToolCallPartDelta):
+                    chunk = event.delta.args_delta
+            if not chunk or not isinstance(chunk, str):
+                continue
+
+            buffer.append(chunk)
+            text = self.extract_stream_text("".join(buffer))
+            if not text or text == emitted:
+                continue
+            delta = text[len(emitted) :] if text.startswith(emitted) else text
+            emitted = text
+            await self.on_stream_delta(context, delta, text)
+
+        if emitted:
+            await self.on_stream_complete(context, emitted)
+
+    def extract_stream_text(self, raw: str) -> str:
+        """Map the raw streamed buffer to user-visible text.
+
+        The default passes the buffer through.  Services with structured output
+        override this to pull display text out of partial JSON.
+        """
+        return raw
+
+    async def on_stream_delta(self, context: dict[str, Any], delta: str, text: str) -> None:
+        """Called as visible streamed text grows. Override in subclasses."""
+
+    async def on_stream_complete(self, context: dict[str, Any], text: str) -> None:
+        """Called when a model response finishes streaming. Override in subclasses."""
+
     @property
     def slug(self) -> str:
         """Get slug for service (from identity string)."""
@@ -763,6 +1067,7 @@ class BaseService[T: BaseModel](
 
 __all__ = [
     "BaseService",
+    "ContextResolver",
     "CoreTaskProxy",
     "TaskDescriptor",
     "register_task_proxy_factory",
@@ -17,6 +17,15 @@ DEFAULTS: dict[str, object] = {
     "DEFAULT_TIMEOUT": 60,
     "DEFAULT_MODEL": "openai-responses:gpt-5-nano",
     "DEFAULT_MAX_RETRIES": 3,
+    # Shared provider HTTP client pool (see orchestrai.utils.http_clients).
+    # TIMEOUT defaults to DEFAULT_TIMEOUT; HTTP2 needs the optional ``h2`` package.
+    "HTTP_POOL": {
+        "MAX_CONNECTIONS": 100,
+        "MAX_KEEPALIVE_CONNECTIONS": 20,
+        "KEEPALIVE_EXPIRY": 30.0,
+        "CONNECT_TIMEOUT": 5.0,
+        "HTTP2": True,
+    },
     # API key environment variable names (standard provider defaults)
     # These map provider names to the environment variable containing the API key.
     # OrchestrAI Django overrides these with ORCA_ prefixed variants.
@@ -89,6 +89,21 @@ immediately — no silent empty-string fallback.
 Non-required (optional) variables missing from context silently render as
 empty string.  Use ``required_variables`` for anything that must be present.
 
+Python instructions that read shared objects (a simulation, the user) declare
+them via ``context_requirements``.  Before rendering, the service resolves the
+union of requirements across its instructions once, using resolvers registered
+with ``BaseService.register_context_resolver()``, so several instructions
+reading the same object cost one lookup:
+
+.. code-block:: python
+
+    class PatientNameInstruction(BaseInstruction):
+        context_requirements = ("simulation",)
+
+        async def render_instruction(self) -> str:
+            simulation = self.context.get("simulation")
+            ...
+
 Identity and naming
 ---------------------
 Instruction identities follow the pattern::
@@ -0,0 +1,304 @@
+# orchestrai/utils/http_clients.py
+"""Process-wide HTTP client pool for provider SDKs.
+
+Provider SDKs (and Pydantic AI providers) build a fresh ``httpx`` client when
+none is supplied, so every model or SDK client pays its own TCP + TLS
+handshakes.  This module hands out one long-lived client per
+``(provider, api_key)`` pair with keep-alive, HTTP/2 when ``h2`` is installed,
+and pool limits taken from ``app.conf["HTTP_POOL"]``.
+
+Async clients are safe to share across event loops: their transport keeps one
+connection pool per running loop and closes it when that loop shuts down, so a
+client never touches a connection bound to another (possibly closed) loop.
+
+Connections can only be reused while their loop lives.  A short-lived loop,
+such as the one a bare ``async_to_sync`` creates for every call, therefore pays
+a fresh handshake each time.  Synchronous workers should run async service
+calls on :func:`get_worker_loop`, a long-lived loop owned by the process, so
+consecutive calls share one pool.
+
+Call :func:`aclose_http_clients` (ASGI lifespan) or :func:`close_http_clients`
+(worker shutdown) when the process is stopping; the latter also stops the
+worker loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import os
+import threading
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    "aclose_http_clients",
+    "close_http_clients",
+    "get_async_http_client",
+    "get_http_client",
+    "get_worker_loop",
+    "http_pool_settings",
+)
+
+_DEFAULT_POOL_SETTINGS: dict[str, Any] = {
+    "MAX_CONNECTIONS": 100,
+    "MAX_KEEPALIVE_CONNECTIONS": 20,
+    "KEEPALIVE_EXPIRY": 30.0,
+    "CONNECT_TIMEOUT": 5.0,
+    "HTTP2": True,
+}
+_FALLBACK_TIMEOUT = 60.0
+_WORKER_LOOP_SHUTDOWN_TIMEOUT = 10.0
+
+_lock = threading.Lock()
+_async_clients: dict[tuple[str, str], httpx.AsyncClient] = {}
+_sync_clients: dict[tuple[str, str], httpx.Client] = {}
+
+_worker_loop_lock = threading.Lock()
+_worker_loop: asyncio.AbstractEventLoop | None = None
+_worker_thread: threading.Thread | None = None
+_worker_pid: int | None = None
+
+
+def http_pool_settings() -> dict[str, Any]:
+    """Return pool settings from ``app.conf["HTTP_POOL"]`` merged over defaults.
+
+    The read timeout follows ``app.conf["DEFAULT_TIMEOUT"]`` unless
+    ``HTTP_POOL["TIMEOUT"]`` is set.
+    """
+    settings = dict(_DEFAULT_POOL_SETTINGS)
+    configured: Any = None
+    default_timeout: Any = None
+    try:
+        from orchestrai import get_current_app
+
+        app = get_current_app()
+        if app and app.conf:
+            configured = app.conf.get("HTTP_POOL")
+            default_timeout = app.conf.get("DEFAULT_TIMEOUT")
+    except Exception:
+        logger.debug("OrchestrAI app unavailable; using default HTTP pool settings")
+    if isinstance(configured, dict):
+        settings.update(configured)
+    settings.setdefault("TIMEOUT", default_timeout or _FALLBACK_TIMEOUT)
+    return settings
+
+
+def _pool_key(provider: str, api_key: str | None) -> tuple[str, str]:
+    # Never keep raw keys around as dict keys; a digest is enough to separate pools.
+    digest = hashlib.sha256(api_key.encode()).hexdigest()[:16] if api_key else ""
+    return provider, digest
+
+
+def _http2_enabled(settings: dict[str, Any]) -> bool:
+    return bool(settings.get("HTTP2")) and importlib.util.find_spec("h2") is not None
+
+
+def _limits(settings: dict[str, Any]) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.get("MAX_CONNECTIONS"),
+        max_keepalive_connections=settings.get("MAX_KEEPALIVE_CONNECTIONS"),
+        keepalive_expiry=settings.get("KEEPALIVE_EXPIRY"),
+    )
+
+
+def _timeout(settings: dict[str, Any]) -> httpx.Timeout:
+    return httpx.Timeout(timeout=settings["TIMEOUT"], connect=settings.get("CONNECT_TIMEOUT"))
+
+
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """Async transport that keeps one connection pool per running event loop.
+
+    Each pool is paired with a guard task on its loop.  ``asyncio.run`` (and so
+    ``async_to_sync``) cancels pending tasks before closing a loop; the guard
+    then closes the pool while the loop can still run the close.
+    """
+
+    def __init__(self, **transport_kwargs: Any) -> None:
+        self._transport_kwargs = transport_kwargs
+        self._transports: dict[
+            asyncio.AbstractEventLoop, tuple[httpx.AsyncHTTPTransport, asyncio.Task]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def _current(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._transports.get(loop)
+            if entry is None:
+                # Loops closed without cancelling their tasks never ran the
+                # guard; their sockets are released when the pool is dropped.
+                for stale in [other for other in self._transports if other.is_closed()]:
+                    del self._transports[stale]
+                transport = httpx.AsyncHTTPTransport(**self._transport_kwargs)
+                guard = loop.create_task(self._close_on_loop_shutdown(loop, transport))
+                entry = self._transports[loop] = (transport, guard)
+            return entry[0]
+
+    async def _close_on_loop_shutdown(
+        self, loop: asyncio.AbstractEventLoop, transport: httpx.AsyncHTTPTransport
+    ) -> None:
+        try:
+            await loop.create_future()
+        finally:
+            with self._lock:
+                if self._transports.get(loop, (None,))[0] is transport:
+                    del self._transports[loop]
+            await transport.aclose()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._current().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entries = dict(self._transports)
+            self._transports.clear()
+        for owner, (_transport, guard) in entries.items():
+            if owner is loop:
+                guard.cancel()
+                await asyncio.gather(guard, return_exceptions=True)
+            elif owner.is_running():
+                # Pools must be closed on their own loop; the guard does that.
+                owner.call_soon_threadsafe(guard.cancel)
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide long-lived event loop for synchronous workers.
+
+    The loop runs forever in a daemon thread, so pooled connections opened by
+    one call are reused by the next.  A forked child gets its own loop.
+    """
+    global _worker_loop, _worker_thread, _worker_pid
+
+    with _worker_loop_lock:
+        if (
+            _worker_loop is None
+            or _worker_pid != os.getpid()
+            or _worker_thread is None
+            or not _worker_thread.is_alive()
+        ):
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="orchestrai-worker-loop", daemon=True
+            )
+            thread.start()
+            _worker_loop, _worker_thread, _worker_pid = loop, thread, os.getpid()
+        return _worker_loop
+
+
+def _stop_worker_loop(async_clients: list[httpx.AsyncClient]) -> bool:
+    """Close *async_clients* on the worker loop, then stop it.
+
+    Returns ``False`` when this process has no running worker loop.
+    """
+    global _worker_loop, _worker_thread, _worker_pid
+
+    with _worker_loop_lock:
+        loop, thread = _worker_loop, _worker_thread
+        owned = _worker_pid == os.getpid()
+        _worker_loop = _worker_thread = _worker_pid = None
+    if loop is None or thread is None or not owned or not thread.is_alive():
+        return False
+
+    try:
+        asyncio.run_coroutine_threadsafe(_aclose_clients(async_clients), loop).result(
+            timeout=_WORKER_LOOP_SHUTDOWN_TIMEOUT
+        )
+    except Exception:
+        logger.debug("Error closing pooled async HTTP clients on worker loop", exc_info=True)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=_WORKER_LOOP_SHUTDOWN_TIMEOUT)
+    if not thread.is_alive():
+        loop.close()
+    return True
+
+
+def get_async_http_client(provider: str, api_key: str | None = None) -> httpx.AsyncClient:
+    """Return the shared async client for *provider* and *api_key*."""
+    key = _pool_key(provider, api_key)
+    client = _async_clients.get(key)
+    if client is not None and not client.is_closed:
+        return client
+
+    with _lock:
+        client = _async_clients.get(key)
+        if client is None or client.is_closed:
+            settings = http_pool_settings()
+            http2 = _http2_enabled(settings)
+            client = httpx.AsyncClient(
+                transport=_LoopLocalTransport(limits=_limits(settings), http2=http2),
+                timeout=_timeout(settings),
+            )
+            _async_clients[key] = client
+            logger.debug("Created pooled async HTTP client for %s (http2=%s)", provider, http2)
+    return client
+
+
+def get_http_client(provider: str, api_key: str | None = None) -> httpx.Client:
+    """Return the shared sync client for *provider* and *api_key*."""
+    key = _pool_key(provider, api_key)
+    client = _sync_clients.get(key)
+    if client is not None and not client.is_closed:
+        return client
+
+    with _lock:
+        client = _sync_clients.get(key)
+        if client is None or client.is_closed:
+            settings = http_pool_settings()
+            http2 = _http2_enabled(settings)
+            client = httpx.Client(
+                limits=_limits(settings),
+                timeout=_timeout(settings),
+                http2=http2,
+            )
+            _sync_clients[key] = client
+            logger.debug("Created pooled HTTP client for %s (http2=%s)", provider, http2)
+    return client
+
+
+def _drain() -> tuple[list[httpx.AsyncClient], list[httpx.Client]]:
+    with _lock:
+        async_clients = list(_async_clients.values())
+        sync_clients = list(_sync_clients.values())
+        _async_clients.clear()
+        _sync_clients.clear()
+    return async_clients, sync_clients
+
+
+async def _aclose_clients(clients: list[httpx.AsyncClient]) -> None:
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            logger.debug("Error closing pooled async HTTP client", exc_info=True)
+
+
+async def aclose_http_clients() -> None:
+    """Close every pooled client.  Call from an ASGI lifespan shutdown."""
+    async_clients, sync_clients = _drain()
+    for client in sync_clients:
+        client.close()
+    await _aclose_clients(async_clients)
+
+
+def close_http_clients() -> None:
+    """Close every pooled client and stop the worker loop (e.g. worker shutdown)."""
+    async_clients, sync_clients = _drain()
+    for client in sync_clients:
+        client.close()
+    if _stop_worker_loop(async_clients) or not async_clients:
+        return
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_aclose_clients(async_clients))
+    else:
+        # Inside a running loop the caller should use aclose_http_clients().
+        logger.warning("close_http_clients() called inside an event loop; async clients dropped")
@@ -0,0 +1,108 @@
+"""Tests for orchestrai.utils.http_clients - shared provider HTTP client pool."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from orchestrai.utils import http_clients
+
+
+@pytest.fixture(autouse=True)
+def _empty_pool():
+    http_clients.close_http_clients()
+    yield
+    http_clients.close_http_clients()
+
+
+class _EchoTransport(httpx.MockTransport):
+    def __init__(self, created: list["_EchoTransport"]):
+        super().__init__(lambda request: httpx.Response(200, json={"ok": True}))
+        self.closed = False
+        created.append(self)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class TestClientPool:
+    def test_async_client_is_shared_per_provider_and_key(self):
+        first = http_clients.get_async_http_client("openai", "sk-a")
+
+        assert http_clients.get_async_http_client("openai", "sk-a") is first
+        assert http_clients.get_async_http_client("openai", "sk-b") is not first
+        assert http_clients.get_async_http_client("anthropic", "sk-a") is not first
+
+    def test_sync_client_is_shared_and_recreated_after_close(self):
+        first = http_clients.get_http_client("openai", "sk-a")
+        assert http_clients.get_http_client("openai", "sk-a") is first
+
+        http_clients.close_http_clients()
+
+        assert first.is_closed
+        assert http_clients.get_http_client("openai", "sk-a") is not first
+
+    def test_pool_settings_are_applied(self, monkeypatch):
+        monkeypatch.setattr(
+            http_clients,
+            "http_pool_settings",
+            lambda: {
+                "MAX_CONNECTIONS": 7,
+                "MAX_KEEPALIVE_CONNECTIONS": 3,
+                "KEEPALIVE_EXPIRY": 11.0,
+                "CONNECT_TIMEOUT": 2.0,
+                "TIMEOUT": 9.0,
+                "HTTP2": False,
+            },
+        )
+
+        client = http_clients.get_http_client("openai")
+        pool = client._transport._pool
+
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 11.0
+        assert client.timeout.read == 9.0
+        assert client.timeout.connect == 2.0
+
+    def test_worker_loop_reuses_one_transport_across_calls(self, monkeypatch):
+        created: list[_EchoTransport] = []
+        monkeypatch.setattr(
+            http_clients.httpx, "AsyncHTTPTransport", lambda **_: _EchoTransport(created)
+        )
+        client = http_clients.get_async_http_client("openai", "sk-a")
+
+        async def request():
+            return (await client.get("https://example.test/")).status_code
+
+        loop = http_clients.get_worker_loop()
+        for _ in range(3):
+            assert asyncio.run_coroutine_threadsafe(request(), loop).result(timeout=5) == 200
+
+        assert http_clients.get_worker_loop() is loop
+        assert len(created) == 1
+        assert not created[0].closed
+
+        http_clients.close_http_clients()
+
+        assert created[0].closed
+        assert loop.is_closed()
+
+    def test_transport_is_closed_when_its_loop_shuts_down(self, monkeypatch):
+        created: list[_EchoTransport] = []
+        monkeypatch.setattr(
+            http_clients.httpx, "AsyncHTTPTransport", lambda **_: _EchoTransport(created)
+        )
+        client = http_clients.get_async_http_client("openai", "sk-a")
+
+        async def two_requests():
+            await client.get("https://example.test/a")
+            await client.get("https://example.test/b")
+
+        asyncio.run(two_requests())
+        asyncio.run(two_requests())
+
+        # Each short-lived loop got one transport, closed as the loop finished.
+        assert len(created) == 2
+        assert all(transport.closed for transport in created)
+        assert client._transport._transports == {}
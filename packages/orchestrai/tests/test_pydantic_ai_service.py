@@ -196,3 +196,219 @@ class TestBaseServiceIntegration:
 
         assert output_def is not None
         assert output_def.strict is False
+
+
+class TestContextRequirements:
+    async def test_requirements_resolved_once_per_resolver(self, monkeypatch):
+        from orchestrai.components.services import BaseService
+
+        calls: list[frozenset[str]] = []
+
+        async def resolver(context, requested):
+            calls.append(requested)
+            return {"simulation": f"sim-{context['simulation_id']}", "user": "user-1"}
+
+        @orca.instruction(order=10)
+        class SimulationInstruction(BaseInstruction):
+            context_requirements = ("simulation",)
+
+            async def render_instruction(self) -> str:
+                return self.context["simulation"]
+
+        @orca.instruction(order=20)
+        class UserInstruction(BaseInstruction):
+            context_requirements = ("user", "simulation")
+
+            async def render_instruction(self) -> str:
+                return self.context["user"]
+
+        class TestService(SimulationInstruction, UserInstruction, BaseService):
+            abstract = False
+
+        monkeypatch.setattr(TestService, "_CONTEXT_RESOLVERS", {})
+        TestService.register_context_resolver(("simulation", "user"), resolver)
+
+        service = TestService(context={"simulation_id": 7})
+        resolved = await service._aresolve_context_requirements(service.context)
+
+        assert calls == [frozenset({"simulation", "user"})]
+        assert resolved == {"simulation": "sim-7", "user": "user-1"}
+        assert service.context == {"simulation_id": 7}
+
+    async def test_present_requirements_are_not_resolved(self, monkeypatch):
+        from orchestrai.components.services import BaseService
+
+        calls: list[frozenset[str]] = []
+
+        async def resolver(context, requested):
+            calls.append(requested)
+            return {"user": "resolved"}
+
+        @orca.instruction(order=10)
+        class SimulationUserInstruction(BaseInstruction):
+            context_requirements = ("simulation", "user")
+
+        class TestService(SimulationUserInstruction, BaseService):
+            abstract = False
+
+        monkeypatch.setattr(TestService, "_CONTEXT_RESOLVERS", {})
+        TestService.register_context_resolver(("simulation", "user"), resolver)
+
+        service = TestService(context={"simulation": "given"})
+        resolved = await service._aresolve_context_requirements(service.context)
+
+        assert calls == [frozenset({"user"})]
+        assert resolved == {"user": "resolved"}
+
+    async def test_arun_renders_prefetched_context_without_keeping_it(self, monkeypatch):
+        from pydantic_ai.messages import ModelResponse, TextPart
+        from pydantic_ai.models.function import FunctionModel
+
+        from orchestrai.components.services import BaseService
+
+        prompts: list[str] = []
+
+        async def resolver(context, requested):
+            return {"simulation": f"sim-{context['simulation_id']}"}
+
+        async def respond(messages, info):
+            prompts.extend(
+                part.content for part in messages[0].parts if part.part_kind == "system-prompt"
+            )
+            return ModelResponse(parts=[TextPart(content="ok")])
+
+        @orca.instruction(order=10)
+        class PrefetchedSimulationInstruction(BaseInstruction):
+            context_requirements = ("simulation",)
+
+            async def render_instruction(self) -> str:
+                return f"Simulation: {self.context['simulation']}"
+
+        class TestService(PrefetchedSimulationInstruction, BaseService):
+            abstract = False
+
+        monkeypatch.setattr(TestService, "_CONTEXT_RESOLVERS", {})
+        TestService.register_context_resolver("simulation", resolver)
+        monkeypatch.setattr(
+            TestService, "_get_or_build_class_model", lambda self: FunctionModel(respond)
+        )
+
+        service = TestService()
+        await service.arun(simulation_id=3, user_message="hi")
+
+        assert prompts == ["Simulation: sim-3"]
+        assert service.context == {}
+
+
+class TestStreaming:
+    async def test_stream_events_emit_visible_text_deltas(self):
+        from types import SimpleNamespace
+
+        from pydantic_ai.messages import (
+            PartDeltaEvent,
+            PartStartEvent,
+            TextPart,
+            TextPartDelta,
+        )
+
+        from orchestrai.components.services import BaseService
+
+        class StreamingService(BaseService):
+            abstract = False
+            streaming = True
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.deltas: list[tuple[str, str]] = []
+                self.completed: list[str] = []
+
+            def extract_stream_text(self, raw: str) -> str:
+                return raw.upper()
+
+            async def on_stream_delta(self, context, delta, text):
+                self.deltas.append((delta, text))
+
+            async def on_stream_complete(self, context, text):
+                self.completed.append(text)
+
+        async def events():
+            yield PartStartEvent(index=0, part=TextPart(content="he"))
+            yield PartDeltaEvent(index=0, delta=TextPartDelta(content_delta=""))
+            yield PartDeltaEvent(index=0, delta=TextPartDelta(content_delta="llo"))
+
+        service = StreamingService()
+        await service._handle_stream_events(SimpleNamespace(deps={"k": 1}), events())
+
+        assert service.deltas == [("HE", "HE"), ("LLO", "HELLO")]
+        assert service.completed == ["HELLO"]
+
+
+class TestResponseCache:
+    def _service_cls(self, monkeypatch, calls: list[str]):
+        from pydantic_ai.messages import ModelResponse, TextPart
+        from pydantic_ai.models.function import FunctionModel
+
+        from orchestrai.components.services import BaseService
+        from orchestrai.components.services.cache import InMemoryResponseCache
+
+        class CachedSchema(BaseModel):
+            answer: str
+
+        async def respond(messages, info):
+            calls.append("model")
+            return ModelResponse(parts=[TextPart(content='{"answer": "42"}')])
+
+        class CachedService(BaseService):
+            abstract = False
+            response_schema = CachedSchema
+            use_native_output = True
+            cache_ttl = 60
+
+        monkeypatch.setattr(CachedService, "_RESPONSE_CACHE", InMemoryResponseCache())
+        monkeypatch.setattr(
+            CachedService, "_get_or_build_class_model", lambda self: FunctionModel(respond)
+        )
+        return CachedService
+
+    async def test_identical_requests_are_served_from_cache(self, monkeypatch):
+        calls: list[str] = []
+        service_cls = self._service_cls(monkeypatch, calls)
+
+        first = await service_cls().arun(user_message="question")
+        second = await service_cls().arun(user_message="question")
+
+        assert calls == ["model"]
+        assert getattr(first, "cache_hit", False) is False
+        assert second.cache_hit is True
+        assert second.output == first.output
+        assert second.usage().total_tokens == 0
+
+    async def test_changed_input_or_history_bypasses_cache(self, monkeypatch):
+        calls: list[str] = []
+        service_cls = self._service_cls(monkeypatch, calls)
+
+        await service_cls().arun(user_message="question")
+        await service_cls().arun(user_message="another question")
+        await service_cls(
+            context={"previous_response_id": "resp_1"},
+        ).arun(user_message="question")
+
+        assert calls == ["model", "model", "model"]
+
+    async def test_in_memory_cache_is_size_bounded_with_ttl(self, monkeypatch):
+        from orchestrai.components.services import cache as cache_module
+
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        store = cache_module.InMemoryResponseCache(max_entries=2)
+
+        await store.aset("a", 1, ttl=10)
+        await store.aset("b", 2, ttl=10)
+        await store.aget("a")
+        await store.aset("c", 3, ttl=10)
+
+        assert await store.aget("b") is None
+        assert await store.aget("a") == 1
+        now[0] = 111.0
+        assert await store.aget("c") is None
+        assert len(store) == 1
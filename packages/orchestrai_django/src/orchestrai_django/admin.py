@@ -4,7 +4,7 @@ from typing import Any, ClassVar
 from django.contrib import admin
 from django.utils.html import format_html
 
-from .models import ServiceCall, ServiceCallAttempt
+from .models import ATTEMPT_PAYLOAD_FIELDS, ServiceCall, ServiceCallAttempt
 
 # ----------------------------- helpers ---------------------------------
 
@@ -44,6 +44,11 @@ def _pretty_json(value: Any) -> str:
         return str(value)
 
 
+def _is_changelist(request) -> bool:
+    match = getattr(request, "resolver_match", None)
+    return bool(match and match.url_name and match.url_name.endswith("_changelist"))
+
+
 # ----------------------------- ModelAdmins ------------------------------
 
 
@@ -65,6 +70,9 @@ class ServiceCallAttemptInline(admin.TabularInline):
     )
     fields = readonly_fields
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).for_listing()
+
     def has_add_permission(self, request, obj=None):
         return False
 
@@ -83,11 +91,13 @@ class ServiceCallAdmin(admin.ModelAdmin):
         "domain_persisted",
         "related_object_id",
         "finished_at",
+        "payload_bytes",
     )
     list_filter = (
         "status",
         "backend",
         "domain_persisted",
+        "cache_hit",
         ("created_at", admin.DateFieldListFilter),
     )
     search_fields = (
@@ -113,6 +123,7 @@ class ServiceCallAdmin(admin.ModelAdmin):
         "task_id",
         "started_at",
         "finished_at",
+        "cache_hit",
         "domain_persisted",
         "domain_persist_error",
         "domain_persist_attempts",
@@ -122,6 +133,7 @@ class ServiceCallAdmin(admin.ModelAdmin):
         "related_object_id",
         "correlation_id",
         "schema_fqn",
+        "payload_bytes",
         "input_pretty",
         "context_pretty",
         "request_pretty",
@@ -149,6 +161,7 @@ class ServiceCallAdmin(admin.ModelAdmin):
                     ("backend", "queue"),
                     "task_id",
                     ("started_at", "finished_at"),
+                    "cache_hit",
                 )
             },
         ),
@@ -177,6 +190,7 @@ class ServiceCallAdmin(admin.ModelAdmin):
             "Data",
             {
                 "fields": (
+                    "payload_bytes",
                     "input_pretty",
                     "context_pretty",
                     "request_pretty",
@@ -187,6 +201,17 @@ class ServiceCallAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if not _is_changelist(request):
+            return queryset
+        # successful_attempt is rendered via __str__, which needs no payload.
+        return (
+            queryset.for_listing()
+            .select_related("successful_attempt")
+            .defer(*(f"successful_attempt__{field}" for field in ATTEMPT_PAYLOAD_FIELDS))
+        )
+
     @admin.display(description="Input")
     def input_pretty(self, obj: ServiceCall) -> str:
         return _pretty_json(obj.input)
@@ -339,15 +364,20 @@ class ServiceCallAttemptAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if _is_changelist(request):
+            queryset = queryset.for_listing()
+        return queryset
+
     @admin.display(description="Service Call")
     def service_call_link(self, obj: ServiceCallAttempt) -> str:
-        if obj.service_call:
+        if obj.service_call_id:
+            service_call_id = str(obj.service_call_id)
             return format_html(
                 '<a href="/admin/orchestrai_django/servicecall/{}/change/">{}</a>',
-                obj.service_call_id,
-                obj.service_call_id[:16] + "..."
-                if len(obj.service_call_id) > 16
-                else obj.service_call_id,
+                service_call_id,
+                service_call_id[:16] + "..." if len(service_call_id) > 16 else service_call_id,
             )
         return "-"
 
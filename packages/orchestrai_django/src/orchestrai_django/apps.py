@@ -272,6 +272,13 @@ class OrchestrAIDjangoConfig(AppConfig):
         except Exception:
             logger.debug("Failed to install Django task proxy during app ready", exc_info=True)
 
+        try:
+            from orchestrai_django.components.services.cache import use_django_response_cache
+
+            use_django_response_cache()
+        except Exception:
+            logger.debug("Failed to install Django response cache during app ready", exc_info=True)
+
         # Allow opt-out for special cases (tests, one-off management commands, etc.)
         if not _autostart_enabled():
             return
@@ -0,0 +1,39 @@
+# orchestrai_django/components/services/cache.py
+"""Django cache-backed store for the OrchestrAI response cache.
+
+The core default store is process-local, which Celery workers do not share.
+This store goes through Django's cache framework (``ORCA_RESPONSE_CACHE_ALIAS``,
+default ``"default"``) so every worker sees the same entries.  Size bounds are
+those of the configured backend (e.g. ``MAX_ENTRIES`` or Redis ``maxmemory``).
+"""
+
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+
+KEY_PREFIX = "orca:response-cache:"
+
+
+class DjangoCacheResponseCache:
+    """``ResponseCache`` implementation over a Django cache alias."""
+
+    def __init__(self, alias: str | None = None) -> None:
+        self.alias = alias or getattr(settings, "ORCA_RESPONSE_CACHE_ALIAS", "default")
+
+    @property
+    def _cache(self):
+        return caches[self.alias]
+
+    async def aget(self, key: str) -> Any | None:
+        return await self._cache.aget(KEY_PREFIX + key)
+
+    async def aset(self, key: str, value: Any, ttl: int) -> None:
+        await self._cache.aset(KEY_PREFIX + key, value, timeout=ttl)
+
+
+def use_django_response_cache() -> None:
+    """Install the Django cache store on ``BaseService``."""
+    from orchestrai.components.services import BaseService
+
+    BaseService.set_response_cache(DjangoCacheResponseCache())
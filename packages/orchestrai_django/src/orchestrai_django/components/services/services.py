@@ -184,3 +184,21 @@ class DjangoBaseService(BaseService, ABC):
         style without fighting the BaseService signature.
         """
         await self.on_failure_ctx(context=context or {}, err=error)
+
+    async def on_stream_delta(self, context: dict[str, Any], delta: str, text: str) -> None:
+        """Forward streamed text to the emitter's stream-chunk hook."""
+        if self.emitter:
+            self.emitter.emit_stream_chunk(
+                context,
+                self.identity.as_str,
+                {"delta": delta, "text": text},
+            )
+
+    async def on_stream_complete(self, context: dict[str, Any], text: str) -> None:
+        """Forward stream completion to the emitter."""
+        if self.emitter:
+            self.emitter.emit_stream_complete(
+                context,
+                self.identity.as_str,
+                context.get("correlation_id"),
+            )
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.4 on 2026-10-18 22:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orchestrai_django', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicecall',
+            name='cache_hit',
+            field=models.BooleanField(default=False, help_text='Result served from the response cache; no provider call was made'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.4 on 2026-10-18 23:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orchestrai_django', '0002_servicecall_cache_hit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicecall',
+            name='payload_bytes',
+            field=models.PositiveBigIntegerField(default=0, help_text='Serialized size of the payload JSON columns, maintained on save'),
+        ),
+    ]
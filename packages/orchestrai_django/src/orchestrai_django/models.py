@@ -1,5 +1,6 @@
 # orchestrai_django/models.py
 from datetime import timedelta
+import json
 from uuid import uuid4
 
 from django.core.exceptions import ValidationError
@@ -54,9 +55,43 @@ class AlreadySucceededError(Exception):
     """Raised when trying to mark success on an already-succeeded call."""
 
 
+# Large JSON columns left out of list views; read them from a single row instead.
+SERVICE_CALL_PAYLOAD_FIELDS = (
+    "service_kwargs",
+    "input",
+    "context",
+    "request",
+    "output_data",
+    "messages_json",
+    "usage_json",
+    "dispatch",
+)
+ATTEMPT_PAYLOAD_FIELDS = (
+    "request_input",
+    "request_pydantic",
+    "request_provider",
+    "request_messages",
+    "request_tools",
+    "agent_config",
+    "response_raw",
+    "response_provider_raw",
+    "structured_data",
+)
+
+
+def _json_size(value) -> int:
+    if value is None:
+        return 0
+    return len(json.dumps(value, default=str, separators=(",", ":")).encode("utf-8"))
+
+
 class ServiceCallQuerySet(models.QuerySet):
     """Common `ServiceCall` filters."""
 
+    def for_listing(self):
+        """Defer payload JSON; summary, token, cost and timing columns stay loaded."""
+        return self.defer(*SERVICE_CALL_PAYLOAD_FIELDS)
+
     def completed(self):
         """Return only completed calls."""
         return self.filter(status=CallStatus.COMPLETED)
@@ -100,6 +135,17 @@ class ServiceCallQuerySet(models.QuerySet):
 ServiceCallManager = models.Manager.from_queryset(ServiceCallQuerySet)
 
 
+class ServiceCallAttemptQuerySet(models.QuerySet):
+    """Common `ServiceCallAttempt` filters."""
+
+    def for_listing(self):
+        """Defer request/response snapshots; status, tokens and timing stay loaded."""
+        return self.defer(*ATTEMPT_PAYLOAD_FIELDS)
+
+
+ServiceCallAttemptManager = models.Manager.from_queryset(ServiceCallAttemptQuerySet)
+
+
 class ServiceCall(TimestampedModel):
     """Persisted state for one service call and its winning result."""
 
@@ -154,6 +200,10 @@ class ServiceCall(TimestampedModel):
     output_tokens = models.PositiveIntegerField(default=0)
     total_tokens = models.PositiveIntegerField(default=0)
     reasoning_tokens = models.PositiveIntegerField(default=0)
+    cache_hit = models.BooleanField(
+        default=False,
+        help_text="Result served from the response cache; no provider call was made",
+    )
 
     # Cost tracking
     input_cost_usd = models.DecimalField(
@@ -240,6 +290,11 @@ class ServiceCall(TimestampedModel):
     # Dispatch metadata
     dispatch = models.JSONField(default=dict)
 
+    payload_bytes = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Serialized size of the payload JSON columns, maintained on save",
+    )
+
     # Custom manager
     objects = ServiceCallManager()
 
@@ -262,6 +317,59 @@ class ServiceCall(TimestampedModel):
     def __str__(self) -> str:
         return f"ServiceCall(id={self.pk}, service={self.service_identity}, status={self.status})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_payload()
+        return instance
+
+    def _remember_payload(self, fields=SERVICE_CALL_PAYLOAD_FIELDS) -> None:
+        """Record the payload objects now in the database, to spot reassignment."""
+        loaded = self.__dict__.setdefault("_loaded_payload", {})
+        for field in fields:
+            if field in self.__dict__:
+                loaded[field] = self.__dict__[field]
+
+    def _reassigned_payload_fields(self) -> tuple[str, ...]:
+        loaded = getattr(self, "_loaded_payload", None)
+        if self._state.adding or loaded is None:
+            return SERVICE_CALL_PAYLOAD_FIELDS
+        return tuple(
+            field
+            for field in SERVICE_CALL_PAYLOAD_FIELDS
+            if field not in loaded or self.__dict__.get(field) is not loaded[field]
+        )
+
+    def measure_payload_bytes(self) -> int:
+        """Serialized size of the payload JSON columns as currently set."""
+        return sum(_json_size(getattr(self, field)) for field in SERVICE_CALL_PAYLOAD_FIELDS)
+
+    def save(self, *args, update_fields=None, **kwargs):
+        """Refresh ``payload_bytes`` when payload columns are written.
+
+        Measured on inserts, on saves whose ``update_fields`` name a payload
+        column, and on full saves where a payload attribute was reassigned
+        since the row was loaded.  A payload mutated in place must be saved
+        with ``update_fields`` to be measured.  Skipped when a payload column
+        is deferred, since its size is unknown.
+
+        ``QuerySet.update()`` bypasses this method: callers that change
+        payload columns that way must set ``payload_bytes`` in the same
+        update (see :meth:`measure_payload_bytes`).
+        """
+        if update_fields is None:
+            touched = self._reassigned_payload_fields()
+        else:
+            touched = tuple(
+                field for field in SERVICE_CALL_PAYLOAD_FIELDS if field in update_fields
+            )
+        if touched and not self.get_deferred_fields().intersection(SERVICE_CALL_PAYLOAD_FIELDS):
+            self.payload_bytes = self.measure_payload_bytes()
+            if update_fields is not None:
+                update_fields = [*update_fields, "payload_bytes"]
+        super().save(*args, update_fields=update_fields, **kwargs)
+        self._remember_payload(SERVICE_CALL_PAYLOAD_FIELDS if update_fields is None else touched)
+
     def __repr__(self) -> str:
         return (
             f"<ServiceCall id={self.pk!r} service={self.service_identity!r} status={self.status!r}>"
@@ -591,6 +699,8 @@ class ServiceCallAttempt(TimestampedModel):
         help_text="Whether this attempt used streaming",
     )
 
+    objects = ServiceCallAttemptManager()
+
     class Meta:
         db_table = "service_call_attempt"
         verbose_name = "Service Call Attempt"
@@ -650,7 +760,7 @@ class ServiceCallAttempt(TimestampedModel):
         """Mark this attempt as dispatched to the provider."""
         self.status = AttemptStatus.DISPATCHED
         self.dispatched_at = timezone.now()
-        self.save(update_fields=["status", "dispatched_at", "updated_at"])
+        self.save(update_fields=["status", "dispatched_at", "is_streaming", "updated_at"])
 
     def mark_received(self, response_raw: dict | None = None) -> None:
         """Mark this attempt as having received a response."""
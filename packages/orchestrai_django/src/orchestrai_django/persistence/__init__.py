@@ -1,11 +1,21 @@
 """Declarative persistence framework for mapping Pydantic schemas to Django models."""
 
 from .auto_mapper import OrmOverride
-from .engine import PersistContext, persist_schema, resolve_schema_class
+from .engine import (
+    PersistContext,
+    PersistPlan,
+    clear_persist_caches,
+    get_persist_plan,
+    persist_schema,
+    resolve_schema_class,
+)
 
 __all__ = [
     "OrmOverride",
     "PersistContext",
+    "PersistPlan",
+    "clear_persist_caches",
+    "get_persist_plan",
     "persist_schema",
     "resolve_schema_class",
 ]
@@ -4,8 +4,14 @@ When a schema field has ``__persist__ = {"field": None}``, the engine
 delegates to this module which reads ``__orm_model__`` from the Pydantic
 item class and creates Django model instances by matching field names.
 
+Field matching and coercion are compiled once per (item class, model,
+field map).  Instances are built unsaved and written in one transaction, with
+one ``bulk_create`` per plain model.
+
 Public API:
     auto_persist_field(field_name, value, schema, context) → created instances
+    build_orm_instances(field_name, value, schema, context) → unsaved instances
+    save_orm_instances(built) → saved instances (one transaction)
     OrmOverride        — Annotated descriptor to override __orm_model__ per-field
 """
 
@@ -13,9 +19,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field as dc_field
 from datetime import UTC, datetime
+import functools
 import logging
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from pydantic import BaseModel
 
 from orchestrai_django.persistence.engine import PersistContext
@@ -64,66 +72,76 @@ def _get_orm_override(field_info: Any) -> OrmOverride | None:
     return None
 
 
-async def auto_persist_field(
-    field_name: str,
-    value: Any,
-    schema: BaseModel,
-    context: PersistContext,
-) -> Any:
-    """Auto-persist a field using ``__orm_model__`` from item types.
+@dataclass(frozen=True)
+class _MappingPlan:
+    """Compiled item → model mapping, built once per (item class, model, field map)."""
 
-    Handles both single items and lists. For lists, creates one Django
-    instance per item.
+    model_cls: type
+    # (pydantic field, orm field, kind) where kind is "json", "datetime" or "value"
+    columns: tuple[tuple[str, str, str], ...]
+    inject_simulation: bool
+    plain_model: bool
+
+    def build(self, item: Any, context: PersistContext) -> Any:
+        """Return an unsaved model instance for *item*."""
+        kwargs: dict[str, Any] = {}
+        for pydantic_field, orm_field, kind in self.columns:
+            value = getattr(item, pydantic_field)
+            if kind == "json":
+                # Pass JSON-serialisable values through directly for JSONField columns.
+                kwargs[orm_field] = value
+                continue
+            if (
+                kind == "datetime"
+                and isinstance(value, (int, float))
+                and not isinstance(value, bool)
+            ):
+                # Accept epoch-style schema timestamps for DateTimeField mappings.
+                value = datetime.fromtimestamp(value, tz=UTC)
+            kwargs[orm_field] = _coerce_value(value)
+
+        # Inject context fields — Django FK fields are named "simulation" but accept
+        # "simulation_id" for raw ID assignment.
+        if self.inject_simulation and "simulation_id" not in kwargs:
+            kwargs["simulation_id"] = context.simulation_id
+
+        return self.model_cls(**kwargs)
+
+
+def _coerce_value(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if hasattr(value, "value"):  # Enum
+        return value.value
+    return str(value)
+
+
+def _is_plain_model(model_cls: type) -> bool:
+    """Whether *model_cls* could be written with ``bulk_create`` instead of ``save()``.
+
+    ``bulk_create`` skips ``save()`` and cannot insert multi-table inherited
+    models.  It also skips save signals, but receivers can be connected at any
+    time, so those are checked at save time by :func:`_has_save_receivers`.
     """
-    from django.apps import apps
+    from django.db import models
 
-    field_info = type(schema).model_fields[field_name]
-    orm_override = _get_orm_override(field_info)
+    return not model_cls._meta.parents and model_cls.save is models.Model.save
 
-    if isinstance(value, list):
-        results = []
-        for item in value:
-            model_ref = (
-                orm_override.model if orm_override else getattr(type(item), "__orm_model__", None)
-            )
-            field_map = (
-                orm_override.field_map
-                if orm_override
-                else getattr(type(item), "__orm_field_map__", {})
-            )
-            if model_ref is None:
-                raise ValueError(
-                    f"No __orm_model__ on {type(item).__name__} and no OrmOverride "
-                    f"on field {field_name!r}"
-                )
-            model_cls = apps.get_model(*model_ref.split(".", 1))
-            results.append(await _create_orm_instance(item, model_cls, field_map, context))
-        return results
-    else:
-        model_ref = (
-            orm_override.model if orm_override else getattr(type(value), "__orm_model__", None)
-        )
-        field_map = (
-            orm_override.field_map
-            if orm_override
-            else getattr(type(value), "__orm_field_map__", {})
-        )
-        if model_ref is None:
-            raise ValueError(
-                f"No __orm_model__ on {type(value).__name__} and no OrmOverride "
-                f"on field {field_name!r}"
-            )
-        model_cls = apps.get_model(*model_ref.split(".", 1))
-        return await _create_orm_instance(value, model_cls, field_map, context)
 
+def _has_save_receivers(model_cls: type) -> bool:
+    """Whether any pre/post_save receiver (with or without a sender) would fire."""
+    from django.db.models import signals
+
+    return signals.pre_save.has_listeners(model_cls) or signals.post_save.has_listeners(model_cls)
 
-async def _create_orm_instance(
-    item: Any,
+
+@functools.lru_cache(maxsize=256)
+def _compile_plan(
+    item_cls: type[BaseModel],
     model_cls: type,
-    field_map: dict[str, str],
-    context: PersistContext,
-) -> Any:
-    """Create a Django model instance from a Pydantic model via field mapping.
+    field_map: tuple[tuple[str, str], ...],
+) -> _MappingPlan:
+    """Resolve field matching and coercion for an item class once.
 
     Field resolution rules:
         1. If pydantic field name is in ``field_map``, use the mapped Django field name.
@@ -135,22 +153,22 @@ async def _create_orm_instance(
     """
     from django.db import models
 
-    kwargs: dict[str, Any] = {}
+    mapped = dict(field_map)
     model_fields = {f.name: f for f in model_cls._meta.get_fields() if hasattr(f, "column")}
-    model_field_names = set(model_fields.keys())
+    columns: list[tuple[str, str, str]] = []
 
-    for pydantic_field in type(item).model_fields:
+    for pydantic_field in item_cls.model_fields:
         # 1. Check explicit field map
-        if pydantic_field in field_map:
-            orm_field = field_map[pydantic_field]
+        if pydantic_field in mapped:
+            orm_field = mapped[pydantic_field]
         # 2. Check direct name match
-        elif pydantic_field in model_field_names:
+        elif pydantic_field in model_fields:
             orm_field = pydantic_field
         # 3. No match — skip
         else:
             logger.debug(
                 "Skipping %s.%s: no matching field on %s and not in __orm_field_map__",
-                type(item).__name__,
+                item_cls.__name__,
                 pydantic_field,
                 model_cls.__name__,
             )
@@ -167,30 +185,100 @@ async def _create_orm_instance(
             )
             continue
 
-        value = getattr(item, pydantic_field)
         model_field = model_fields.get(orm_field)
-        if (
-            model_field is not None
-            and isinstance(model_field, models.DateTimeField)
-            and isinstance(value, (int, float))
-            and not isinstance(value, bool)
-        ):
-            # Accept epoch-style schema timestamps for DateTimeField mappings.
-            value = datetime.fromtimestamp(value, tz=UTC)
-
-        if model_field is not None and isinstance(model_field, models.JSONField):
-            # Pass JSON-serialisable values through directly for JSONField columns.
-            kwargs[orm_field] = value
-        elif isinstance(value, (str, int, float, bool)) or value is None:
-            kwargs[orm_field] = value
-        elif hasattr(value, "value"):  # Enum
-            kwargs[orm_field] = value.value
+        if isinstance(model_field, models.JSONField):
+            kind = "json"
+        elif isinstance(model_field, models.DateTimeField):
+            kind = "datetime"
         else:
-            kwargs[orm_field] = str(value)
+            kind = "value"
+        columns.append((pydantic_field, orm_field, kind))
+
+    return _MappingPlan(
+        model_cls=model_cls,
+        columns=tuple(columns),
+        inject_simulation="simulation" in model_fields,
+        plain_model=_is_plain_model(model_cls),
+    )
 
-    # Inject context fields — Django FK fields are named "simulation" but accept
-    # "simulation_id" for raw ID assignment.
-    if "simulation" in model_field_names and "simulation_id" not in kwargs:
-        kwargs["simulation_id"] = context.simulation_id
 
-    return await model_cls.objects.acreate(**kwargs)
+def _plan_for(item: Any, field_name: str, orm_override: OrmOverride | None) -> _MappingPlan:
+    from django.apps import apps
+
+    item_cls = type(item)
+    model_ref = orm_override.model if orm_override else getattr(item_cls, "__orm_model__", None)
+    field_map = (
+        orm_override.field_map if orm_override else getattr(item_cls, "__orm_field_map__", {})
+    )
+    if model_ref is None:
+        raise ValueError(
+            f"No __orm_model__ on {item_cls.__name__} and no OrmOverride on field {field_name!r}"
+        )
+    model_cls = apps.get_model(*model_ref.split(".", 1))
+    return _compile_plan(item_cls, model_cls, tuple(sorted(field_map.items())))
+
+
+def build_orm_instances(
+    field_name: str,
+    value: Any,
+    schema: BaseModel,
+    context: PersistContext,
+) -> list[tuple[_MappingPlan, Any]]:
+    """Build unsaved Django instances for a field using ``__orm_model__`` from item types.
+
+    Handles both single items and lists.  Pass the result to
+    :func:`save_orm_instances` to write it.
+    """
+    field_info = type(schema).model_fields[field_name]
+    orm_override = _get_orm_override(field_info)
+    items = value if isinstance(value, list) else [value]
+    built = []
+    for item in items:
+        plan = _plan_for(item, field_name, orm_override)
+        built.append((plan, plan.build(item, context)))
+    return built
+
+
+def _save_orm_instances(built: list[tuple[_MappingPlan, Any]]) -> None:
+    from django.db import transaction
+
+    bulk: dict[type, list[Any]] = {}
+    bulk_insert: dict[type, bool] = {}
+    with transaction.atomic():
+        for plan, instance in built:
+            model_cls = plan.model_cls
+            if model_cls not in bulk_insert:
+                bulk_insert[model_cls] = plan.plain_model and not _has_save_receivers(model_cls)
+            if bulk_insert[model_cls]:
+                bulk.setdefault(model_cls, []).append(instance)
+            else:
+                instance.save(force_insert=True)
+        for model_cls, instances in bulk.items():
+            model_cls.objects.bulk_create(instances)
+
+
+async def save_orm_instances(built: list[tuple[_MappingPlan, Any]]) -> list[Any]:
+    """Insert instances from :func:`build_orm_instances` in one transaction.
+
+    Instances of the same plain model share one ``bulk_create``; models with
+    custom ``save()``, save signals or multi-table inheritance are saved one
+    by one inside the same transaction.
+    """
+    if built:
+        await sync_to_async(_save_orm_instances, thread_sensitive=True)(built)
+    return [instance for _, instance in built]
+
+
+async def auto_persist_field(
+    field_name: str,
+    value: Any,
+    schema: BaseModel,
+    context: PersistContext,
+) -> Any:
+    """Auto-persist a field using ``__orm_model__`` from item types.
+
+    Handles both single items and lists. For lists, creates one Django
+    instance per item.
+    """
+    instances = await save_orm_instances(build_orm_instances(field_name, value, schema, context))
+    return instances if isinstance(value, list) else instances[0]
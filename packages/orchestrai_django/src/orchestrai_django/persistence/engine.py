@@ -2,11 +2,17 @@
 
 Walks the MRO of a Pydantic schema to merge ``__persist__`` dicts, then
 dispatches each mapped field to either an explicit async persist function
-or the auto-mapper (when the mapping value is ``None``).
+or the auto-mapper (when the mapping value is ``None``).  Auto-mapped fields
+are inserted together in one transaction after the explicit persisters run.
+
+Merged declarations are compiled once per schema class into a
+:class:`PersistPlan`, and resolved schema classes are cached by FQN.
 
 Public API:
     persist_schema(schema, context) → primary domain object or results dict
     resolve_schema_class(fqn)       → Pydantic model class
+    get_persist_plan(cls)           → compiled PersistPlan (cached)
+    clear_persist_caches()          → drop compiled plans after a module reload
 """
 
 from __future__ import annotations
@@ -84,74 +90,115 @@ def _get_primary_from_mro(cls: type) -> str | None:
     return None
 
 
-async def _persist_field_auto(
-    *,
-    field_name: str,
-    value: Any,
-    schema: BaseModel,
-    context: PersistContext,
-) -> Any:
-    """Persist a mapped field without an explicit handler.
+@dataclass(frozen=True)
+class PersistPlan:
+    """Compiled ``__persist__`` declarations for one schema class."""
+
+    handlers: tuple[tuple[str, Callable | None], ...]
+    primary_field: str | None = None
+
+
+# Plans and schema classes are compiled once per process.  Module reloads
+# outside Django's autoreloader (which restarts the process) must call
+# ``clear_persist_caches()`` to pick up new handler bindings.
+_PERSIST_PLANS: dict[type, PersistPlan | None] = {}
+_SCHEMA_CLASSES: dict[str, type] = {}
+
+
+def _compile_persist_plan(cls: type) -> PersistPlan | None:
+    persist_map = _merge_persist_from_mro(cls)
+    if not persist_map:
+        return None
+
+    model_fields = getattr(cls, "model_fields", {})
+    handlers = []
+    for field_name, fn_or_none in persist_map.items():
+        if field_name not in model_fields:
+            logger.debug(
+                "Skipping persist mapping %r: not a field on %s",
+                field_name,
+                cls.__name__,
+            )
+            continue
+        handlers.append((field_name, fn_or_none))
+    return PersistPlan(handlers=tuple(handlers), primary_field=_get_primary_from_mro(cls))
+
+
+def get_persist_plan(cls: type) -> PersistPlan | None:
+    """Return the cached persist plan for *cls*, or ``None`` if it declares nothing."""
+    try:
+        return _PERSIST_PLANS[cls]
+    except KeyError:
+        plan = _PERSIST_PLANS[cls] = _compile_persist_plan(cls)
+        return plan
+
+
+def clear_persist_caches() -> None:
+    """Drop compiled persist plans, resolved schema classes and auto-mapper plans.
 
-    Supports nested declarative schemas by recursing when a field value is
-    itself a BaseModel with ``__persist__`` declarations.
+    Call after ``importlib.reload()`` of schema or persister modules.
     """
-    if isinstance(value, BaseModel):
-        nested_map = _merge_persist_from_mro(type(value))
-        if nested_map:
-            return await persist_schema(value, context)
+    from orchestrai_django.persistence.auto_mapper import _compile_plan
 
-    # Auto-map via __orm_model__ on the item type.
-    from orchestrai_django.persistence.auto_mapper import auto_persist_field
+    _PERSIST_PLANS.clear()
+    _SCHEMA_CLASSES.clear()
+    _compile_plan.cache_clear()
 
-    return await auto_persist_field(field_name, value, schema, context)
+
+def _is_nested_schema(value: Any) -> bool:
+    """Whether a field value is itself a declarative schema to recurse into."""
+    return isinstance(value, BaseModel) and get_persist_plan(type(value)) is not None
 
 
 async def persist_schema(schema: BaseModel, context: PersistContext) -> Any:
-    """Walk MRO, merge ``__persist__`` declarations, run each persister.
+    """Run each persister from the schema's compiled persist plan.
 
     Returns:
         The primary domain object (if ``__persist_primary__`` is set and
         the field was persisted), otherwise the full results dict, or
         ``None`` if the schema has no ``__persist__`` declarations.
     """
-    persist_map = _merge_persist_from_mro(type(schema))
-    primary_field = _get_primary_from_mro(type(schema))
-
-    if not persist_map:
+    plan = get_persist_plan(type(schema))
+    if plan is None:
         return None
 
-    results: dict[str, Any] = {}
+    from orchestrai_django.persistence.auto_mapper import (
+        build_orm_instances,
+        save_orm_instances,
+    )
 
-    for field_name, fn_or_none in persist_map.items():
-        if field_name not in type(schema).model_fields:
-            logger.debug(
-                "Skipping persist mapping %r: not a field on %s",
-                field_name,
-                type(schema).__name__,
-            )
-            continue
+    results: dict[str, Any] = {}
+    # Auto-mapped fields are built as they come up and written together below.
+    auto_fields: dict[str, list] = {}
 
+    for field_name, fn_or_none in plan.handlers:
         value = getattr(schema, field_name)
 
         if fn_or_none is not None:
             # Explicit persist function
             results[field_name] = await fn_or_none(value, context)
+        elif _is_nested_schema(value):
+            results[field_name] = await persist_schema(value, context)
         else:
-            results[field_name] = await _persist_field_auto(
-                field_name=field_name,
-                value=value,
-                schema=schema,
-                context=context,
-            )
+            # Auto-map via __orm_model__ on the item type.
+            auto_fields[field_name] = build_orm_instances(field_name, value, schema, context)
+            results[field_name] = None
+
+    if auto_fields:
+        # One transaction, one bulk insert per model, across every auto-mapped field.
+        await save_orm_instances([entry for built in auto_fields.values() for entry in built])
+        for field_name, built in auto_fields.items():
+            instances = [instance for _, instance in built]
+            is_list = isinstance(getattr(schema, field_name), list)
+            results[field_name] = instances if is_list else instances[0]
 
     # Post-persist hook
     if hasattr(schema, "post_persist"):
         await schema.post_persist(results, context)
 
     # Return primary domain object
-    if primary_field and primary_field in results:
-        r = results[primary_field]
+    if plan.primary_field and plan.primary_field in results:
+        r = results[plan.primary_field]
         return r[0] if isinstance(r, list) else r
 
     return results
@@ -170,6 +217,8 @@ _ALLOWED_FQN_PREFIXES: tuple[str, ...] = (
 def resolve_schema_class(fqn: str) -> type:
     """Import and return a Pydantic schema class from a fully-qualified name.
 
+    Resolved classes are cached; see :func:`clear_persist_caches`.
+
     Args:
         fqn: Dotted path like ``apps.chatlab.orca.schemas.patient.PatientInitialOutputSchema``
 
@@ -181,6 +230,10 @@ def resolve_schema_class(fqn: str) -> type:
         ImportError: If the module cannot be found.
         AttributeError: If the class does not exist in the module.
     """
+    cached = _SCHEMA_CLASSES.get(fqn)
+    if cached is not None:
+        return cached
+
     module_path, class_name = fqn.rsplit(".", 1)
 
     if not any(module_path.startswith(prefix) for prefix in _ALLOWED_FQN_PREFIXES):
@@ -190,4 +243,5 @@ def resolve_schema_class(fqn: str) -> type:
         )
 
     module = importlib.import_module(module_path)
-    return getattr(module, class_name)
+    schema_cls = _SCHEMA_CLASSES[fqn] = getattr(module, class_name)
+    return schema_cls
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
 from email.utils import parsedate_to_datetime
 import inspect
 import logging
 import random
+from typing import Any
 
 from asgiref.sync import async_to_sync
 from django.conf import settings
@@ -34,6 +36,7 @@ from orchestrai_django.utils.serialization import (
     pydantic_model_to_dict,
     serialize_run_messages_envelope,
 )
+from orchestrai_django.utils.worker_loop import async_to_sync_on_worker_loop
 
 logger = logging.getLogger(__name__)
 
@@ -568,30 +571,32 @@ def run_service_call(call_id: str):
         payload = call.input or {}
 
         # Mark attempt as dispatched before calling the service
+        attempt_record.is_streaming = bool(getattr(service, "streaming", False))
         attempt_record.mark_dispatched()
         emit_service_call_dispatched(call, attempt=attempt_record.attempt)
 
         # Execute service inside a parent OTEL span so that instrumented child spans
         # (e.g. openai.responses.create from logfire.instrument_openai) are grouped
         # under a single "Orca service call" trace in Logfire.  OTEL context propagates
-        # through async_to_sync via Python contextvars (copied by asgiref).
+        # through async_to_sync via Python contextvars (copied by asgiref).  Service
+        # calls run on the worker loop so pooled provider connections are reused.
         with service_span("orchestrai.service_call", attributes=span_attrs):
             # Prefer arun (Pydantic AI services), then aexecute, then execute
             if hasattr(service, "arun") and callable(service.arun):
-                result = async_to_sync(service.arun)(**payload)
+                result = async_to_sync_on_worker_loop(service.arun)(**payload)
             elif hasattr(service, "aexecute") and callable(service.aexecute):
                 aexecute = service.aexecute
                 if inspect.iscoroutinefunction(aexecute):
-                    result = async_to_sync(aexecute)(**payload)
+                    result = async_to_sync_on_worker_loop(aexecute)(**payload)
                 else:  # pragma: no cover - defensive fallback
                     result = aexecute(**payload)
             elif hasattr(service, "execute") and callable(service.execute):
                 execute = service.execute
                 if inspect.iscoroutinefunction(execute):
-                    result = async_to_sync(execute)(**payload)
+                    result = async_to_sync_on_worker_loop(execute)(**payload)
                 else:
                     result = (
-                        async_to_sync(service.aexecute)(**payload)
+                        async_to_sync_on_worker_loop(service.aexecute)(**payload)
                         if hasattr(service, "aexecute")
                         else execute(**payload)
                     )
@@ -729,7 +734,8 @@ def run_service_call(call_id: str):
 
             # Mark for domain persistence
             call.domain_persisted = False
-            call.save(update_fields=["domain_persisted"])
+            call.cache_hit = bool(getattr(result, "cache_hit", False))
+            call.save(update_fields=["domain_persisted", "cache_hit"])
 
         logger.info(
             "Service call %s succeeded on attempt %d, attempting inline persistence",
@@ -1094,13 +1100,13 @@ def process_pending_persistence():
             ServiceCallModel.objects.bulk_update(pending_calls, ["domain_persist_attempts"])
 
     stats["claimed"] += len(pending_calls)
+    if not pending_calls:
+        logger.debug("Domain persistence batch complete: nothing claimed")
+        return stats
 
     for call in pending_calls:
         try:
             _inline_persist_service_call(call)
-            if call.domain_persisted:
-                emit_service_call_succeeded(call)
-            stats["processed"] += 1
         except Exception as exc:
             stats["failed"] += 1
             logger.exception(
@@ -1110,17 +1116,19 @@ def process_pending_persistence():
                 max_attempts,
                 exc,
             )
-            with transaction.atomic():
-                call.domain_persist_error = str(exc)[:1000]
-                call.save(update_fields=["domain_persist_error"])
-
+            call.domain_persist_error = str(exc)[:1000]
+            update_fields = ["domain_persist_error"]
             if call.domain_persist_attempts >= max_attempts:
                 logger.error(
                     "Giving up on persistence for %s after %d attempts", call.id, max_attempts
                 )
-                with transaction.atomic():
-                    call.domain_persisted = True
-                    call.save(update_fields=["domain_persisted"])
+                call.domain_persisted = True
+                update_fields.append("domain_persisted")
+            call.save(update_fields=update_fields)
+            continue
+
+        stats["processed"] += 1
+        emit_service_call_succeeded(call)
 
     # Only log at INFO when there was actual work to do; idle cycles are DEBUG-only
     log_fn = logger.info if stats["claimed"] > 0 else logger.debug
@@ -1135,23 +1143,19 @@ def process_pending_persistence():
     return stats
 
 
-def _inline_persist_service_call(call: ServiceCallModel):
-    """Run declarative persist_schema() for a ServiceCall."""
-    from orchestrai_django.persistence import PersistContext, persist_schema, resolve_schema_class
+def _prepare_persist(call: ServiceCallModel, resolve: Callable[[str], type]):
+    """Return ``(schema_instance, PersistContext)`` for a call, or ``None`` to skip."""
+    from orchestrai_django.persistence import PersistContext
 
     if not call.schema_fqn or call.output_data is None:
-        call.domain_persisted = True
-        call.save(update_fields=["domain_persisted"])
         logger.debug("Service call %s: no schema_fqn or output_data, skipping", call.id)
-        return
+        return None
 
     try:
-        schema_cls = resolve_schema_class(call.schema_fqn)
+        schema_cls = resolve(call.schema_fqn)
     except (ImportError, AttributeError):
         logger.warning("Service call %s: could not resolve schema %s", call.id, call.schema_fqn)
-        call.domain_persisted = True
-        call.save(update_fields=["domain_persisted"])
-        return
+        return None
 
     schema_instance = schema_cls.model_validate(call.output_data)
 
@@ -1172,12 +1176,10 @@ def _inline_persist_service_call(call: ServiceCallModel):
         correlation_id=str(call.correlation_id) if call.correlation_id else None,
         extra=extra,
     )
+    return schema_instance, context
 
-    domain_obj = async_to_sync(persist_schema)(schema_instance, context)
-
-    call.domain_persisted = True
-    call.save(update_fields=["domain_persisted"])
 
+def _log_persist_result(call: ServiceCallModel, domain_obj: Any) -> None:
     if domain_obj is not None:
         logger.info(
             "Service call %s: domain persistence complete (created %s)",
@@ -1188,6 +1190,25 @@ def _inline_persist_service_call(call: ServiceCallModel):
         logger.debug("Service call %s: schema has no __persist__, skipped", call.id)
 
 
+def _inline_persist_service_call(call: ServiceCallModel):
+    """Run declarative persist_schema() for a ServiceCall.
+
+    The domain writes and the ``domain_persisted`` flag commit together, so a
+    worker killed mid-batch never leaves a persisted call looking pending.
+    ``persist_schema`` runs its ORM work through thread-sensitive
+    ``sync_to_async``, i.e. on this thread's connection inside this atomic block.
+    """
+    from orchestrai_django.persistence import persist_schema, resolve_schema_class
+
+    with transaction.atomic():
+        prepared = _prepare_persist(call, resolve_schema_class)
+        if prepared is not None:
+            _log_persist_result(call, async_to_sync_on_worker_loop(persist_schema)(*prepared))
+
+        call.domain_persisted = True
+        call.save(update_fields=["domain_persisted"])
+
+
 __all__ = [
     "process_pending_persistence",
     "run_service_call",
@@ -0,0 +1,45 @@
+"""Run async service calls from synchronous workers on one long-lived loop.
+
+A bare ``async_to_sync`` call from a thread without an event loop runs its
+coroutine in a fresh ``asyncio.run`` loop.  Pooled provider connections are
+bound to the loop that opened them, so every Celery LLM call would pay a new
+TCP + TLS handshake.  :func:`async_to_sync_on_worker_loop` schedules the
+coroutine on :func:`orchestrai.utils.http_clients.get_worker_loop` instead,
+so consecutive calls reuse the same connections.
+
+Thread-sensitive ``sync_to_async`` code (the ORM) awaited by the coroutine
+still runs in the calling thread, exactly as with plain ``async_to_sync``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+import os
+
+from asgiref.sync import AsyncToSync, SyncToAsync
+
+from orchestrai.utils.http_clients import get_worker_loop
+
+
+def async_to_sync_on_worker_loop[**P, R](func: Callable[P, Awaitable[R]]) -> Callable[P, R]:
+    """Like ``async_to_sync``, but run on the process-wide worker loop.
+
+    Inside a ``sync_to_async`` frame whose loop is still running, that loop
+    is kept, as asgiref does.
+    """
+    wrapper = AsyncToSync(func)
+    if wrapper.main_event_loop is None and not _inside_sync_to_async():
+        wrapper.main_event_loop = get_worker_loop()
+    return wrapper
+
+
+def _inside_sync_to_async() -> bool:
+    # asgiref never clears this threadlocal, so after any earlier
+    # sync_to_async call it may still name a loop that has since closed.
+    threadlocal = SyncToAsync.threadlocal
+    loop = getattr(threadlocal, "main_event_loop", None)
+    return (
+        loop is not None
+        and loop.is_running()
+        and getattr(threadlocal, "main_event_loop_pid", None) == os.getpid()
+    )
@@ -113,6 +113,87 @@ class TestServiceCallModel:
         assert data["status"] == CallStatus.COMPLETED
         assert data["output_data"] == {"result": "success"}
 
+    @pytest.mark.django_db
+    def test_payload_bytes_tracks_payload_writes(self):
+        import uuid
+
+        from orchestrai_django.models import CallStatus, ServiceCall
+
+        call = ServiceCall.objects.create(
+            id=str(uuid.uuid4()),
+            service_identity="services.test.example.TestService",
+            status=CallStatus.IN_PROGRESS,
+            input={"prompt": "x" * 100},
+        )
+        created_size = call.payload_bytes
+        assert created_size > 100
+
+        call.mark_running()
+        call.refresh_from_db()
+        assert call.payload_bytes == created_size
+
+        call.mark_completed(output_data={"message": "y" * 500})
+        call.refresh_from_db()
+        assert call.payload_bytes > created_size + 500
+
+    @pytest.mark.django_db
+    def test_full_save_measures_payload_only_when_reassigned(self):
+        from unittest.mock import patch
+        import uuid
+
+        from orchestrai_django.models import CallStatus, ServiceCall
+
+        ServiceCall.objects.create(
+            id=str(uuid.uuid4()),
+            service_identity="services.test.example.TestService",
+            status=CallStatus.IN_PROGRESS,
+            input={"prompt": "x" * 100},
+        )
+        call = ServiceCall.objects.get()
+        created_size = call.payload_bytes
+
+        with patch.object(
+            ServiceCall, "measure_payload_bytes", wraps=call.measure_payload_bytes
+        ) as measure:
+            call.status = CallStatus.COMPLETED
+            call.save()
+            measure.assert_not_called()
+
+            call.output_data = {"message": "y" * 500}
+            call.save()
+            measure.assert_called_once()
+
+            call.save()
+            measure.assert_called_once()
+
+        call.refresh_from_db()
+        assert call.payload_bytes > created_size + 500
+
+    @pytest.mark.django_db
+    def test_for_listing_defers_payload_columns(self, django_assert_num_queries):
+        import uuid
+
+        from orchestrai_django.models import (
+            SERVICE_CALL_PAYLOAD_FIELDS,
+            CallStatus,
+            ServiceCall,
+        )
+
+        ServiceCall.objects.create(
+            id=str(uuid.uuid4()),
+            service_identity="services.test.example.TestService",
+            status=CallStatus.COMPLETED,
+            output_data={"result": "success"},
+            total_tokens=42,
+        )
+
+        with django_assert_num_queries(1):
+            call = ServiceCall.objects.for_listing().get()
+            assert call.total_tokens == 42
+            assert call.payload_bytes > 0
+
+        assert call.get_deferred_fields() == set(SERVICE_CALL_PAYLOAD_FIELDS)
+
 
 class TestDjangoBaseService:
     """Tests for DjangoBaseService."""
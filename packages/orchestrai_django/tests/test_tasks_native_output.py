@@ -208,6 +208,50 @@ def test_run_service_call_stores_output_and_schema(monkeypatch):
     assert any("schema_fqn" in fields for fields in call.saved_fields if fields)
 
 
+def test_run_service_call_records_cache_hit_with_zero_usage(monkeypatch):
+    from orchestrai.components.services.cache import CachedRunResult
+
+    call = DummyCall()
+
+    class DummyService:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+        async def arun(self, **payload):
+            return CachedRunResult(output=FakeOutput(), cache_key="key")
+
+    def _select_for_update(*args, **kwargs):
+        return types.SimpleNamespace(get=lambda **kw: call)
+
+    class _NoopAtomic:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    monkeypatch.setattr(
+        tasks, "ensure_service_registry", lambda app=None: DummyRegistry(DummyService)
+    )
+    monkeypatch.setattr(tasks.ServiceCallModel.objects, "select_for_update", _select_for_update)
+    monkeypatch.setattr(tasks.transaction, "atomic", lambda: _NoopAtomic())
+    monkeypatch.setattr(
+        tasks,
+        "_inline_persist_service_call",
+        lambda call: setattr(call, "domain_persisted", True),
+    )
+
+    result = tasks.run_service_call(call.id)
+
+    assert result["status"] == "completed"
+    attempt = call.mark_attempt_args[0]
+    assert call.mark_attempt_args[1] == {"answer": "ok"}
+    assert call.mark_attempt_args[2] is None
+    assert attempt.total_tokens == 0
+    assert call.cache_hit is True
+    assert ["domain_persisted", "cache_hit"] in call.saved_fields
+
+
 def test_run_service_call_persists_messages_as_list_without_fallback(monkeypatch):
     call = DummyCall()
 
@@ -486,8 +530,16 @@ def test_inline_persist_uses_output_data_even_if_empty(monkeypatch):
         def save(self, update_fields=None):
             self.saved_fields = update_fields
 
+    class _NoopAtomic:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
     call = DummyCallForPersist()
 
+    monkeypatch.setattr(tasks.transaction, "atomic", lambda: _NoopAtomic())
     monkeypatch.setattr(
         "orchestrai_django.persistence.resolve_schema_class",
         fake_resolve_schema_class,
@@ -835,3 +887,105 @@ def test_run_service_call_skips_when_in_flight_attempt_exists(monkeypatch):
     assert result["status"] == "in_progress"
     assert not call._allocate_called, "allocate_attempt must not be called when in-flight"
     assert not service_executed, "LLM service must not be executed when in-flight"
+
+
+def test_process_pending_persistence_flags_each_call_as_it_persists(monkeypatch):
+    from orchestrai_django import persistence
+
+    class Schema:
+        @classmethod
+        def model_validate(cls, data):
+            return data
+
+    events: list[tuple[str, str]] = []
+
+    class PendingQuery:
+        def __init__(self, items):
+            self._items = items
+
+        def exclude(self, **kwargs):
+            return self
+
+        def select_for_update(self, **kwargs):
+            return self
+
+        def order_by(self, *args, **kwargs):
+            return self
+
+        def __getitem__(self, item):
+            return self._items
+
+    class _RecordingAtomic:
+        def __enter__(self):
+            events.append(("begin", ""))
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            events.append(("rollback" if exc_type else "commit", ""))
+            return False
+
+    class RecordingCall(DummyCall):
+        def save(self, update_fields=None):
+            super().save(update_fields=update_fields)
+            events.append(("save", self.id))
+
+    async def _persist(schema_instance, context):
+        events.append(("persist", context.call_id))
+        if schema_instance == {"boom": True}:
+            raise ValueError("boom")
+        return None
+
+    calls = []
+    for call_id, output in (("a", {"ok": 1}), ("b", {"boom": True}), ("c", {"ok": 2})):
+        call = RecordingCall()
+        call.id = call.pk = call_id
+        call.status = "completed"
+        call.schema_fqn = "tests.schema.FakeSchema"
+        call.output_data = output
+        call.previous_provider_response_id = None
+        call.domain_persist_attempts = 0
+        calls.append(call)
+
+    def _receiver(sender, **payload):
+        events.append(("emit", payload["call_id"]))
+
+    monkeypatch.setattr(persistence, "resolve_schema_class", lambda fqn: Schema)
+    monkeypatch.setattr(persistence, "persist_schema", _persist)
+    monkeypatch.setattr(
+        tasks.ServiceCallModel.objects, "filter", lambda **kwargs: PendingQuery(calls)
+    )
+    monkeypatch.setattr(tasks.ServiceCallModel.objects, "bulk_update", lambda calls, fields: None)
+    monkeypatch.setattr(tasks.transaction, "atomic", lambda: _RecordingAtomic())
+
+    service_call_succeeded.connect(_receiver)
+    try:
+        stats = tasks.process_pending_persistence.call()
+    finally:
+        service_call_succeeded.disconnect(_receiver)
+
+    assert stats["processed"] == 2
+    assert stats["failed"] == 1
+    # Claim transaction, then one transaction per call holding its domain
+    # writes and its completion flag; success is emitted before the next call.
+    assert events == [
+        ("begin", ""),
+        ("commit", ""),
+        ("begin", ""),
+        ("persist", "a"),
+        ("save", "a"),
+        ("commit", ""),
+        ("emit", "a"),
+        ("begin", ""),
+        ("persist", "b"),
+        ("rollback", ""),
+        ("save", "b"),
+        ("begin", ""),
+        ("persist", "c"),
+        ("save", "c"),
+        ("commit", ""),
+        ("emit", "c"),
+    ]
+    assert calls[0].saved_fields == [["domain_persisted"]]
+    assert calls[1].saved_fields == [["domain_persist_error"]]
+    assert calls[1].domain_persisted is False
+    assert calls[1].domain_persist_error == "boom"
@@ -0,0 +1,81 @@
+"""Service calls from sync workers reuse pooled provider connections."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+from asgiref.sync import async_to_sync, sync_to_async
+import pytest
+
+from orchestrai.utils import http_clients
+from orchestrai_django.utils.worker_loop import async_to_sync_on_worker_loop
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    httpd.daemon_threads = True
+    httpd.connections = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    http_clients.close_http_clients()
+    yield httpd
+    http_clients.close_http_clients()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _fetch(url):
+    async def fetch():
+        client = http_clients.get_async_http_client("local", "key")
+        return (await client.get(url)).json()
+
+    return fetch
+
+
+def test_repeated_calls_reuse_one_connection(server):
+    url = f"http://127.0.0.1:{server.server_port}/"
+
+    for _ in range(3):
+        assert async_to_sync_on_worker_loop(_fetch(url))() == {"ok": True}
+
+    assert server.connections == 1
+
+
+def test_reuse_survives_an_earlier_sync_to_async_round_trip(server):
+    url = f"http://127.0.0.1:{server.server_port}/"
+    # Leaves asgiref's threadlocal pointing at a loop that is now closed.
+    async_to_sync(sync_to_async(lambda: None))()
+
+    for _ in range(2):
+        assert async_to_sync_on_worker_loop(_fetch(url))() == {"ok": True}
+
+    assert server.connections == 1
+
+
+def test_plain_async_to_sync_reconnects_per_call(server):
+    url = f"http://127.0.0.1:{server.server_port}/"
+
+    for _ in range(2):
+        assert async_to_sync(_fetch(url))() == {"ok": True}
+
+    # Each call ran on a fresh loop, whose pool was closed with it.
+    assert server.connections == 2
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""Benchmark thread hops and latency of the middleware stack under ASGI.
+
+Sends requests to a trivial async view through ``settings.MIDDLEWARE`` with
+Django's ASGI test client and reports, per request, how many ``sync_to_async``
+thread hops the stack made and the mean/p95 latency.  The ``stock`` profile
+swaps the inline-hook variants back to Django's classes and marks the
+project's own middleware sync-only, i.e. the stack before the async-first
+profile.
+
+Usage from the repo root:
+    uv run python scripts/bench_middleware.py
+    uv run python scripts/bench_middleware.py --requests 2000
+"""
+
+import argparse
+import asyncio
+from contextlib import ExitStack
+import os
+from pathlib import Path
+import statistics
+import sys
+import time
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SIMWORKS_DIR = REPO_ROOT / "SimWorks"
+
+sys.path.insert(0, str(SIMWORKS_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ["DJANGO_SKIP_READY"] = "1"
+
+import django  # noqa: E402
+
+django.setup()
+
+from asgiref import sync  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.http import JsonResponse  # noqa: E402
+from django.test import AsyncClient, override_settings  # noqa: E402
+from django.urls import path  # noqa: E402
+from django.utils.module_loading import import_string  # noqa: E402
+
+from apps.common.middleware import InlineHooksMixin  # noqa: E402
+
+PROJECT_MIDDLEWARE_PREFIX = "apps."
+
+
+async def async_view(request):
+    return JsonResponse({"ok": True})
+
+
+urlpatterns = [path("bench/async/", async_view)]
+
+
+class HopCounter:
+    """Count ``sync_to_async`` calls (each one is a thread hop)."""
+
+    def __init__(self) -> None:
+        self.hops = 0
+        self._original = sync.SyncToAsync.__call__
+
+    def __enter__(self):
+        counter = self
+        original = self._original
+
+        async def counting_call(self, *args, **kwargs):
+            counter.hops += 1
+            return await original(self, *args, **kwargs)
+
+        self._patch = mock.patch.object(sync.SyncToAsync, "__call__", counting_call)
+        self._patch.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._patch.stop()
+
+
+def non_async_middleware() -> list[str]:
+    return [
+        dotted
+        for dotted in settings.MIDDLEWARE
+        if not getattr(import_string(dotted), "async_capable", False)
+    ]
+
+
+def stock_profile() -> tuple[list[str], list[type]]:
+    """Return the pre-async-first middleware list and the classes to force sync."""
+    middleware: list[str] = []
+    force_sync: list[type] = []
+    for dotted in settings.MIDDLEWARE:
+        cls = import_string(dotted)
+        if isinstance(cls, type) and issubclass(cls, InlineHooksMixin):
+            stock = next(base for base in cls.__bases__ if base is not InlineHooksMixin)
+            middleware.append(f"{stock.__module__}.{stock.__qualname__}")
+        else:
+            middleware.append(dotted)
+            if dotted.startswith(PROJECT_MIDDLEWARE_PREFIX):
+                force_sync.append(cls)
+    return middleware, force_sync
+
+
+async def run_profile(requests: int) -> dict[str, float]:
+    client = AsyncClient()
+    await client.get("/bench/async/")  # load the middleware chain
+
+    latencies: list[float] = []
+    with HopCounter() as counter:
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get("/bench/async/")
+            latencies.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.status_code
+
+    latencies.sort()
+    return {
+        "hops_per_request": counter.hops / requests,
+        "mean_ms": statistics.fmean(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    sync_only = non_async_middleware()
+    if sync_only:
+        print("Sync-only middleware (adapted per request):")
+        for dotted in sync_only:
+            print(f"  - {dotted}")
+
+    stock_middleware, force_sync = stock_profile()
+
+    print(f"{'profile':<16}{'hops/req':>10}{'mean ms':>10}{'p95 ms':>10}")
+    for profile in ("async-first", "stock"):
+        with ExitStack() as stack:
+            stack.enter_context(
+                override_settings(ROOT_URLCONF=__name__, ALLOWED_HOSTS=["testserver"])
+            )
+            if profile == "stock":
+                stack.enter_context(override_settings(MIDDLEWARE=stock_middleware))
+                for cls in force_sync:
+                    stack.enter_context(mock.patch.object(cls, "async_capable", False))
+            result = asyncio.run(run_profile(args.requests))
+        print(
+            f"{profile:<16}{result['hops_per_request']:>10.1f}"
+            f"{result['mean_ms']:>10.3f}{result['p95_ms']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
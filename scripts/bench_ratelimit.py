@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+"""Benchmark rate-limit checks against a real Redis.
+
+Compares the GCRA script in ``apps.common.ratelimit`` with the previous
+sorted-set sliding window (reproduced below) on the same Redis.  For each
+algorithm it reports checks per second, mean/p95 latency, round trips per
+check and the memory one exhausted key occupies.  The ``gcra+local`` row
+repeats the GCRA run on already-exhausted keys to show the per-process fast
+path, which rejects without contacting Redis.
+
+Usage from the repo root (needs a reachable Redis; db 15 is flushed):
+    uv run python scripts/bench_ratelimit.py --redis-url redis://localhost:6379/15
+    uv run python scripts/bench_ratelimit.py --checks 20000 --limit 100 --threads 8
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import statistics
+import sys
+import time
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SIMWORKS_DIR = REPO_ROOT / "SimWorks"
+
+sys.path.insert(0, str(SIMWORKS_DIR))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ["DJANGO_SKIP_READY"] = "1"
+
+import django  # noqa: E402
+
+django.setup()
+
+import redis  # noqa: E402
+
+from apps.common import ratelimit  # noqa: E402
+
+
+def sliding_window_check(client: redis.Redis, key: str, limit: int, period: int) -> bool:
+    """The pre-GCRA implementation: one ZSET member per request."""
+    now = time.time()
+    pipe = client.pipeline()
+    pipe.zremrangebyscore(key, 0, now - period)
+    pipe.zcard(key)
+    pipe.zadd(key, {f"{now}:{id(now)}": now})
+    pipe.expire(key, period + 1)
+    count = pipe.execute()[1]
+    if count >= limit:
+        client.zrange(key, 0, 0, withscores=True)
+        return False
+    return True
+
+
+def gcra_check(client: redis.Redis, key: str, limit: int, period: int) -> bool:
+    return ratelimit.check_rate_limit(client, key, limit, period)[0]
+
+
+def gcra_remote_check(client: redis.Redis, key: str, limit: int, period: int) -> bool:
+    ratelimit._local_denials.clear()
+    return gcra_check(client, key, limit, period)
+
+
+ALGORITHMS = {
+    "sliding-window": sliding_window_check,
+    "gcra": gcra_remote_check,
+    "gcra+local": gcra_check,
+}
+
+
+class RoundTripCounter:
+    """Count commands sent to Redis (pipelines count once)."""
+
+    def __init__(self, client: redis.Redis) -> None:
+        self.count = 0
+        self._client = client
+
+    def __enter__(self):
+        original_command = self._client.execute_command
+        original_pipeline = self._client.pipeline
+        counter = self
+
+        def execute_command(*args, **kwargs):
+            counter.count += 1
+            return original_command(*args, **kwargs)
+
+        def pipeline(*args, **kwargs):
+            pipe = original_pipeline(*args, **kwargs)
+            original_execute = pipe.execute
+
+            def execute(*a, **kw):
+                counter.count += 1
+                return original_execute(*a, **kw)
+
+            pipe.execute = execute
+            return pipe
+
+        self._client.execute_command = execute_command
+        self._client.pipeline = pipeline
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        del self._client.execute_command
+        del self._client.pipeline
+
+
+def run(client, check, *, checks: int, keys: int, limit: int, threads: int) -> dict:
+    latencies: list[float] = []
+
+    def one(i: int) -> None:
+        started = time.perf_counter()
+        check(client, f"bench:{i % keys}", limit, 60)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    with RoundTripCounter(client) as counter:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(one, range(checks)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    key_memory = client.memory_usage("bench:0") or client.memory_usage("bench:0:tat") or 0
+    return {
+        "ops": checks / elapsed,
+        "mean_ms": statistics.fmean(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "trips": counter.count / checks,
+        "key_bytes": key_memory,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--checks", type=int, default=5000)
+    parser.add_argument("--keys", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    client = redis.Redis.from_url(args.redis_url)
+    print(f"{'algorithm':<16}{'checks/s':>10}{'mean ms':>10}{'p95 ms':>10}{'trips':>8}{'key B':>8}")
+    for name, check in ALGORITHMS.items():
+        if name != "gcra+local":
+            client.flushdb()
+            ratelimit._local_denials.clear()
+        result = run(
+            client,
+            check,
+            checks=args.checks,
+            keys=args.keys,
+            limit=args.limit,
+            threads=args.threads,
+        )
+        print(
+            f"{name:<16}{result['ops']:>10.0f}{result['mean_ms']:>10.3f}"
+            f"{result['p95_ms']:>10.3f}{result['trips']:>8.2f}{result['key_bytes']:>8}"
+        )
+    client.flushdb()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from django.test import override_settings
+import pytest
+
+from api.v1.auth import JWTAuth, create_access_token
+from apps.accounts import principal_cache
+from apps.accounts.context import resolve_account_for_user_with_reason
+from apps.accounts.models import Account, AccountMembership, UserRole
+from apps.accounts.principal_cache import get_active_user
+
+
+@pytest.fixture
+def user(django_user_model):
+    role = UserRole.objects.create(title="Principal Cache")
+    return django_user_model.objects.create_user(
+        email="principal@example.com",
+        password="testpass123",
+        role=role,
+    )
+
+
+@pytest.mark.django_db
+def test_jwt_principal_resolves_without_queries_when_warm(user, django_assert_num_queries):
+    token = create_access_token(user)
+    auth = JWTAuth()
+
+    assert auth.authenticate(None, token) == user
+    with django_assert_num_queries(0):
+        assert auth.authenticate(None, token) == user
+
+
+@pytest.mark.django_db
+def test_account_resolution_is_cached(user, django_assert_num_queries):
+    account, reason = resolve_account_for_user_with_reason(user)
+    assert reason == "default_account_resolved"
+
+    with django_assert_num_queries(0):
+        assert resolve_account_for_user_with_reason(user) == (account, reason)
+
+
+@pytest.mark.django_db
+def test_user_deactivation_invalidates_principal(user):
+    assert get_active_user(user.pk) == user
+
+    user.is_active = False
+    user.save(update_fields=["is_active"])
+
+    assert get_active_user(user.pk) is None
+
+
+@pytest.mark.django_db
+def test_principal_recached_before_commit_is_dropped_on_commit(
+    user, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+        # A concurrent request still reading the pre-commit row re-caches it.
+        principal_cache._cached(user.pk, "user", lambda: user)
+        assert get_active_user(user.pk) == user
+
+    assert get_active_user(user.pk) is None
+
+
+@pytest.mark.django_db
+def test_membership_change_invalidates_account_resolution(user):
+    org = Account.objects.create(name="Org", account_type=Account.AccountType.ORGANIZATION)
+    uuid = str(org.uuid)
+
+    assert resolve_account_for_user_with_reason(user, account_uuid=uuid) == (
+        None,
+        "account_access_denied",
+    )
+
+    membership = AccountMembership.objects.create(
+        account=org,
+        user=user,
+        invite_email=user.email,
+        status=AccountMembership.Status.ACTIVE,
+    )
+    assert resolve_account_for_user_with_reason(user, account_uuid=uuid)[0] == org
+
+    membership.status = AccountMembership.Status.SUSPENDED
+    membership.save()
+    assert resolve_account_for_user_with_reason(user, account_uuid=uuid)[0] is None
+
+
+@pytest.mark.django_db
+@override_settings(PRINCIPAL_CACHE_TTL=0)
+def test_zero_ttl_disables_cache(user, django_assert_num_queries):
+    get_active_user(user.pk)
+
+    with django_assert_num_queries(1):
+        assert get_active_user(user.pk) == user
@@ -4,8 +4,11 @@ import time
 from unittest.mock import MagicMock, patch
 
 from django.test import RequestFactory, override_settings
+from ninja.errors import HttpError
 import pytest
+import redis
 
+from apps.common import ratelimit as ratelimit_module
 from apps.common.ratelimit import (
     RateLimitExceeded,
     check_rate_limit,
@@ -117,13 +120,16 @@ class TestGetRateLimitKey:
 class TestCheckRateLimit:
     """Tests for the rate limit check function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_local_denials(self):
+        ratelimit_module._local_denials.clear()
+        yield
+        ratelimit_module._local_denials.clear()
+
     def test_allows_request_within_limit(self):
         """Test that requests within the limit are allowed."""
         mock_redis = MagicMock()
-        mock_redis.pipeline.return_value.__enter__ = lambda s: s
-        mock_redis.pipeline.return_value.__exit__ = lambda s, *args: None
-        mock_pipe = mock_redis.pipeline.return_value
-        mock_pipe.execute.return_value = [None, 0, None, None]
+        mock_redis.evalsha.return_value = [1, 9, 0]
 
         is_allowed, count, retry_after = check_rate_limit(
             mock_redis, "test:key", limit=10, period=60
@@ -132,16 +138,14 @@ class TestCheckRateLimit:
         assert is_allowed is True
         assert count == 1
         assert retry_after == 0
+        mock_redis.evalsha.assert_called_once_with(
+            ratelimit_module.GCRA_SCRIPT_SHA, 1, "test:key:tat", 10, 60000
+        )
 
     def test_blocks_request_exceeding_limit(self):
         """Test that requests exceeding the limit are blocked."""
         mock_redis = MagicMock()
-        mock_redis.pipeline.return_value.__enter__ = lambda s: s
-        mock_redis.pipeline.return_value.__exit__ = lambda s, *args: None
-        mock_pipe = mock_redis.pipeline.return_value
-        mock_pipe.execute.return_value = [None, 10, None, None]
-
-        mock_redis.zrange.return_value = [(b"12345:123", time.time() - 30)]
+        mock_redis.evalsha.return_value = [0, 0, 5500]
 
         is_allowed, count, retry_after = check_rate_limit(
             mock_redis, "test:key", limit=10, period=60
@@ -149,7 +153,35 @@ class TestCheckRateLimit:
 
         assert is_allowed is False
         assert count == 10
-        assert retry_after > 0
+        assert retry_after == 6
+
+    def test_denied_key_is_rejected_locally_until_retry(self):
+        """Test that a denied key skips Redis until its retry time passes."""
+        mock_redis = MagicMock()
+        mock_redis.evalsha.return_value = [0, 0, 30000]
+        check_rate_limit(mock_redis, "test:key", limit=10, period=60)
+
+        is_allowed, _, retry_after = check_rate_limit(mock_redis, "test:key", limit=10, period=60)
+
+        assert is_allowed is False
+        assert 0 < retry_after <= 30
+        assert mock_redis.evalsha.call_count == 1
+
+        with patch("apps.common.ratelimit.time.monotonic", return_value=time.monotonic() + 31):
+            mock_redis.evalsha.return_value = [1, 0, 0]
+            assert check_rate_limit(mock_redis, "test:key", limit=10, period=60)[0] is True
+        assert mock_redis.evalsha.call_count == 2
+
+    def test_loads_script_when_not_cached_by_redis(self):
+        """Test that a NOSCRIPT reply falls back to EVAL with the script source."""
+        mock_redis = MagicMock()
+        mock_redis.evalsha.side_effect = redis.exceptions.NoScriptError("NOSCRIPT")
+        mock_redis.eval.return_value = [1, 4, 0]
+
+        assert check_rate_limit(mock_redis, "test:key", limit=5, period=60) == (True, 1, 0)
+        mock_redis.eval.assert_called_once_with(
+            ratelimit_module.GCRA_SCRIPT, 1, "test:key:tat", 5, 60000
+        )
 
 
 class TestRateLimitDecorator:
@@ -183,6 +215,25 @@ class TestRateLimitDecorator:
             result = my_endpoint(request)
             assert result == "ok"
 
+    @pytest.mark.parametrize("fail_closed", [False, True])
+    def test_connection_error_honours_fail_closed(self, fail_closed):
+        """Test that a Redis outage fails open, or 503s when fail_closed is set."""
+        mock_redis = MagicMock()
+        mock_redis.evalsha.side_effect = redis.ConnectionError("down")
+
+        @rate_limit(key="ip", limit=1, period=60, prefix="outage", fail_closed=fail_closed)
+        def my_endpoint(request):
+            return "ok"
+
+        request = RequestFactory().get("/")
+        with patch("apps.common.ratelimit.get_redis_client", return_value=mock_redis):
+            if fail_closed:
+                with pytest.raises(HttpError) as exc_info:
+                    my_endpoint(request)
+                assert exc_info.value.status_code == 503
+            else:
+                assert my_endpoint(request) == "ok"
+
 
 class TestRateLimitExceeded:
     """Tests for RateLimitExceeded exception."""
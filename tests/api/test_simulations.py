@@ -347,14 +347,15 @@ class TestListSimulations:
             display_name="Patient",
             display_initials="Pt",
         )
-        Message.objects.create(
-            simulation=sim,
-            conversation=conversation,
-            sender=test_user,
-            content="unique chest pain phrase",
-            role=RoleChoices.USER,
-            is_from_ai=False,
-        )
+        for content in ("unique chest pain phrase", "more unique chest pain"):
+            Message.objects.create(
+                simulation=sim,
+                conversation=conversation,
+                sender=test_user,
+                content=content,
+                role=RoleChoices.USER,
+                is_from_ai=False,
+            )
 
         response = auth_client.get(
             "/api/v1/simulations/?q=unique%20chest%20pain&search_messages=true"
@@ -364,6 +365,9 @@ class TestListSimulations:
         assert len(data["items"]) == 1
         assert data["items"][0]["id"] == sim.id
 
+        response = auth_client.get("/api/v1/simulations/?q=unique%20chest%20pain")
+        assert response.json()["items"] == []
+
 
 @pytest.mark.django_db
 class TestGetSimulation:
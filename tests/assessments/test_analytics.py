@@ -0,0 +1,152 @@
+"""Daily assessment rollups: write-path refresh, rebuild command, queries."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+import pytest
+
+pytestmark = pytest.mark.django_db
+
+
+def _assess(published_rubric, account, user, *, diagnosis, experience):
+    """Persist one assessment through the bulk write path."""
+    from apps.assessments.models import Assessment, AssessmentCriterionScore
+    from apps.assessments.services import compute_overall_score, normalize_criterion_value
+    from apps.assessments.services.persistence import _save_assessment
+
+    criteria = {criterion.slug: criterion for criterion in published_rubric.criteria.all()}
+    assessment = Assessment(
+        rubric=published_rubric,
+        account=account,
+        assessed_user=user,
+        assessment_type="initial_feedback",
+        lab_type="chatlab",
+    )
+    scores = [
+        AssessmentCriterionScore(
+            assessment=assessment,
+            criterion=criteria[slug],
+            score=normalize_criterion_value(criteria[slug], **{field: value}),
+            **{field: value},
+        )
+        for slug, field, value in (
+            ("correct_diagnosis", "value_bool", diagnosis),
+            ("patient_experience", "value_int", experience),
+        )
+    ]
+    assessment.overall_score = compute_overall_score(scores)
+    with transaction.atomic():
+        _save_assessment(assessment, scores=scores, sources=[])
+    return assessment
+
+
+def _by_slug(rows):
+    return {row.criterion.slug: row for row in rows}
+
+
+def test_persisting_assessment_refreshes_rollups_after_commit(
+    published_rubric, account, user, django_capture_on_commit_callbacks
+):
+    from apps.assessments.models import AssessmentCriterionDailyRollup, AssessmentDailyRollup
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _assess(published_rubric, account, user, diagnosis=True, experience=4)
+        _assess(published_rubric, account, user, diagnosis=False, experience=1)
+
+    rollup = AssessmentDailyRollup.objects.get()
+    assert rollup.day == timezone.localdate()
+    assert rollup.assessment_count == 2
+    assert rollup.score_count == 2
+    # Overall scores: (1.0 + 0.8) / 2 = 0.9 and (0.0 + 0.2) / 2 = 0.1.
+    assert rollup.mean_score == Decimal("0.500")
+    assert rollup.score_buckets == [1, 0, 0, 0, 1]
+
+    criteria = _by_slug(AssessmentCriterionDailyRollup.objects.select_related("criterion"))
+    assert set(criteria) == {"correct_diagnosis", "patient_experience"}
+    assert criteria["correct_diagnosis"].score_buckets == [1, 0, 0, 0, 1]
+    assert criteria["patient_experience"].mean_score == Decimal("0.500")
+    assert criteria["patient_experience"].score_buckets == [0, 1, 0, 0, 1]
+
+
+def test_rollups_wait_for_commit(published_rubric, account, user):
+    from apps.assessments.models import AssessmentDailyRollup
+
+    _assess(published_rubric, account, user, diagnosis=True, experience=5)
+
+    assert not AssessmentDailyRollup.objects.exists()
+
+
+def test_rebuild_command_backfills_and_drops_stale_partitions(published_rubric, account, user):
+    from apps.assessments.models import (
+        Assessment,
+        AssessmentCriterionDailyRollup,
+        AssessmentDailyRollup,
+    )
+
+    kept = _assess(published_rubric, account, user, diagnosis=True, experience=5)
+    gone = _assess(published_rubric, account, user, diagnosis=False, experience=0)
+    Assessment.objects.filter(pk=gone.pk).update(created_at=timezone.now() - timedelta(days=3))
+
+    out = StringIO()
+    call_command("rebuild_assessment_rollups", stdout=out)
+    assert "Rebuilt 2 rollup partition(s)." in out.getvalue()
+    assert AssessmentDailyRollup.objects.count() == 2
+
+    gone.delete()
+    call_command("rebuild_assessment_rollups", stdout=StringIO())
+
+    rollup = AssessmentDailyRollup.objects.get()
+    assert rollup.day == timezone.localdate(kept.created_at)
+    assert rollup.mean_score == Decimal("1.000")
+    assert AssessmentCriterionDailyRollup.objects.filter(day=rollup.day).count() == 2
+    assert AssessmentCriterionDailyRollup.objects.count() == 2
+
+
+def test_rebuild_command_rejects_inverted_range():
+    from django.core.management.base import CommandError
+
+    with pytest.raises(CommandError, match="--since"):
+        call_command("rebuild_assessment_rollups", since="2026-02-01", until="2026-01-01")
+
+
+def test_queries_read_only_rollups(
+    published_rubric, account, user, django_capture_on_commit_callbacks, django_assert_num_queries
+):
+    from apps.assessments.services.analytics import criterion_scores, daily_scores
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _assess(published_rubric, account, user, diagnosis=True, experience=4)
+        _assess(published_rubric, account, user, diagnosis=True, experience=2)
+    today = timezone.localdate()
+
+    with django_assert_num_queries(1):
+        (day,) = daily_scores(account, since=today - timedelta(days=7), until=today)
+    assert day.key == today
+    assert day.assessment_count == 2
+    # Overall scores: 0.9 and 0.7.
+    assert day.mean_score == Decimal("0.800")
+
+    with django_assert_num_queries(1):
+        summaries = criterion_scores(account, rubric=published_rubric, since=today, until=today)
+    assert [summary.key for summary in summaries] == ["correct_diagnosis", "patient_experience"]
+    assert summaries[0].mean_score == Decimal("1.000")
+    assert summaries[1].buckets == (0, 0, 1, 0, 1)
+    assert summaries[1].assessment_count is None
+
+
+def test_daily_scores_excludes_other_accounts(
+    published_rubric, account, account_b, user, django_capture_on_commit_callbacks
+):
+    from apps.assessments.services.analytics import daily_scores
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _assess(published_rubric, account_b, user, diagnosis=True, experience=4)
+    today = timezone.localdate()
+
+    assert daily_scores(account, since=today, until=today) == []
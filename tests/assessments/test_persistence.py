@@ -413,3 +413,36 @@ def test_continuation_returns_none_when_rubric_missing(simulation, monkeypatch):
         service_call_attempt_id=None,
     )
     assert result is None
+
+
+# ---------------------------------------------------------------------------
+# Write path
+# ---------------------------------------------------------------------------
+
+
+def test_initial_write_uses_constant_queries_once_rubric_is_cached(
+    simulation, django_assert_num_queries
+):
+    from apps.assessments.services.persistence import _write_initial_assessment
+
+    _seed_initial_rubric()
+    _write_initial_assessment(sim=simulation, block=_block(), service_call_attempt_id=None)
+
+    # Savepoint, assessment insert, one bulk insert each for scores and
+    # sources, release; SimulationSummary.update_or_create adds four more
+    # (its own savepoint, select for update, update, release).
+    with django_assert_num_queries(9):
+        _write_initial_assessment(sim=simulation, block=_block(), service_call_attempt_id=None)
+
+
+def test_initial_invalid_value_writes_nothing(simulation):
+    from apps.assessments.models import Assessment
+    from apps.assessments.services.persistence import _write_initial_assessment
+
+    _seed_initial_rubric()
+
+    with pytest.raises(ValidationError, match="max_value"):
+        _write_initial_assessment(
+            sim=simulation, block=_block(patient_experience=9), service_call_attempt_id=None
+        )
+    assert not Assessment.objects.exists()
@@ -232,3 +232,83 @@ def test_account_none_only_matches_global(account):
     # to GLOBAL — none exists, so we raise.
     with pytest.raises(RubricNotFoundError):
         resolve_rubric(account=None, lab_type=LAB_TYPE, assessment_type=ASSESSMENT_TYPE)
+
+
+# ---------------------------------------------------------------------------
+# Caching
+# ---------------------------------------------------------------------------
+
+
+def _published_with_criterion(*, slug, version, account=None):
+    from apps.assessments.models import AssessmentCriterion, AssessmentRubric
+
+    rubric = _make_rubric(
+        slug=slug,
+        version=version,
+        scope=AssessmentRubric.Scope.ACCOUNT if account else AssessmentRubric.Scope.GLOBAL,
+        status=AssessmentRubric.Status.DRAFT,
+        account=account,
+    )
+    for sort_order, criterion_slug in ((20, "second"), (10, "first")):
+        AssessmentCriterion.objects.create(
+            rubric=rubric,
+            slug=criterion_slug,
+            label=criterion_slug.title(),
+            category="general",
+            value_type=AssessmentCriterion.ValueType.TEXT,
+            sort_order=sort_order,
+        )
+    rubric.status = AssessmentRubric.Status.PUBLISHED
+    rubric.save()
+    return rubric
+
+
+def test_cached_resolution_includes_ordered_criteria(django_assert_num_queries):
+    from apps.assessments.services import resolve_rubric
+
+    rubric = _published_with_criterion(slug="r", version=1)
+    resolve_rubric(account=None, lab_type=LAB_TYPE, assessment_type=ASSESSMENT_TYPE)
+
+    with django_assert_num_queries(0):
+        cached = resolve_rubric(account=None, lab_type=LAB_TYPE, assessment_type=ASSESSMENT_TYPE)
+        slugs = [criterion.slug for criterion in cached.criteria.all()]
+
+    assert cached.pk == rubric.pk
+    assert slugs == ["first", "second"]
+
+
+def test_publishing_new_version_invalidates_cached_resolution(account):
+    from apps.assessments.services import resolve_rubric
+
+    _published_with_criterion(slug="r", version=1)
+    assert resolve_rubric(account=account, lab_type=LAB_TYPE, assessment_type=ASSESSMENT_TYPE)
+
+    newer = _published_with_criterion(slug="r", version=2)
+
+    result = resolve_rubric(account=account, lab_type=LAB_TYPE, assessment_type=ASSESSMENT_TYPE)
+    assert result.pk == newer.pk
+
+
+def test_archiving_invalidates_cached_resolution():
+    from apps.assessments.models import AssessmentRubric
+    from apps.assessments.services import RubricNotFoundError, resolve_rubric
+
+    rubric = _published_with_criterion(slug="r", version=1)
+    resolve_rubric(account=None, lab_type=LAB_TYPE, assessment_type=ASSESSMENT_TYPE)
+
+    rubric.status = AssessmentRubric.Status.ARCHIVED
+    rubric.save()
+
+    with pytest.raises(RubricNotFoundError):
+        resolve_rubric(account=None, lab_type=LAB_TYPE, assessment_type=ASSESSMENT_TYPE)
+
+
+def test_cache_disabled_queries_every_time(settings, django_assert_num_queries):
+    from apps.assessments.services import resolve_rubric
+
+    settings.ASSESSMENT_RUBRIC_CACHE_TTL = 0
+    _published_with_criterion(slug="r", version=1)
+    resolve_rubric(account=None, lab_type=LAB_TYPE, assessment_type=ASSESSMENT_TYPE)
+
+    with django_assert_num_queries(2):
+        resolve_rubric(account=None, lab_type=LAB_TYPE, assessment_type=ASSESSMENT_TYPE)
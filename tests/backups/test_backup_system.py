@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import base64
+from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
+import hashlib
+import io
 import json
 from pathlib import Path
+import sys
 from typing import ClassVar
 
 from django.core.management import call_command
@@ -12,7 +17,7 @@ from django.utils import timezone
 import pytest
 
 from apps.accounts.models import Account, Invitation, User, UserRole
-from apps.common.backups.config import get_postgres_connection_info
+from apps.common.backups.config import PostgresConnectionInfo, get_postgres_connection_info
 from apps.common.backups.inventory import (
     CORE_BACKUP_TABLES,
     CORE_FORBIDDEN_TABLES,
@@ -21,9 +26,16 @@ from apps.common.backups.manifest import (
     build_manifest,
     keys_for_backup,
     sha256_file,
+    validate_manifest,
     validate_migration_compatibility,
 )
-from apps.common.backups.postgres import backup_advisory_lock, pg_dump
+from apps.common.backups.postgres import (
+    backup_advisory_lock,
+    pg_dump,
+    pg_dump_command,
+    pg_restore,
+    run_pipeline,
+)
 from apps.common.backups.restore import (
     FullRestoreTableCheck,
     check_database_empty_for_full_restore,
@@ -45,7 +57,7 @@ POSTGRES_DATABASES = {
 }
 
 
-def build_test_manifest(mode: str, encrypted: Path, *, migration_heads=None):
+def build_test_manifest(mode: str, encrypted: Path, *, migration_heads=None, jobs=1):
     keys = keys_for_backup("production", mode, datetime(2026, 5, 3, 12, 0, tzinfo=UTC))
     return build_manifest(
         mode=mode,
@@ -57,6 +69,8 @@ def build_test_manifest(mode: str, encrypted: Path, *, migration_heads=None):
         size_bytes=encrypted.stat().st_size,
         created_at=datetime(2026, 5, 3, 12, 0, tzinfo=UTC),
         migration_heads=migration_heads or {"accounts": "0001_initial"},
+        dump_format="directory" if jobs > 1 else "custom",
+        jobs=jobs,
     )
 
 
@@ -121,6 +135,204 @@ def test_requires_postgresql_and_pgpassword_is_subprocess_only(monkeypatch, tmp_
     assert captured["command"].count("--table") == 1
 
 
+def test_parallel_dump_uses_uncompressed_directory_format(tmp_path):
+    connection_info = PostgresConnectionInfo("medsim", "appuser", "", "db", "5432")
+
+    command = pg_dump_command(
+        connection_info=connection_info,
+        output_path=tmp_path / "dump",
+        dump_format="directory",
+        jobs=4,
+    )
+
+    assert "--format=directory" in command
+    assert "--compress=0" in command
+    assert command[command.index("--jobs") + 1] == "4"
+
+
+def test_parallel_restore_replaces_single_transaction(monkeypatch, tmp_path):
+    commands = []
+    monkeypatch.setattr(
+        "apps.common.backups.postgres.run_checked",
+        lambda command, env=None: commands.append(command),
+    )
+    connection_info = PostgresConnectionInfo("medsim", "appuser", "", "db", "5432")
+
+    pg_restore(connection_info=connection_info, input_path=tmp_path)
+    pg_restore(connection_info=connection_info, input_path=tmp_path, jobs=4)
+
+    assert "--single-transaction" in commands[0]
+    assert "--jobs" not in commands[0]
+    assert "--single-transaction" not in commands[1]
+    assert commands[1][1:4] == ["--jobs", "4", "--exit-on-error"]
+
+
+def test_run_pipeline_chains_processes_without_temp_files():
+    commands = [
+        [sys.executable, "-c", "import sys; sys.stdout.write('abc' * 1000)"],
+        [sys.executable, "-c", "import sys; sys.stdout.write(sys.stdin.read().upper())"],
+    ]
+
+    with run_pipeline(commands) as stream:
+        assert stream.read() == b"ABC" * 1000
+
+
+def test_run_pipeline_reports_failed_stage():
+    commands = [
+        [sys.executable, "-c", "import sys; sys.stdout.write('partial'); sys.exit(3)"],
+        [sys.executable, "-c", "import sys; sys.stdout.write(sys.stdin.read())"],
+    ]
+
+    with pytest.raises(CommandError, match="Backup tool failed"), run_pipeline(commands) as stream:
+        stream.read()
+
+
+def test_run_pipeline_reports_missing_tool():
+    with pytest.raises(CommandError, match="not installed"), run_pipeline([["no-such-tool"]]):
+        pass
+
+
+class FakeMultipartClient:
+    def __init__(self, fail_on_part=None):
+        self.fail_on_part = fail_on_part
+        self.parts = []
+        self.aborted = False
+        self.completed = None
+
+    def create_multipart_upload(self, **kwargs):
+        self.create_kwargs = kwargs
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, *, PartNumber, Body, ContentMD5, **kwargs):
+        if PartNumber == self.fail_on_part:
+            raise ConnectionError("network down")
+        assert base64.b64decode(ContentMD5) == hashlib.md5(Body).digest()
+        self.parts.append(Body)
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    def complete_multipart_upload(self, *, MultipartUpload, **kwargs):
+        self.completed = MultipartUpload["Parts"]
+        return {"ETag": '"final-etag-2"'}
+
+    def abort_multipart_upload(self, **kwargs):
+        self.aborted = True
+
+
+def build_streaming_storage(client):
+    storage = R2Storage.__new__(R2Storage)
+    storage.settings = type("Settings", (), {"bucket": "bucket"})()
+    storage._client = client
+    return storage
+
+
+def test_upload_stream_sends_bounded_parts_with_md5():
+    client = FakeMultipartClient()
+    storage = build_streaming_storage(client)
+    part_size = 5 * 1024 * 1024
+    payload = b"x" * (part_size + 10)
+
+    result = storage.upload_stream(stream=io.BytesIO(payload), key="backup", part_size=1)
+
+    assert [len(part) for part in client.parts] == [part_size, 10]
+    assert client.completed == [
+        {"ETag": '"etag-1"', "PartNumber": 1},
+        {"ETag": '"etag-2"', "PartNumber": 2},
+    ]
+    assert result.size_bytes == len(payload)
+    assert result.etag == "final-etag-2"
+    assert result.part_count == 2
+
+
+def test_upload_stream_aborts_failed_upload():
+    client = FakeMultipartClient(fail_on_part=1)
+    storage = build_streaming_storage(client)
+
+    with pytest.raises(ConnectionError):
+        storage.upload_stream(stream=io.BytesIO(b"data"), key="backup", part_size=1)
+
+    assert client.aborted
+    assert client.completed is None
+
+
+def test_upload_stream_does_not_complete_when_dump_fails_mid_stream():
+    client = FakeMultipartClient()
+    storage = build_streaming_storage(client)
+    commands = [
+        [sys.executable, "-c", "import sys; sys.stdout.write('truncated'); sys.exit(3)"],
+        [sys.executable, "-c", "import sys; sys.stdout.write(sys.stdin.read())"],
+    ]
+
+    with pytest.raises(CommandError, match="Backup tool failed"), run_pipeline(commands) as stream:
+        storage.upload_stream(
+            stream=stream, key="backup", part_size=1, before_complete=stream.finish
+        )
+
+    assert client.parts == [b"truncated"]
+    assert client.completed is None
+    assert client.aborted
+
+
+def test_backup_streams_upload_and_records_throughput(monkeypatch):
+    payload = b"encrypted-backup-bytes" * 100
+    uploads = {}
+
+    class FakeUploadStorage:
+        def __init__(self, settings):
+            pass
+
+        def upload_stream(self, *, stream, key, part_size, metadata, before_complete):
+            body = stream.read()
+            before_complete()
+            uploads[key] = body
+            return type("Upload", (), {"etag": "etag-1", "part_count": 1})()
+
+        def upload_file(self, *, path, key, content_type):
+            uploads[key] = Path(path).read_bytes()
+
+        def put_json(self, *, key, payload):
+            uploads[key] = payload
+
+        def object_matches(self, *, key, size_bytes, etag=None):
+            assert etag in (None, "etag-1")
+            return len(uploads[key]) == size_bytes
+
+    class FakePipelineStream(io.BytesIO):
+        def finish(self):
+            pass
+
+    @contextmanager
+    def fake_stream(**kwargs):
+        yield FakePipelineStream(payload)
+
+    @contextmanager
+    def no_lock():
+        yield
+
+    configure_fake_r2_env(monkeypatch)
+    monkeypatch.setenv("BACKUP_AGE_PUBLIC_KEY", "age1test")
+    module = "apps.common.management.commands.backup_database"
+    monkeypatch.setattr(f"{module}.R2Storage", FakeUploadStorage)
+    monkeypatch.setattr(f"{module}.encrypted_dump_stream", fake_stream)
+    monkeypatch.setattr(f"{module}.backup_advisory_lock", no_lock)
+    monkeypatch.setattr(
+        f"{module}.get_postgres_connection_info",
+        lambda: PostgresConnectionInfo("medsim", "appuser", "", "db", "5432"),
+    )
+    monkeypatch.setattr(
+        "apps.common.backups.manifest.get_migration_heads", lambda: {"accounts": "0001_initial"}
+    )
+
+    call_command("backup_database", "--mode", "core", "--encrypt", "--verify-upload")
+
+    manifest_key = next(key for key in uploads if key.endswith(".manifest.json"))
+    manifest = json.loads(uploads[manifest_key])
+    assert uploads[manifest["backup_key"]] == payload
+    assert manifest["sha256"] == hashlib.sha256(payload).hexdigest()
+    assert manifest["size_bytes"] == len(payload)
+    assert manifest["throughput"]["parts"] == 1
+    assert manifest["throughput"]["bytes_per_second"] > 0
+
+
 def test_rejects_non_postgresql_database(settings):
     settings.DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}
 
@@ -133,7 +345,9 @@ def test_backup_dry_run_prints_tables_without_dump_or_upload(monkeypatch):
     def fail(*args, **kwargs):
         raise AssertionError("dry run should not perform backup side effects")
 
-    monkeypatch.setattr("apps.common.management.commands.backup_database.pg_dump", fail)
+    monkeypatch.setattr(
+        "apps.common.management.commands.backup_database.encrypted_dump_stream", fail
+    )
     monkeypatch.setattr("apps.common.management.commands.backup_database.R2Storage", fail)
 
     call_command("backup_database", "--mode", "core", "--dry-run")
@@ -365,6 +579,87 @@ def test_core_restore_reseeds_sequences_after_data_only_restore(monkeypatch, tmp
     assert calls == ["decrypt", "decompress", "truncate", "pg_restore", "reseed", "expire", "check"]
 
 
+@override_settings(DATABASES=POSTGRES_DATABASES)
+@pytest.mark.parametrize(("jobs_args", "expected_jobs"), [((), 1), (("--jobs", "2"), 2)])
+def test_directory_core_restore_extracts_and_runs_post_restore_steps(
+    monkeypatch, tmp_path, jobs_args, expected_jobs
+):
+    """A parallel dump restores atomically with one job unless --jobs is passed."""
+    encrypted = tmp_path / "core.dump.zst.age"
+    encrypted.write_bytes(b"encrypted-core-backup")
+    FakeStorage.manifest = build_test_manifest("core", encrypted, jobs=4)
+    FakeStorage.encrypted_payload = encrypted.read_bytes()
+    calls = []
+    module = "apps.common.management.commands.restore_database"
+
+    configure_fake_r2_env(monkeypatch)
+    monkeypatch.setenv("BACKUP_AGE_PRIVATE_KEY", "AGE-SECRET-KEY-test")
+    monkeypatch.setattr(f"{module}.R2Storage", FakeStorage)
+    monkeypatch.setattr(
+        f"{module}.validate_migration_compatibility", lambda manifest, mode=None: None
+    )
+    monkeypatch.setattr(
+        f"{module}.check_no_business_data",
+        type("BusinessCheck", (), {"has_business_data": False}),
+    )
+    monkeypatch.setattr(f"{module}.truncate_core_tables", lambda: calls.append("truncate"))
+    monkeypatch.setattr(f"{module}.age_decrypt", lambda *args: calls.append("decrypt"))
+    monkeypatch.setattr(
+        f"{module}.zstd_decompress",
+        lambda source, target: calls.append("decompress") or target.write_bytes(b"tar"),
+    )
+    monkeypatch.setattr(
+        f"{module}.tar_extract", lambda archive, output_dir: calls.append("extract")
+    )
+    monkeypatch.setattr(
+        f"{module}.pg_restore",
+        lambda *, connection_info, input_path, jobs: calls.append(
+            ("pg_restore", input_path.name, jobs)
+        ),
+    )
+    monkeypatch.setattr(f"{module}.reseed_core_sequences", lambda: calls.append("reseed"))
+    monkeypatch.setattr(
+        f"{module}.expire_pending_invitations_after_restore", lambda: calls.append("expire") or 0
+    )
+    monkeypatch.setattr(f"{module}.call_command", lambda *a, **k: calls.append("check"))
+
+    call_command(
+        "restore_database",
+        "--mode",
+        "core",
+        "--backup-key",
+        "production/core/2026/05/03/core-20260503T120000Z.manifest.json",
+        "--require-empty-db",
+        *jobs_args,
+    )
+
+    assert calls == [
+        "decrypt",
+        "decompress",
+        "extract",
+        "truncate",
+        ("pg_restore", "restore-dir", expected_jobs),
+        "reseed",
+        "expire",
+        "check",
+    ]
+
+
+def test_manifest_rejects_unknown_dump_format(tmp_path):
+    encrypted = tmp_path / "full.dump.zst.age"
+    encrypted.write_bytes(b"payload")
+    manifest = build_test_manifest("full", encrypted)
+    assert manifest["dump_format"] == "custom"
+    assert manifest["jobs"] == 1
+
+    manifest["dump_format"] = "tar"
+    with pytest.raises(ValueError, match="dump format"):
+        validate_manifest(manifest)
+
+    del manifest["dump_format"]
+    validate_manifest(manifest)
+
+
 def test_reseed_table_sequences_sets_sequence_from_restored_values(monkeypatch):
     executed = []
 
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.test import override_settings
+from django.utils import timezone
+import pytest
+
+from apps.accounts.models import UserRole
+from apps.accounts.services import create_organization_account, get_personal_account_for_user
+from apps.billing.catalog import ProductCode
+from apps.billing.models import Entitlement, SeatAllocation, SeatAssignment, Subscription
+from apps.billing.providers.stripe import _revoke_subscription_entitlements
+from apps.billing.services.entitlements import (
+    build_entitlement_index,
+    get_access_snapshot,
+    has_product_access,
+)
+from apps.billing.services.subscriptions import reconcile_subscription_entitlements
+from apps.chatlab.access import has_lab_access
+
+
+@pytest.fixture
+def owner_user(django_user_model):
+    role = UserRole.objects.create(title="Entitlement Index Role")
+    return django_user_model.objects.create_user(
+        email="index-owner@example.com",
+        password="pass12345",
+        role=role,
+    )
+
+
+def _grant(account, product_code, **kwargs):
+    defaults = {
+        "source_type": Entitlement.SourceType.MANUAL,
+        "source_ref": f"manual:{product_code}",
+        "scope_type": Entitlement.ScopeType.ACCOUNT,
+        "status": Entitlement.Status.ACTIVE,
+    }
+    defaults.update(kwargs)
+    return Entitlement.objects.create(account=account, product_code=product_code, **defaults)
+
+
+@pytest.mark.django_db
+def test_warm_access_checks_do_not_query(owner_user, django_assert_num_queries):
+    personal_account = get_personal_account_for_user(owner_user)
+    _grant(personal_account, ProductCode.CHATLAB_GO.value)
+
+    assert has_lab_access(owner_user, personal_account) is True
+
+    with django_assert_num_queries(0):
+        assert has_lab_access(owner_user, personal_account) is True
+        assert not has_product_access(owner_user, personal_account, ProductCode.TRAINERLAB_GO.value)
+        snapshot = get_access_snapshot(owner_user, personal_account)
+
+    assert snapshot["membership_role"] == "org_admin"
+    assert list(snapshot["products"]) == [ProductCode.CHATLAB_GO.value]
+
+
+@pytest.mark.django_db
+def test_seat_assignment_invalidates_cached_index(owner_user):
+    org_account = create_organization_account(name="Index Seats", owner_user=owner_user)
+    _grant(org_account, ProductCode.TRAINERLAB_PLUS.value)
+    SeatAllocation.objects.create(
+        account=org_account,
+        product_code=ProductCode.TRAINERLAB_PLUS.value,
+        seat_limit=1,
+        effective_from=timezone.now(),
+    )
+    assert has_product_access(owner_user, org_account, ProductCode.TRAINERLAB_PLUS.value) is False
+
+    assignment = SeatAssignment.objects.create(
+        account=org_account,
+        user=owner_user,
+        product_code=ProductCode.TRAINERLAB_PLUS.value,
+        assigned_by=owner_user,
+    )
+    assert has_product_access(owner_user, org_account, ProductCode.TRAINERLAB_PLUS.value) is True
+
+    assignment.ended_at = timezone.now()
+    assignment.save()
+    assert has_product_access(owner_user, org_account, ProductCode.TRAINERLAB_PLUS.value) is False
+
+
+@pytest.mark.django_db
+def test_portable_grant_invalidates_other_account_indexes(owner_user):
+    personal_account = get_personal_account_for_user(owner_user)
+    org_account = create_organization_account(name="Index Portable", owner_user=owner_user)
+    assert has_product_access(owner_user, org_account, ProductCode.CHATLAB_GO.value) is False
+
+    _grant(
+        personal_account,
+        ProductCode.CHATLAB_GO.value,
+        scope_type=Entitlement.ScopeType.USER,
+        subject_user=owner_user,
+        portable_across_accounts=True,
+    )
+
+    assert has_product_access(owner_user, org_account, ProductCode.CHATLAB_GO.value) is True
+
+
+@pytest.mark.django_db
+def test_bulk_revocation_invalidates_cached_index(owner_user):
+    personal_account = get_personal_account_for_user(owner_user)
+    subscription = Subscription.objects.create(
+        account=personal_account,
+        provider_type="stripe",
+        provider_subscription_id="sub_index",
+        plan_code="price_chatlab_go_monthly",
+        status=Subscription.Status.ACTIVE,
+        current_period_end=timezone.now() + timedelta(days=30),
+    )
+    reconcile_subscription_entitlements(subscription)
+    assert has_product_access(owner_user, personal_account, ProductCode.CHATLAB_GO.value) is True
+
+    _revoke_subscription_entitlements(subscription)
+
+    assert has_product_access(owner_user, personal_account, ProductCode.CHATLAB_GO.value) is False
+
+
+@pytest.mark.django_db
+def test_index_goes_stale_at_next_entitlement_boundary(owner_user):
+    personal_account = get_personal_account_for_user(owner_user)
+    ends_at = timezone.now() + timedelta(minutes=5)
+    _grant(personal_account, ProductCode.CHATLAB_GO.value, ends_at=ends_at)
+
+    index = build_entitlement_index(owner_user, personal_account)
+
+    assert index.has_product(ProductCode.CHATLAB_GO.value)
+    assert index.valid_until == ends_at
+    assert index.is_stale(at=ends_at + timedelta(seconds=1))
+
+
+@pytest.mark.django_db
+@override_settings(ENTITLEMENT_CACHE_TTL=0)
+def test_zero_ttl_disables_cache(owner_user, django_assert_max_num_queries):
+    personal_account = get_personal_account_for_user(owner_user)
+    _grant(personal_account, ProductCode.CHATLAB_GO.value)
+    has_product_access(owner_user, personal_account, ProductCode.CHATLAB_GO.value)
+
+    with django_assert_max_num_queries(3) as captured:
+        assert has_product_access(owner_user, personal_account, ProductCode.CHATLAB_GO.value)
+    assert len(captured) > 0
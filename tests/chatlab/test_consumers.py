@@ -372,6 +372,22 @@ class TestChatConsumerContract:
 
         consumer._send_envelope.assert_not_awaited()
 
+    async def test_chatlab_transient_forwards_message_stream_delta(self):
+        simulation, user = await create_simulation_and_user(in_progress=True)
+        consumer = ChatConsumer()
+        consumer.scope = {"user": user}
+        consumer.simulation_id = simulation.id
+        consumer.channel_name = "test-channel"
+        consumer._send_envelope = AsyncMock()
+
+        envelope = chat_realtime.build_realtime_envelope(
+            chat_realtime.MESSAGE_STREAM_DELTA,
+            {"conversation_id": 1, "delta": "lo", "text": "Hello"},
+        )
+        await consumer.chatlab_transient({"event": envelope})
+
+        consumer._send_envelope.assert_awaited_once_with(envelope)
+
     async def test_resume_deduplicates_live_events_buffered_during_replay(self, monkeypatch):
         simulation, user = await create_simulation_and_user()
         anchor = await OutboxEvent.objects.acreate(
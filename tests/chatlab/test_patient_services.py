@@ -519,3 +519,83 @@ class TestPatientRecentScenarioHistoryInstruction:
         # After Fix 1, it is pre-loaded so this access is safe.
         assert cached.user is not None
         assert cached.user.pk == history_user.pk
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPatientContextPrefetch:
+    def test_initial_service_prefetches_simulation_and_user_in_one_query(self, history_user):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from apps.simcore.models import Simulation
+
+        simulation = Simulation.objects.create(
+            user=history_user,
+            sim_patient_full_name="Prefetch Patient",
+        )
+        service = GenerateInitialResponse(context={"simulation_id": simulation.id})
+
+        assert {"simulation", "user"} <= service._context_requirements
+
+        with CaptureQueriesContext(connection) as queries:
+            resolved = async_to_sync(service._aresolve_context_requirements)(service.context)
+
+        assert len(queries) == 1
+        assert resolved["simulation"].pk == simulation.pk
+        assert resolved["user"].pk == history_user.pk
+        service.context = {**service.context, **resolved}
+
+        with CaptureQueriesContext(connection) as queries:
+            rendered = async_to_sync(
+                patient_instruction_module.PatientNameInstruction.render_instruction
+            )(service)
+            async_to_sync(patient_instruction_module.PatientModifierInstruction.render_instruction)(
+                service
+            )
+
+        assert "Prefetch Patient" in rendered
+        assert len(queries) == 0
+
+
+class TestPatientStreaming:
+    def test_patient_services_stream(self):
+        assert GenerateInitialResponse.streaming is True
+        assert GenerateReplyResponse.streaming is True
+
+    def test_extract_message_text_reads_partial_json(self):
+        from apps.chatlab.orca.mixins.streaming import extract_message_text
+
+        raw = (
+            '{"messages": [{"role": "patient", "content": [{"type": "text", "text": "Hi"}]},'
+            ' {"role": "patient", "content": [{"type": "text", "text": "My chest hu'
+        )
+
+        assert extract_message_text(raw) == "Hi\n\nMy chest hu"
+        assert extract_message_text('{"messages": [{"role": "pat') == ""
+        assert extract_message_text("") == ""
+
+    def test_stream_delta_is_sent_as_transient_event(self, monkeypatch):
+        from unittest.mock import AsyncMock, MagicMock
+
+        from apps.chatlab.orca.mixins import streaming as streaming_module
+        from apps.chatlab.realtime import MESSAGE_STREAM_DELTA
+
+        channel_layer = MagicMock()
+        channel_layer.group_send = AsyncMock()
+        monkeypatch.setattr(streaming_module, "get_channel_layer", lambda: channel_layer)
+
+        service = GenerateReplyResponse(context={"simulation_id": 5}, emitter=MagicMock())
+        async_to_sync(service.on_stream_delta)(
+            {"simulation_id": 5, "conversation_id": 9, "correlation_id": "corr-1"},
+            "lo",
+            "Hello",
+        )
+
+        group, message = channel_layer.group_send.await_args.args
+        assert group == "simulation_5"
+        assert message["type"] == "chatlab.transient"
+        assert message["event"]["event_type"] == MESSAGE_STREAM_DELTA
+        assert message["event"]["correlation_id"] == "corr-1"
+        assert message["event"]["payload"]["conversation_id"] == 9
+        assert message["event"]["payload"]["text"] == "Hello"
+        service.emitter.emit_stream_chunk.assert_called_once()
@@ -789,6 +789,36 @@ class TestMROMerging:
 
         assert persist_map["messages"] is fresh_handler
 
+    def test_persist_plan_is_cached_until_cleared(self):
+        """Compiled plans are reused; clear_persist_caches() picks up reloaded handlers."""
+        import apps.chatlab.orca.persisters as persisters_module
+        from orchestrai_django.persistence import clear_persist_caches, get_persist_plan
+
+        plan = get_persist_plan(PatientInitialOutputSchema)
+        assert get_persist_plan(PatientInitialOutputSchema) is plan
+        assert plan.handlers[0][0] == "messages"
+
+        reloaded_module = importlib.reload(persisters_module)
+        assert get_persist_plan(PatientInitialOutputSchema) is plan
+
+        clear_persist_caches()
+
+        fresh_plan = get_persist_plan(PatientInitialOutputSchema)
+        assert fresh_plan is not plan
+        assert dict(fresh_plan.handlers)["messages"] is reloaded_module.persist_messages
+
+    def test_resolve_schema_class_is_cached(self):
+        from orchestrai_django.persistence import clear_persist_caches, engine, resolve_schema_class
+
+        fqn = f"{PatientReplyOutputSchema.__module__}.{PatientReplyOutputSchema.__name__}"
+        clear_persist_caches()
+        assert resolve_schema_class(fqn) is PatientReplyOutputSchema
+
+        with patch.object(engine.importlib, "import_module") as import_module:
+            assert resolve_schema_class(fqn) is PatientReplyOutputSchema
+
+        import_module.assert_not_called()
+
 
 @pytest.mark.asyncio
 class TestSchemaWithoutPersist:
@@ -804,3 +834,104 @@ class TestSchemaWithoutPersist:
 
         result = await persist_schema(schema, ctx)
         assert result is None
+
+
+class TestAutoMapperPlans:
+    def test_plan_is_compiled_once_per_item_class(self):
+        from apps.simcore.models import LabResult
+        from apps.simcore.orca.schemas.metadata_items import LabResultItem
+        from orchestrai_django.persistence.auto_mapper import _plan_for
+
+        item = LabResultItem(
+            kind="lab_result",
+            key="Hemoglobin",
+            value="13.5",
+            panel_name="CBC",
+            result_unit="g/dL",
+            reference_range_low="12",
+            reference_range_high="16",
+            result_flag="normal",
+            result_comment=None,
+        )
+
+        plan = _plan_for(item, "results", None)
+
+        assert _plan_for(item, "results", None) is plan
+        assert plan.model_cls is LabResult
+        # Multi-table inherited metadata models keep per-instance saves.
+        assert plan.plain_model is False
+
+    @staticmethod
+    def _summary_schema(diagnosis):
+        from typing import Annotated, ClassVar
+
+        from pydantic import BaseModel, Field
+
+        from orchestrai_django.persistence import OrmOverride
+
+        class SummaryItem(BaseModel):
+            summary_text: str
+            diagnosis: str
+
+        class SummarySchema(BaseModel):
+            __persist__: ClassVar[dict] = {"summary": None}
+
+            summary: Annotated[
+                list[SummaryItem], OrmOverride(model="simcore.SimulationSummary")
+            ] = Field(...)
+
+        return SummarySchema(summary=[SummaryItem(summary_text="Done", diagnosis=diagnosis)])
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.asyncio
+    async def test_plain_models_are_bulk_inserted(self, context):
+        from django.db.models.signals import post_save, pre_save
+
+        from apps.simcore.models import SimulationSummary
+
+        schema = self._summary_schema("Asthma")
+
+        with (
+            patch.object(pre_save, "has_listeners", return_value=False),
+            patch.object(post_save, "has_listeners", return_value=False),
+            patch.object(
+                SimulationSummary.objects,
+                "bulk_create",
+                wraps=SimulationSummary.objects.bulk_create,
+            ) as bulk_create,
+        ):
+            results = await persist_schema(schema, context)
+
+        bulk_create.assert_called_once()
+        [summary] = results["summary"]
+        assert summary.pk is not None
+        assert summary.simulation_id == context.simulation_id
+        assert await SimulationSummary.objects.filter(diagnosis="Asthma").aexists()
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.asyncio
+    async def test_sender_less_save_receivers_disable_bulk_insert(self, context):
+        from django.db.models.signals import post_save
+
+        from apps.simcore.models import SimulationSummary
+
+        saved = []
+
+        def _receiver(sender, instance, created, **kwargs):
+            if sender is SimulationSummary:
+                saved.append(instance.diagnosis)
+
+        # Connected after the plan for SimulationSummary was compiled.
+        post_save.connect(_receiver, weak=False)
+        try:
+            with patch.object(
+                SimulationSummary.objects,
+                "bulk_create",
+                wraps=SimulationSummary.objects.bulk_create,
+            ) as bulk_create:
+                await persist_schema(self._summary_schema("Sepsis"), context)
+        finally:
+            post_save.disconnect(_receiver)
+
+        bulk_create.assert_not_called()
+        assert saved == ["Sepsis"]
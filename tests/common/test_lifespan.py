@@ -0,0 +1,24 @@
+from unittest.mock import AsyncMock
+
+from apps.common import lifespan
+
+
+async def test_lifespan_closes_pooled_http_clients_on_shutdown(monkeypatch):
+    aclose = AsyncMock()
+    monkeypatch.setattr(lifespan, "aclose_http_clients", aclose)
+    messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+    sent: list[dict] = []
+
+    async def receive():
+        return next(messages)
+
+    async def send(message):
+        sent.append(message)
+
+    await lifespan.LifespanApp()({"type": "lifespan"}, receive, send)
+
+    assert [m["type"] for m in sent] == [
+        "lifespan.startup.complete",
+        "lifespan.shutdown.complete",
+    ]
+    aclose.assert_awaited_once()
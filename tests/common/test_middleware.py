@@ -0,0 +1,81 @@
+import ast
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.module_loading import import_string
+import pytest
+
+from apps.accounts.middleware import InvitationMiddleware
+from apps.common import middleware
+from apps.common.middleware import (
+    AsyncSecurityMiddleware,
+    AsyncXFrameOptionsMiddleware,
+    CorrelationIDMiddleware,
+    HealthCheckMiddleware,
+)
+
+SETTINGS_PATH = Path(__file__).resolve().parents[2] / "SimWorks" / "config" / "settings.py"
+
+
+def _project_middleware() -> list[str]:
+    tree = ast.parse(SETTINGS_PATH.read_text())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "MIDDLEWARE" for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise AssertionError("MIDDLEWARE not found in config/settings.py")
+
+
+async def _ok(request):
+    return HttpResponse("ok")
+
+
+@pytest.mark.parametrize("dotted", sorted(set(_project_middleware()) | set(settings.MIDDLEWARE)))
+def test_every_configured_middleware_is_async_capable(dotted):
+    assert getattr(import_string(dotted), "async_capable", False), dotted
+
+
+async def test_health_check_short_circuits_in_async_mode():
+    mw = HealthCheckMiddleware(_ok)
+
+    response = await mw(RequestFactory().get("/health"))
+
+    assert response.status_code == 200
+    assert b'"OK"' in response.content
+
+
+async def test_correlation_id_is_propagated_in_async_mode():
+    mw = CorrelationIDMiddleware(_ok)
+    request = RequestFactory().get("/", headers={"X-Correlation-ID": "corr-123"})
+
+    response = await mw(request)
+
+    assert request.correlation_id == "corr-123"
+    assert response["X-Correlation-ID"] == "corr-123"
+
+
+async def test_invitation_token_uses_async_session_api():
+    mw = InvitationMiddleware(_ok)
+    request = RequestFactory().get("/accounts/signup/", {"invitation": "abc123"})
+    request.session = AsyncMock()
+
+    await mw(request)
+
+    request.session.aset.assert_awaited_once_with("invitation_token", "abc123")
+
+
+async def test_inline_hooks_do_not_hop_threads(monkeypatch):
+    def _no_thread_hop(*args, **kwargs):
+        raise AssertionError("inline hook went through sync_to_async")
+
+    monkeypatch.setattr(middleware, "sync_to_async", _no_thread_hop)
+    mw = AsyncSecurityMiddleware(AsyncXFrameOptionsMiddleware(_ok))
+
+    response = await mw(RequestFactory().get("/"))
+
+    assert response["X-Frame-Options"] == "DENY"
+    assert "X-Content-Type-Options" in response
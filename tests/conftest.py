@@ -333,6 +333,16 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
             item.add_marker(pytest.mark.unit)
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Cached principals, rubrics, counters and checksums must not leak across tests."""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def failure_artifacts(request: pytest.FixtureRequest) -> FailureArtifactCollector:
     collector = FailureArtifactCollector()
@@ -181,6 +181,7 @@ class TestEnqueueEvent:
         assert event.payload["nested"]["ids"] == [str(call_id)]
 
     @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
     async def test_enqueue_event_async_creates_event(self):
         """Async enqueue_event creates an event."""
         event = await enqueue_event(
@@ -195,6 +196,7 @@ class TestEnqueueEvent:
         assert event.simulation_id == 99
 
     @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
     async def test_enqueue_event_async_returns_none_for_duplicate(self):
         """Async duplicate returns None."""
         await enqueue_event(
@@ -214,6 +216,7 @@ class TestEnqueueEvent:
         assert result is None
 
     @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
     async def test_enqueue_event_async_serializes_uuid_payload(self):
         """Async enqueue_event also normalizes UUID payload values."""
         call_id = uuid4()
@@ -267,6 +270,7 @@ class TestGetEventsForSimulation:
     """Tests for catch-up endpoint helper."""
 
     @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
     async def test_returns_events_for_simulation(self):
         """Returns events for the specified simulation."""
         # Create events for different simulations using async version
@@ -280,6 +284,7 @@ class TestGetEventsForSimulation:
         assert all(e.simulation_id == 100 for e in events)
 
     @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
     async def test_respects_limit(self):
         """Respects limit parameter."""
         for i in range(5):
@@ -292,6 +297,7 @@ class TestGetEventsForSimulation:
         assert next_cursor is not None
 
     @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
     async def test_cursor_pagination(self):
         """Cursor-based pagination works."""
         for i in range(5):
@@ -309,6 +315,7 @@ class TestGetEventsForSimulation:
         assert not ids1 & ids2
 
     @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
     async def test_cursor_pagination_handles_same_created_at(self):
         """Timestamp ties should still page deterministically."""
         for i in range(3):
@@ -326,6 +333,7 @@ class TestGetEventsForSimulation:
         assert len(seen_ids) == len(set(seen_ids)) == 3
 
     @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
     async def test_returns_empty_for_no_events(self):
         """Returns empty list when no events exist."""
         events, next_cursor, has_more = await get_events_for_simulation(999)
@@ -355,6 +355,133 @@ class TestFeedbackAnalytics:
 
         assert analytics["resolved_last_30_days"] == 1
 
+    def test_counters_use_one_query_and_are_cached(self, user, django_assert_num_queries):
+        UserFeedback.objects.create(user=user, category="other", body="Open")
+        UserFeedback.objects.create(
+            user=user, category="other", body="Planned", status=UserFeedback.Status.PLANNED
+        )
+        UserFeedback.objects.create(user=user, category="other", body="Archived", is_archived=True)
+        service = FeedbackQueryService()
+
+        with django_assert_num_queries(1):
+            analytics = service.analytics()
+        with django_assert_num_queries(0):
+            assert service.unreviewed_count() == 2
+
+        assert analytics == {
+            "open": 2,
+            "planned": 1,
+            "resolved_last_30_days": 0,
+            "duplicate": 0,
+            "wont_fix": 0,
+            "unreviewed": 2,
+        }
+
+    def test_workflow_transitions_invalidate_counters(self, user, staff_user):
+        feedback = UserFeedback.objects.create(user=user, category="other", body="Open")
+        service = FeedbackQueryService()
+        workflow = FeedbackWorkflowService()
+        assert service.unreviewed_count() == 1
+
+        workflow.set_status(feedback, UserFeedback.Status.WONT_FIX, staff_user)
+        assert service.analytics()["wont_fix"] == 1
+        assert service.unreviewed_count() == 0
+
+        workflow.archive(feedback, staff_user)
+        assert service.analytics()["wont_fix"] == 0
+
+    def test_submission_invalidates_counters_after_commit(
+        self, user, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        monkeypatch.setattr(
+            FeedbackSubmissionService, "_enqueue_notification", lambda *args, **kwargs: None
+        )
+        service = FeedbackQueryService()
+        assert service.unreviewed_count() == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            FeedbackSubmissionService().submit_feedback(
+                request=_request_for(user), body=FeedbackCreate(category="other", body="New")
+            )
+
+        assert service.unreviewed_count() == 1
+
+
+@pytest.mark.django_db
+class TestFeedbackInboxPagination:
+    def _create(self, user, count, *, reviewed_every=None):
+        now = timezone.now()
+        items = []
+        for index in range(count):
+            feedback = UserFeedback.objects.create(
+                user=user,
+                category="other",
+                body=f"Item {index}",
+                is_reviewed=bool(reviewed_every and index % reviewed_every == 0),
+            )
+            UserFeedback.objects.filter(pk=feedback.pk).update(
+                created_at=now - timedelta(hours=index)
+            )
+            items.append(feedback)
+        return items
+
+    def test_keyset_pages_walk_forward_and_back(self, user):
+        self._create(user, 7, reviewed_every=3)
+        service = FeedbackQueryService()
+        expected = [item.pk for item in service.staff_inbox_queryset({})]
+
+        seen = []
+        params = {}
+        pages = []
+        while True:
+            page = service.staff_inbox_page(params, page_size=3)
+            pages.append(page)
+            seen.extend(item.pk for item in page.items)
+            if page.next_cursor is None:
+                break
+            params = {"after": str(page.next_cursor)}
+
+        assert seen == expected
+        assert [len(page.items) for page in pages] == [3, 3, 1]
+        assert pages[0].previous_cursor is None
+
+        back = service.staff_inbox_page({"before": str(pages[2].previous_cursor)}, page_size=3)
+        assert [item.pk for item in back.items] == [item.pk for item in pages[1].items]
+        assert back.previous_cursor == pages[1].items[0].pk
+        assert back.next_cursor == pages[1].items[-1].pk
+
+    def test_unknown_cursor_returns_first_page(self, user):
+        self._create(user, 2)
+        service = FeedbackQueryService()
+
+        page = service.staff_inbox_page({"after": "999999"}, page_size=5)
+
+        assert len(page.items) == 2
+        assert page.next_cursor is None
+        assert page.previous_cursor is None
+
+    def test_date_range_covers_whole_days(self, user):
+        old, recent = self._create(user, 2)
+        UserFeedback.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=3))
+        today = timezone.localdate()
+
+        matched = FeedbackQueryService().staff_inbox_queryset(
+            {"date_from": today.isoformat(), "date_to": today.isoformat()}
+        )
+
+        assert [item.pk for item in matched] == [recent.pk]
+
+    def test_inbox_view_links_next_page(self, user, staff_user):
+        self._create(user, 51)
+        client = Client()
+        client.force_login(staff_user)
+
+        response = client.get("/staff/feedback/?category=other")
+
+        page = response.context["page"]
+        assert len(page.items) == 50
+        assert f"?category=other&after={page.next_cursor}".encode() in response.content
+
 
 @pytest.mark.django_db
 class TestFeedbackStaffWeb:
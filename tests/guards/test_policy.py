@@ -6,7 +6,7 @@ import pytest
 
 from apps.billing.catalog import ProductCode
 from apps.guards.enums import LabType
-from apps.guards.policy import GuardPolicy, resolve_policy
+from apps.guards.policy import GuardPolicy, resolve_policy, uniform_inactivity_policy
 
 
 class TestGuardPolicyDefaults:
@@ -85,3 +85,13 @@ class TestResolvePolicy:
         policy = resolve_policy(LabType.TRAINERLAB, ProductCode.TRAINERLAB_GO)
         with pytest.raises(AttributeError):
             policy.runtime_cap_seconds = 999
+
+
+class TestUniformInactivityPolicy:
+    def test_trainerlab_products_share_thresholds(self):
+        policy = uniform_inactivity_policy(LabType.TRAINERLAB)
+        assert policy is not None
+        assert policy.inactivity_pause_seconds == 300
+
+    def test_chatlab_products_override_default(self):
+        assert uniform_inactivity_policy(LabType.CHATLAB) is None
@@ -0,0 +1,189 @@
+"""Tests for the Redis presence store integration in guard services."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.utils import timezone
+import pytest
+import redis
+
+from apps.guards.enums import ClientVisibility, GuardState, LabType
+from apps.guards.models import SessionPresence
+from apps.guards.presence import DUE_KEY, PresenceSnapshot, RedisPresenceStore
+from apps.guards.services import evaluate_inactivity, evaluate_inactivity_batch, record_heartbeat
+from apps.guards.tasks import check_stale_sessions
+
+pytestmark = [pytest.mark.django_db, pytest.mark.integration]
+
+
+class InMemoryPresenceStore:
+    """Dict-backed stand-in with the ``RedisPresenceStore`` interface."""
+
+    def __init__(self):
+        self.snapshots: dict[int, PresenceSnapshot] = {}
+        self.due_index: dict[int, float] = {}
+
+    def record(self, simulation_id, client_visibility, at, *, index):
+        previous = self.snapshots.get(simulation_id)
+        changed_at = previous.last_visibility_change_at if previous else None
+        if (previous.client_visibility if previous else "unknown") != client_visibility:
+            changed_at = at
+        snapshot = PresenceSnapshot(at, client_visibility, changed_at)
+        self.snapshots[simulation_id] = snapshot
+        if index:
+            self.index(simulation_id, at)
+        return snapshot
+
+    def get_many(self, simulation_ids):
+        return {sid: self.snapshots[sid] for sid in simulation_ids if sid in self.snapshots}
+
+    def get(self, simulation_id):
+        return self.snapshots.get(simulation_id)
+
+    def due(self, cutoff):
+        return [sid for sid, score in self.due_index.items() if score <= cutoff.timestamp()]
+
+    def index(self, simulation_id, at):
+        self.due_index[simulation_id] = at.timestamp()
+
+    def forget(self, simulation_ids):
+        for simulation_id in simulation_ids:
+            self.due_index.pop(simulation_id, None)
+
+
+@pytest.fixture
+def store():
+    store = InMemoryPresenceStore()
+    with (
+        patch("apps.guards.services.get_presence_store", return_value=store),
+        patch("apps.guards.tasks.get_presence_store", return_value=store),
+    ):
+        yield store
+
+
+def _presence(*, age_seconds=0, lab_type=LabType.TRAINERLAB, guard_state=GuardState.ACTIVE):
+    from apps.simcore.models import Simulation
+
+    now = timezone.now()
+    return SessionPresence.objects.create(
+        simulation=Simulation.objects.create(),
+        lab_type=lab_type,
+        guard_state=guard_state,
+        last_presence_at=now - timedelta(seconds=age_seconds),
+        wall_clock_started_at=now,
+        wall_clock_expires_at=now + timedelta(hours=2),
+    )
+
+
+class TestHeartbeatWithStore:
+    def test_heartbeat_does_not_write_presence_row(self, store):
+        presence = _presence(age_seconds=60)
+        stored_at = presence.last_presence_at
+
+        result = record_heartbeat(presence.simulation_id, ClientVisibility.FOREGROUND)
+
+        assert result.last_presence_at > stored_at
+        assert result.client_visibility == ClientVisibility.FOREGROUND
+        presence.refresh_from_db()
+        assert presence.last_presence_at == stored_at
+        assert presence.client_visibility == ClientVisibility.UNKNOWN
+        assert presence.simulation_id in store.due_index
+
+    def test_heartbeat_clears_warning_in_database(self, store):
+        presence = _presence(guard_state=GuardState.WARNING)
+
+        result = record_heartbeat(presence.simulation_id, ClientVisibility.FOREGROUND)
+
+        assert result.guard_state == GuardState.ACTIVE
+        presence.refresh_from_db()
+        assert presence.guard_state == GuardState.ACTIVE
+        assert presence.engine_runnable is True
+
+    def test_chatlab_heartbeat_is_not_indexed(self, store):
+        presence = _presence(lab_type=LabType.CHATLAB)
+
+        record_heartbeat(presence.simulation_id, ClientVisibility.FOREGROUND)
+
+        assert presence.simulation_id in store.snapshots
+        assert presence.simulation_id not in store.due_index
+
+    def test_store_outage_falls_back_to_database(self, store):
+        presence = _presence(age_seconds=60)
+        store.record = MagicMock(side_effect=redis.ConnectionError("down"))
+
+        record_heartbeat(presence.simulation_id, ClientVisibility.BACKGROUND)
+
+        presence.refresh_from_db()
+        assert presence.client_visibility == ClientVisibility.BACKGROUND
+        assert (timezone.now() - presence.last_presence_at).total_seconds() < 5
+
+
+class TestInactivityWithStore:
+    def test_store_freshness_overrides_stale_database_floor(self, store):
+        presence = _presence(age_seconds=310)
+        store.record(presence.simulation_id, "foreground", timezone.now(), index=True)
+
+        assert evaluate_inactivity(presence.simulation_id) is None
+
+    def test_stale_store_presence_pauses(self, store):
+        presence = _presence(age_seconds=600)
+        store.record(
+            presence.simulation_id,
+            "foreground",
+            timezone.now() - timedelta(seconds=310),
+            index=True,
+        )
+
+        assert evaluate_inactivity(presence.simulation_id) == GuardState.PAUSED_INACTIVITY
+
+    def test_batch_uses_store_freshness(self, store):
+        fresh = _presence(age_seconds=600)
+        stale = _presence(age_seconds=600)
+        store.record(fresh.simulation_id, "foreground", timezone.now(), index=True)
+
+        transitions = evaluate_inactivity_batch([fresh.simulation_id, stale.simulation_id])
+
+        assert transitions == {stale.simulation_id: GuardState.PAUSED_INACTIVITY}
+
+    def test_store_outage_skips_evaluation(self, store):
+        presence = _presence(age_seconds=600)
+        store.get_many = MagicMock(side_effect=redis.ConnectionError("down"))
+
+        assert evaluate_inactivity(presence.simulation_id) is None
+        presence.refresh_from_db()
+        assert presence.guard_state == GuardState.ACTIVE
+
+    def test_stale_check_reads_only_due_sessions_and_prunes(self, store):
+        fresh = _presence(age_seconds=600)
+        stale = _presence(age_seconds=600)
+        paused = _presence(age_seconds=600, guard_state=GuardState.PAUSED_MANUAL)
+        now = timezone.now()
+        store.index(fresh.simulation_id, now)
+        store.index(stale.simulation_id, now - timedelta(seconds=310))
+        store.index(paused.simulation_id, now - timedelta(seconds=310))
+
+        with patch("apps.guards.services.evaluate_inactivity_batch") as evaluate:
+            evaluate.return_value = {}
+            check_stale_sessions()
+
+        evaluate.assert_called_once_with([stale.simulation_id])
+        assert paused.simulation_id not in store.due_index
+        assert fresh.simulation_id in store.due_index
+
+
+def test_redis_store_records_heartbeat_in_one_script_call():
+    client = MagicMock()
+    client.register_script.return_value.return_value = b"1700000000.5"
+    store = RedisPresenceStore(client, ttl=120)
+    at = timezone.now()
+
+    snapshot = store.record(42, "foreground", at, index=True)
+
+    client.register_script.return_value.assert_called_once_with(
+        keys=["guards:presence:42", DUE_KEY],
+        args=[repr(at.timestamp()), "foreground", 120, 42, 1],
+    )
+    assert snapshot.last_presence_at == at
+    assert snapshot.last_visibility_change_at.timestamp() == 1700000000.5
@@ -22,8 +22,10 @@ from apps.guards.models import SessionPresence, UsageRecord
 from apps.guards.services import (
     ensure_session_presence,
     evaluate_inactivity,
+    evaluate_inactivity_batch,
     evaluate_runtime_cap,
     evaluate_wall_clock,
+    evaluate_wall_clock_batch,
     get_guard_state_for_simulation,
     get_usage_snapshot,
     guard_service_entry,
@@ -294,6 +296,81 @@ class TestEvaluateWallClock:
         assert trainerlab_presence.engine_runnable is False
 
 
+class TestBatchEvaluation:
+    def _presence(self, *, age_seconds=0, guard_state=GuardState.ACTIVE, expires_in=7200):
+        from apps.simcore.models import Simulation
+
+        now = timezone.now()
+        return SessionPresence.objects.create(
+            simulation=Simulation.objects.create(),
+            lab_type=LabType.TRAINERLAB,
+            guard_state=guard_state,
+            last_presence_at=now - timedelta(seconds=age_seconds),
+            wall_clock_started_at=now,
+            wall_clock_expires_at=now + timedelta(seconds=expires_in),
+        )
+
+    def test_inactivity_batch_classifies_and_applies(self):
+        fresh = self._presence()
+        warned = self._presence(age_seconds=275)
+        already_warned = self._presence(age_seconds=275, guard_state=GuardState.WARNING)
+        paused = self._presence(age_seconds=310, guard_state=GuardState.WARNING)
+        ids = [p.simulation_id for p in (fresh, warned, already_warned, paused)]
+
+        with unittest.mock.patch("apps.guards.services._autopause_trainerlab_session") as pause:
+            transitions = evaluate_inactivity_batch(ids)
+
+        assert transitions == {
+            warned.simulation_id: GuardState.WARNING,
+            paused.simulation_id: GuardState.PAUSED_INACTIVITY,
+        }
+        pause.assert_called_once_with(paused.simulation_id)
+        states = dict(
+            SessionPresence.objects.filter(simulation_id__in=ids).values_list(
+                "simulation_id", "guard_state"
+            )
+        )
+        assert states[fresh.simulation_id] == GuardState.ACTIVE
+        assert states[warned.simulation_id] == GuardState.WARNING
+        assert states[paused.simulation_id] == GuardState.PAUSED_INACTIVITY
+        paused.refresh_from_db()
+        assert paused.pause_reason == PauseReason.INACTIVITY
+        assert paused.engine_runnable is False
+
+    def test_inactivity_batch_query_count_is_constant(self, django_assert_max_num_queries):
+        ids = [self._presence(age_seconds=275).simulation_id for _ in range(10)]
+
+        with (
+            unittest.mock.patch("apps.common.outbox.poke_drain_sync"),
+            django_assert_max_num_queries(8),
+        ):
+            transitions = evaluate_inactivity_batch(ids)
+
+        assert len(transitions) == 10
+        from apps.common.models import OutboxEvent
+
+        assert OutboxEvent.objects.filter(event_type="guard.warning.updated").count() == 10
+
+    def test_wall_clock_batch_ends_only_expired_active_sessions(self):
+        expired = self._presence(expires_in=-60)
+        running = self._presence()
+        paused = self._presence(expires_in=-60, guard_state=GuardState.PAUSED_MANUAL)
+
+        with unittest.mock.patch("apps.guards.services._emit_guard_events") as emit:
+            transitions = evaluate_wall_clock_batch()
+
+        assert transitions == {expired.simulation_id: GuardState.ENDED}
+        payload = emit.call_args[0][0][0][2]
+        assert payload["guard_reason"] == PauseReason.WALL_CLOCK_EXPIRY
+        expired.refresh_from_db()
+        assert expired.guard_state == GuardState.ENDED
+        assert expired.engine_runnable is False
+        running.refresh_from_db()
+        paused.refresh_from_db()
+        assert running.guard_state == GuardState.ACTIVE
+        assert paused.guard_state == GuardState.PAUSED_MANUAL
+
+
 class TestGuardServiceEntry:
     def test_no_presence_allows(self, simulation):
         """If no presence row exists, guard is backwards-compatible."""
@@ -0,0 +1,230 @@
+"""Tests for Redis-buffered usage accounting in guard services."""
+
+from __future__ import annotations
+
+from collections import Counter
+from unittest.mock import MagicMock, call, patch
+from uuid import uuid4
+
+from django.utils import timezone
+import pytest
+import redis
+
+from apps.guards.enums import LabType, UsageScopeType
+from apps.guards.models import UsageFlushBatch, UsageRecord
+from apps.guards.services import flush_buffered_usage, get_usage_snapshot, record_usage
+from apps.guards.usage_buffer import PENDING_KEY, RedisUsageBuffer, UsageBatch
+
+pytestmark = [pytest.mark.django_db, pytest.mark.integration]
+
+
+class InMemoryUsageBuffer:
+    """Dict-backed stand-in with the ``RedisUsageBuffer`` interface."""
+
+    def __init__(self):
+        self.pending: dict[str, Counter] = {}
+        self.inflight: dict[str, Counter] = {}
+        self.unflushed: Counter = Counter()
+        self.locked = False
+
+    def add(self, scopes, *, lab_type, product_code, period_start, counters):
+        for scope_type, scope_id in scopes:
+            key = RedisUsageBuffer.key(scope_type, scope_id, lab_type, product_code, period_start)
+            self.pending.setdefault(key, Counter()).update(counters)
+            self.unflushed[(scope_type, scope_id)] += counters["total_tokens"]
+
+    def unflushed_totals(self, scopes):
+        return {
+            scope_type: self.unflushed[(scope_type, scope_id)] for scope_type, scope_id in scopes
+        }
+
+    def acquire(self, timeout_ms):
+        if self.locked:
+            return None
+        self.locked = True
+        return "token"
+
+    def release(self, token):
+        self.locked = False
+
+    def drain(self, batch_size):
+        if not self.inflight:
+            self.batch_token = uuid4().hex
+            for key in list(self.pending)[:batch_size]:
+                self.inflight[key] = self.pending.pop(key)
+        rows = [RedisUsageBuffer.parse(key, dict(c)) for key, c in self.inflight.items()]
+        return UsageBatch(token=self.batch_token, rows=rows)
+
+    def ack(self, batch):
+        for row in batch.rows:
+            del self.inflight[row.key]
+            self.unflushed[(row.scope_type, row.scope_id)] -= row.counters["total_tokens"]
+
+
+@pytest.fixture
+def buffer():
+    buffer = InMemoryUsageBuffer()
+    with patch("apps.guards.services.get_usage_buffer", return_value=buffer):
+        yield buffer
+
+
+@pytest.fixture
+def simulation(db):
+    from apps.simcore.models import Simulation
+
+    return Simulation.objects.create()
+
+
+@pytest.fixture
+def account_member(simulation):
+    from django.contrib.auth import get_user_model
+
+    from apps.accounts.models import UserRole
+    from apps.accounts.services import get_personal_account_for_user
+
+    role = UserRole.objects.create(title="Usage Buffer Role")
+    user = get_user_model().objects.create_user(
+        email="usage-buffer@example.com", password="pass12345", role=role
+    )
+    return user, get_personal_account_for_user(user)
+
+
+def _record(simulation, user=None, account=None, total_tokens=300):
+    record_usage(
+        simulation_id=simulation.pk,
+        user_id=user.pk if user else None,
+        account_id=account.pk if account else None,
+        lab_type=LabType.TRAINERLAB,
+        product_code="trainerlab_go",
+        input_tokens=100,
+        output_tokens=total_tokens - 100,
+        total_tokens=total_tokens,
+    )
+
+
+class TestBufferedRecording:
+    def test_record_buffers_without_writing_rows(self, buffer, simulation, account_member):
+        user, account = account_member
+
+        _record(simulation, user, account)
+
+        assert not UsageRecord.objects.exists()
+        assert len(buffer.pending) == 3
+
+    def test_snapshot_merges_flushed_and_unflushed(self, buffer, simulation, account_member):
+        user, account = account_member
+        _record(simulation, user, account)
+        flush_buffered_usage()
+        _record(simulation, user, account, total_tokens=200)
+
+        snapshot = get_usage_snapshot(
+            simulation_id=simulation.pk, user_id=user.pk, account_id=account.pk
+        )
+
+        assert snapshot == {
+            "session_total_tokens": 500,
+            "user_total_tokens": 500,
+            "account_total_tokens": 500,
+        }
+
+    def test_redis_outage_falls_back_to_direct_upsert(self, buffer, simulation):
+        buffer.add = MagicMock(side_effect=redis.ConnectionError("down"))
+        buffer.unflushed_totals = MagicMock(side_effect=redis.ConnectionError("down"))
+
+        _record(simulation)
+
+        assert get_usage_snapshot(simulation_id=simulation.pk)["session_total_tokens"] == 300
+        assert UsageRecord.objects.get(simulation=simulation).service_call_count == 1
+
+
+class TestFlush:
+    def test_flush_inserts_then_increments_rows(self, buffer, simulation, account_member):
+        user, account = account_member
+        for _ in range(3):
+            _record(simulation, user, account)
+
+        assert flush_buffered_usage() == 3
+        _record(simulation, user, account)
+        assert flush_buffered_usage() == 3
+
+        rows = UsageRecord.objects.order_by("scope_type")
+        assert [row.scope_type for row in rows] == ["account", "session", "user"]
+        for row in rows:
+            assert row.total_tokens == 1200
+            assert row.input_tokens == 400
+            assert row.service_call_count == 4
+        assert rows.get(scope_type=UsageScopeType.ACCOUNT).account_id == account.pk
+        assert not buffer.inflight
+        assert sum(buffer.unflushed.values()) == 0
+
+    def test_failed_flush_keeps_rows_in_flight(self, buffer, simulation):
+        _record(simulation)
+
+        with (
+            patch("apps.guards.services._bulk_upsert_usage", side_effect=RuntimeError),
+            pytest.raises(RuntimeError),
+        ):
+            flush_buffered_usage()
+
+        assert not buffer.locked
+        assert len(buffer.inflight) == 1
+        assert flush_buffered_usage() == 1
+        assert UsageRecord.objects.get(simulation=simulation).total_tokens == 300
+
+    def test_failed_ack_does_not_double_count(self, buffer, simulation):
+        _record(simulation)
+        ack = buffer.ack
+
+        with (
+            patch.object(buffer, "ack", side_effect=redis.ConnectionError("down")),
+            pytest.raises(redis.ConnectionError),
+        ):
+            flush_buffered_usage()
+
+        assert len(buffer.inflight) == 1
+        _record(simulation, total_tokens=200)
+        with patch.object(buffer, "ack", wraps=ack):
+            # The committed batch is acknowledged without being re-applied ...
+            assert flush_buffered_usage() == 1
+            assert UsageRecord.objects.get(simulation=simulation).total_tokens == 300
+            # ... and the call buffered meanwhile is flushed as a new batch.
+            assert flush_buffered_usage() == 1
+
+        record = UsageRecord.objects.get(simulation=simulation)
+        assert record.total_tokens == 500
+        assert record.service_call_count == 2
+        assert UsageFlushBatch.objects.count() == 2
+        assert not buffer.inflight
+        assert sum(buffer.unflushed.values()) == 0
+
+    def test_flush_skips_when_another_flush_holds_the_lock(self, buffer, simulation):
+        _record(simulation)
+        buffer.locked = True
+
+        assert flush_buffered_usage() == 0
+        assert not UsageRecord.objects.exists()
+
+
+def test_redis_buffer_adds_all_scopes_in_one_transaction():
+    client = MagicMock()
+    pipe = client.pipeline.return_value
+    period = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    RedisUsageBuffer(client).add(
+        [("session", 7), ("account", 3)],
+        lab_type="trainerlab",
+        product_code="trainerlab_go",
+        period_start=period,
+        counters={"input_tokens": 5, "reasoning_tokens": 0, "total_tokens": 5},
+    )
+
+    client.pipeline.assert_called_once_with(transaction=True)
+    session_key = f"guards:usage:session:7:trainerlab:trainerlab_go:{period.isoformat()}"
+    assert pipe.hincrby.call_args_list[:2] == [
+        call(session_key, "input_tokens", 5),
+        call(session_key, "total_tokens", 5),
+    ]
+    pipe.sadd.assert_any_call(PENDING_KEY, session_key)
+    pipe.incrby.assert_any_call("guards:usage:unflushed:account:3", 5)
+    pipe.execute.assert_called_once_with()
+    assert RedisUsageBuffer.parse(session_key, {}).period_start == period
@@ -45,14 +45,14 @@ ROOT_URLCONF = "config.urls"
 MIDDLEWARE = [
     "apps.common.middleware.HealthCheckMiddleware",
     "apps.common.middleware.CorrelationIDMiddleware",
-    "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
-    "django.middleware.common.CommonMiddleware",
+    "apps.common.middleware.AsyncSecurityMiddleware",
+    "apps.common.middleware.AsyncSessionMiddleware",
+    "apps.common.middleware.AsyncCommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.common.middleware.AsyncAuthenticationMiddleware",
     "allauth.account.middleware.AccountMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.common.middleware.AsyncMessageMiddleware",
+    "apps.common.middleware.AsyncXFrameOptionsMiddleware",
 ]
 
 # Template configuration (minimal for tests)
@@ -77,6 +77,8 @@ PRIVACY_ENABLE_PII_WARNING = True
 PRIVACY_ENABLE_BASIC_PII_SCAN = True
 PRIVACY_CHAT_RETENTION_DAYS = 30
 PRIVACY_RAW_AI_RETENTION_DAYS = 14
+PRIVACY_RETENTION_BATCH_SIZE = 1000
+PRIVACY_RETENTION_TIME_BUDGET_SECONDS = 20
 PRIVACY_DERIVED_FEEDBACK_RETENTION_DAYS = 3650
 PRIVACY_PERSIST_RAW_AI_REQUESTS = False
 PRIVACY_PERSIST_RAW_AI_RESPONSES = False
@@ -85,6 +87,7 @@ PRIVACY_PERSIST_PROVIDER_RAW = False
 PRIVACY_ANALYTICS_ENABLED = False
 PRIVACY_ANALYTICS_REQUIRE_CONSENT = True
 PRIVACY_DELETE_EXPORT_TOKEN_TTL_SECONDS = 600
+PRIVACY_EXPORT_STALE_AFTER_SECONDS = 3600
 
 # Channels configuration for WebSocket tests
 CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
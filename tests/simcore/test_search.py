@@ -0,0 +1,30 @@
+"""Tests for full-text simulation search helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from apps.simcore.models import Simulation
+from apps.simcore.search import prefix_search_query, search_simulations
+
+
+def test_prefix_query_strips_tsquery_operators():
+    query = prefix_search_query("chest & !pain | (dyspn")
+
+    assert query._constructor_args[0] == ("chest:* & pain:* & dyspn:*",)
+
+
+def test_prefix_query_without_words_is_none():
+    assert prefix_search_query("&&  !") is None
+
+
+@pytest.mark.django_db
+def test_full_text_search_uses_indexed_expressions_without_distinct():
+    queryset = Simulation.objects.order_by("-start_timestamp")
+
+    with patch("apps.simcore.search.uses_full_text_search", return_value=True):
+        filtered = search_simulations(queryset, "chest pain", include_messages=True)
+
+    assert not filtered.query.distinct
+    assert "_search" not in filtered.query.annotation_select
+    assert filtered.query.order_by == ("-start_timestamp",)
@@ -0,0 +1,113 @@
+"""Tests for cached tool checksums and push-based tool invalidation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from apps.chatlab.utils import broadcast_tool_checksums
+from apps.common.models import OutboxEvent
+from apps.common.outbox import event_types as outbox_events
+from apps.simcore.models import PatientDemographics, Simulation
+from apps.simcore.tools import get_tool
+from apps.simcore.tools.checksums import get_cached_checksum
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def simulation():
+    return Simulation.objects.create()
+
+
+def _tools_events(simulation):
+    return OutboxEvent.objects.filter(
+        simulation_id=simulation.pk, event_type=outbox_events.SIMULATION_TOOLS_UPDATED
+    )
+
+
+class TestCachedChecksum:
+    def test_rendering_caches_checksum_for_metadata_backed_tool(
+        self, simulation, django_assert_num_queries
+    ):
+        tool = get_tool("simulation_metadata")(simulation)
+        checksum = tool.to_dict()["checksum"]
+
+        assert get_cached_checksum("simulation_metadata", simulation.pk) == checksum
+        with django_assert_num_queries(0):
+            assert tool.get_checksum() == checksum
+
+    def test_default_dict_reads_data_once(self, simulation):
+        tool = get_tool("patient_history")(simulation)
+
+        with patch.object(tool, "get_data", wraps=tool.get_data) as get_data:
+            tool.to_dict()
+
+        get_data.assert_called_once_with()
+
+    def test_non_metadata_tool_is_not_cached(self, simulation):
+        get_tool("simulation_assessment")(simulation).get_checksum()
+
+        assert get_cached_checksum("simulation_assessment", simulation.pk) is None
+
+
+class TestBroadcastToolChecksums:
+    def test_skips_unchanged_state(self, simulation):
+        with patch("apps.common.outbox.poke_drain_sync") as poke:
+            broadcast_tool_checksums(simulation.pk)
+            broadcast_tool_checksums(simulation.pk)
+
+        event = _tools_events(simulation).get()
+        assert set(event.payload["tools"]) == {
+            "simulation_metadata",
+            "patient_history",
+            "patient_results",
+        }
+        poke.assert_called_once_with()
+
+    def test_metadata_change_pushes_new_checksums_after_commit(
+        self, simulation, django_capture_on_commit_callbacks
+    ):
+        stale = get_tool("simulation_metadata")(simulation).get_checksum()
+
+        with (
+            patch("apps.common.outbox.poke_drain_sync"),
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            PatientDemographics.objects.create(simulation=simulation, key="age", value="42")
+
+        event = _tools_events(simulation).get()
+        fresh = event.payload["tools"]["simulation_metadata"]
+        assert fresh != stale
+        assert get_tool("simulation_metadata")(simulation).get_checksum() == fresh
+
+    def test_returning_to_an_earlier_state_is_pushed(self, simulation):
+        with patch("apps.common.outbox.poke_drain_sync"):
+            broadcast_tool_checksums(simulation.pk)
+            row = PatientDemographics.objects.create(simulation=simulation, key="age", value="42")
+            broadcast_tool_checksums(simulation.pk)
+            row.delete()
+            broadcast_tool_checksums(simulation.pk)
+
+        first, changed, reverted = _tools_events(simulation).order_by("created_at", "id")
+        assert changed.payload != first.payload
+        assert reverted.payload == first.payload
+
+    def test_many_writes_push_once_per_simulation_per_transaction(
+        self, simulation, django_capture_on_commit_callbacks
+    ):
+        other = Simulation.objects.create()
+
+        with (
+            patch("apps.chatlab.signals.broadcast_tool_checksums") as broadcast,
+            django_capture_on_commit_callbacks(execute=True) as callbacks,
+        ):
+            for index in range(3):
+                PatientDemographics.objects.create(
+                    simulation=simulation, key=f"k{index}", value="v"
+                )
+            PatientDemographics.objects.create(simulation=other, key="k", value="v")
+
+        assert len(callbacks) == 1
+        assert sorted(call.args[0] for call in broadcast.call_args_list) == sorted(
+            [simulation.pk, other.pk]
+        )
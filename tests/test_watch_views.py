@@ -8,7 +8,12 @@ import pytest
 from apps.common.models import OutboxEvent
 from apps.common.outbox.event_types import PATIENT_PULSE_CREATED, PATIENT_VITAL_UPDATED
 from apps.common.outbox.outbox import order_outbox_queryset
-from apps.common.watch import parse_watch_page_state, serialize_outbox_events
+from apps.common.watch import (
+    count_watch_event_categories,
+    parse_watch_page_state,
+    select_watch_events,
+    serialize_outbox_events,
+)
 from apps.trainerlab.models import RuntimeEvent
 from apps.trainerlab.services import create_session
 from orchestrai_django.models import ServiceCall
@@ -227,7 +232,7 @@ def test_service_call_actions_only_show_download_for_full_call(
 ):
     client.force_login(chatlab_owner)
 
-    ServiceCall.objects.create(
+    service_call = ServiceCall.objects.create(
         service_identity="chatlab.patient",
         related_object_id=str(chat_simulation.id),
         input={"prompt": "hello"},
@@ -239,8 +244,17 @@ def test_service_call_actions_only_show_download_for_full_call(
     )
 
     content = response.content.decode()
-    assert content.count("Download JSON") == 3
-    assert content.count("Copy JSON") == 3
+    assert content.count("Download JSON") == 1
+    assert content.count("Copy JSON") == 1
+
+    detail = client.get(
+        reverse(
+            "chatlab:watch_service_call_detail",
+            kwargs={"simulation_id": chat_simulation.id, "service_call_id": service_call.id},
+        )
+    ).content.decode()
+    assert detail.count("Download JSON") == 2
+    assert detail.count("Copy JSON") == 2
 
 
 @pytest.mark.django_db
@@ -363,3 +377,133 @@ def test_trainerlab_watch_view_uses_chronological_event_timeline(
         for event in timeline["events"]
         if "sequence" in event["payload"]
     ] == [0, 1, 2]
+
+
+def _create_watch_events(simulation, event_types):
+    base_time = datetime(2030, 1, 1, tzinfo=UTC)
+    events = []
+    for index, event_type in enumerate(event_types):
+        event = OutboxEvent.objects.create(
+            simulation_id=simulation.id,
+            event_type=event_type,
+            payload={"index": index},
+            idempotency_key=f"watch-window:{simulation.id}:{index}",
+        )
+        OutboxEvent.objects.filter(pk=event.pk).update(
+            created_at=base_time + timedelta(seconds=index)
+        )
+        events.append(event)
+    return events
+
+
+@pytest.mark.django_db
+def test_select_watch_events_returns_newest_window_with_keyset_paging(chat_simulation):
+    _create_watch_events(chat_simulation, [PATIENT_PULSE_CREATED] * 5)
+    outbox_events = OutboxEvent.objects.filter(simulation_id=chat_simulation.id)
+
+    newest, has_older = select_watch_events(outbox_events, limit=2)
+    assert [event.payload["index"] for event in newest] == [3, 4]
+    assert has_older is True
+
+    older, has_older = select_watch_events(outbox_events, before=str(newest[0].id), limit=2)
+    assert [event.payload["index"] for event in older] == [1, 2]
+    assert has_older is True
+
+    oldest, has_older = select_watch_events(outbox_events, before=str(older[0].id), limit=2)
+    assert [event.payload["index"] for event in oldest] == [0]
+    assert has_older is False
+
+    assert select_watch_events(outbox_events, before="not-a-uuid") == ([], False)
+
+
+@pytest.mark.django_db
+def test_watch_events_filter_and_search_run_in_database(chat_simulation):
+    _create_watch_events(
+        chat_simulation,
+        [PATIENT_PULSE_CREATED, "message.item.created", PATIENT_VITAL_UPDATED, "custom.thing"],
+    )
+    outbox_events = OutboxEvent.objects.filter(simulation_id=chat_simulation.id)
+
+    metadata, _ = select_watch_events(outbox_events, events_filter="metadata")
+    assert [event.event_type for event in metadata] == [
+        PATIENT_PULSE_CREATED,
+        PATIENT_VITAL_UPDATED,
+    ]
+
+    other, _ = select_watch_events(outbox_events, events_filter="other")
+    assert [event.event_type for event in other] == ["custom.thing"]
+
+    searched, _ = select_watch_events(outbox_events, events_q="vital")
+    assert [event.event_type for event in searched] == [PATIENT_VITAL_UPDATED]
+
+    counts = count_watch_event_categories(outbox_events)
+    assert counts["all"] == 4
+    assert counts["metadata"] == 2
+    assert counts["chat"] == 1
+    assert counts["other"] == 1
+
+
+@pytest.mark.django_db
+def test_chatlab_watch_page_embeds_only_newest_window(
+    client, chatlab_owner, chat_simulation, monkeypatch
+):
+    monkeypatch.setattr("apps.common.watch.WATCH_EVENTS_WINDOW", 3)
+    events = _create_watch_events(chat_simulation, [PATIENT_PULSE_CREATED] * 5)
+    client.force_login(chatlab_owner)
+    watch_url = reverse("chatlab:watch_simulation", kwargs={"simulation_id": chat_simulation.id})
+    events_url = reverse("chatlab:watch_events", kwargs={"simulation_id": chat_simulation.id})
+
+    response = client.get(watch_url)
+
+    embedded = json.loads(response.context["outbox_events_json"])
+    assert [event["payload"]["index"] for event in embedded] == [2, 3, 4]
+    window = json.loads(response.context["outbox_events_window_json"])
+    assert window["has_older"] is True
+    assert window["stream_cursor"] == str(events[-1].id)
+    assert window["category_counts"]["all"] == 5
+    assert response.context["events_url"] == events_url
+
+    older = client.get(events_url, {"before": embedded[0]["event_id"]}).json()
+    assert [event["payload"]["index"] for event in older["events"]] == [0, 1]
+    assert older["has_older"] is False
+    assert "category_counts" not in older
+
+
+@pytest.mark.django_db
+def test_service_calls_partial_loads_payload_lazily_and_flags_large_calls(
+    client, chatlab_owner, chat_simulation, trainer_simulation
+):
+    client.force_login(chatlab_owner)
+    large_call = ServiceCall.objects.create(
+        service_identity="chatlab.patient",
+        related_object_id=str(chat_simulation.id),
+        input={"prompt": "needle-input"},
+        output_data={"message": "x" * 1_000_001},
+    )
+    other_call = ServiceCall.objects.create(
+        service_identity="chatlab.patient",
+        related_object_id=str(trainer_simulation.id),
+        input={"prompt": "other"},
+    )
+
+    response = client.get(
+        reverse("chatlab:watch_service_calls", kwargs={"simulation_id": chat_simulation.id})
+    )
+
+    content = response.content.decode()
+    assert "needle-input" not in content
+    assert "Large payload" in content
+    assert response.context["service_calls"][0].get_deferred_fields() >= {"input", "output_data"}
+
+    detail_url = reverse(
+        "chatlab:watch_service_call_detail",
+        kwargs={"simulation_id": chat_simulation.id, "service_call_id": large_call.id},
+    )
+    assert detail_url in content
+    assert "needle-input" in client.get(detail_url).content.decode()
+
+    foreign_detail_url = reverse(
+        "chatlab:watch_service_call_detail",
+        kwargs={"simulation_id": chat_simulation.id, "service_call_id": other_call.id},
+    )
+    assert client.get(foreign_detail_url).status_code == 404